@@ -0,0 +1,449 @@
+"""
+Columnar OHLC Store — memory-mapped binary copy of MASTER_DATA RESEARCH CSVs.
+Located in data_access/, NOT in engine.
+
+Stage-1 subprocesses (tools/run_stage1.py::load_market_data) and basket runs
+(tools/basket_data_loader.py::_read_year_csv_cached) re-parse the same yearly
+RESEARCH CSVs on every process start. This module converts one
+(research dir, file pattern) — i.e. one symbol / broker / timeframe — into a
+set of .npy column files that later processes open with mmap_mode="r":
+
+    .cache/columnar_ohlc/<SYMBOL_BROKER_TF>_<dirhash>/
+        current.json              -> name of the live content directory
+        <content_hash>/
+            manifest.json         sources (name, size, mtime_ns, sha256,
+                                  row range, columns, dtypes) + column map
+            c<k>.npy              one array per CSV column (concatenated)
+            time_ns.npy           per-row `read_csv(parse_dates=["time"])` value
+            time_utc_ns.npy       per-row Stage-1 parse (dayfirst, mixed, utc)
+
+Time windows: when a time column is in order at build time its manifest spec
+is flagged `sorted` and rows_between() binary-searches the memory-mapped
+ticks, so a caller decodes only frame(rows) for the window it needs.
+
+Refresh: every open() re-stats the source CSVs. Unchanged (size, mtime_ns)
+-> the store is used as-is; a changed stat whose sha256 still matches only
+refreshes the recorded stat; any content change, added or removed file
+rebuilds the store. Builds land in a temp directory and are published by an
+atomic rename + current.json replace, so concurrent readers never see a
+partial store.
+
+Fidelity: a store is only published after every per-file frame and the
+concatenated frame read back from it equal the pandas parse exactly
+(values, dtypes, columns). Anything the .npy layout cannot reproduce makes
+open() return None and the caller keeps its CSV path.
+
+Activation (default OFF — callers parse CSVs as before):
+  TS_COLUMNAR_OHLC=1
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+_READER_DIR = Path(__file__).resolve().parent
+STORE_ROOT = _READER_DIR.parent.parent / ".cache" / "columnar_ohlc"
+
+STORE_SCHEMA_VERSION = 2
+TIME_COLUMN = "time"
+_NS_PER_TICK = {"s": 10**9, "ms": 10**6, "us": 10**3, "ns": 1}
+
+# Process-local: opened stores (re-validated against source stats on every
+# open) and source sets whose build already failed (not retried per call).
+_OPEN_STORES: dict[Path, "ColumnarOhlcStore"] = {}
+_UNSUPPORTED: set[tuple] = set()
+
+
+def columnar_store_enabled() -> bool:
+    """True when TS_COLUMNAR_OHLC=1 (opt-in)."""
+    return os.environ.get("TS_COLUMNAR_OHLC", "").strip() == "1"
+
+
+# ---------------------------------------------------------------------------
+# Source fingerprinting
+# ---------------------------------------------------------------------------
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _stat(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _store_dir(source_dir: Path, pattern: str) -> Path:
+    source_dir = Path(source_dir).resolve()
+    tag = hashlib.md5(f"{source_dir}|{pattern}".encode()).hexdigest()[:10]
+    stem = pattern.split("*", 1)[0].rstrip("_") or "store"
+    return STORE_ROOT / f"{stem}_{tag}"
+
+
+# ---------------------------------------------------------------------------
+# Column encoding
+# ---------------------------------------------------------------------------
+
+def _encode_column(values: pd.Series) -> Optional[tuple[np.ndarray, Optional[np.ndarray], str]]:
+    """Return (array, null_mask, kind) or None when .npy cannot hold it exactly."""
+    dtype = values.dtype
+    if dtype.kind in "biuf":
+        return values.to_numpy(), None, "num"
+    if dtype != object:
+        return None
+    mask = values.isna().to_numpy()
+    present = values[~mask]
+    if not all(type(v) is str for v in present):
+        return None
+    filled = values.where(~mask, "").to_numpy(dtype=str)
+    try:
+        return filled.astype("S"), (mask if mask.any() else None), "ascii"
+    except UnicodeEncodeError:
+        return filled, (mask if mask.any() else None), "str"
+
+
+def _decode_column(arr: np.ndarray, mask: Optional[np.ndarray], kind: str) -> np.ndarray:
+    if kind == "num":
+        return np.array(arr)
+    out = (arr.astype("U") if kind == "ascii" else np.array(arr)).astype(object)
+    if mask is not None:
+        out[mask] = np.nan
+    return out
+
+
+def _frames_identical(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    return (
+        list(a.columns) == list(b.columns)
+        and a.dtypes.equals(b.dtypes)
+        and a.index.equals(b.index)
+        and a.equals(b)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class ColumnarOhlcStore:
+    """Read side of one published store (arrays are memory-mapped, read-only)."""
+
+    def __init__(self, content_dir: Path, manifest: dict) -> None:
+        self.content_dir = content_dir
+        self.manifest = manifest
+        self._sources = {s["name"]: s for s in manifest["sources"]}
+        self._arrays: dict[str, np.ndarray] = {}
+
+    # --- raw access --------------------------------------------------------
+
+    @property
+    def nrows(self) -> int:
+        return int(self.manifest["nrows"])
+
+    @property
+    def source_names(self) -> list[str]:
+        return [s["name"] for s in self.manifest["sources"]]
+
+    def _array(self, fname: str) -> np.ndarray:
+        arr = self._arrays.get(fname)
+        if arr is None:
+            arr = np.load(self.content_dir / fname, mmap_mode="r")
+            self._arrays[fname] = arr
+        return arr
+
+    def _column(self, col: str, rows: slice) -> np.ndarray:
+        spec = self.manifest["columns"][col]
+        mask = self._array(spec["mask"])[rows] if spec.get("mask") else None
+        return _decode_column(self._array(spec["file"])[rows], mask, spec["kind"])
+
+    def has_time(self, which: str) -> bool:
+        """`which` = 'naive' (read_csv parse_dates) or 'utc' (Stage-1 parse)."""
+        return bool(self.manifest["time"].get(which))
+
+    def time_values(self, which: str, rows: slice = slice(None)) -> pd.DatetimeIndex:
+        spec = self.manifest["time"][which]
+        raw = np.array(self._array(spec["file"])[rows]).view(f"M8[{spec['unit']}]")
+        idx = pd.DatetimeIndex(raw)
+        return idx.tz_localize("UTC") if which == "utc" else idx
+
+    @property
+    def time_text_increasing(self) -> bool:
+        """True when the raw `time` strings are present and strictly
+        increasing, i.e. drop_duplicates + sort_values on them is a no-op."""
+        return bool(self.manifest.get("time_text_increasing"))
+
+    def rows_between(self, which: str, start=None, end=None) -> Optional[slice]:
+        """Rows whose `which` time lies in [start, end] (either bound may be
+        None), located by searchsorted on the memory-mapped ticks — nothing
+        else is decoded. Bounds compare like pandas does against the column
+        (strings are naive for 'naive', UTC for 'utc'). None when the column
+        was not in time order at build time."""
+        spec = self.manifest["time"].get(which)
+        if not spec or not spec.get("sorted"):
+            return None
+        ticks = self._array(spec["file"])
+        lo = 0
+        hi = len(ticks)
+        if start is not None:
+            lo = int(np.searchsorted(ticks, _bound_ticks(start, which, spec["unit"], ceil=True), side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(ticks, _bound_ticks(end, which, spec["unit"], ceil=False), side="right"))
+        return slice(lo, hi)
+
+    # --- frames ------------------------------------------------------------
+
+    def frame(self, rows: slice = slice(None)) -> pd.DataFrame:
+        """Concatenated raw frame == pd.concat([read_csv(f, comment='#') ...],
+        ignore_index=True) over the sorted sources, restricted to `rows`."""
+        start, stop, _ = rows.indices(self.nrows)
+        data = {col: self._column(col, slice(start, stop)) for col in self.manifest["column_order"]}
+        df = pd.DataFrame(data, columns=self.manifest["column_order"])
+        df.index = pd.RangeIndex(start, stop)
+        return df.astype(self.manifest["dtypes"], copy=False)
+
+    def source_frame(self, name: str, parse_time: bool = False) -> Optional[pd.DataFrame]:
+        """One source CSV as `read_csv(f, comment='#')` returns it — with
+        `parse_dates=['time']` semantics when `parse_time`. None if the file
+        is not part of this store (or its time column did not parse)."""
+        src = self._sources.get(name)
+        if src is None:
+            return None
+        start, stop = src["rows"]
+        rows = slice(start, stop)
+        df = pd.DataFrame(
+            {col: self._column(col, rows) for col in src["columns"]},
+            columns=src["columns"],
+        )
+        df = df.astype(src["dtypes"], copy=False)
+        if parse_time:
+            if not src.get("time_parsed"):
+                return None
+            df[TIME_COLUMN] = self.time_values("naive", rows)
+        return df
+
+    # --- open / build --------------------------------------------------------
+
+    @classmethod
+    def open(cls, source_dir: Path, pattern: str) -> Optional["ColumnarOhlcStore"]:
+        """Open (building or refreshing as needed) the store for every file in
+        `source_dir` matching `pattern`. Returns None when there are no
+        sources or the data cannot be stored exactly."""
+        source_dir = Path(source_dir)
+        files = sorted(source_dir.glob(pattern))
+        if not files:
+            return None
+        store_dir = _store_dir(source_dir, pattern)
+        store = _OPEN_STORES.get(store_dir) or cls._load_current(store_dir)
+        if store is not None and store._refresh(files):
+            _OPEN_STORES[store_dir] = store
+            return store
+        _OPEN_STORES.pop(store_dir, None)
+        attempt = (store_dir, tuple((f.name, *_stat(f)) for f in files))
+        if attempt in _UNSUPPORTED:
+            return None  # already failed for these exact sources in this process
+        try:
+            store = cls._build(store_dir, files)
+        except Exception as e:
+            print(f"  COLUMNAR_OHLC_BUILD_ERROR  {source_dir.name}/{pattern}  {type(e).__name__}: {e}")
+            store = None
+        if store is None:
+            _UNSUPPORTED.add(attempt)
+        else:
+            _OPEN_STORES[store_dir] = store
+        return store
+
+    @classmethod
+    def _load_current(cls, store_dir: Path) -> Optional["ColumnarOhlcStore"]:
+        try:
+            current = json.loads((store_dir / "current.json").read_text(encoding="utf-8"))
+            content_dir = store_dir / current["content"]
+            manifest = json.loads((content_dir / "manifest.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError, KeyError):
+            return None
+        if manifest.get("schema_version") != STORE_SCHEMA_VERSION:
+            return None
+        return cls(content_dir, manifest)
+
+    def _refresh(self, files: list[Path]) -> bool:
+        """True if the store still matches `files` (updating recorded stats
+        for touched-but-identical files); False if a rebuild is required."""
+        if [f.name for f in files] != self.source_names:
+            return False
+        touched = False
+        for f in files:
+            src = self._sources[f.name]
+            size, mtime_ns = _stat(f)
+            if (size, mtime_ns) == (src["size"], src["mtime_ns"]):
+                continue
+            if size != src["size"] or _sha256_file(f) != src["sha256"]:
+                return False
+            src["mtime_ns"] = mtime_ns
+            touched = True
+        if touched:
+            _write_json_atomic(self.content_dir / "manifest.json", self.manifest)
+        return True
+
+    @classmethod
+    def _build(cls, store_dir: Path, files: list[Path]) -> Optional["ColumnarOhlcStore"]:
+        sources, parts, naive_parts = [], [], []
+        offset = 0
+        for f in files:
+            size, mtime_ns = _stat(f)
+            sha = _sha256_file(f)
+            part = pd.read_csv(f, comment="#")
+            time_parsed = None
+            if TIME_COLUMN in part.columns:
+                # The call source_frame(parse_time=True) stands in for; a
+                # column it leaves unparsed (object) or tz-aware is not stored.
+                reference = pd.read_csv(f, comment="#", parse_dates=[TIME_COLUMN])[TIME_COLUMN]
+                if isinstance(reference.dtype, np.dtype) and reference.dtype.kind == "M":
+                    time_parsed = reference
+            sources.append({
+                "name": f.name, "size": size, "mtime_ns": mtime_ns, "sha256": sha,
+                "rows": [offset, offset + len(part)],
+                "columns": list(part.columns),
+                "dtypes": {c: str(t) for c, t in part.dtypes.items()},
+                "time_parsed": time_parsed is not None,
+            })
+            parts.append(part)
+            naive_parts.append(time_parsed)
+            offset += len(part)
+
+        full = pd.concat(parts, ignore_index=True)
+        content = hashlib.sha256("|".join(s["sha256"] for s in sources).encode()).hexdigest()[:16]
+
+        store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = store_dir / f"{content}.{uuid.uuid4().hex[:8]}.tmp"
+        tmp_dir.mkdir()
+        try:
+            manifest = {
+                "schema_version": STORE_SCHEMA_VERSION,
+                "nrows": len(full),
+                "column_order": list(full.columns),
+                "dtypes": {c: str(t) for c, t in full.dtypes.items()},
+                "columns": {},
+                "time": {},
+                "sources": sources,
+            }
+            for k, col in enumerate(full.columns):
+                encoded = _encode_column(full[col])
+                if encoded is None:
+                    print(f"  COLUMNAR_OHLC_UNSUPPORTED  {files[0].parent.name}  column={col!r} dtype={full[col].dtype}")
+                    return None
+                arr, mask, kind = encoded
+                spec = {"file": f"c{k}.npy", "kind": kind}
+                np.save(tmp_dir / spec["file"], arr, allow_pickle=False)
+                if mask is not None:
+                    spec["mask"] = f"c{k}.mask.npy"
+                    np.save(tmp_dir / spec["mask"], mask, allow_pickle=False)
+                manifest["columns"][col] = spec
+
+            if TIME_COLUMN in full.columns:
+                # Files whose time column did not parse hold NaT here; their
+                # sources[].time_parsed is False so readers never use them.
+                naive = pd.concat([
+                    p if p is not None else pd.Series(pd.NaT, index=range(len(parts[i])), dtype="M8[ns]")
+                    for i, p in enumerate(naive_parts)
+                ], ignore_index=True)
+                manifest["time"]["naive"] = _save_time(tmp_dir / "time_ns.npy", naive)
+                manifest["time"]["naive"]["sorted"] = _in_time_order(naive)
+                try:
+                    utc = pd.to_datetime(full[TIME_COLUMN], dayfirst=True, format="mixed", utc=True)
+                    manifest["time"]["utc"] = _save_time(tmp_dir / "time_utc_ns.npy", utc)
+                    manifest["time"]["utc"]["sorted"] = _in_time_order(utc)
+                except (ValueError, TypeError):
+                    pass
+                text = full[TIME_COLUMN]
+                manifest["time_text_increasing"] = bool(
+                    text.map(type).eq(str).all()
+                    and (text.to_numpy()[1:] > text.to_numpy()[:-1]).all()
+                )
+
+            _write_json_atomic(tmp_dir / "manifest.json", manifest)
+
+            # Verify before publishing: every frame read back must equal the parse.
+            candidate = cls(tmp_dir, manifest)
+            if not _frames_identical(candidate.frame(), full):
+                print(f"  COLUMNAR_OHLC_UNSUPPORTED  {files[0].parent.name}  concatenated frame round-trip mismatch")
+                return None
+            for src, part, reference in zip(sources, parts, naive_parts):
+                if not _frames_identical(candidate.source_frame(src["name"]), part):
+                    print(f"  COLUMNAR_OHLC_UNSUPPORTED  {src['name']}  per-file round-trip mismatch")
+                    return None
+                if reference is not None:
+                    start, stop = src["rows"]
+                    if not candidate.time_values("naive", slice(start, stop)).equals(pd.DatetimeIndex(reference)):
+                        print(f"  COLUMNAR_OHLC_UNSUPPORTED  {src['name']}  parsed time round-trip mismatch")
+                        return None
+            del candidate
+
+            final_dir = store_dir / content
+            if final_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)  # another process published it
+            else:
+                os.replace(str(tmp_dir), str(final_dir))
+            _write_json_atomic(store_dir / "current.json", {"content": content})
+            print(f"  COLUMNAR_OHLC_BUILT  {store_dir.name}  files={len(sources)} rows={len(full)}")
+        finally:
+            if tmp_dir.exists():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        _prune_stale(store_dir, keep=content)
+        return cls._load_current(store_dir)
+
+
+def _save_time(path: Path, values: pd.Series) -> dict:
+    """Persist a datetime Series as int64 ticks; returns its manifest spec."""
+    dtype = values.dtype
+    unit = getattr(dtype, "unit", None) or np.datetime_data(dtype)[0]
+    ticks = values.dt.tz_convert(None) if getattr(dtype, "tz", None) is not None else values
+    np.save(path, ticks.to_numpy().view("i8"), allow_pickle=False)
+    return {"file": path.name, "unit": unit}
+
+
+def _in_time_order(values: pd.Series) -> bool:
+    """True when `values` has no NaT and never decreases (searchsorted-safe)."""
+    return bool(values.notna().all() and values.is_monotonic_increasing)
+
+
+def _bound_ticks(value, which: str, unit: str, ceil: bool) -> int:
+    """A rows_between() bound as stored ticks; sub-tick bounds round inwards."""
+    ts = pd.Timestamp(value)
+    if which == "utc":
+        ts = (ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")).tz_localize(None)
+    elif ts.tzinfo is not None:
+        raise TypeError(f"naive time bound must be tz-naive, got {value!r}")
+    per_tick = _NS_PER_TICK[unit]
+    return -(-ts.value // per_tick) if ceil else ts.value // per_tick
+
+
+def _write_json_atomic(path: Path, payload: dict) -> None:
+    tmp = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(str(tmp), str(path))
+
+
+def _prune_stale(store_dir: Path, keep: str) -> None:
+    """Best-effort removal of superseded content dirs (an mmap held open by
+    another process may block deletion on Windows — retried next build)."""
+    for child in store_dir.iterdir():
+        if child.is_dir() and child.name != keep and not child.name.endswith(".tmp"):
+            shutil.rmtree(child, ignore_errors=True)
+
+
+def open_store(source_dir: Path, pattern: str) -> Optional[ColumnarOhlcStore]:
+    """Open the store for `source_dir`/`pattern` when TS_COLUMNAR_OHLC=1,
+    else None (callers keep their CSV path)."""
+    if not columnar_store_enabled():
+        return None
+    return ColumnarOhlcStore.open(source_dir, pattern)
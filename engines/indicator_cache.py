@@ -0,0 +1,357 @@
+"""
+Indicator Memoization Layer (opt-in)
+
+Strategies call the same indicator functions (atr, hurst_regime,
+linreg_regime, ...) with the same parameters on the same OHLC across many
+runs and sweep variants. This module memoizes those calls, keyed by
+
+    (input-data fingerprint, indicator module, semantic version hash
+     from tools/indicator_hasher.py, function name, parameters)
+
+plus an AST dump of the module, so an edit to the indicator's logic
+(including an indentation-only change of block structure) invalidates every
+entry it produced, while a comment/formatting edit does not.
+
+Tiers:
+  memory  — bounded in-process LRU (shared by every variant a worker runs,
+            see run_pipeline.py --sweep-in-process).
+  disk    — bounded parquet store under .cache/indicator_cache, shared
+            across processes and batches. LRU by mtime. An entry is only
+            persisted after a parquet round-trip reproduces the result
+            exactly, so a disk hit is byte-identical to a fresh computation.
+
+Activation (default OFF — every call goes straight to the indicator):
+  TS_INDICATOR_CACHE=memory   memory tier only
+  TS_INDICATOR_CACHE=disk     memory + disk tiers
+
+Only functions that return a new Series / DataFrame and never mutate their
+inputs may be memoized; in-place mutators (candle_state, ...) must not be.
+"""
+from __future__ import annotations
+
+import ast
+import functools
+import hashlib
+import importlib
+import importlib.util
+import os
+import sys
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "memoize_indicator",
+    "install_indicator_cache",
+    "cache_mode",
+    "clear_memory_cache",
+    "MEMOIZABLE_INDICATORS",
+]
+
+_ENGINE_ROOT = Path(__file__).resolve().parents[1]  # Trade_Scan/
+INDICATOR_CACHE_DIR = _ENGINE_ROOT / ".cache" / "indicator_cache"
+
+MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+DISK_CACHE_MAX_BYTES = int(os.environ.get("TS_INDICATOR_CACHE_MAX_MB", "1024")) * 1024 * 1024
+
+# Pure indicators (new output, inputs untouched) memoized by
+# install_indicator_cache(). Value = DataFrame columns the function reads
+# (fingerprint is restricted to them), or None for Series-input indicators.
+MEMOIZABLE_INDICATORS = {
+    ("indicators.volatility.atr", "atr"): ("high", "low", "close"),
+    ("indicators.volatility.atr_percentile", "atr_percentile"): None,
+    ("indicators.volatility.realized_vol", "realized_vol"): None,
+    ("indicators.trend.hurst_regime", "hurst_regime"): None,
+    ("indicators.trend.linreg_regime", "linreg_regime"): None,
+    ("indicators.trend.ema_regime", "ema_regime"): None,
+    ("indicators.trend.efficiency_ratio_regime", "efficiency_ratio_regime"): None,
+    ("indicators.structure.adx", "adx"): None,
+}
+
+_MEMORY_CACHE: "OrderedDict[str, pd.Series | pd.DataFrame]" = OrderedDict()
+_MEMORY_CACHE_BYTES = 0
+_VERSION_HASHES: dict[str, str] = {}
+_SERIES_COLUMN = "__series__"
+
+
+def cache_mode() -> str:
+    """Return the active tier set: 'off', 'memory' or 'disk'."""
+    mode = os.environ.get("TS_INDICATOR_CACHE", "").strip().lower()
+    return mode if mode in ("memory", "disk") else "off"
+
+
+def clear_memory_cache() -> None:
+    """Drop every in-memory entry (disk tier untouched)."""
+    global _MEMORY_CACHE_BYTES
+    _MEMORY_CACHE.clear()
+    _MEMORY_CACHE_BYTES = 0
+
+
+# ---------------------------------------------------------------------------
+# Keying
+# ---------------------------------------------------------------------------
+
+def _version_hash(module_name: str) -> str:
+    """Semantic content hash of the indicator module (cached per process).
+
+    indicator_hasher's token hash drops INDENT/DEDENT, so moving a statement
+    out of a block would keep its hash; the AST dump (no line/column
+    attributes) pins block structure while still ignoring comments and
+    formatting.
+    """
+    if module_name not in _VERSION_HASHES:
+        from tools.indicator_hasher import compute_indicator_hash, resolve_module_path
+        path = resolve_module_path(module_name, _ENGINE_ROOT)
+        tree = ast.dump(ast.parse(path.read_bytes()))
+        _VERSION_HASHES[module_name] = (
+            compute_indicator_hash(path) + ":" + hashlib.sha256(tree.encode("utf-8")).hexdigest()
+        )
+    return _VERSION_HASHES[module_name]
+
+
+def _fingerprint(value, columns) -> str:
+    """Content fingerprint of one call argument."""
+    if isinstance(value, pd.DataFrame):
+        if columns is not None:
+            value = value[list(columns)]
+        h = hashlib.sha256()
+        h.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        return "df:" + h.hexdigest()
+    if isinstance(value, pd.Series):
+        h = hashlib.sha256()
+        h.update(repr((value.name, str(value.dtype))).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        return "s:" + h.hexdigest()
+    if isinstance(value, np.ndarray):
+        return "nd:" + hashlib.sha256(
+            repr((value.dtype.str, value.shape)).encode() + np.ascontiguousarray(value).tobytes()
+        ).hexdigest()
+    return "v:" + repr(value)
+
+
+def _cache_key(fn, args, kwargs, columns) -> str:
+    parts = [
+        fn.__module__,
+        fn.__qualname__,
+        _version_hash(fn.__module__),
+        *(_fingerprint(a, columns) for a in args),
+        *(f"{k}={_fingerprint(kwargs[k], columns)}" for k in sorted(kwargs)),
+    ]
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Tiers
+# ---------------------------------------------------------------------------
+
+def _memory_get(key):
+    if key not in _MEMORY_CACHE:
+        return None
+    _MEMORY_CACHE.move_to_end(key)
+    return _MEMORY_CACHE[key]
+
+
+def _nbytes(result) -> int:
+    usage = result.memory_usage(index=True, deep=False)
+    return int(usage.sum()) if isinstance(result, pd.DataFrame) else int(usage)
+
+
+def _memory_put(key, result) -> None:
+    global _MEMORY_CACHE_BYTES
+    size = _nbytes(result)
+    if size > MEMORY_CACHE_MAX_BYTES or key in _MEMORY_CACHE:
+        return
+    _MEMORY_CACHE[key] = result
+    _MEMORY_CACHE_BYTES += size
+    while _MEMORY_CACHE_BYTES > MEMORY_CACHE_MAX_BYTES and _MEMORY_CACHE:
+        _, evicted = _MEMORY_CACHE.popitem(last=False)
+        _MEMORY_CACHE_BYTES -= _nbytes(evicted)
+
+
+def _disk_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _to_frame(result):
+    """Series results are stored as a one-column frame; None name -> sentinel."""
+    if isinstance(result, pd.Series):
+        name = _SERIES_COLUMN if result.name is None else result.name
+        return result.to_frame(name=name), "series"
+    return result, "frame"
+
+
+def _from_frame(frame: pd.DataFrame, kind: str):
+    if kind == "series":
+        s = frame.iloc[:, 0]
+        if s.name == _SERIES_COLUMN:
+            s.name = None
+        return s
+    return frame
+
+
+def _disk_path(key: str, kind: str) -> Path:
+    return INDICATOR_CACHE_DIR / f"{key}.{kind}.parquet"
+
+
+def _disk_get(key):
+    for kind in ("series", "frame"):
+        path = _disk_path(key, kind)
+        if not path.exists():
+            continue
+        try:
+            result = _from_frame(pd.read_parquet(path), kind)
+        except Exception as e:
+            print(f"  INDICATOR_CACHE_CORRUPT  key={key[:12]}...  {type(e).__name__}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # LRU touch
+        except OSError:
+            pass
+        return result
+    return None
+
+
+def _disk_put(key, result) -> None:
+    frame, kind = _to_frame(result)
+    path = _disk_path(key, kind)
+    INDICATOR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        frame.to_parquet(tmp_path)
+        # Persist only when the round-trip is exact (dtype, index, name) —
+        # a disk hit must be indistinguishable from a fresh computation.
+        restored = _from_frame(pd.read_parquet(tmp_path), kind)
+        if not _identical(restored, result):
+            tmp_path.unlink(missing_ok=True)
+            return
+        os.replace(str(tmp_path), str(path))
+    except Exception as e:
+        print(f"  INDICATOR_CACHE_WRITE_ERROR  key={key[:12]}...  {type(e).__name__}: {e}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return
+    _prune_disk()
+
+
+def _prune_disk() -> None:
+    """Evict least-recently-used parquet files until under DISK_CACHE_MAX_BYTES."""
+    try:
+        files = [(p.stat().st_mtime, p.stat().st_size, p) for p in INDICATOR_CACHE_DIR.glob("*.parquet")]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files, key=lambda f: f[0]):
+        if total <= DISK_CACHE_MAX_BYTES:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+
+
+def _same_index(a: pd.Index, b: pd.Index) -> bool:
+    return a.equals(b) and a.dtype == b.dtype and a.name == b.name \
+        and getattr(a, "freq", None) == getattr(b, "freq", None)
+
+
+def _identical(a, b) -> bool:
+    if type(a) is not type(b) or not _same_index(a.index, b.index):
+        return False
+    if isinstance(a, pd.Series):
+        return a.name == b.name and a.dtype == b.dtype and a.equals(b)
+    return list(a.columns) == list(b.columns) and a.dtypes.equals(b.dtypes) and a.equals(b)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def memoize_indicator(fn=None, *, columns=None):
+    """Wrap a pure indicator function with the memoization layer.
+
+    Args:
+        fn: indicator returning a new pd.Series / pd.DataFrame.
+        columns: DataFrame columns the indicator reads. Restricts the
+            fingerprint so unrelated columns a strategy has already added do
+            not cause misses. Must list EVERY column the function reads.
+
+    The wrapper is a pass-through while TS_INDICATOR_CACHE is off, and for
+    results that are not a Series/DataFrame. Every hit returns a private copy.
+    """
+    if fn is None:
+        return functools.partial(memoize_indicator, columns=columns)
+    if getattr(fn, "__indicator_memoized__", False):
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        mode = cache_mode()
+        if mode == "off":
+            return fn(*args, **kwargs)
+
+        key = _cache_key(fn, args, kwargs, columns)
+        hit = _memory_get(key)
+        if hit is None and mode == "disk" and _disk_available():
+            hit = _disk_get(key)
+            if hit is not None:
+                _memory_put(key, hit)
+        if hit is not None:
+            return hit.copy()
+
+        result = fn(*args, **kwargs)
+        if not isinstance(result, (pd.Series, pd.DataFrame)):
+            return result
+        stored = result.copy()
+        _memory_put(key, stored)
+        if mode == "disk" and _disk_available():
+            _disk_put(key, stored)
+        return result
+
+    wrapper.__indicator_memoized__ = True
+    return wrapper
+
+
+def install_indicator_cache() -> int:
+    """Swap every MEMOIZABLE_INDICATORS function for its memoized wrapper.
+
+    Rebinds the defining module's attribute and every re-export of the same
+    function in its parent packages (``indicators.volatility.atr``,
+    ``indicators.atr``), so strategies that import through a package hit the
+    cache too. Must run BEFORE strategy modules are imported (they bind
+    indicator names at import time). No-op while TS_INDICATOR_CACHE is off;
+    idempotent. Returns the number of functions wrapped by this call.
+    """
+    if cache_mode() == "off":
+        return 0
+    wrapped = 0
+    for (module_name, func_name), columns in MEMOIZABLE_INDICATORS.items():
+        module = importlib.import_module(module_name)
+        fn = getattr(module, func_name)
+        if getattr(fn, "__indicator_memoized__", False):
+            memoized, raw = fn, fn.__wrapped__
+        else:
+            memoized, raw = memoize_indicator(fn, columns=columns), fn
+            setattr(module, func_name, memoized)
+            wrapped += 1
+        _rebind_package_exports(module_name, raw, memoized)
+    return wrapped
+
+
+def _rebind_package_exports(module_name: str, raw, memoized) -> None:
+    """Point every parent-package name bound to *raw* at *memoized*."""
+    parts = module_name.split(".")
+    for depth in range(len(parts) - 1, 0, -1):
+        package = sys.modules.get(".".join(parts[:depth]))
+        if package is None:
+            continue
+        for name, value in list(vars(package).items()):
+            if value is raw:
+                setattr(package, name, memoized)
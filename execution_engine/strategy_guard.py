@@ -33,13 +33,14 @@ All thresholds live in GuardConfig so they can be overridden without touching
 this module.  Defaults match the task specification.
 """
 
+import bisect
 import csv
 import hashlib
 import json
 import logging
 from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Deque, Dict, List, Optional, Tuple
 
@@ -215,7 +216,7 @@ def _load_baseline(
             if t.get("signal_hash"):
                 signal_index[tid] = t["signal_hash"]
             # Build detail record for tolerant matching.
-            # entry_ts is normalized at load time so _timestamp_diff_seconds
+            # entry_ts is normalized at load time so _epoch_seconds
             # compares like-for-like against the live-side normalized timestamp.
             try:
                 signal_details[tid] = {
@@ -304,6 +305,65 @@ def _load_baseline_from_vault(
     )
 
 
+# ---------------------------------------------------------------------------
+# Signal reference index (built once per guard)
+# ---------------------------------------------------------------------------
+
+class _SignalReferenceIndex:
+    """
+    Load-time lookup structures for validate_signal().
+
+    Tier 1 uses a set of research hashes. Tier 2 keeps, per (symbol,
+    direction), the reference entries sorted by pre-parsed epoch seconds so
+    the time window is a bisect instead of a scan of every signal_details
+    row. Each entry carries its signal_details position: when several
+    references fall inside the window the earliest-loaded one wins, exactly
+    as the original first-match scan did.
+    """
+
+    def __init__(self, signal_index: Dict[str, str], signal_details: Dict[str, dict]) -> None:
+        self.hashes = frozenset(signal_index.values())
+        rows: Dict[Tuple[str, int], List[Tuple[int, int, str, float]]] = {}
+        for order, (ref_id, ref) in enumerate(signal_details.items()):
+            if ref["entry_price"] == 0:
+                continue  # never matchable (relative price delta undefined)
+            secs = _epoch_seconds(ref["entry_ts"])
+            if secs is None:
+                continue
+            rows.setdefault((ref["symbol"], ref["direction"]), []).append(
+                (secs, order, ref_id, ref["entry_price"])
+            )
+        self._rows = {key: sorted(entries) for key, entries in rows.items()}
+        self._times = {key: [e[0] for e in entries] for key, entries in self._rows.items()}
+
+    def soft_match(
+        self,
+        symbol: str,
+        direction: int,
+        live_secs: int,
+        entry_price: float,
+        price_tolerance: float,
+        time_window_s: int,
+    ) -> Optional[Tuple[str, float, int]]:
+        """(ref_id, price_delta, time_delta) of the first tolerant match, or None."""
+        entries = self._rows.get((symbol, direction))
+        if not entries:
+            return None
+        times = self._times[(symbol, direction)]
+        lo = bisect.bisect_left(times, live_secs - time_window_s)
+        hi = bisect.bisect_right(times, live_secs + time_window_s)
+
+        best: Optional[Tuple[int, str, float, int]] = None
+        for secs, order, ref_id, ref_price in entries[lo:hi]:
+            if best is not None and order > best[0]:
+                continue
+            p_delta = abs(entry_price - ref_price) / ref_price
+            if p_delta > price_tolerance:
+                continue
+            best = (order, ref_id, p_delta, abs(live_secs - secs))
+        return best[1:] if best is not None else None
+
+
 # ---------------------------------------------------------------------------
 # Signal mismatch / halt events
 # ---------------------------------------------------------------------------
@@ -348,6 +408,9 @@ class StrategyGuard:
         self.rolling_results: Deque[float]  = deque(maxlen=config.rolling_window_trades)
         self.events:         List[GuardEvent] = []
 
+        # Signal lookup structures (validate_signal)
+        self._signal_refs = _SignalReferenceIndex(baseline.signal_index, baseline.signal_details)
+
     # ------------------------------------------------------------------
     # Factory
     # ------------------------------------------------------------------
@@ -564,33 +627,24 @@ class StrategyGuard:
             return SignalResult(status="EXACT_MATCH", hash=live_hash)
 
         # Tier 1: Exact hash match
-        if live_hash in self.baseline.signal_index.values():
+        if live_hash in self._signal_refs.hashes:
             logger.debug("[GUARD] EXACT_MATCH  hash=%s", live_hash)
             return SignalResult(status="EXACT_MATCH", hash=live_hash)
 
-        # Tier 2: Tolerant match against signal_details
-        if self.baseline.signal_details:
-            live_ts = _normalize_hash_timestamp(entry_timestamp)
-            for ref_id, ref in self.baseline.signal_details.items():
-                if ref["symbol"] != symbol or ref["direction"] != direction:
-                    continue
-                ref_price = ref["entry_price"]
-                if ref_price == 0:
-                    continue
-                p_delta = abs(entry_price - ref_price) / ref_price
-                if p_delta > ptol:
-                    continue
-                # Time comparison
-                t_delta = _timestamp_diff_seconds(live_ts, ref["entry_ts"])
-                if t_delta is not None and t_delta <= tw:
-                    logger.info(
-                        "[GUARD] SOFT_MATCH  hash=%s  ref=%s  price_delta=%.6f  time_delta=%ds",
-                        live_hash, ref_id, p_delta, t_delta,
-                    )
-                    return SignalResult(
-                        status="SOFT_MATCH", hash=live_hash,
-                        matched_ref=ref_id, price_delta=p_delta, time_delta=float(t_delta),
-                    )
+        # Tier 2: Tolerant match — bisect the (symbol, direction) time window
+        live_secs = _epoch_seconds(_normalize_hash_timestamp(entry_timestamp))
+        if live_secs is not None:
+            match = self._signal_refs.soft_match(symbol, direction, live_secs, entry_price, ptol, tw)
+            if match is not None:
+                ref_id, p_delta, t_delta = match
+                logger.info(
+                    "[GUARD] SOFT_MATCH  hash=%s  ref=%s  price_delta=%.6f  time_delta=%ds",
+                    live_hash, ref_id, p_delta, t_delta,
+                )
+                return SignalResult(
+                    status="SOFT_MATCH", hash=live_hash,
+                    matched_ref=ref_id, price_delta=p_delta, time_delta=float(t_delta),
+                )
 
         # No match — but if this is a genuinely new signal (not in backtest period),
         # we should not block it. Check if it's beyond the last backtest trade.
@@ -776,15 +830,28 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+
+def _epoch_seconds(ts: str) -> Optional[int]:
+    """Whole seconds since the epoch for a normalized "%Y-%m-%d %H:%M:%S" string.
+
+    Returns None if the timestamp cannot be parsed.
+    """
+    try:
+        return (datetime.strptime(ts.strip(), "%Y-%m-%d %H:%M:%S") - _EPOCH) // _ONE_SECOND
+    except (ValueError, AttributeError):
+        return None
+
+
 def _timestamp_diff_seconds(ts_a: str, ts_b: str) -> Optional[int]:
     """Compute absolute difference in seconds between two timestamp strings.
 
     Returns None if either timestamp cannot be parsed.
     """
-    try:
-        fmt = "%Y-%m-%d %H:%M:%S"
-        a = datetime.strptime(ts_a.strip(), fmt)
-        b = datetime.strptime(ts_b.strip(), fmt)
-        return abs(int((a - b).total_seconds()))
-    except (ValueError, AttributeError):
+    a = _epoch_seconds(ts_a)
+    b = _epoch_seconds(ts_b)
+    if a is None or b is None:
         return None
+    return abs(a - b)
@@ -0,0 +1,103 @@
+"""Active-run index (tools/orchestration/active_run_index.py).
+
+Contract: PipelineStateManager writes keep runs/active_runs.json listing
+exactly the non-terminal runs with their latest heartbeat; stale-run
+recovery opens only indexed runs, aborts the verified-stale ones and
+prunes entries whose state file is gone; a missing or corrupt index is
+rebuilt from disk.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import tools.orchestration.active_run_index as ari
+import tools.orchestration.run_watchdog as rw
+import tools.pipeline_utils as pu
+
+
+@pytest.fixture
+def runs(tmp_path, monkeypatch):
+    runs_dir = tmp_path / "runs"
+    runs_dir.mkdir()
+    for mod in (ari, rw, pu):
+        monkeypatch.setattr(mod, "RUNS_DIR", runs_dir)
+    return runs_dir
+
+
+def _rid(n: int) -> str:
+    return f"{n:024x}"
+
+
+def _write_state(runs_dir, run_id, state, heartbeat_ts=None):
+    data = {"run_id": run_id, "directive_id": None, "current_state": state, "history": []}
+    if heartbeat_ts is not None:
+        data["heartbeat_ts"] = heartbeat_ts
+    (runs_dir / run_id).mkdir(parents=True, exist_ok=True)
+    (runs_dir / run_id / "run_state.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_state_manager_maintains_index(runs):
+    mgr = pu.PipelineStateManager(_rid(1))
+    mgr.initialize()
+    assert ari.load_active_runs(runs)[_rid(1)]["current_state"] == "IDLE"
+
+    mgr.transition_to("PREFLIGHT_COMPLETE")
+    mgr.record_heartbeat()
+    entry = ari.load_active_runs(runs)[_rid(1)]
+    assert entry["current_state"] == "PREFLIGHT_COMPLETE"
+    assert entry["heartbeat_ts"] == mgr.get_state_data()["heartbeat_ts"]
+
+    other = pu.PipelineStateManager(_rid(2))
+    other.initialize()
+    mgr.transition_to("FAILED")
+    assert set(ari.load_active_runs(runs)) == {_rid(2)}
+
+
+def test_missing_index_is_seeded_from_disk(runs):
+    _write_state(runs, _rid(1), "STAGE_1_COMPLETE")
+    _write_state(runs, _rid(2), "COMPLETE")
+    pu.PipelineStateManager(_rid(3)).initialize()
+    assert set(ari.load_active_runs(runs)) == {_rid(1), _rid(3)}
+
+
+def test_recovery_reads_only_indexed_runs(runs, capsys):
+    now = datetime.now(timezone.utc).timestamp()
+    stale, fresh, vanished = _rid(1), _rid(2), _rid(3)
+    _write_state(runs, stale, "STAGE_1_COMPLETE", heartbeat_ts=now - 3600)
+    _write_state(runs, fresh, "STAGE_2_COMPLETE", heartbeat_ts=now)
+    _write_state(runs, vanished, "STAGE_1_COMPLETE", heartbeat_ts=now - 3600)
+    for n in range(10, 40):
+        _write_state(runs, _rid(n), "COMPLETE")
+    assert set(ari.rebuild_active_run_index(runs)) == {stale, fresh, vanished}
+
+    # Terminal runs are never opened again: corrupting them must go unnoticed.
+    for n in range(10, 40):
+        (runs / _rid(n) / "run_state.json").write_text("{not json", encoding="utf-8")
+    (runs / vanished / "run_state.json").unlink()
+
+    rw.recover_stale_runs(threshold_minutes=10)
+    out = capsys.readouterr().out
+    assert "Failed to parse" not in out and "Recovered 1 stale" in out
+    assert pu.PipelineStateManager(stale).get_state_data()["current_state"] == "ABORTED"
+    assert pu.PipelineStateManager(fresh).get_state_data()["current_state"] == "STAGE_2_COMPLETE"
+    assert set(ari.load_active_runs(runs)) == {fresh}
+
+
+def test_corrupt_index_rebuilds_and_cli(runs, capsys):
+    now = datetime.now(timezone.utc).timestamp()
+    _write_state(runs, _rid(1), "STAGE_3_COMPLETE", heartbeat_ts=now - 3600)
+    ari.index_path(runs).write_text("garbage", encoding="utf-8")
+    assert ari.load_active_runs(runs) is None
+
+    rw.recover_stale_runs(threshold_minutes=10)
+    assert "rebuilding from disk" in capsys.readouterr().out
+    assert pu.PipelineStateManager(_rid(1)).get_state_data()["current_state"] == "ABORTED"
+    assert ari.load_active_runs(runs) == {}
+
+    _write_state(runs, _rid(2), "STAGE_1_COMPLETE")
+    assert ari.main(["--rebuild"]) == 0
+    assert _rid(2) in capsys.readouterr().out
+    assert set(ari.load_active_runs(runs)) == {_rid(2)}
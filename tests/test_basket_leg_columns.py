@@ -0,0 +1,63 @@
+"""Per-leg column arrays handed to recycle rules (tools/basket_runner.py).
+
+Contract: `BasketLeg.value(col, bar_ts)` returns exactly what
+`leg.df.loc[bar_ts, col]` returns — from the pre-materialized LegColumns
+array when the runner's cursor is on `bar_ts`, label-based otherwise.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.basket_runner import BasketLeg, LegColumns
+
+
+def _frame(n: int = 50) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2025-01-01", periods=n, freq="5min")
+    close = 1.1 + rng.normal(0, 1e-3, n).cumsum()
+    return pd.DataFrame({
+        "close": close,
+        "high": close + 1e-4,
+        "flag": np.arange(n) % 2 == 0,
+        "label": ["a", "b"] * (n // 2),
+    }, index=idx)
+
+
+def _leg(df: pd.DataFrame) -> BasketLeg:
+    return BasketLeg(symbol="EURUSD", lot=0.01, direction=1, df=df, strategy=None)
+
+
+def test_cursor_reads_match_label_lookup():
+    df = _frame()
+    aligned = df.index[5:45]
+    leg = _leg(df)
+    leg.columns = LegColumns(df, aligned)
+    for i, bar_ts in enumerate(aligned):
+        leg.columns.seek(i, bar_ts)
+        for col in ("close", "high", "flag", "label"):
+            got = leg.value(col, bar_ts)
+            want = df.loc[bar_ts, col]
+            assert got == want and type(got) is type(want)
+
+
+def test_off_cursor_and_detached_legs_fall_back_to_loc():
+    df = _frame()
+    leg = _leg(df)
+    assert leg.value("close", df.index[7]) == df.loc[df.index[7], "close"]
+
+    leg.columns = LegColumns(df, df.index)
+    leg.columns.seek(3, df.index[3])
+    # A helper asking about a different bar than the cursor's gets .loc semantics.
+    assert leg.value("close", df.index[9]) == df.loc[df.index[9], "close"]
+
+
+def test_missing_column_raises_keyerror():
+    df = _frame()
+    leg = _leg(df)
+    leg.columns = LegColumns(df, df.index)
+    leg.columns.seek(0, df.index[0])
+    assert "close" in leg.columns and "nope" not in leg.columns
+    with pytest.raises(KeyError):
+        leg.value("nope", df.index[0])
@@ -0,0 +1,171 @@
+"""Columnar trade ingestion (tools/capital/capital_events.py).
+
+Contract: load_sorted_events returns exactly the TradeEvents that
+load_trades -> build_events -> sort_events produce — same fields, same
+tz-aware UTC timestamps, same order including full ties — for mixed
+timestamp formats, optional recon columns and partial legs; malformed
+artifacts fail with the row path's errors.
+"""
+from __future__ import annotations
+
+import csv
+import random
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tools.capital import capital_events as ce
+
+FIELDS = ce.REQUIRED_COLUMNS + ce.OPTIONAL_RECON_COLUMNS
+
+
+def _fmt(dt: datetime, rng: random.Random) -> str:
+    """Render one instant in any of the shapes _parse_ts accepts."""
+    style = rng.randrange(7)
+    if style == 0:
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    if style == 1:
+        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if style == 2:
+        return dt.astimezone(timezone(timedelta(hours=2))).isoformat()
+    if style == 3:
+        return dt.astimezone(timezone(timedelta(hours=-5))).strftime("%Y-%m-%d %H:%M:%S%z")
+    if style == 4:
+        return f"  {dt.strftime('%Y-%m-%d %H:%M:%S')}.{rng.randrange(10**6):06d} "
+    if style == 5:
+        return dt.isoformat()
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _write_run(run_dir, rows, fields=FIELDS):
+    (run_dir / "raw").mkdir(parents=True)
+    with open(run_dir / "raw" / "results_tradelevel.csv", "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        w.writeheader()
+        w.writerows(rows)
+
+
+@pytest.fixture
+def runs(tmp_path):
+    rng = random.Random(11)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # A coarse grid forces many equal timestamps across runs and strategies.
+    slots = [base + timedelta(hours=4 * k) for k in range(60)]
+    run_dirs, partials = [], {}
+    for r in range(5):
+        strategy = f"S{r % 3}"  # duplicate strategy names across runs
+        rows = []
+        for i in range(80):
+            entry = rng.choice(slots[:-1])
+            exit_ = entry if rng.random() < 0.1 else rng.choice([s for s in slots if s >= entry])
+            row = {
+                "strategy_name": strategy,
+                "parent_trade_id": str(rng.randrange(60)),
+                "symbol": rng.choice(["EURUSD", "XAUUSD", "NAS100"]),
+                "entry_timestamp": _fmt(entry, rng),
+                "exit_timestamp": _fmt(exit_, rng),
+                "direction": rng.choice(["1", "-1", " 1"]),
+                "entry_price": repr(rng.uniform(1, 2000)),
+                "exit_price": repr(rng.uniform(1, 2000)),
+                "risk_distance": f"{rng.uniform(0.0001, 5):.5f}",
+            }
+            if r != 4:  # run 4 predates the recon columns
+                row.update({
+                    "initial_stop_price": rng.choice(["", "None", " none ", "1.2345", "nan"]),
+                    "atr_entry": rng.choice(["", "0.5", "3e-4"]),
+                    "r_multiple": rng.choice(["None", "-1.0", "2.25"]),
+                    "volatility_regime": rng.choice(["", " high", "low "]),
+                    "trend_regime": rng.choice(["", "up"]),
+                    "trend_label": rng.choice(["", " strong_up "]),
+                })
+            tid = f"{strategy}|{row['parent_trade_id']}"
+            if tid not in partials and rng.random() < 0.3:
+                partials[tid] = {"entry": entry, "exit": exit_}
+            rows.append(row)
+        run_dir = tmp_path / f"run{r}"
+        _write_run(run_dir, rows, FIELDS if r != 4 else ce.REQUIRED_COLUMNS)
+        run_dirs.append(run_dir)
+
+    legs = {}
+    for tid, w in partials.items():
+        # Only legs inside every same-id trade's window are valid for both paths.
+        legs[tid] = {"timestamp": w["entry"], "exit_price": 1.5, "fraction": 0.5, "pnl_usd_sidecar": 0.0}
+    return run_dirs, legs
+
+
+def _row_path(run_dirs, partials):
+    return ce.sort_events(ce.build_events(ce.load_trades(run_dirs), partials))
+
+
+def _dump(events):
+    # repr, not ==: a literal "nan" recon value must survive as float nan.
+    return [repr(asdict(e)) for e in events]
+
+
+def test_columnar_events_match_row_path(runs):
+    run_dirs, _ = runs
+    want = _row_path(run_dirs, None)
+    got = ce.load_sorted_events(run_dirs)
+    assert len(got) == len(want) == 2 * 400
+    assert _dump(got) == _dump(want)
+    assert all(e.timestamp.tzinfo is timezone.utc for e in got)
+    assert len({e.timestamp for e in got}) < len(got) / 4  # ties were exercised
+
+
+def test_columnar_partials_match_row_path(runs):
+    run_dirs, legs = runs
+    trades = ce.load_trades(run_dirs)
+    windows = {}
+    for t in trades:
+        tid = f"{t['strategy_name']}|{t['parent_trade_id']}"
+        lo, hi = ce._parse_ts(t["entry_timestamp"]), ce._parse_ts(t["exit_timestamp"])
+        cur = windows.get(tid, (lo, hi))
+        windows[tid] = (max(cur[0], lo), min(cur[1], hi))
+    legs = {tid: pl for tid, pl in legs.items() if windows[tid][0] <= windows[tid][1]}
+    for tid, pl in legs.items():
+        pl["timestamp"] = windows[tid][0]
+    assert legs
+
+    want = _row_path(run_dirs, legs)
+    got = ce.load_sorted_events(run_dirs, legs)
+    assert _dump(got) == _dump(want)
+    assert sum(e.event_type == ce.EVENT_TYPE_PARTIAL for e in got) > len(legs)
+
+
+def test_parse_ts_array_matches_parse_ts():
+    values = [
+        "2024-03-01 08:00:00", "2024-03-01T08:00:00Z", "2024-03-01", " 2024-03-01 08:00:00.5 ",
+        "2024-03-01T10:00:00+02:00", "2024-03-01 08:00:00+0000", "2024-03-01T08:00:00-0130",
+        "1500-06-01 00:00:00", "2024-03-01T08:00:00.123456789",
+    ]
+    got = ce._parse_ts_array(values)
+    assert list(got) == [ce._epoch_us(ce._parse_ts(v)) for v in values]
+    with pytest.raises(ValueError, match="Cannot parse timestamp: '2024-02-30 00:00:00'"):
+        ce._parse_ts_array(["2024-03-01", "2024-02-30 00:00:00"])
+
+
+def test_columnar_load_errors(tmp_path):
+    row = {c: "1" for c in ce.REQUIRED_COLUMNS}
+    row.update(entry_timestamp="2024-01-01", exit_timestamp="2024-01-02", parent_trade_id="7")
+
+    with pytest.raises(FileNotFoundError, match="Missing trade artifact"):
+        ce.load_trade_table([tmp_path / "nope"])
+
+    _write_run(tmp_path / "a", [row], [c for c in ce.REQUIRED_COLUMNS if c != "symbol"])
+    with pytest.raises(ValueError, match=r"missing required columns: \['symbol'\]"):
+        ce.load_trade_table([tmp_path / "a"])
+
+    _write_run(tmp_path / "b", [row, dict(row, parent_trade_id="8", exit_price=" None", risk_distance="")])
+    with pytest.raises(ValueError, match="trade 8 has empty required field: 'exit_price'"):
+        ce.load_trade_table([tmp_path / "b"])
+
+    trades = ce.load_trade_table([])
+    assert ce.events_from_table(ce.build_event_table(trades)) == []
+
+    _write_run(tmp_path / "c", [row])
+    trades = ce.load_trade_table([tmp_path / "c"])
+    bad = {"1|7": {"timestamp": datetime(2023, 1, 1, tzinfo=timezone.utc),
+                   "exit_price": 1.0, "fraction": 0.5, "pnl_usd_sidecar": 0.0}}
+    with pytest.raises(ValueError, match="outside"):
+        ce.build_event_table(trades, bad)
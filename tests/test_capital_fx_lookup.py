@@ -0,0 +1,98 @@
+"""Array-backed FX conversion lookup (tools/capital/capital_fx.py).
+
+Contract: ConversionLookup.load builds sorted datetime64/float arrays in
+one pass; get_rate returns exactly what the original per-row
+(date, rate) list + bisect lookup returned, and get_rates answers a whole
+batch of timestamps with the same values.
+"""
+from __future__ import annotations
+
+import bisect
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_access.readers.research_data_reader as rdr
+from tools.capital.capital_fx import CONVERSION_MAP, ConversionLookup
+
+
+def _bars(seed: int, n: int = 400) -> pd.DataFrame:
+    rng = random.Random(seed)
+    start = datetime(2019, 1, 1)
+    days = sorted(rng.sample(range(n * 2), n))  # gaps = weekends/holidays
+    stamps = [start + timedelta(days=d, hours=rng.choice([0, 21, 23])) for d in days]
+    rng.shuffle(stamps)  # the loader sorts
+    close = [rng.choice([0.0, rng.uniform(0.5, 160)]) if i % 97 == 0 else rng.uniform(0.5, 160)
+             for i in range(n)]
+    return pd.DataFrame({"timestamp": pd.to_datetime(stamps), "close": close})
+
+
+def _reference(df: pd.DataFrame, inverted: bool):
+    """The original iterrows + bisect implementation, kept as the oracle."""
+    entries = []
+    for _, row in df.iterrows():
+        ts = pd.to_datetime(row.get("timestamp", row.get("date")), utc=True)
+        close = float(row["close"])
+        rate = (1.0 / close if close != 0 else 0.0) if inverted else close
+        entries.append((ts.date(), rate))
+    entries.sort(key=lambda x: x[0])
+    dates = [e[0] for e in entries]
+
+    def get_rate(lookup_input):
+        d = ConversionLookup._normalize_lookup_date(lookup_input)
+        return entries[max(bisect.bisect_right(dates, d) - 1, 0)][1]
+    return get_rate
+
+
+@pytest.fixture
+def lookup(monkeypatch):
+    frames = {pair: _bars(i) for i, (pair, _) in enumerate(v for v in CONVERSION_MAP.values() if v)}
+    monkeypatch.setattr(rdr, "load_research_data", lambda symbol, **kw: frames[symbol].copy())
+    conv = ConversionLookup()
+    conv.load({"USD", "JPY", "EUR", "GBP"})
+    return conv, frames
+
+
+def _probes(rng: random.Random):
+    utc_plus = timezone(timedelta(hours=5, minutes=30))
+    base = datetime(2018, 12, 1)
+    out = []
+    for _ in range(300):
+        t = base + timedelta(minutes=rng.randrange(60 * 24 * 900))
+        out.append(rng.choice([t, t.replace(tzinfo=timezone.utc), t.replace(tzinfo=utc_plus), t.date()]))
+    return out
+
+
+def test_get_rate_matches_bisect_reference(lookup):
+    conv, frames = lookup
+    probes = _probes(random.Random(5))
+    for ccy in ("JPY", "EUR", "GBP"):
+        pair, inverted = CONVERSION_MAP[ccy]
+        ref = _reference(frames[pair], inverted)
+        got = [conv.get_rate(ccy, p) for p in probes]
+        assert got == [ref(p) for p in probes]
+        assert all(type(r) is float for r in got)
+    assert conv.get_rate("USD", date(2020, 1, 1)) == 1.0
+    assert conv.get_rate("CHF", date(2020, 1, 1)) is None
+    with pytest.raises(TypeError):
+        conv.get_rate("JPY", "2020-01-01")
+
+
+def test_get_rates_batch_matches_get_rate(lookup):
+    conv, _ = lookup
+    probes = _probes(random.Random(9))
+    for ccy in ("JPY", "EUR"):
+        want = [conv.get_rate(ccy, p) for p in probes]
+        assert conv.get_rates(ccy, probes).tolist() == want
+        aware = [p for p in probes if isinstance(p, datetime) and p.tzinfo is not None]
+        series = pd.Series(pd.to_datetime(aware, utc=True))
+        assert conv.get_rates(ccy, series).tolist() == [conv.get_rate(ccy, p) for p in aware]
+    assert conv.get_rates("USD", probes[:4]).tolist() == [1.0] * 4
+    assert conv.get_rates("CHF", probes) is None
+    assert conv.get_rates("JPY", []).shape == (0,)
+    assert conv.get_rates("JPY", np.array(["2020-03-07"], dtype="datetime64[D]")).tolist() == [
+        conv.get_rate("JPY", date(2020, 3, 7))
+    ]
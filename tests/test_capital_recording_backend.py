@@ -0,0 +1,148 @@
+"""Opt-in columnar recording backend (tools/capital/capital_recording.py).
+
+Contract: a simulation run with columnar_recording=True reads back the
+same equity timeline, heat samples, closed-trade and rejection records as
+the default list recorders, and emit_profile_artifacts writes
+byte-identical CSVs and metrics from either backend.
+"""
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+import yaml
+
+from tools.capital import capital_artifacts
+from tools.capital.capital_broker_spec import BROKER_SPECS_ROOT
+from tools.capital.capital_events import build_events, sort_events
+from tools.capital.capital_portfolio_state import PROFILES
+from tools.capital.capital_recording import (
+    ColumnarLog,
+    EquityTimeline,
+    GrowableArray,
+    format_round2,
+)
+from tools.capital.capital_validation import _assert_partial_conservation
+from tools.capital_engine.simulation import run_simulation
+
+SYMBOLS = ["EURUSD", "GBPUSD", "USDJPY"]
+PRICES = {"EURUSD": 1.1, "GBPUSD": 1.27, "USDJPY": 140.0}
+
+
+def _trades(n: int, seed: int):
+    rng = random.Random(seed)
+    base = datetime(2019, 1, 1)
+    trades, legs = [], {}
+    for i in range(n):
+        sym = rng.choice(SYMBOLS)
+        entry = base + timedelta(hours=4 * rng.randrange(6000))
+        exit_ = entry + timedelta(hours=4 * rng.randrange(1, 60), microseconds=rng.choice([0, 250_000]))
+        px = PRICES[sym] * rng.uniform(0.95, 1.05)
+        trades.append({
+            "strategy_name": f"S{i % 4}", "parent_trade_id": str(i), "symbol": sym,
+            "entry_timestamp": entry.strftime("%Y-%m-%d %H:%M:%S"),
+            "exit_timestamp": exit_.isoformat(sep=" "),
+            "direction": rng.choice([1, -1]),
+            "entry_price": px, "exit_price": px * rng.uniform(0.99, 1.01),
+            "risk_distance": px * rng.uniform(0.001, 0.01),
+            "initial_stop_price": rng.choice([None, px * 0.99, float("nan")]),
+            "atr_entry": rng.choice([None, 0.002]), "r_multiple": None,
+            "volatility_regime": rng.choice(["", "high", "a,b"]),
+            "trend_regime": "", "trend_label": "",
+        })
+        if rng.random() < 0.2:
+            legs[f"S{i % 4}|{i}"] = {
+                "timestamp": (entry + (exit_ - entry) / 2).replace(tzinfo=timezone.utc),
+                "exit_price": px, "fraction": 0.5, "pnl_usd_sidecar": 0.0,
+            }
+    return trades, legs
+
+
+@pytest.fixture(scope="module")
+def simulated():
+    trades, legs = _trades(1500, 3)
+    events = sort_events(build_events(trades, legs))
+    specs = {}
+    for sym in SYMBOLS:
+        with open(BROKER_SPECS_ROOT / f"{sym}.yaml", encoding="utf-8") as f:
+            specs[sym] = yaml.safe_load(f)
+    lists = run_simulation(events, specs, profiles=PROFILES)
+    cols = run_simulation(events, specs, profiles=PROFILES, columnar_recording=True)
+    return lists, cols, legs
+
+
+def _same(a, b) -> bool:
+    # repr, not ==: float nan recon values must survive the round trip.
+    return repr(a) == repr(b)
+
+
+def test_columnar_state_reads_back_like_lists(simulated):
+    lists, cols, legs = simulated
+    assert sum(len(s.rejection_log) for s in lists.values()) > 0
+    for name, ls in lists.items():
+        cs = cols[name]
+        assert isinstance(cs.equity_timeline, EquityTimeline)
+        assert isinstance(cs.closed_trades_log, ColumnarLog)
+        assert cs.equity == ls.equity and cs.max_drawdown_usd == ls.max_drawdown_usd
+        assert list(cs.equity_timeline) == ls.equity_timeline
+        assert cs.equity_timeline[-1] == ls.equity_timeline[-1]
+        assert list(cs.heat_samples) == ls.heat_samples
+        assert _same(list(cs.closed_trades_log), ls.closed_trades_log)
+        assert _same(list(cs.rejection_log), ls.rejection_log)
+        if ls.closed_trades_log:
+            assert _same(cs.closed_trades_log[0], ls.closed_trades_log[0])
+    assert any("partial_fraction" in t for s in lists.values() for t in s.closed_trades_log)
+    _assert_partial_conservation(cols, legs)
+
+
+def test_columnar_artifacts_are_byte_identical(simulated, tmp_path, monkeypatch):
+    lists, cols, _ = simulated
+    monkeypatch.setattr(capital_artifacts, "plot_equity_curve", lambda *a, **k: None)
+    for name in lists:
+        m_list = capital_artifacts.emit_profile_artifacts(lists[name], tmp_path / "l" / name, 4, 3)
+        m_cols = capital_artifacts.emit_profile_artifacts(cols[name], tmp_path / "c" / name, 4, 3)
+        assert m_cols == m_list
+        for fname in ("equity_curve.csv", "deployable_trade_log.csv", "rejection_log.csv"):
+            left, right = tmp_path / "l" / name / fname, tmp_path / "c" / name / fname
+            assert left.exists() == right.exists()
+            if left.exists():
+                assert right.read_bytes() == left.read_bytes(), (name, fname)
+
+
+def test_format_round2_matches_round():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.normal(0, 1e4, 20_000), np.round(rng.normal(0, 1e3, 2000), 3),
+        np.arange(-2000, 2000) / 1000 + 0.0005, rng.normal(0, 1e12, 2000),
+        [0.0, -0.0, 0.005, 0.015, 0.125, -0.004, 1e13 + 0.5, 3e17, math.inf, -math.inf, math.nan],
+    ])
+    assert format_round2(values).tolist() == [str(round(v, 2)) for v in values.tolist()]
+
+
+def test_containers_keep_list_semantics():
+    buf = GrowableArray(np.int64, capacity=2)
+    for i in range(10):
+        buf.append(i)
+    assert len(buf) == 10 and buf[-1] == 9 and buf[2:4] == [2, 3] and list(buf) == list(range(10))
+
+    log = ColumnarLog({"x": float})
+    log.append({"id": "a", "x": 1.0})
+    log.append({"id": "b", "x": 2, "extra": True})  # int demotes the float column
+    log.append({"id": "c", "x": None})
+    assert list(log) == [{"id": "a", "x": 1.0}, {"id": "b", "x": 2, "extra": True}, {"id": "c", "x": None}]
+    assert type(log[1]["x"]) is int and log.column("extra") == [None, True, None]
+    with pytest.raises(IndexError):
+        log[3]
+
+    tl = EquityTimeline()
+    tl.append((datetime(2020, 1, 1, tzinfo=timezone.utc), 1))
+    assert tl[0] == (datetime(2020, 1, 1, tzinfo=timezone.utc), 1.0)
+    tl.append((datetime(2020, 1, 2), 1.0))
+    with pytest.raises(ValueError, match="mix naive"):
+        len(tl.equity())
+    tl.append((datetime(2020, 1, 2, tzinfo=timezone(timedelta(hours=1))), 1.0))
+    with pytest.raises(ValueError, match="UTC timestamps only"):
+        list(tl)
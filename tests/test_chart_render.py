@@ -0,0 +1,107 @@
+"""Chart render service + min/max decimation (tools/chart_render.py).
+
+Contract: decimate_minmax keeps at most max_points points, always the
+first/last point and every bucket's minimum and maximum (so global
+extremes survive); capital and portfolio charts render to the same PNG
+paths inline or through a ChartRenderService pool, and drain() surfaces
+render failures.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.capital import capital_plotting as cp
+from tools.chart_render import ChartRenderService, decimate_minmax, minmax_indices
+
+
+def _walk(n: int, seed: int = 0) -> np.ndarray:
+    return 10_000 + np.cumsum(np.random.default_rng(seed).normal(size=n))
+
+
+def test_minmax_indices_match_bucket_reference():
+    y = _walk(100_003)
+    keep = minmax_indices(y, 1000)
+    assert len(keep) <= 1000 and keep[0] == 0 and keep[-1] == len(y) - 1
+    assert np.all(np.diff(keep) > 0)
+
+    n_buckets = (1000 - 2) // 2
+    bucket = np.arange(len(y)) * n_buckets // len(y)
+    for b in range(n_buckets):
+        seg, kept = y[bucket == b], y[keep[bucket[keep] == b]]
+        assert seg.min() in kept and seg.max() in kept
+
+    x = np.arange(len(y))
+    dx, dy = decimate_minmax(x, y, 1000)
+    assert dy.min() == y.min() and dy.max() == y.max()
+    assert np.array_equal(dy, y[dx])
+
+    short = _walk(50)
+    assert np.array_equal(decimate_minmax(np.arange(50), short)[1], short)
+
+
+def _state(name: str, n: int, seed: int):
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    eq = _walk(n, seed)
+    return SimpleNamespace(
+        profile_name=name, starting_capital=10_000.0,
+        equity_timeline=[(start + timedelta(minutes=37 * i), float(e)) for i, e in enumerate(eq)],
+    )
+
+
+def test_equity_payload_matches_daily_series():
+    state = _state("P1", 60_000, 1)
+    payload = cp.equity_curve_payload(state)
+    eq = pd.Series([e for _, e in state.equity_timeline],
+                   index=pd.to_datetime([t for t, _ in state.equity_timeline]))
+    daily = eq.resample("D").last().ffill()
+    assert payload["final_equity"] == daily.iloc[-1]
+    assert len(payload["eq_y"]) == len(daily)  # ~1.5k days: under the point budget
+    assert np.allclose(payload["eq_y"], daily.to_numpy())
+    assert payload["eq_x"].dtype.kind == "M"
+    assert cp.equity_curve_payload(SimpleNamespace(equity_timeline=[])) is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_capital_and_portfolio_charts_render(tmp_path, workers):
+    from tools.portfolio.portfolio_charts import generate_charts
+
+    states = {"REAL_MODEL_V1": _state("REAL_MODEL_V1", 5_000, 2), "FIXED": _state("FIXED", 5_000, 3)}
+    idx = pd.date_range("2020-01-01", periods=3_000, freq="D")
+    port = pd.Series(_walk(3_000, 4), index=idx)
+    syms = {s: pd.Series(_walk(3_000, k), index=idx) for k, s in enumerate(["EURUSD", "XAUUSD"])}
+    corr = {"corr_matrix": pd.DataFrame([[1.0, 0.2], [0.2, 1.0]], index=list(syms), columns=list(syms))}
+    contrib = {s: {"total_pnl": v} for s, v in zip(syms, [120.0, -40.0])}
+    stress = {"baseline": {"net_pnl": 80.0, "sharpe": 1.1, "return_dd": 2.0},
+              "remove_EURUSD": {"net_pnl": -40.0, "sharpe": -0.3, "return_dd": -0.5}}
+
+    with ChartRenderService(max_workers=workers) as charts:
+        for name, state in states.items():
+            (tmp_path / name).mkdir()
+            cp.plot_equity_curve(state, tmp_path / name, renderer=charts)
+        cp.plot_overlay_comparison(states, tmp_path, renderer=charts)
+        generate_charts(port, syms, corr, contrib, stress, tmp_path / "pf", "PF_TEST", renderer=charts)
+
+    pngs = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.png"))
+    assert pngs == [
+        "FIXED/equity_curve.png", "REAL_MODEL_V1/equity_curve.png", "overlay_comparison.png",
+        "pf/contribution_chart.png", "pf/correlation_matrix.png", "pf/drawdown_curve.png",
+        "pf/equity_curve.png", "pf/stress_test_chart.png",
+    ]
+
+
+def _boom(payload, out_path):
+    raise RuntimeError(f"render failed for {out_path}")
+
+
+def test_drain_reraises_render_errors(tmp_path):
+    charts = ChartRenderService(max_workers=2)
+    charts.submit(_boom, {}, tmp_path / "x.png")
+    with pytest.raises(RuntimeError, match="render failed"):
+        charts.close()
+    with pytest.raises(RuntimeError, match="render failed"):
+        ChartRenderService(max_workers=1).submit(_boom, {}, tmp_path / "y.png")
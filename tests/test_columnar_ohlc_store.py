@@ -0,0 +1,189 @@
+"""Memory-mapped columnar OHLC store (data_access/readers/columnar_ohlc_store.py).
+
+Contract: with TS_COLUMNAR_OHLC=1 the Stage-1 and basket loaders read the
+RESEARCH year-files through the store and get frames identical to the CSV
+parse; a content change in any year-file rebuilds the store, a bare touch
+does not; data the .npy layout cannot hold exactly falls back to CSV.
+"""
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_access.readers.columnar_ohlc_store as cos
+import tools.basket_data_loader as bdl
+import tools.run_stage1 as rs1
+
+SYMBOL = "TESTSYM"
+
+
+def _write_year(research_dir, year, n=200, tf="5m", session=True):
+    ts = pd.date_range(f"{year}-01-02", periods=n, freq="5min")
+    rng = np.random.default_rng(year)
+    close = 1.1 + rng.normal(0, 1e-3, n).cumsum()
+    df = pd.DataFrame({
+        "time": ts.strftime("%Y-%m-%d %H:%M:%S"),
+        "open": close, "high": close + 1e-4, "low": close - 1e-4, "close": close,
+        "volume": rng.integers(1, 500, n),
+    })
+    if session:
+        df["session"] = np.where(np.arange(n) % 3 == 0, "asia", "london")
+        df.loc[5, "session"] = np.nan
+    path = research_dir / f"{SYMBOL}_OCTAFX_{tf}_{year}_RESEARCH.csv"
+    path.write_text("# header line\n" + df.to_csv(index=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def research_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cos, "STORE_ROOT", tmp_path / "store")
+    monkeypatch.setenv("TS_COLUMNAR_OHLC", "1")
+    cos._OPEN_STORES.clear()
+    cos._UNSUPPORTED.clear()
+    d = tmp_path / "data_root" / "MASTER_DATA" / f"{SYMBOL}_OCTAFX_MASTER" / "RESEARCH"
+    d.mkdir(parents=True)
+    for year in (2023, 2024):
+        _write_year(d, year)
+    yield d
+    cos._OPEN_STORES.clear()
+    cos._UNSUPPORTED.clear()
+
+
+PATTERN = f"{SYMBOL}_OCTAFX_5m_*_RESEARCH.csv"
+
+
+def test_disabled_by_default(research_dir, monkeypatch):
+    monkeypatch.delenv("TS_COLUMNAR_OHLC")
+    assert cos.open_store(research_dir, PATTERN) is None
+
+
+def test_frames_match_csv_parse(research_dir):
+    store = cos.open_store(research_dir, PATTERN)
+    assert store is not None
+    files = sorted(research_dir.glob(PATTERN))
+    expected = pd.concat([pd.read_csv(f, comment="#") for f in files], ignore_index=True)
+    pd.testing.assert_frame_equal(store.frame(), expected, check_exact=True)
+    for f in files:
+        want = pd.read_csv(f, comment="#", parse_dates=["time"])
+        got = store.source_frame(f.name, parse_time=True)
+        pd.testing.assert_frame_equal(got, want, check_exact=True)
+
+
+def test_touch_keeps_store_content_change_rebuilds(research_dir):
+    store = cos.open_store(research_dir, PATTERN)
+    target = research_dir / f"{SYMBOL}_OCTAFX_5m_2024_RESEARCH.csv"
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cos.open_store(research_dir, PATTERN).content_dir == store.content_dir
+
+    _write_year(research_dir, 2024, n=150)
+    rebuilt = cos.open_store(research_dir, PATTERN)
+    assert rebuilt.content_dir != store.content_dir
+    assert rebuilt.nrows == 350
+
+
+@pytest.mark.parametrize("start,end", [
+    ("2024-01-02", "2024-01-03"),
+    ("2020-01-01", "2023-01-02 03:00"),   # warm-up clipped at row 0
+    ("2025-01-01", "2030-01-01"),         # no bar after START: no warm-up
+    ("2024-01-03", "2023-06-01"),         # END before START: empty
+])
+def test_stage1_load_market_data_identical(research_dir, monkeypatch, start, end):
+    monkeypatch.setattr(rs1, "PROJECT_ROOT", research_dir.parents[3])
+    monkeypatch.setattr(rs1, "BROKER", "OctaFx")
+    monkeypatch.setattr(rs1, "TIMEFRAME", "5m")
+    monkeypatch.setattr(rs1, "START_DATE", start)
+    monkeypatch.setattr(rs1, "END_DATE", end)
+    monkeypatch.setattr(rs1, "RESOLVED_WARMUP_BARS", 20)
+
+    rs1.clear_shared_preprocessing_cache()
+    via_store = rs1.load_market_data(SYMBOL)
+    assert cos._OPEN_STORES  # served by the store, not the CSV fallback
+    monkeypatch.delenv("TS_COLUMNAR_OHLC")
+    rs1.clear_shared_preprocessing_cache()
+    via_csv = rs1.load_market_data(SYMBOL)
+    rs1.clear_shared_preprocessing_cache()
+    pd.testing.assert_frame_equal(via_store, via_csv, check_exact=True)
+
+
+def test_rows_between_matches_time_mask(research_dir):
+    store = cos.open_store(research_dir, PATTERN)
+    for which, start, end in [
+        ("utc", "2023-01-02 01:00", "2024-01-02 02:00"),
+        ("naive", "2023-01-02 00:02", None),
+        ("utc", None, pd.Timestamp("2024-01-02 03:00", tz="Europe/Berlin")),
+    ]:
+        times = store.time_values(which)
+        mask = np.ones(len(times), dtype=bool)
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        rows = store.rows_between(which, start, end)
+        assert np.flatnonzero(mask).tolist() == list(range(store.nrows))[rows]
+
+
+def test_stage1_window_decodes_only_the_window(research_dir, monkeypatch):
+    monkeypatch.setattr(rs1, "PROJECT_ROOT", research_dir.parents[3])
+    monkeypatch.setattr(rs1, "BROKER", "OctaFx")
+    monkeypatch.setattr(rs1, "TIMEFRAME", "5m")
+    monkeypatch.setattr(rs1, "START_DATE", "2024-01-02 05:00")
+    monkeypatch.setattr(rs1, "END_DATE", "2024-01-02 06:00")
+    monkeypatch.setattr(rs1, "RESOLVED_WARMUP_BARS", 10)
+    cos.open_store(research_dir, PATTERN)  # build (and its full verification) up front
+    decoded = []
+    real_frame = cos.ColumnarOhlcStore.frame
+
+    def spy(self, rows=slice(None)):
+        decoded.append(rows.indices(self.nrows))
+        return real_frame(self, rows)
+
+    monkeypatch.setattr(cos.ColumnarOhlcStore, "frame", spy)
+    rs1.clear_shared_preprocessing_cache()
+    df = rs1.load_market_data(SYMBOL)
+    rs1.clear_shared_preprocessing_cache()
+    assert decoded == [(250, 273, 1)]   # 200 rows of 2023, 60 bars to 05:00, 10 warm-up
+    assert len(df) == 23
+
+
+def test_out_of_order_rows_fall_back_to_full_history(research_dir, monkeypatch):
+    path = research_dir / f"{SYMBOL}_OCTAFX_5m_2024_RESEARCH.csv"
+    df = pd.read_csv(path, comment="#")
+    path.write_text("# header line\n" + df.iloc[::-1].to_csv(index=False), encoding="utf-8")
+    store = cos.open_store(research_dir, PATTERN)
+    assert store.rows_between("utc", "2024-01-02", None) is None
+    assert not store.time_text_increasing
+
+    monkeypatch.setattr(rs1, "PROJECT_ROOT", research_dir.parents[3])
+    monkeypatch.setattr(rs1, "BROKER", "OctaFx")
+    monkeypatch.setattr(rs1, "TIMEFRAME", "5m")
+    monkeypatch.setattr(rs1, "START_DATE", "2024-01-02 05:00")
+    monkeypatch.setattr(rs1, "END_DATE", "2024-01-02 06:00")
+    rs1.clear_shared_preprocessing_cache()
+    via_store = rs1.load_market_data(SYMBOL)
+    monkeypatch.delenv("TS_COLUMNAR_OHLC")
+    rs1.clear_shared_preprocessing_cache()
+    via_csv = rs1.load_market_data(SYMBOL)
+    rs1.clear_shared_preprocessing_cache()
+    pd.testing.assert_frame_equal(via_store, via_csv, check_exact=True)
+
+
+def test_basket_year_read_identical(research_dir, monkeypatch):
+    monkeypatch.setattr(bdl, "DATA_ROOT", research_dir.parents[2])
+    bdl.clear_year_file_cache()
+    via_store = bdl._read_year_csv_cached(SYMBOL, 2024, "5m")
+    monkeypatch.delenv("TS_COLUMNAR_OHLC")
+    bdl.clear_year_file_cache()
+    via_csv = bdl._read_year_csv_cached(SYMBOL, 2024, "5m")
+    bdl.clear_year_file_cache()
+    pd.testing.assert_frame_equal(via_store, via_csv, check_exact=True)
+
+
+def test_unrepresentable_columns_are_rejected():
+    assert cos._encode_column(pd.Series(["x", 1.5], dtype=object)) is None
+    assert cos._encode_column(pd.Series(pd.to_timedelta([1, 2], unit="s"))) is None
+    arr, mask, kind = cos._encode_column(pd.Series(["a", np.nan], dtype=object))
+    assert kind == "ascii" and mask.tolist() == [False, True]
@@ -0,0 +1,101 @@
+"""Drawdown anatomy (tools/utils/research/drawdown.py).
+
+Run-length episode detection must reproduce the original iterrows walk,
+and the interval-join attribution must equal analyze_dd_exposure /
+analyze_dd_trade_behavior evaluated per episode.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.utils.research.drawdown import (
+    analyze_dd_episodes,
+    analyze_dd_exposure,
+    analyze_dd_trade_behavior,
+    find_dd_episodes,
+    identify_dd_clusters,
+)
+
+
+def _reference_episodes(eq_df):
+    """The original per-row walk (chronological, before ranking)."""
+    eq = eq_df.copy()
+    eq["timestamp"] = pd.to_datetime(eq["timestamp"])
+    eq = eq.set_index("timestamp")
+    eq = eq[~eq.index.duplicated(keep="last")]
+    daily = eq["equity"].resample("D").last().ffill()
+    peak = daily.cummax()
+    dd_df = pd.DataFrame({"equity": daily, "peak": peak, "dd_pct": (peak - daily) / peak * 100})
+    dd_df["is_peak"] = dd_df["equity"] == dd_df["peak"]
+    periods, in_dd, start_dt, max_dd, trough_dt = [], False, None, 0.0, None
+    for dt, row in dd_df.iterrows():
+        if row["is_peak"]:
+            if in_dd:
+                periods.append({"start_date": start_dt, "trough_date": trough_dt, "recovery_date": dt,
+                                "max_dd_pct": max_dd, "duration_days": (dt - start_dt).days})
+                in_dd = False
+        elif not in_dd:
+            start_dt, in_dd, max_dd, trough_dt = dt, True, row["dd_pct"], dt
+        elif row["dd_pct"] > max_dd:
+            max_dd, trough_dt = row["dd_pct"], dt
+    if in_dd:
+        periods.append({"start_date": start_dt, "trough_date": trough_dt, "recovery_date": pd.NaT,
+                        "max_dd_pct": max_dd, "duration_days": (dd_df.index[-1] - start_dt).days})
+    return periods
+
+
+def _artifacts(seed=3, days=700, n_trades=600):
+    rng = np.random.default_rng(seed)
+    ts = pd.Timestamp("2022-01-03 09:00") + pd.to_timedelta(
+        np.sort(rng.integers(0, days * 24 * 60, 3000)), unit="min"
+    )
+    eq_df = pd.DataFrame({"timestamp": ts, "equity": 10_000 + rng.normal(2, 60, len(ts)).cumsum()})
+    entry = pd.Timestamp("2022-01-03") + pd.to_timedelta(rng.integers(0, days * 24 * 60, n_trades), unit="min")
+    exit_ = entry + pd.to_timedelta(rng.integers(30, 20 * 24 * 60, n_trades), unit="min")
+    tr_df = pd.DataFrame({
+        "entry_timestamp": entry.astype(str),
+        "exit_timestamp": exit_.astype(str),
+        "direction": rng.choice([1, -1], n_trades),
+        "symbol": rng.choice(["EURUSD", "GBPUSD", "USDJPY", "XAUUSD"], n_trades),
+        "pnl_usd": rng.normal(0, 30, n_trades),
+    })
+    return eq_df, tr_df
+
+
+@pytest.mark.parametrize("seed", [1, 3, 8])
+def test_episodes_match_iterrows_walk(seed):
+    eq_df, _ = _artifacts(seed=seed)
+    got = find_dd_episodes(eq_df)
+    want = _reference_episodes(eq_df)
+    assert len(got) == len(want) > 3
+    for g, w in zip(got, want):
+        assert g["start_date"] == w["start_date"] and g["trough_date"] == w["trough_date"]
+        assert (pd.isna(g["recovery_date"]) and pd.isna(w["recovery_date"])) or g["recovery_date"] == w["recovery_date"]
+        assert g["max_dd_pct"] == w["max_dd_pct"] and g["duration_days"] == w["duration_days"]
+
+
+def test_top_n_ranking_and_all_episodes():
+    eq_df, _ = _artifacts()
+    ranked = identify_dd_clusters(eq_df, top_n=None)
+    assert len(ranked) == len(find_dd_episodes(eq_df))
+    assert [c["max_dd_pct"] for c in ranked] == sorted((c["max_dd_pct"] for c in ranked), reverse=True)
+    assert identify_dd_clusters(eq_df, top_n=3) == ranked[:3]
+
+
+def test_interval_join_matches_per_episode_analysis():
+    eq_df, tr_df = _artifacts()
+    episodes = identify_dd_clusters(eq_df, top_n=None)
+    joined = analyze_dd_episodes(tr_df, episodes)
+    assert any(a["behavior"]["trades_closed"] > 0 for a in joined)
+    for ep, a in zip(episodes, joined):
+        assert a["exposure"] == analyze_dd_exposure(tr_df, ep)
+        assert a["behavior"] == analyze_dd_trade_behavior(tr_df, ep)
+
+
+def test_flat_or_rising_equity_has_no_episodes():
+    ts = pd.date_range("2024-01-01", periods=50, freq="D")
+    eq_df = pd.DataFrame({"timestamp": ts, "equity": np.arange(50, dtype=float) + 100})
+    assert find_dd_episodes(eq_df) == []
+    assert analyze_dd_episodes(pd.DataFrame(), []) == []
@@ -0,0 +1,152 @@
+"""Per-variant payload cache for the family report (tools/family_report.py).
+
+Contract: a family report rendered from cached variant payloads is
+identical to a fresh (use_cache=False) render; a regeneration with
+unchanged backtest artifacts loads no trade logs, and adding one new pass
+(or rewriting one variant's trade log) recomputes only that variant; a
+changed soft-gate threshold or producing-code fingerprint recomputes all.
+"""
+from __future__ import annotations
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tools.family_report as fr
+import tools.report.family_verdicts as fv
+import tools.ledger_db as ledger_mod
+from tools.ledger_db import create_tables
+
+PREFIX = "CACHEFAM"
+
+
+def _write_variant(backtests, strategy: str, seed: int, n: int = 1500) -> None:
+    rng = np.random.default_rng(seed)
+    raw = backtests / strategy / "raw"
+    raw.mkdir(parents=True, exist_ok=True)
+    entry = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        np.sort(rng.integers(0, 4 * 365 * 24 * 60, n)), unit="min")
+    exit_ = entry + pd.to_timedelta(rng.integers(5, 600, n), unit="min")
+    pnl = np.round(rng.normal(2, 40, n), 2)
+    pd.DataFrame({
+        "strategy_name": strategy, "parent_trade_id": np.arange(n), "symbol": "XAUUSD",
+        "entry_timestamp": entry.astype(str), "exit_timestamp": exit_.astype(str),
+        "direction": rng.choice([1, -1], n), "entry_price": 1800.0, "exit_price": 1801.0,
+        "pnl_usd": pnl, "r_multiple": pnl / 40,
+        "volatility_regime": rng.choice(["low", "normal", "high"], n),
+        "trend_label": rng.choice(["strong_up", "neutral", "strong_down"], n),
+        "trend_regime": rng.choice([-2, 0, 2], n),
+    }).to_csv(raw / "results_tradelevel.csv", index=False)
+    pd.DataFrame({"timestamp": exit_.astype(str), "equity": 10_000 + np.cumsum(pnl)}).to_csv(
+        raw / "equity_curve.csv", index=False)
+
+
+def _insert_row(db, strategy: str, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    fields = {
+        "run_id": f"r_{strategy}", "strategy": strategy, "symbol": "XAUUSD",
+        "total_trades": 1500, "max_dd_pct": float(rng.uniform(5, 40)),
+        "return_dd_ratio": float(rng.uniform(0, 4)), "sharpe_ratio": float(rng.uniform(0, 2)),
+        "sqn": float(rng.uniform(0, 3)), "profit_factor": float(rng.uniform(0.9, 1.6)),
+        "trade_density": 300.0, "expectancy": 2.0,
+        "test_start": "2020-01-01", "test_end": "2023-12-31",
+    }
+    conn = sqlite3.connect(str(db))
+    conn.execute(
+        f"INSERT INTO master_filter ({','.join(fields)}) VALUES ({','.join('?' * len(fields))})",
+        tuple(fields.values()),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture()
+def family(tmp_path, monkeypatch):
+    db = tmp_path / "ledger.db"
+    conn = sqlite3.connect(str(db))
+    create_tables(conn)
+    conn.close()
+    backtests = tmp_path / "backtests"
+    monkeypatch.setattr(fr, "LEDGER_DB_PATH", db)
+    monkeypatch.setattr(ledger_mod, "LEDGER_DB_PATH", db)
+    monkeypatch.setattr(fr, "_BACKTESTS_DIR", backtests)
+    monkeypatch.setattr(fr, "_PAYLOAD_CACHE_DIR", tmp_path / "cache")
+
+    def add(pass_no: int) -> str:
+        strategy = f"{PREFIX}_S01_V1_P{pass_no:02d}_XAUUSD"
+        _write_variant(backtests, strategy, pass_no)
+        _insert_row(db, strategy, pass_no)
+        return strategy
+
+    loads: list[str] = []
+    real_load = fr._load_trade_log
+    monkeypatch.setattr(fr, "_load_trade_log",
+                        lambda d, s: loads.append(f"{d}_{s}") or real_load(d, s))
+    return add, loads, backtests, tmp_path
+
+
+def _report(tmp_path, name: str, **kw) -> str:
+    out = fr.generate_family_report(PREFIX, out_path=tmp_path / name, **kw)
+    return "\n".join(l for l in out.read_text(encoding="utf-8").splitlines()
+                     if "generated" not in l.lower())
+
+
+def test_cached_report_matches_fresh_and_skips_unchanged_variants(family):
+    add, loads, backtests, tmp_path = family
+    strategies = [add(p) for p in (1, 2, 3)]
+
+    first = _report(tmp_path, "a.md")
+    assert sorted(loads) == sorted(strategies)
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 3
+
+    loads.clear()
+    assert _report(tmp_path, "b.md") == first
+    assert loads == []
+
+    new = add(4)
+    loads.clear()
+    cached = _report(tmp_path, "c.md")
+    assert loads == [new]
+    loads.clear()
+    assert cached == _report(tmp_path, "fresh.md", use_cache=False)
+    assert len(loads) == 4
+    assert "## 15. Worst Drawdown Episode" in cached and " 00:00:00 |" in cached
+
+    # A rewritten trade log invalidates only that variant's entry.
+    _write_variant(backtests, strategies[1], 99)
+    loads.clear()
+    changed = _report(tmp_path, "d.md")
+    assert loads == [strategies[1]]
+    loads.clear()
+    assert changed == _report(tmp_path, "fresh2.md", use_cache=False)
+
+
+def test_corrupt_cache_entry_is_recomputed(family):
+    add, loads, _, tmp_path = family
+    strategy = add(1)
+    first = _report(tmp_path, "a.md")
+    (entry,) = (tmp_path / "cache").glob("*.json")
+    entry.write_text("{not json", encoding="utf-8")
+    loads.clear()
+    assert _report(tmp_path, "b.md") == first
+    assert loads == [strategy]
+
+
+@pytest.mark.parametrize("change", ["threshold", "code"])
+def test_threshold_or_code_change_invalidates(family, monkeypatch, change):
+    add, loads, _, tmp_path = family
+    strategies = [add(p) for p in (1, 2)]
+    _report(tmp_path, "a.md")
+    loads.clear()
+    _report(tmp_path, "b.md")
+    assert loads == []
+
+    if change == "threshold":
+        monkeypatch.setattr(fv, "_SOFT_TAIL_TOP5_THRESHOLD", 0.01)
+    else:
+        monkeypatch.setattr(fr, "_PAYLOAD_CODE_FINGERPRINT", "edited-logic")
+    cached = _report(tmp_path, "c.md")
+    assert sorted(loads) == sorted(strategies)
+    assert cached == _report(tmp_path, "fresh.md", use_cache=False)
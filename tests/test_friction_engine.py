@@ -0,0 +1,94 @@
+"""Array-based friction engine (tools/utils/research/friction.py).
+
+The cost matrix must reproduce the per-trade `_cost_per_trade` oracle for
+every slippage level, and the tier / sweep scenario dicts must equal what
+the original per-scenario iterrows path produced.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tools.utils.research.friction as fr
+
+
+def _trades(n=300, seed=2, with_lots=True):
+    rng = np.random.default_rng(seed)
+    symbols = rng.choice(["EURUSD", "USDJPY", "XAUUSD", "GBPJPY"], n)
+    entry = np.where(np.char.find(symbols.astype(str), "JPY") >= 0, 150.0, 1.1) + rng.normal(0, 0.01, n)
+    exit_ = entry + rng.normal(0, 0.005, n)
+    exit_[::17] = entry[::17]  # flat trades hit the lot-based branch
+    df = pd.DataFrame({
+        "symbol": symbols,
+        "entry_price": entry,
+        "exit_price": exit_,
+        "pnl_usd": rng.normal(5, 40, n),
+    })
+    if with_lots:
+        df["lot_size"] = rng.choice([0.01, 0.05, 0.1], n)
+    return df
+
+
+def _reference_scenario(tr_df, label, slippage_pips, base_net):
+    """Original iterrows implementation."""
+    adj = tr_df.copy()
+    adj["friction_cost"] = [fr._cost_per_trade(row, slippage_pips * 2) for _, row in adj.iterrows()]
+    adj["pnl_usd_adjusted"] = adj["pnl_usd"] - adj["friction_cost"]
+    net = adj["pnl_usd_adjusted"].sum()
+    wins = adj.loc[adj["pnl_usd_adjusted"] > 0, "pnl_usd_adjusted"].sum()
+    losses = abs(adj.loc[adj["pnl_usd_adjusted"] < 0, "pnl_usd_adjusted"].sum())
+    return {
+        "scenario": label,
+        "slippage_pips": slippage_pips,
+        "net_profit": net,
+        "pf": wins / losses if losses > 0 else 999.0,
+        "degradation_pct": (1 - net / base_net) * 100 if base_net != 0 else 0.0,
+        "avg_friction_cost": adj["friction_cost"].mean(),
+        "total_friction_cost": adj["friction_cost"].sum(),
+        "trade_count": len(adj),
+    }
+
+
+@pytest.mark.parametrize("with_lots", [True, False])
+def test_cost_matrix_matches_per_trade_oracle(with_lots):
+    df = _trades(with_lots=with_lots)
+    levels = [0.0, 0.3, 1.0, 2.5]
+    matrix = fr._friction_cost_matrix(df, levels)
+    for k, level in enumerate(levels):
+        oracle = np.array([fr._cost_per_trade(row, level) for _, row in df.iterrows()])
+        np.testing.assert_array_equal(matrix[k], oracle)
+
+
+def test_apply_friction_columns_unchanged():
+    df = _trades()
+    out = fr.apply_friction(df, slippage_pips=0.5)
+    expected = [fr._cost_per_trade(row, 1.0) for _, row in df.iterrows()]
+    assert out["friction_cost"].tolist() == expected
+    pd.testing.assert_series_equal(
+        out["pnl_usd_adjusted"], df["pnl_usd"] - out["friction_cost"], check_names=False,
+    )
+
+
+def test_tiers_and_sweep_match_reference():
+    fr.reset_config_cache()
+    df = _trades()
+    base_net = df["pnl_usd"].sum()
+    tiered = fr.run_tiered_friction(df)["tiers"]
+    for name, res in tiered.items():
+        costs = fr.get_tier_costs(name)
+        want = _reference_scenario(df, costs["label"], costs["slippage_pips"], base_net)
+        assert {k: v for k, v in res.items() if k != "tier"} == want
+
+    levels = list(np.linspace(0.0, 3.0, 25))
+    sweep = fr.run_friction_sweep(df, levels)
+    assert len(sweep) == 25
+    for res, level in zip(sweep, levels):
+        assert res == _reference_scenario(df, res["scenario"], level, base_net)
+
+
+def test_sweep_clamps_to_configured_bounds():
+    fr.reset_config_cache()
+    hi = fr._load_config().get("bounds", {}).get("max_pips", 3.0)
+    res = fr.run_friction_sweep(_trades(n=20), [hi + 5])
+    assert res[0]["slippage_pips"] == hi
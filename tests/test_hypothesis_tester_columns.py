@@ -0,0 +1,84 @@
+"""Columnar breakdowns in tools/hypothesis_tester.py.
+
+Trades are parsed once into _TradeColumns; every direction x categorical x
+session cell must hold exactly the PnLs (in trade order) the per-check list
+comprehensions selected, and matched-trade indices must agree with the
+per-trade _trade_matches_insight() filter.
+"""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import tools.hypothesis_tester as ht
+from tools.metrics_core import _safe_float, _safe_int
+
+
+def _trades(n=600, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        hour = rng.randrange(24)
+        direction = rng.choice([1, -1, "1", "-1", 0, ""])
+        # Late NY: longs strong, shorts a drag (late_ny_asymmetry candidate).
+        skew = (9 if direction in (1, "1") else -9) if hour >= 21 else 0
+        out.append({
+            "direction": direction,
+            "pnl_usd": str(round(rng.gauss(skew + 3, 25), 2)),
+            "entry_timestamp": "" if i % 29 == 0 else f"2024-03-{1 + i % 28:02d} {hour:02d}:15:00",
+            "volatility_regime": rng.choice(["high", "normal", "Low ", "", None, "1"]),
+            "trend_label": rng.choice(["strong_up", "weak_up", "neutral", "weak_down", "strong_down", None]),
+            "regime_age": rng.choice(["0", "1", "4", "12", "", None]),
+        })
+    return out
+
+
+@pytest.mark.parametrize("field", ["volatility_regime", "trend_label"])
+def test_direction_x_categorical_cells_match_comprehensions(field):
+    trades = _trades()
+    cols = ht._TradeColumns(trades)
+    cat_values = sorted({str(t.get(field, "")).strip().lower() for t in trades})
+    index = {v: j for j, v in enumerate(cat_values)}
+    codes = cols.direction_codes() * len(cat_values)
+    keys = codes + [index[v] for v in cols.labels(field)]
+    keys[cols.direction_codes() < 0] = -1
+    cells = ht._group_pnls(cols.pnl, keys)
+    for dir_code, dir_val in enumerate((1, -1)):
+        for raw in cat_values:
+            want = [_safe_float(t.get("pnl_usd", 0)) for t in trades
+                    if _safe_int(t.get("direction", 0)) == dir_val
+                    and str(t.get(field, "")).strip().lower() == raw]
+            assert cells.get(dir_code * len(cat_values) + index[raw], []) == want
+
+
+def test_session_cells_match_hour_parse():
+    trades = _trades(seed=3)
+    cols = ht._TradeColumns(trades)
+    by_session = ht._group_pnls(cols.pnl, cols.session)
+    for name, code in ht._SESSION_CODES.items():
+        want = []
+        for t in trades:
+            hour = ht._get_entry_hour(t)
+            if hour is not None and ht._classify_session_hour(hour) == name:
+                want.append(_safe_float(t.get("pnl_usd", 0)))
+        assert by_session.get(code, []) == want
+
+
+def test_matched_indices_agree_with_per_trade_filter():
+    trades = _trades(n=1500, seed=7)
+    insights = ht.extract_structured_insights(trades, 10_000.0)
+    assert any(i.eligible for i in insights)
+    cols = ht._TradeColumns(trades)
+    for ins in insights:
+        want = frozenset(i for i, t in enumerate(trades) if ht._trade_matches_insight(t, ins))
+        assert ht._matched_trade_indices(cols, ins) == want
+        if ins.eligible:
+            assert ins._matched_trade_indices == want
+
+
+def test_late_ny_short_drag_is_surfaced():
+    insights = ht.extract_structured_insights(_trades(n=3000, seed=11), 10_000.0)
+    late = [i for i in insights if i.hypothesis_class == "late_ny_asymmetry"]
+    assert late and late[0].secondary_value == -1 and late[0].bucket_net_pnl < 0
+    assert ht.extract_structured_insights([], 10_000.0) == []
@@ -0,0 +1,140 @@
+"""Persistent prior-evidence index (tools/idea_evaluation_gate.py).
+
+Contract: the indexed searches return exactly what the original full scans
+returned (same rows, same order) for every MODEL / asset class / signal
+version / idea filter; a section is rebuilt only when its own source files
+change; the index survives a process restart without re-reading sources.
+"""
+from __future__ import annotations
+
+import json
+import random
+
+import pandas as pd
+import pytest
+
+import tools.idea_evaluation_gate as gate
+from tools.idea_evaluation_gate import NAME_PATTERN, _row_asset_class, _row_signal_version, _safe_float
+
+MODELS = ["RSIAVG", "IMPULSE", "CHOCH"]
+SYMBOLS = ["EURUSD", "XAUUSD", "NAS100", "BTCUSD"]
+
+
+def _reference_run_summary(model, timeframe, asset_class, signal_version):
+    """The original iterrows scan, kept as the oracle."""
+    df = pd.read_csv(gate.RUN_SUMMARY_PATH, dtype={"run_id": str})
+    out = []
+    for _, row in df.iterrows():
+        sid = str(row.get("strategy_id", ""))
+        m = NAME_PATTERN.match(sid)
+        if not m or m.group("model") != model:
+            continue
+        if asset_class is not None and _row_asset_class(row, sid) != asset_class:
+            continue
+        if signal_version is not None and _row_signal_version(row) != signal_version:
+            continue
+        out.append((str(row.get("run_id", "")), _safe_float(row.get("avg_profit_factor")),
+                    str(row.get("timeframe", "")).lower() == timeframe.lower()))
+    return out
+
+
+def _reference_hypotheses(model, idea_id, asset_class, signal_version):
+    out = []
+    for entry in json.loads(gate.HYPOTHESIS_LOG_PATH.read_text(encoding="utf-8")):
+        m = NAME_PATTERN.match(entry["strategy"])
+        if not m or (m.group("model") != model and m.group("idea_id") != idea_id):
+            continue
+        if asset_class is not None and gate.classify_asset(entry["strategy"]) != asset_class:
+            continue
+        try:
+            sv = int(entry.get("signal_version", 1) or 1)
+        except (TypeError, ValueError):
+            sv = 1
+        if signal_version is not None and sv != signal_version:
+            continue
+        out.append((entry["strategy"], entry["decision"]))
+    return out
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    rng = random.Random(3)
+    rows = []
+    for i in range(300):
+        sym, tf = rng.choice(SYMBOLS), rng.choice(["1H", "4H"])
+        rows.append({
+            "run_id": f"{i:024x}",
+            "strategy_id": f"{rng.randint(10, 14)}_CONT_{sym}_{tf}_{rng.choice(MODELS)}_S01_V1_P00",
+            "status": rng.choice(["complete", "failed"]),
+            "symbols": sym if rng.random() > 0.2 else "",
+            "timeframe": tf,
+            "total_trades": rng.randint(0, 200),
+            "avg_profit_factor": rng.choice([rng.uniform(0.5, 2.0), None]),
+            "signal_version": rng.choice([1, 2, None]),
+        })
+    rows.append(dict(rows[0], strategy_id="not_a_strategy"))
+    pd.DataFrame(rows).to_csv(tmp_path / "run_summary.csv", index=False)
+    hyps = [{"strategy": r["strategy_id"], "hypothesis": "h", "decision": rng.choice(["ACCEPT", "REJECT"]),
+             "signal_version": rng.choice([1, 2, None, "bad"]), "result": {"pf": 1.1}} for r in rows[:120]]
+    (tmp_path / "hypothesis_log.json").write_text(json.dumps(hyps), encoding="utf-8")
+
+    monkeypatch.setattr(gate, "RUN_SUMMARY_PATH", tmp_path / "run_summary.csv")
+    monkeypatch.setattr(gate, "HYPOTHESIS_LOG_PATH", tmp_path / "hypothesis_log.json")
+    monkeypatch.setattr(gate, "EVIDENCE_INDEX_PATH", tmp_path / "idea_evidence_index.json")
+    monkeypatch.setattr(gate, "_research_memory_sources", lambda: [tmp_path / "rm.md"])
+    monkeypatch.setattr(gate, "_build_research_memory_section",
+                        lambda: {"entries": [], "parse_warnings": 0})
+    gate._evidence_cache.clear()
+    yield tmp_path
+    gate._evidence_cache.clear()
+
+
+@pytest.mark.parametrize("asset_class", [None, "FX", "XAU", "INDEX"])
+@pytest.mark.parametrize("signal_version", [None, 1, 2])
+def test_indexed_searches_match_full_scans(sources, asset_class, signal_version):
+    for model in MODELS + ["ABSENT"]:
+        got = [(r["run_id"], r["avg_profit_factor"], r["tf_match"])
+               for r in gate._search_run_summary(model, "1H", asset_class, signal_version)]
+        assert got == _reference_run_summary(model, "1H", asset_class, signal_version)
+        for idea_id in ("10", "12", "99"):
+            got = [(h["strategy"], h["decision"])
+                   for h in gate._search_hypothesis_log(model, idea_id, asset_class, signal_version)]
+            assert got == _reference_hypotheses(model, idea_id, asset_class, signal_version)
+
+
+def test_only_changed_section_rebuilds(sources, monkeypatch):
+    built = []
+    for name in ("_build_run_summary_section", "_build_hypothesis_log_section"):
+        real = getattr(gate, name)
+        monkeypatch.setattr(gate, name, lambda real=real, name=name: built.append(name) or real())
+
+    gate._search_run_summary("RSIAVG", "1H", "FX", 1)
+    gate._search_hypothesis_log("RSIAVG", "10", "FX", 1)
+    assert sorted(built) == ["_build_hypothesis_log_section", "_build_run_summary_section"]
+
+    built.clear()
+    for _ in range(5):
+        gate._search_run_summary("CHOCH", "4H", "XAU", 2)
+        gate._search_hypothesis_log("CHOCH", "11", None, 1)
+    assert built == []
+
+    hyps = json.loads(gate.HYPOTHESIS_LOG_PATH.read_text(encoding="utf-8"))
+    hyps.append({"strategy": "11_CONT_EURUSD_1H_CHOCH_S01_V1_P00", "decision": "REJECT"})
+    gate.HYPOTHESIS_LOG_PATH.write_text(json.dumps(hyps), encoding="utf-8")
+    assert ("11_CONT_EURUSD_1H_CHOCH_S01_V1_P00", "REJECT") in [
+        (h["strategy"], h["decision"]) for h in gate._search_hypothesis_log("CHOCH", "11", None, 1)
+    ]
+    gate._search_run_summary("CHOCH", "4H", "XAU", 2)
+    assert built == ["_build_hypothesis_log_section"]
+
+
+def test_index_persists_across_processes(sources, monkeypatch):
+    want = gate._search_run_summary("IMPULSE", "4H", "FX", None)
+    assert gate.EVIDENCE_INDEX_PATH.exists()
+
+    gate._evidence_cache.clear()  # a fresh process
+    monkeypatch.setattr(gate, "_build_run_summary_section", lambda: pytest.fail("rebuilt"))
+    assert gate._search_run_summary("IMPULSE", "4H", "FX", None) == want
+
+    counts = gate.refresh_evidence_index()
+    assert counts["run_summary"] == 300 and counts["research_memory"] == 0
@@ -0,0 +1,190 @@
+"""Opt-in indicator memoization layer (engines/indicator_cache.py).
+
+Contract: with TS_INDICATOR_CACHE unset every call goes straight to the
+indicator; when enabled, a hit is indistinguishable from a fresh computation
+(same values, dtype, index, name) and is a private copy. Keys include the
+indicator's semantic version hash plus an AST dump, so a logic edit --
+including an indentation-only one -- invalidates old entries while a
+comment edit does not.
+"""
+from __future__ import annotations
+
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import engines.indicator_cache as ic
+from indicators.volatility.atr import atr as raw_atr
+from indicators.trend.linreg_regime import linreg_regime as raw_linreg
+
+
+def _ohlc(n: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame({
+        "open": close, "high": close + 0.5, "low": close - 0.5, "close": close,
+    }, index=pd.date_range("2025-01-01", periods=n, freq="1h", tz="UTC"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(ic, "INDICATOR_CACHE_DIR", tmp_path / "indicator_cache")
+    ic.clear_memory_cache()
+    yield
+    ic.clear_memory_cache()
+
+
+def _counting(fn):
+    calls = []
+
+    def inner(*args, **kwargs):
+        calls.append(1)
+        return fn(*args, **kwargs)
+
+    inner.__module__ = fn.__module__
+    inner.__qualname__ = fn.__qualname__
+    return inner, calls
+
+
+def test_off_by_default_is_pass_through(monkeypatch):
+    monkeypatch.delenv("TS_INDICATOR_CACHE", raising=False)
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()
+    cached(df, 14)
+    cached(df, 14)
+    assert len(calls) == 2
+    assert ic.install_indicator_cache() == 0
+
+
+def test_memory_hit_is_identical_private_copy(monkeypatch):
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "memory")
+    fn, calls = _counting(raw_linreg)
+    cached = ic.memoize_indicator(fn)
+    close = _ohlc()["close"]
+
+    fresh = raw_linreg(close, window=50)
+    first = cached(close, window=50)
+    second = cached(close, window=50)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(second, fresh, check_exact=True)
+    second.iloc[:, 0] = 0
+    pd.testing.assert_frame_equal(cached(close, window=50), first, check_exact=True)
+
+
+def test_params_and_data_change_the_key(monkeypatch):
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "memory")
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()
+    cached(df, 14)
+    cached(df, 20)
+    shifted = df.copy()
+    shifted.loc[shifted.index[-1], "close"] += 1.0
+    cached(shifted, 14)
+    assert len(calls) == 3
+
+
+def test_declared_columns_ignore_unrelated_strategy_columns(monkeypatch):
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "memory")
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()
+    a = cached(df, 14)
+    df["signal"] = 1
+    b = cached(df, 14)
+    assert len(calls) == 1
+    pd.testing.assert_series_equal(a, b, check_exact=True)
+
+
+def test_indicator_version_change_invalidates(monkeypatch):
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "memory")
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()
+    cached(df, 14)
+    monkeypatch.setitem(ic._VERSION_HASHES, raw_atr.__module__, "edited-logic")
+    cached(df, 14)
+    assert len(calls) == 2
+
+
+def test_indentation_only_logic_change_changes_version_hash(tmp_path, monkeypatch):
+    from tools.indicator_hasher import compute_indicator_hash
+
+    mod = tmp_path / "indkey" / "flip.py"
+    mod.parent.mkdir()
+    monkeypatch.setattr(ic, "_ENGINE_ROOT", tmp_path)
+    variants = {
+        "inside": "def f(x):\n    if x:\n        x = 1\n        x = x + 1\n    return x\n",
+        "outside": "def f(x):\n    if x:\n        x = 1\n    x = x + 1\n    return x\n",
+        "comment": "def f(x):\n    if x:  # note\n        x = 1\n        x = x + 1\n    return x\n",
+    }
+    hashes = {}
+    for name, source in variants.items():
+        mod.write_text(source, encoding="utf-8")
+        monkeypatch.setattr(ic, "_VERSION_HASHES", {})
+        hashes[name] = (compute_indicator_hash(mod), ic._version_hash("indkey.flip"))
+    assert hashes["inside"][0] == hashes["outside"][0]  # token hash alone misses it
+    assert hashes["inside"][1] != hashes["outside"][1]
+    assert hashes["inside"][1] == hashes["comment"][1]
+
+
+def test_disk_tier_round_trip_is_exact(monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "disk")
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()
+    df.index = pd.DatetimeIndex(list(df.index), name="timestamp")  # no freq, as loaded from CSV
+    fresh = raw_atr(df, 14)
+    cached(df, 14)
+    ic.clear_memory_cache()
+    from_disk = cached(df, 14)
+    assert len(calls) == 1
+    pd.testing.assert_series_equal(from_disk, fresh, check_exact=True)
+    assert from_disk.index.freq is None and from_disk.name == fresh.name
+
+
+def test_disk_tier_skips_results_parquet_cannot_reproduce(monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "disk")
+    fn, calls = _counting(raw_atr)
+    cached = ic.memoize_indicator(fn, columns=("high", "low", "close"))
+    df = _ohlc()  # hourly freq on the index is lost by a parquet round-trip
+    cached(df, 14)
+    ic.clear_memory_cache()
+    again = cached(df, 14)
+    assert len(calls) == 2
+    assert again.index.freq is not None
+
+
+def test_install_wraps_allowlist_idempotently(monkeypatch):
+    monkeypatch.setenv("TS_INDICATOR_CACHE", "memory")
+    import indicators
+    import indicators.structure
+    import indicators.volatility
+
+    originals = {
+        key: getattr(importlib.import_module(key[0]), key[1])
+        for key in ic.MEMOIZABLE_INDICATORS
+    }
+    packages = [indicators, indicators.volatility, indicators.structure]
+    package_attrs = [dict(vars(pkg)) for pkg in packages]
+    try:
+        assert ic.install_indicator_cache() == len(ic.MEMOIZABLE_INDICATORS)
+        assert ic.install_indicator_cache() == 0
+        atr_mod = importlib.import_module("indicators.volatility.atr")
+        assert atr_mod.atr.__wrapped__ is raw_atr
+        # Package re-exports are rebound too, not just the defining module.
+        assert indicators.volatility.atr is atr_mod.atr
+        assert indicators.structure.adx is importlib.import_module("indicators.structure.adx").adx
+        assert indicators.structure.adx.__indicator_memoized__
+    finally:
+        for (module_name, func_name), fn in originals.items():
+            setattr(importlib.import_module(module_name), func_name, fn)
+        for pkg, attrs in zip(packages, package_attrs):
+            for name, value in attrs.items():
+                setattr(pkg, name, value)
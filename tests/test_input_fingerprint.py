@@ -0,0 +1,35 @@
+"""Shared stat fingerprints for file-keyed caches (tools/input_fingerprint.py).
+
+Contract: a fingerprint changes when a source's size or mtime changes and
+records a missing source as [path, None, None]; ledger_db_paths() names the
+ledger DB and its WAL so writes not yet checkpointed invalidate caches.
+"""
+from __future__ import annotations
+
+import os
+
+import tools.input_fingerprint as fpm
+import tools.ledger_db as ledger_db
+
+
+def test_fingerprint_tracks_mtime_size_and_missing(tmp_path):
+    src = tmp_path / "a.csv"
+    src.write_text("x\n", encoding="utf-8")
+    missing = tmp_path / "gone.csv"
+    first = fpm.stat_fingerprint([src, missing])
+    st = src.stat()
+    assert first == [[str(src), st.st_mtime_ns, st.st_size], [str(missing), None, None]]
+
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert fpm.stat_fingerprint([src, missing]) != first
+
+
+def test_ledger_db_paths_include_wal(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger_db, "_resolve_db_path", lambda: tmp_path / "ledger.db")
+    assert fpm.ledger_db_paths() == [tmp_path / "ledger.db", tmp_path / "ledger.db-wal"]
+
+    def broken():
+        raise RuntimeError("no state root")
+
+    monkeypatch.setattr(ledger_db, "_resolve_db_path", broken)
+    assert fpm.ledger_db_paths() == []
@@ -0,0 +1,184 @@
+"""Columnar metrics kernel (tools/metrics_core.py).
+
+compute_metrics_from_trades / compute_metrics_by_direction must return the
+identical dict the list-based pipeline produced: the reference below is the
+pre-kernel orchestrator body, composed from the public list functions.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tools.metrics_core as mc
+
+
+def _reference_metrics(trades, starting_capital, direction_filter=None, metadata=None):
+    filtered = trades
+    if direction_filter is not None:
+        filtered = [t for t in trades if mc._safe_int(t.get("direction", 0)) == direction_filter]
+    if not filtered:
+        return mc.empty_metrics(starting_capital)
+    pnls = [mc._safe_float(t.get("pnl_usd", 0)) for t in filtered]
+    bars_list = [mc._safe_int(t.get("bars_held", 0)) for t in filtered if t.get("bars_held") not in (None, "", "None")]
+    basics = mc.compute_pnl_basics(pnls)
+    period = mc.compute_trading_period(filtered, basics["trade_count"])
+    bars_per_day = mc.compute_bars_per_day(filtered, metadata)
+    total_in_period = period["trading_period_days"] * bars_per_day
+    days = period["trading_period_days"]
+    return mc._assemble_metrics(
+        starting_capital, basics,
+        mc.compute_drawdown(pnls, basics["net_profit"], starting_capital),
+        mc.compute_streaks(pnls),
+        mc.compute_bars_stats(filtered, bars_list),
+        period,
+        (sum(bars_list) if bars_list else 0) / total_in_period if total_in_period > 0 else 0.0,
+        mc.compute_mfe_mae(filtered),
+        mc.compute_concentration(basics["wins"], basics["losses"], basics["gross_profit"], basics["gross_loss"]),
+        mc.compute_risk_ratios(pnls, basics["avg_trade"]),
+        mc.compute_k_ratio(pnls),
+        mc.summarize_buckets(mc.bucket_breakdown(filtered, "volatility_regime", mc.VOL_REGIME_BUCKETS, strict=True), ""),
+        mc.compute_session_breakdown(filtered),
+        mc.summarize_buckets(mc.bucket_breakdown(filtered, "trend_label", mc.TREND_LABEL_BUCKETS, strict=False), ""),
+        int(round(basics["trade_count"] / (days / 365.25))) if days > 0 else 0,
+    )
+
+
+def _trades(n=500, seed=0, messy=True):
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2022-01-03")
+    trades = []
+    for i in range(n):
+        entry = base + pd.Timedelta(minutes=int(rng.integers(0, 600_000)))
+        exit_ = entry + pd.Timedelta(seconds=int(rng.integers(60, 400_000)))
+        pnl = float(rng.normal(2, 40))
+        t = {
+            "parent_trade_id": f"T{i}",
+            "direction": int(rng.choice([1, -1])),
+            "pnl_usd": round(pnl, 2) if i % 11 else 0.0,
+            "bars_held": int(rng.integers(0, 60)),
+            "entry_timestamp": entry.isoformat() + ("Z" if i % 2 else ""),
+            "exit_timestamp": exit_.isoformat(),
+            "mfe_r": float(rng.uniform(0, 3)) if i % 4 else 0,
+            "mae_r": float(rng.uniform(0, 1)),
+            "volatility_regime": str(rng.choice(["low", "normal", "high", "-1", "0.0", "1"])),
+            "trend_label": str(rng.choice(["strong_up", "weak_up", "neutral", "weak_down", "strong_down"])),
+        }
+        if messy:
+            if i % 13 == 0:
+                t["trend_label"] = None
+            if i % 17 == 0:
+                t["bars_held"] = ""
+            if i % 19 == 0:
+                t["entry_timestamp"] = ""
+            if i % 23 == 0:
+                t["mfe_r"] = "None"
+                t["direction"] = str(t["direction"])
+        trades.append(t)
+    return trades
+
+
+def _assert_same(got, want):
+    assert list(got) == list(want)
+    for key in want:
+        g, w = got[key], want[key]
+        assert type(g) is type(w), key
+        assert g == w or (isinstance(w, float) and math.isnan(w) and math.isnan(g)), key
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("metadata", [None, {"timeframe": "1h"}, {"bar_geometry": {"median_bar_seconds": 900}}])
+def test_matches_list_pipeline(seed, metadata, capsys):
+    trades = _trades(seed=seed)
+    for direction in (None, 1, -1):
+        _assert_same(mc.compute_metrics_from_trades(trades, 10_000.0, direction, metadata),
+                     _reference_metrics(trades, 10_000.0, direction, metadata))
+
+
+def test_by_direction_equals_three_calls_and_accepts_dataframe(capsys):
+    trades = _trades(seed=4, messy=False)
+    meta = {"timeframe": "5m"}
+    triple = mc.compute_metrics_by_direction(trades, 5_000.0, meta)
+    for got, direction in zip(triple, (None, 1, -1)):
+        _assert_same(got, _reference_metrics(trades, 5_000.0, direction, meta))
+    frame_triple = mc.compute_metrics_by_direction(pd.DataFrame(trades), 5_000.0, meta)
+    for got, want in zip(frame_triple, triple):
+        _assert_same(got, want)
+
+
+def test_drawdown_streaks_and_k_ratio_kernels():
+    rng = np.random.default_rng(9)
+    for n in (0, 1, 3, 50, 2000):
+        pnl = rng.normal(0, 10, n).round(1)
+        pnl[::7] = 0.0
+        pnls = pnl.tolist()
+        assert mc._kernel_drawdown(pnl, sum(pnls), 1000.0) == mc.compute_drawdown(pnls, sum(pnls), 1000.0)
+        assert mc._kernel_k_ratio(pnl) == mc.compute_k_ratio(pnls)
+        assert {"max_consec_wins": mc._longest_run(pnl > 0),
+                "max_consec_losses": mc._longest_run(pnl < 0)} == mc.compute_streaks(pnls)
+
+
+def test_strict_volatility_errors_match():
+    trades = _trades(n=40, seed=3, messy=False)
+    trades[7]["volatility_regime"] = "nan"
+    trades[9]["volatility_regime"] = "extreme"
+    for direction in (None, 1, -1):
+        with pytest.raises(ValueError) as want:
+            _reference_metrics(trades, 1000.0, direction, {})
+        with pytest.raises(ValueError) as got:
+            mc.compute_metrics_from_trades(trades, 1000.0, direction, {})
+        assert str(got.value) == str(want.value)
+
+
+def test_timezone_offsets_fall_back_to_list_functions():
+    trades = _trades(n=60, seed=5, messy=False)
+    trades[3]["entry_timestamp"] = "2022-02-01T10:00:00+02:00"
+    trades[3]["exit_timestamp"] = "2022-02-02T10:00:00+02:00"
+    assert not mc.TradeColumns(trades).naive_times
+    with pytest.raises(TypeError):
+        _reference_metrics(trades, 1000.0, None, {})
+    with pytest.raises(TypeError):
+        mc.compute_metrics_from_trades(trades, 1000.0, None, {})
+
+
+def test_empty_slice_returns_empty_metrics():
+    trades = [t for t in _trades(n=30, messy=False) if t["direction"] == 1]
+    assert mc.compute_metrics_from_trades(trades, 100.0, -1, {}) == mc.empty_metrics(100.0)
+    assert mc.compute_metrics_from_trades([], 100.0, None, {}) == mc.empty_metrics(100.0)
+
+
+def test_direction_calls_on_one_list_coerce_once(monkeypatch, capsys):
+    builds = []
+
+    class CountingColumns(mc.TradeColumns):
+        def __init__(self, trades):
+            builds.append(len(trades))
+            super().__init__(trades)
+
+    monkeypatch.setattr(mc, "TradeColumns", CountingColumns)
+    monkeypatch.setattr(mc, "_LAST_COLUMNS", [])
+    trades = _trades(seed=6)
+    for direction in (None, 1, -1):
+        mc.compute_metrics_from_trades(trades, 1000.0, direction, {})
+    assert builds == [len(trades)]
+
+    trades[4]["pnl_usd"] = 999.0  # edited in place: the columns are stale
+    _assert_same(mc.compute_metrics_from_trades(trades, 1000.0, None, {}),
+                 _reference_metrics(trades, 1000.0, None, {}))
+    assert len(builds) == 2
+
+
+def test_datetime_like_timestamps_parse_like_strings(capsys):
+    trades = _trades(n=80, seed=7, messy=False)
+    frame = pd.DataFrame(trades)
+    for col in ("entry_timestamp", "exit_timestamp"):
+        frame[col] = pd.to_datetime(frame[col].str.rstrip("Z"))
+    want = mc.compute_metrics_by_direction(trades, 1000.0, {})
+    for got, expected in zip(mc.compute_metrics_by_direction(frame, 1000.0, {}), want):
+        _assert_same(got, expected)
+    assert mc._parse_timestamp(np.datetime64("2022-01-03T04:05:06")) == pd.Timestamp("2022-01-03 04:05:06")
+    assert mc._parse_timestamp(pd.Timestamp("2022-01-03", tz="UTC")).tzinfo is None
+    assert mc._parse_timestamp(pd.NaT) is None
+    assert mc._parse_timestamp(np.datetime64("NaT")) is None
@@ -30,6 +30,8 @@ from tools.news_calendar import (
     _build_windows,
     group_windows_by_currency,
     load_news_calendar,
+    build_window_index,
+    NewsWindowIndex,
     _CALENDAR_CACHE,
 )
 from tools.report_generator import (
@@ -748,5 +750,57 @@ class TestCaching(unittest.TestCase):
         self.assertIsNone(r2)
 
 
+
+# =====================================================================
+# 11. Sorted-interval index parity
+# =====================================================================
+
+class TestWindowIndex(unittest.TestCase):
+
+    @staticmethod
+    def _brute_force(entries, exits, ws, we):
+        """Reference per-trade scan (the pre-index classification)."""
+        out = []
+        for entry, exit_ in zip(entries, exits):
+            overlap = (entry <= we) & (exit_ > ws)
+            if not overlap.any():
+                out.append((False, False, False, pd.NaT))
+                continue
+            eiw = ((ws <= entry) & (entry <= we)).any()
+            strad = (entry < ws) & (exit_ > ws)
+            out.append((True, bool(eiw), bool(strad.any()),
+                        ws[strad].min() if strad.any() else pd.NaT))
+        return out
+
+    def test_matches_brute_force_on_random_calendar(self):
+        rng = np.random.default_rng(11)
+        base = pd.Timestamp('2024-01-01', tz='UTC')
+        ws = base + pd.to_timedelta(np.sort(rng.integers(0, 60 * 24 * 30, 200)), unit='min')
+        we = ws + pd.to_timedelta(rng.integers(0, 90, 200), unit='min')
+        entries = base + pd.to_timedelta(rng.integers(0, 60 * 24 * 30, 500), unit='min')
+        exits = entries + pd.to_timedelta(rng.integers(0, 600, 500), unit='min')
+
+        nf, eiw, strad, ews = NewsWindowIndex(ws, we).classify_trades(entries, exits)
+        expected = self._brute_force(entries, exits, pd.DatetimeIndex(ws), pd.DatetimeIndex(we))
+        self.assertEqual(list(nf), [e[0] for e in expected])
+        self.assertEqual(list(eiw), [e[1] for e in expected])
+        self.assertEqual(list(strad), [e[2] for e in expected])
+        for got, want in zip(ews, expected):
+            self.assertTrue((pd.isna(got) and pd.isna(want[3])) or got == want[3])
+
+    def test_index_cached_per_calendar_and_currency_set(self):
+        wdf = pd.DataFrame({
+            'window_start': [pd.Timestamp('2024-01-05 13:15')],
+            'window_end': [pd.Timestamp('2024-01-05 13:45')],
+            'currency': ['USD'], 'event': ['NFP'], 'impact': ['High'],
+            'datetime_utc': [pd.Timestamp('2024-01-05 13:30')],
+        })
+        wbc = group_windows_by_currency(wdf)
+        a = build_window_index(wbc, ['USD', 'EUR'])
+        self.assertIs(a, build_window_index(wbc, ['EUR', 'USD']))
+        self.assertIsNot(a, build_window_index(wbc, ['JPY']))
+        self.assertEqual(len(build_window_index(wbc, ['JPY'])), 0)
+
+
 if __name__ == '__main__':
     unittest.main()
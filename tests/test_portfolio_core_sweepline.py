@@ -0,0 +1,112 @@
+"""Columnar equity / concurrency math (tools/portfolio_core/deterministic.py).
+
+The cumsum equity path and the lexsort sweep-line must reproduce the
+original per-row / per-event loops exactly, including the exit-before-entry
+tie-break and Timedelta.total_seconds() microsecond truncation.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.portfolio_core.deterministic import (
+    compute_concurrency_series,
+    compute_drawdown,
+    compute_equity_curve,
+)
+
+
+def _reference_equity(trades, reference_capital):
+    equity, before, after, rets = reference_capital, [], [], []
+    for _, row in trades.iterrows():
+        before.append(equity)
+        pnl = row["pnl"]
+        rets.append(pnl / equity if equity != 0 else 0.0)
+        equity += pnl
+        after.append(equity)
+    out = trades.copy()
+    out["equity_before_trade"] = before
+    out["equity_after_trade"] = after
+    out["return_t"] = rets
+    return out
+
+
+def _reference_concurrency(df):
+    events = []
+    for _, row in df.sort_values("entry_timestamp").iterrows():
+        events.append((row["entry_timestamp"], 1))
+        events.append((row["exit_timestamp"], -1))
+    events.sort(key=lambda x: (x[0], x[1]))
+    cur = mx = 0
+    weighted = deployed = 0.0
+    by_count = defaultdict(float)
+    last = events[0][0]
+    total = (events[-1][0] - events[0][0]).total_seconds()
+    series = []
+    for t, kind in events:
+        delta = (t - last).total_seconds()
+        if delta > 0:
+            weighted += cur * delta
+            by_count[cur] += delta
+            if cur > 0:
+                deployed += delta
+        cur += kind
+        if kind == 1:
+            series.append(cur)
+        mx = max(mx, cur)
+        last = t
+    if total <= 0:
+        return series, mx, 0.0, 0.0, 0.0
+    return series, mx, weighted / total, by_count[mx] / total, deployed / total
+
+
+def _trades(n=400, seed=4, grid="min"):
+    rng = np.random.default_rng(seed)
+    unit = {"min": 60_000_000_000, "ns": 1}[grid]
+    entry = pd.Timestamp("2023-01-02") + pd.to_timedelta(rng.integers(0, 10**5, n) * unit, unit="ns")
+    exit_ = entry + pd.to_timedelta(rng.integers(0, 3000, n) * unit + rng.integers(0, 999, n), unit="ns")
+    # Shared timestamps exercise the exit-before-entry tie-break.
+    exit_ = exit_.where(np.arange(n) % 7 != 0, entry[np.roll(np.arange(n), 1)].max())
+    df = pd.DataFrame({"entry_timestamp": entry, "exit_timestamp": exit_, "pnl": rng.normal(3, 50, n)})
+    return df.sort_values("exit_timestamp").reset_index(drop=True)
+
+
+@pytest.mark.parametrize("seed,grid", [(1, "min"), (4, "ns"), (9, "min")])
+def test_concurrency_matches_event_loop(seed, grid):
+    df = _trades(seed=seed, grid=grid)
+    got = compute_concurrency_series(df)
+    want = _reference_concurrency(df)
+    assert got[0] == want[0]
+    assert got[1:] == want[1:]
+    assert got[1] > 1
+
+
+def test_concurrency_ties_and_degenerate_inputs():
+    t = pd.Timestamp("2024-01-01")
+    back_to_back = pd.DataFrame({
+        "entry_timestamp": [t, t + pd.Timedelta(hours=1)],
+        "exit_timestamp": [t + pd.Timedelta(hours=1), t + pd.Timedelta(hours=2)],
+    })
+    assert compute_concurrency_series(back_to_back) == _reference_concurrency(back_to_back)
+    assert compute_concurrency_series(back_to_back)[1] == 1
+    instant = pd.DataFrame({"entry_timestamp": [t], "exit_timestamp": [t]})
+    # Exit sorts before entry on the shared timestamp, as in the original loop.
+    assert compute_concurrency_series(instant) == _reference_concurrency(instant) == ([0], 0, 0.0, 0.0, 0.0)
+    assert compute_concurrency_series(pd.DataFrame()) == ([], 0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("capital", [10_000.0, 5_000, 0.0])
+def test_equity_curve_matches_row_walk(capital):
+    df = _trades()
+    got = compute_equity_curve(df.copy(), capital)
+    pd.testing.assert_frame_equal(got, _reference_equity(df, capital), check_exact=True)
+    assert compute_drawdown(got) == compute_drawdown(_reference_equity(df, capital))
+
+
+def test_integer_pnl_keeps_integer_equity():
+    df = pd.DataFrame({"pnl": [5, -3, 10], "exit_timestamp": pd.date_range("2024", periods=3)})
+    got = compute_equity_curve(df.copy(), 100)
+    pd.testing.assert_frame_equal(got, _reference_equity(df, 100), check_exact=True)
@@ -0,0 +1,154 @@
+"""Symbol PnL matrix analytics (tools/portfolio/portfolio_metrics.py).
+
+Stress scenarios and the leave-one-symbol-out sweep come from one
+date x symbol matrix; they must agree (to float tolerance) with the
+original per-scenario regroup. Flat-period detection must equal the
+original item walk exactly, and contribution_analysis the original loop.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.portfolio.portfolio_config import TOTAL_PORTFOLIO_CAPITAL
+from tools.portfolio.portfolio_metrics import (
+    SymbolPnlMatrix,
+    _metrics_flat_period,
+    contribution_analysis,
+    leave_one_symbol_out,
+    stress_test,
+)
+
+SYMBOLS = ["EURUSD", "NAS100", "SPX500", "XAUUSD", "GBPJPY"]
+
+
+def _portfolio(seed=4, n=900, symbols=SYMBOLS):
+    rng = np.random.default_rng(seed)
+    weights = np.linspace(1, 2, len(symbols))
+    exits = pd.Timestamp("2023-01-02 10:00") + pd.to_timedelta(rng.integers(0, 500 * 24 * 60, n), unit="min")
+    df = pd.DataFrame({
+        "symbol": rng.choice(symbols, n, p=weights / weights.sum()),
+        "exit_timestamp": exits,
+        "pnl_usd": rng.normal(3, 40, n),
+        "volatility_regime": rng.choice(["low", "normal", "high"], n),
+    })
+    df = df.sort_values("exit_timestamp").reset_index(drop=True)
+    return {sym: g for sym, g in df.groupby("symbol")}, df
+
+
+def _reference_subset_metrics(portfolio_df, syms):
+    """The original per-scenario regroup, kept verbatim as the oracle."""
+    subset = portfolio_df[portfolio_df['symbol'].isin(syms)].copy()
+    subset.sort_values('exit_timestamp', inplace=True)
+    if len(subset) == 0:
+        return {'net_pnl': 0, 'sharpe': 0, 'max_dd_usd': 0, 'return_dd': 0}
+    daily_pnl = subset.groupby(subset['exit_timestamp'].dt.date)['pnl_usd'].sum()
+    daily_pnl.index = pd.DatetimeIndex(daily_pnl.index)
+    capital = TOTAL_PORTFOLIO_CAPITAL
+    equity = daily_pnl.cumsum() + capital
+    net = equity.iloc[-1] - capital
+    dd = (equity - equity.cummax()).min()
+    rets = (daily_pnl / equity.shift(1)).dropna()
+    sh = (rets.mean() / rets.std()) * np.sqrt(252) if len(rets) > 1 and rets.std() > 0 else 0
+    return {'symbols': len(syms), 'net_pnl': net, 'sharpe': sh, 'max_dd_usd': dd,
+            'return_dd': abs(net / dd) if dd != 0 else 0}
+
+
+def _reference_flat_period(portfolio_equity, portfolio_df):
+    in_dd = portfolio_equity < portfolio_equity.cummax()
+    periods, start = [], None
+    for dt, is_flat in in_dd.items():
+        if is_flat and start is None:
+            start = dt
+        elif not is_flat and start is not None:
+            periods.append((start, dt))
+            start = None
+    if start is not None:
+        periods.append((start, portfolio_equity.index[-1]))
+    if not periods:
+        return 0, 0
+    lf = max(periods, key=lambda x: (x[1] - x[0]).days)
+    days = (lf[1] - lf[0]).days
+    trades = 0
+    if days > 0:
+        trades = len(portfolio_df[(portfolio_df['exit_timestamp'] >= lf[0]) &
+                                  (portfolio_df['exit_timestamp'] <= lf[1])])
+    return days, trades
+
+
+def _assert_metrics_close(got, want):
+    assert got.keys() == want.keys()
+    for key in want:
+        assert got[key] == pytest.approx(want[key], rel=1e-9, abs=1e-9), key
+
+
+@pytest.mark.parametrize("seed", [1, 4, 9])
+def test_stress_scenarios_match_regroup(seed):
+    symbol_trades, df = _portfolio(seed=seed)
+    got = stress_test(symbol_trades, df)
+    sym_pnl = {s: t["pnl_usd"].sum() for s, t in symbol_trades.items()}
+    top, worst = max(sym_pnl, key=sym_pnl.get), min(sym_pnl, key=sym_pnl.get)
+    assert list(got) == ["baseline", f"remove_top ({top})", f"remove_worst ({worst})", "remove_US_cluster"]
+    scenarios = [
+        list(symbol_trades),
+        [s for s in symbol_trades if s != top],
+        [s for s in symbol_trades if s != worst],
+        [s for s in symbol_trades if s not in ("NAS100", "SPX500", "US30")],
+    ]
+    for res, syms in zip(got.values(), scenarios):
+        _assert_metrics_close(res, _reference_subset_metrics(df, syms))
+
+
+def test_empty_scenario_and_shared_matrix():
+    symbol_trades, df = _portfolio(symbols=["NAS100", "SPX500"])
+    matrix = SymbolPnlMatrix(df)
+    got = stress_test(symbol_trades, df, pnl_matrix=matrix)
+    assert got["remove_US_cluster"] == {'net_pnl': 0, 'sharpe': 0, 'max_dd_usd': 0, 'return_dd': 0}
+    assert got == stress_test(symbol_trades, df)
+
+
+def test_leave_one_out_matches_subset_recompute():
+    _, df = _portfolio(seed=7)
+    got = leave_one_symbol_out(df)
+    assert list(got) == sorted(SYMBOLS)
+    for sym, res in got.items():
+        _assert_metrics_close(res, _reference_subset_metrics(df, [s for s in SYMBOLS if s != sym]))
+
+
+@pytest.mark.parametrize("seed", [2, 5, 11])
+def test_flat_period_matches_item_walk(seed):
+    _, df = _portfolio(seed=seed)
+    daily = df.groupby(df["exit_timestamp"].dt.normalize())["pnl_usd"].sum()
+    equity = daily.cumsum() + TOTAL_PORTFOLIO_CAPITAL
+    assert _metrics_flat_period(equity, df) == _reference_flat_period(equity, df)
+    rising = pd.Series(np.arange(30.0), index=pd.date_range("2024-01-01", periods=30))
+    assert _metrics_flat_period(rising, df) == (0, 0)
+
+
+def test_contribution_analysis_matches_loop():
+    symbol_trades, df = _portfolio(seed=3)
+    symbol_trades["EURUSD"] = symbol_trades["EURUSD"][symbol_trades["EURUSD"]["volatility_regime"] != "high"]
+    got = contribution_analysis(symbol_trades, df)
+    total = df["pnl_usd"].sum()
+    for sym, t in symbol_trades.items():
+        c = got[sym]
+        assert c["trades"] == len(t)
+        assert c["total_pnl"] == pytest.approx(t["pnl_usd"].sum(), rel=1e-12)
+        assert c["pnl_pct"] == pytest.approx(t["pnl_usd"].sum() / total, rel=1e-12)
+        assert c["volatility"] == pytest.approx(t["pnl_usd"].std(), rel=1e-12)
+        for regime in ("low", "normal", "high"):
+            want = t.loc[t["volatility_regime"] == regime, "pnl_usd"].sum()
+            assert c["regime_pnl"][regime] == pytest.approx(want, rel=1e-12, abs=1e-9)
+
+
+def test_contribution_analysis_empty_inputs():
+    symbol_trades, df = _portfolio(seed=4)
+    assert contribution_analysis({}, df) == {}
+    symbol_trades["EURUSD"] = symbol_trades["EURUSD"].iloc[0:0]
+    got = contribution_analysis(symbol_trades, df)
+    assert got["EURUSD"]["total_pnl"] == 0.0 and got["EURUSD"]["trades"] == 0
+    assert np.isnan(got["EURUSD"]["volatility"])
+    assert got["EURUSD"]["regime_pnl"] == {"low": 0.0, "normal": 0.0, "high": 0.0}
+    only_empty = {"EURUSD": symbol_trades["EURUSD"]}
+    assert contribution_analysis(only_empty, df)["EURUSD"]["trades"] == 0
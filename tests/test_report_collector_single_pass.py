@@ -0,0 +1,127 @@
+"""Single-pass per-symbol collection (tools/report/report_collector.py).
+
+Contract: the one grouped aggregation over categorical regime / session
+labels yields exactly the volatility, trend and session rows of the
+original per-pass groupby code; _classify_sessions labels every row like
+_classify_session; and _collect_symbol_payloads on a thread pool returns
+the same SymbolPayloads as a sequential walk.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.report.report_collector import (
+    _collect_session_row,
+    _collect_symbol_payloads,
+    _collect_trade_cells,
+    _collect_vol_trend_edges,
+)
+from tools.report.report_sessions import _classify_session, _classify_sessions
+
+
+def _trades(n: int, seed: int, gaps: bool = True) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    entry = pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(0, 400 * 24 * 60, n), unit="min")
+    stamps = entry.astype(str).to_numpy(object)
+    if gaps:
+        stamps[::97] = None
+    pnl = np.round(rng.normal(1, 25, n), 2)
+    pnl[::53] = np.nan
+    return pd.DataFrame({
+        "entry_timestamp": stamps,
+        "exit_timestamp": (entry + pd.Timedelta(hours=2)).astype(str),
+        "pnl_usd": pnl, "r_multiple": pnl / 25,
+        "volatility_regime": rng.choice(["high", " High", "NORMAL ", "low", "", None, 3.0], n),
+        "trend_label": rng.choice(["strong_up", "Weak_Up", " neutral", "weak_down", "Strong_Down", np.nan], n),
+        "regime_age": rng.integers(0, 40, n),
+    })
+
+
+def _reference_edges(tdf):
+    """The original per-pass implementation, kept as the oracle."""
+    vol = tdf["volatility_regime"].astype(str).str.lower().str.strip()
+    trend = tdf["trend_label"].astype(str).str.lower().str.strip()
+    sess = tdf["entry_timestamp"].apply(_classify_session)
+    out = {}
+    for name, key, labels in (("vol", vol, ["high", "normal", "low"]),
+                              ("trend", trend, ["strong_up", "weak_up", "neutral", "weak_down", "strong_down"]),
+                              ("session", sess, ["asia", "london", "ny"])):
+        sums = tdf.groupby(key)["pnl_usd"].sum()
+        counts = tdf.groupby(key)["pnl_usd"].count()
+        for label in labels:
+            out[(name, label)] = (float(sums.get(label, 0.0)), int(counts.get(label, 0)))
+    return out
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_grouped_cells_match_per_pass_groupby(seed):
+    tdf = _trades(3000, seed)
+    ref = _reference_edges(tdf.copy())
+    edges = _collect_vol_trend_edges(tdf.copy())
+    for key, label in (("h_vol", "high"), ("n_vol", "normal"), ("l_vol", "low")):
+        assert (edges[key], edges[f"{key}_t"]) == ref[("vol", label)]
+    for key, label in (("s_up", "strong_up"), ("w_up", "weak_up"), ("neu", "neutral"),
+                       ("w_dn", "weak_down"), ("s_dn", "strong_down")):
+        assert (edges[key], edges[f"{key}_t"]) == ref[("trend", label)]
+    row = _collect_session_row("X", tdf.copy())
+    assert [(row[k], row[f"{k}_T"]) for k in ("Asia", "London", "NY")] == [
+        ref[("session", s)] for s in ("asia", "london", "ny")]
+
+    cells_df = tdf.copy()
+    _collect_trade_cells(cells_df)
+    assert isinstance(cells_df["volatility_regime_clean"].dtype, pd.CategoricalDtype)
+    assert cells_df["volatility_regime_clean"].astype(str).tolist() == (
+        tdf["volatility_regime"].astype(str).str.lower().str.strip().tolist())
+
+
+def test_classify_sessions_matches_scalar():
+    values = pd.Series([
+        "2020-01-01 07:59:59", "2020-01-01 08:00:00", "2020-01-01T15:30:00.250", None,
+        np.nan, "garbage", "01/02/2020 17:00", "2020-01-01 07:00:00+05:00",
+    ], dtype=object)
+    assert _classify_sessions(values).tolist() == values.apply(_classify_session).tolist()
+    mixed = pd.Series(["2020-01-01 07:00:00+05:00", "2020-01-02 20:00:00+01:00"], dtype=object)
+    assert _classify_sessions(mixed).tolist() == mixed.apply(_classify_session).tolist()
+    dt = pd.Series(pd.date_range("2020-01-01", periods=100, freq="37min"))
+    assert _classify_sessions(dt).tolist() == dt.apply(_classify_session).tolist()
+
+
+def _symbol_dir(root, name: str, seed: int, stage3: bool):
+    raw = root / f"DIR_{name}" / "raw"
+    raw.mkdir(parents=True)
+    (root / f"DIR_{name}" / "metadata").mkdir()
+    (root / f"DIR_{name}" / "metadata" / "run_metadata.json").write_text(
+        json.dumps({"timeframe": f"{seed + 1}m"}), encoding="utf-8")
+    tdf = _trades(800, seed, gaps=False)
+    tdf["volatility_regime"] = np.random.default_rng(seed).choice([-1, 0, 1], len(tdf))
+    tdf.to_csv(raw / "results_tradelevel.csv", index=False)
+    if stage3:
+        pd.DataFrame([{"total_trades": 800, "net_profit": 120.5, "win_rate": 0.5, "profit_factor": 1.2,
+                       "gross_profit": 900.25, "gross_loss": -779.75}]).to_csv(raw / "results_standard.csv", index=False)
+        pd.DataFrame([{"max_drawdown_pct": 9.0, "max_drawdown_usd": 300.0, "return_dd_ratio": 1.5,
+                       "sharpe_ratio": 1.1, "sortino_ratio": 1.4, "k_ratio": 0.2, "sqn": 1.9}]).to_csv(
+            raw / "results_risk.csv", index=False)
+    return root / f"DIR_{name}"
+
+
+def test_pooled_collection_matches_sequential(tmp_path):
+    dirs = [_symbol_dir(tmp_path, f"S{k}", k, stage3=k % 2 == 0) for k in range(5)]
+    (tmp_path / "DIR_EMPTY").mkdir()
+    dirs.insert(2, tmp_path / "DIR_EMPTY")
+
+    seq = _collect_symbol_payloads(dirs, "DIR", max_workers=1)
+    pooled = _collect_symbol_payloads(dirs, "DIR", max_workers=4)
+    a, b = dataclasses.asdict(seq), dataclasses.asdict(pooled)
+    frames_a, frames_b = a.pop("all_trades_dfs"), b.pop("all_trades_dfs")
+    assert repr(a) == repr(b)
+    assert [r["Symbol"] for r in pooled.symbols_data] == [f"S{k}" for k in range(5)]
+    assert pooled.timeframe == "5m" and pooled.global_has_stage3
+    assert pooled.start_date != "YYYY-MM-DD"
+    assert len(pooled.vol_data[0]) == 7 and pooled.vol_data[0]["High_T"] > 0
+    for fa, fb in zip(frames_a, frames_b):
+        pd.testing.assert_frame_equal(fa, fb)
@@ -0,0 +1,87 @@
+"""Rolling-window stability engine (tools/utils/research/rolling.py).
+
+The searchsorted / 2-D-gather engine must reproduce the original per-window
+loop exactly (same windows, returns, drawdowns, trade counts), and the grid
+entry point must equal separate rolling_window calls.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.utils.research.rolling import (
+    classify_stability,
+    rolling_window,
+    rolling_window_grid,
+)
+
+
+def _reference_rolling_window(eq_df, tr_df, window_days, step_days):
+    """The pre-vectorisation loop, kept verbatim as the oracle."""
+    eq = eq_df.copy()
+    eq["timestamp"] = pd.to_datetime(eq["timestamp"])
+    eq = eq.set_index("timestamp")
+    eq = eq[~eq.index.duplicated(keep="last")]
+    eq = eq.sort_index()
+    daily = eq["equity"].resample("D").last().ffill()
+    tr = tr_df.copy()
+    tr["exit_timestamp"] = pd.to_datetime(tr["exit_timestamp"])
+    start, end = daily.index[0], daily.index[-1]
+    rows = []
+    current = start
+    while current + pd.Timedelta(days=window_days) <= end:
+        w_end = current + pd.Timedelta(days=window_days)
+        w_eq = daily.loc[current:w_end]
+        if len(w_eq) < 2:
+            current += pd.Timedelta(days=step_days)
+            continue
+        ret = (w_eq.iloc[-1] / w_eq.iloc[0] - 1) * 100
+        peak = w_eq.cummax()
+        dd = ((peak - w_eq) / peak * 100).max()
+        trades_in = tr[(tr["exit_timestamp"] >= current) & (tr["exit_timestamp"] <= w_end)]
+        rows.append({"start": current, "end": w_end, "return_pct": ret,
+                     "max_dd_pct": dd, "trade_count": len(trades_in)})
+        current += pd.Timedelta(days=step_days)
+    return pd.DataFrame(rows)
+
+
+def _artifacts(seed=5, days=900, trades=400):
+    rng = np.random.default_rng(seed)
+    ts = pd.Timestamp("2021-03-01 17:00") + pd.to_timedelta(
+        np.sort(rng.integers(0, days * 24 * 60, trades * 2)), unit="min"
+    )
+    equity = 10_000 + rng.normal(5, 80, len(ts)).cumsum()
+    eq_df = pd.DataFrame({"timestamp": ts, "equity": equity})
+    exits = ts[rng.choice(len(ts), trades, replace=False)]
+    tr_df = pd.DataFrame({"exit_timestamp": exits, "pnl_usd": rng.normal(0, 50, trades)})
+    return eq_df, tr_df
+
+
+@pytest.mark.parametrize("window_days,step_days", [(365, 30), (90, 7), (180, 45), (30, 1)])
+def test_matches_reference_loop(window_days, step_days):
+    eq_df, tr_df = _artifacts()
+    got = rolling_window(eq_df, tr_df, window_days=window_days, step_days=step_days)
+    want = _reference_rolling_window(eq_df, tr_df, window_days, step_days)
+    pd.testing.assert_frame_equal(got, want, check_exact=True)
+    assert classify_stability(got) == classify_stability(want)
+
+
+def test_window_longer_than_history_is_empty():
+    eq_df, tr_df = _artifacts(days=60)
+    out = rolling_window(eq_df, tr_df, window_days=365, step_days=30)
+    assert out.empty
+    assert classify_stability(out)["negative_windows"] == 0
+
+
+def test_grid_equals_individual_calls():
+    eq_df, tr_df = _artifacts()
+    grid = ((90, 30), (365, 30))
+    out = rolling_window_grid(eq_df, tr_df, grid=grid)
+    for window_days, step_days in grid:
+        part = out[(out["window_days"] == window_days) & (out["step_days"] == step_days)]
+        part = part.drop(columns=["window_days", "step_days"]).reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            part, rolling_window(eq_df, tr_df, window_days=window_days, step_days=step_days),
+            check_exact=True,
+        )
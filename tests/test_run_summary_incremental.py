@@ -0,0 +1,147 @@
+"""Incremental run-summary generation (tools/generate_run_summary.py).
+
+Contract: after any sequence of appends to index.csv (including runs whose
+symbol rows straddle the high-water mark), the incremental summary equals a
+full rebuild; a rewritten index, a changed registry or --full re-reads the
+sources; unchanged Excel/ledger sources are not reloaded.
+"""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tools.generate_run_summary as grs
+
+INDEX_COLS = [
+    "run_id", "strategy_id", "symbol", "timeframe", "date_start", "date_end",
+    "total_trades", "net_pnl_usd", "profit_factor", "win_rate", "max_drawdown_pct",
+    "execution_timestamp_utc",
+]
+
+
+def _index_rows(run_ids, seed):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for rid in run_ids:
+        for sym in rng.choice(["EURUSD", "GBPUSD", "XAUUSD", "NAS100"], rng.integers(1, 4), replace=False):
+            rows.append({
+                "run_id": rid, "strategy_id": f"S_{rid[:2]}", "symbol": sym, "timeframe": "1h",
+                "date_start": f"2024-0{rng.integers(1, 9)}-01", "date_end": f"2025-0{rng.integers(1, 9)}-01",
+                "total_trades": int(rng.integers(5, 200)), "net_pnl_usd": float(rng.normal(0, 500)),
+                "profit_factor": float(rng.uniform(0.5, 2.5)) if rng.random() > 0.1 else "",
+                "win_rate": float(rng.uniform(0.3, 0.7)), "max_drawdown_pct": float(rng.uniform(1, 30)),
+                "execution_timestamp_utc": f"2026-01-{rng.integers(10, 28)}T10:00:00Z",
+            })
+    return pd.DataFrame(rows, columns=INDEX_COLS)
+
+
+def _append(path, df):
+    df.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    research = tmp_path / "research"
+    research.mkdir()
+    monkeypatch.setattr(grs, "REGISTRY_PATH", tmp_path / "run_registry.json")
+    monkeypatch.setattr(grs, "INDEX_PATH", research / "index.csv")
+    monkeypatch.setattr(grs, "CANDIDATE_PATH", tmp_path / "candidates.xlsx")
+    monkeypatch.setattr(grs, "OUTPUT_PATH", research / "run_summary.csv")
+    monkeypatch.setattr(grs, "STATE_PATH", research / "run_summary.state.json")
+    monkeypatch.setattr(grs, "ledger_db_paths", lambda: [tmp_path / "ledger.db"])
+    monkeypatch.setattr(grs, "_load_portfolio_verdicts", lambda: pd.DataFrame())
+    return tmp_path
+
+
+def _write_registry(env, run_ids):
+    reg = {rid: {"run_id": rid, "tier": "T1", "status": "complete", "created_at": f"2026-02-0{i % 9 + 1}",
+                 "directive_hash": f"S_{rid[:2]}"} for i, rid in enumerate(run_ids)}
+    (env / "run_registry.json").write_text(json.dumps(reg), encoding="utf-8")
+
+
+def _summary(**kw):
+    grs.generate(quiet=True, **kw)
+    return pd.read_csv(grs.OUTPUT_PATH, dtype={"run_id": str})
+
+
+def test_incremental_appends_equal_full_rebuild(env):
+    index = grs.INDEX_PATH
+    ids = [f"{a}{b}{n:04d}" for a in "ab" for b in "xy" for n in range(12)]
+    _write_registry(env, ids + ["zz9999"])
+    _append(index, _index_rows(ids[:20], seed=1))
+    _summary()
+    state = json.loads(grs.STATE_PATH.read_text())
+    assert state["index"]["rows"] == len(pd.read_csv(index))
+
+    # Second batch re-uses run ids from the first (straddling the mark).
+    _append(index, _index_rows(ids[15:35], seed=2))
+    _append(index, _index_rows(ids[30:], seed=3))
+    incremental = _summary()
+    full = _summary(full_rebuild=True)
+    pd.testing.assert_frame_equal(incremental, full)
+    assert set(full["run_id"]) == set(ids) | {"zz9999"}
+    straddler = full.set_index("run_id").loc[ids[16]]
+    rows = pd.read_csv(index, dtype={"run_id": str})
+    rows = rows[rows["run_id"] == ids[16]]
+    assert straddler["symbols"] == ",".join(sorted(rows["symbol"].unique()))
+    assert straddler["total_trades"] == rows["total_trades"].sum()
+
+
+def test_full_aggregation_matches_groupby(env):
+    df = _index_rows([f"r{n:03d}" for n in range(40)], seed=7)
+    df.to_csv(grs.INDEX_PATH, index=False)
+    raw = pd.read_csv(grs.INDEX_PATH, dtype={"run_id": str})
+    want = raw.groupby("run_id", as_index=False).agg(
+        strategy_id=("strategy_id", "first"),
+        symbols=("symbol", lambda x: ",".join(sorted(x.unique()))),
+        symbol_count=("symbol", "nunique"),
+        timeframe=("timeframe", "first"),
+        date_start=("date_start", "min"),
+        date_end=("date_end", "max"),
+        total_trades=("total_trades", "sum"),
+        net_pnl_usd=("net_pnl_usd", "sum"),
+        avg_profit_factor=("profit_factor", "mean"),
+        avg_win_rate=("win_rate", "mean"),
+        max_drawdown_pct=("max_drawdown_pct", "max"),
+        execution_timestamp=("execution_timestamp_utc", "max"),
+    )
+    for c in ["net_pnl_usd", "avg_profit_factor", "avg_win_rate", "max_drawdown_pct"]:
+        want[c] = want[c].round(4)
+    pd.testing.assert_frame_equal(grs._aggregate_index(raw), want, check_exact=True)
+
+
+def test_partial_trailing_line_is_deferred(env):
+    index = grs.INDEX_PATH
+    _append(index, _index_rows(["aa0001", "aa0002"], seed=4))
+    extra = _index_rows(["aa0003"], seed=5).to_csv(index=False, header=False)
+    with open(index, "a", encoding="utf-8", newline="") as f:
+        f.write(extra[:20])
+    assert set(_summary()["run_id"]) == {"aa0001", "aa0002"}
+    with open(index, "a", encoding="utf-8", newline="") as f:
+        f.write(extra[20:])
+    assert set(_summary()["run_id"]) == {"aa0001", "aa0002", "aa0003"}
+
+
+def test_rewritten_index_and_changed_sources_reload(env, monkeypatch):
+    index = grs.INDEX_PATH
+    _write_registry(env, ["aa0001"])
+    _append(index, _index_rows(["aa0001", "aa0002", "aa0003"], seed=6))
+    _summary()
+
+    # Rewrite (not append): a different, shorter index must be re-read in full.
+    _index_rows(["bb0001"], seed=8).to_csv(index, index=False)
+    assert set(_summary()["run_id"]) == {"aa0001", "bb0001"}
+
+    calls = []
+    monkeypatch.setattr(grs, "_load_candidate_status", lambda: calls.append(1) or pd.DataFrame())
+    _summary()
+    assert calls == []  # candidate source unchanged since the saved state
+    (env / "candidates.xlsx").write_bytes(b"changed")
+    _summary()
+    assert calls == [1]
+
+    _write_registry(env, ["aa0001", "cc0001"])
+    assert "cc0001" in set(_summary()["run_id"])
@@ -0,0 +1,157 @@
+"""In-process Stage-1 sweep execution: shared preprocessing caches.
+
+`run_pipeline.py --sweep-in-process` (TS_STAGE1_IN_PROCESS=1) runs every
+Stage-1 job inside the pipeline worker via
+`tools.run_stage1.execute_stage1_in_process`. Sweep variants share a
+(symbol, timeframe, window), so the RESEARCH CSV parse and the HTF regime
+frame must be computed once per worker -- and every variant must still see
+exactly the frame a fresh subprocess would have built.
+"""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+import tools.run_stage1 as rs1
+from tools.orchestration.stage_symbol_execution import stage1_in_process_enabled
+
+
+def _write_research(root, symbol="TESTSYM", broker="OCTAFX", tf="1h"):
+    data_dir = root / "data_root" / "MASTER_DATA" / f"{symbol}_{broker}_MASTER" / "RESEARCH"
+    data_dir.mkdir(parents=True)
+    ts = pd.date_range("2024-01-01", periods=400, freq="h", tz="UTC")
+    df = pd.DataFrame({
+        "time": ts.strftime("%Y-%m-%d %H:%M:%S"),
+        "open": range(400), "high": range(1, 401), "low": range(400), "close": range(400),
+    })
+    df.to_csv(data_dir / f"{symbol}_{broker}_{tf}_2024_RESEARCH.csv", index=False)
+
+
+@pytest.fixture
+def stage1_env(tmp_path, monkeypatch):
+    _write_research(tmp_path)
+    monkeypatch.setattr(rs1, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(rs1, "BROKER", "OctaFx")
+    monkeypatch.setattr(rs1, "TIMEFRAME", "1h")
+    monkeypatch.setattr(rs1, "START_DATE", "2024-01-05")
+    monkeypatch.setattr(rs1, "END_DATE", "2024-01-10")
+    monkeypatch.setattr(rs1, "RESOLVED_WARMUP_BARS", 50)
+    rs1.clear_shared_preprocessing_cache()
+    yield tmp_path
+    rs1.clear_shared_preprocessing_cache()
+
+
+def test_market_data_parsed_once_and_sliced_per_window(stage1_env, monkeypatch):
+    reads = []
+    real_read_csv = pd.read_csv
+    monkeypatch.setattr(rs1.pd, "read_csv", lambda *a, **k: reads.append(a) or real_read_csv(*a, **k))
+
+    first = rs1.load_market_data("TESTSYM")
+    monkeypatch.setattr(rs1, "START_DATE", "2024-01-08")
+    second = rs1.load_market_data("TESTSYM")
+
+    assert len(reads) == 1
+    assert first["timestamp"].iloc[0] < second["timestamp"].iloc[0]
+
+    # Same bytes as an uncached (fresh-process) parse of the same window.
+    rs1.clear_shared_preprocessing_cache()
+    fresh = rs1.load_market_data("TESTSYM")
+    pd.testing.assert_frame_equal(second, fresh)
+
+
+def test_cached_market_data_is_a_private_copy(stage1_env):
+    first = rs1.load_market_data("TESTSYM")
+    first["close"] = -1.0
+    second = rs1.load_market_data("TESTSYM")
+    assert (second["close"] >= 0).all()
+
+
+def test_regime_frame_shared_for_same_window_only(stage1_env, monkeypatch):
+    calls = []
+
+    def fake_apply(df, resample_freq=None, symbol_hint=None):
+        calls.append(symbol_hint)
+        out = df.copy()
+        out["market_regime"] = "RANGE"
+        return out
+
+    monkeypatch.setattr(rs1, "apply_regime_model", fake_apply)
+    monkeypatch.setattr(rs1, "resolve_regime_config", lambda tf: ("1h", "1D"))
+
+    a = rs1._stage1_compute_regime_dataframe("TESTSYM")
+    b = rs1._stage1_compute_regime_dataframe("TESTSYM")
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(a, b)
+    assert a is not b
+
+    monkeypatch.setattr(rs1, "RESOLVED_WARMUP_BARS", 10)
+    rs1._stage1_compute_regime_dataframe("TESTSYM")
+    assert len(calls) == 2
+
+
+def test_in_process_run_resets_globals_to_defaults(monkeypatch):
+    seen = {}
+
+    def fake_run(args):
+        seen.update(args=vars(args), broker=rs1.BROKER, warmup=rs1.RESOLVED_WARMUP_BARS)
+        return "NO_TRADES"
+
+    monkeypatch.setattr(rs1, "run_stage1", fake_run)
+    monkeypatch.setattr(rs1, "BROKER", "LeftoverBroker")
+    monkeypatch.setattr(rs1, "RESOLVED_WARMUP_BARS", 999)
+
+    assert rs1.execute_stage1_in_process("D1", "EURUSD", "rid") == "NO_TRADES"
+    assert seen["args"] == {"directive": "D1", "symbol": "EURUSD", "run_id": "rid"}
+    assert seen["broker"] == rs1._RUN_GLOBAL_DEFAULTS["BROKER"]
+    assert seen["warmup"] == rs1._RUN_GLOBAL_DEFAULTS["RESOLVED_WARMUP_BARS"]
+
+
+def test_in_process_mode_is_opt_in(monkeypatch):
+    monkeypatch.delenv("TS_STAGE1_IN_PROCESS", raising=False)
+    assert stage1_in_process_enabled() is False
+    monkeypatch.setenv("TS_STAGE1_IN_PROCESS", "1")
+    assert stage1_in_process_enabled() is True
+
+
+def test_conversion_frames_are_lru_bounded(stage1_env, monkeypatch):
+    loads = []
+    frame = pd.DataFrame({"timestamp": ["2024-01-02 00:00:00"], "close": [1.25]})
+    monkeypatch.setattr(rs1, "load_market_data", lambda pair, tf_override=None: loads.append(pair) or frame)
+    pairs = [f"PAIR{i}" for i in range(rs1._SHARED_CACHE_MAX_ENTRIES + 3)]
+    for pair in pairs:
+        assert rs1.get_conversion_price_at_time(pair, pd.Timestamp("2024-01-05", tz="UTC")) == 1.25
+    assert len(rs1._CONVERSION_DF_CACHE) == rs1._SHARED_CACHE_MAX_ENTRIES
+    rs1.get_conversion_price_at_time(pairs[-1], pd.Timestamp("2024-01-05", tz="UTC"))
+    rs1.get_conversion_price_at_time(pairs[0], pd.Timestamp("2024-01-05", tz="UTC"))
+    assert loads == pairs + [pairs[0]]
+
+
+@pytest.mark.parametrize("outcome", ["FAILED", "raise"])
+def test_in_process_failure_writes_crash_diagnostics(tmp_path, monkeypatch, outcome):
+    import config.state_paths as state_paths
+    import tools.skill_loader as skill_loader
+
+    (tmp_path / "rid").mkdir()
+    monkeypatch.setattr(state_paths, "RUNS_DIR", tmp_path)
+    logged = []
+    monkeypatch.setattr(skill_loader, "_log_failure", lambda **kw: logged.append(kw))
+
+    def fake_run(args):
+        print("stage-1 progress line")
+        if outcome == "raise":
+            raise KeyError("boom")
+        return "FAILED"
+
+    monkeypatch.setattr(rs1, "run_stage1", fake_run)
+    if outcome == "raise":
+        with pytest.raises(KeyError):
+            rs1.execute_stage1_in_process("D1", "EURUSD", "rid")
+    else:
+        assert rs1.execute_stage1_in_process("D1", "EURUSD", "rid") == "FAILED"
+
+    trace = (tmp_path / "rid" / "crash_trace.log").read_text(encoding="utf-8")
+    assert "Exit Code: 1" in trace and "execute_stage1_in_process('D1', 'EURUSD', 'rid')" in trace
+    assert "stage-1 progress line" in (tmp_path / "rid" / "worker_stdout.log").read_text(encoding="utf-8")
+    if outcome == "raise":
+        assert "KeyError: 'boom'" in (tmp_path / "rid" / "worker_stderr.log").read_text(encoding="utf-8")
+    assert [(e["directive_id"], e["run_id"], e["error_type"]) for e in logged] == [("D1", "rid", "ENGINE_CRASH")]
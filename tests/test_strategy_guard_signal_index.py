@@ -0,0 +1,103 @@
+"""Indexed signal verification (execution_engine/strategy_guard.py).
+
+validate_signal() must return the same SignalResult as the original linear
+scans: hash membership over signal_index values, then the first
+signal_details entry (in load order) whose symbol / direction match and
+whose price and time fall inside the tolerances.
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from execution_engine.strategy_guard import (
+    BaselineStats,
+    GuardConfig,
+    SignalResult,
+    StrategyGuard,
+    _compute_signal_hash,
+    _normalize_hash_timestamp,
+    _timestamp_diff_seconds,
+)
+
+SYMBOLS = ["EURUSD", "XAUUSD", "USDJPY"]
+T0 = datetime(2025, 3, 3, 8, 0, 0)
+
+
+def _baseline(n=1500, seed=0):
+    rng = random.Random(seed)
+    index, details = {}, {}
+    for i in range(n):
+        tid = f"T{i:05d}"
+        sym = rng.choice(SYMBOLS)
+        ts = T0 + timedelta(seconds=rng.randrange(0, 400_000))
+        price = 0.0 if i % 97 == 0 else round(rng.uniform(1.0, 2.0), 5)
+        ref = {"symbol": sym, "direction": rng.choice([1, -1]), "entry_price": price,
+               "entry_ts": _normalize_hash_timestamp(ts), "risk_distance": 0.001}
+        if i % 211 == 0:
+            ref["entry_ts"] = "not-a-time"
+        details[tid] = ref
+        index[tid] = _compute_signal_hash(sym, ts, ref["direction"], price, 0.001)
+    return BaselineStats(0.5, 5, 1000.0, 10_000.0, index, details, total_trades=n)
+
+
+def _reference_validate(baseline, cfg, symbol, ts, direction, price, risk):
+    live_hash = _compute_signal_hash(symbol, ts, direction, price, risk)
+    if live_hash in baseline.signal_index.values():
+        return SignalResult(status="EXACT_MATCH", hash=live_hash)
+    live_ts = _normalize_hash_timestamp(ts)
+    for ref_id, ref in baseline.signal_details.items():
+        if ref["symbol"] != symbol or ref["direction"] != direction or ref["entry_price"] == 0:
+            continue
+        p_delta = abs(price - ref["entry_price"]) / ref["entry_price"]
+        if p_delta > cfg.price_tolerance:
+            continue
+        t_delta = _timestamp_diff_seconds(live_ts, ref["entry_ts"])
+        if t_delta is not None and t_delta <= cfg.time_window_s:
+            return SignalResult(status="SOFT_MATCH", hash=live_hash, matched_ref=ref_id,
+                                price_delta=p_delta, time_delta=float(t_delta))
+    return SignalResult(status="HARD_FAIL", hash=live_hash)
+
+
+@pytest.mark.parametrize("window,tol", [(60, 0.001), (3600, 0.05), (0, 0.5)])
+def test_matches_linear_scan(window, tol):
+    baseline = _baseline()
+    cfg = GuardConfig(price_tolerance=tol, time_window_s=window)
+    guard = StrategyGuard(baseline, cfg)
+    rng = random.Random(window)
+    refs = list(baseline.signal_details.values())
+    statuses = set()
+    for _ in range(600):
+        ref = rng.choice(refs)
+        try:
+            base_ts = datetime.strptime(ref["entry_ts"], "%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            base_ts = T0
+        if rng.random() < 0.1:  # exact replay of a research signal
+            ts, price = base_ts, ref["entry_price"]
+        else:
+            ts = base_ts + timedelta(seconds=rng.randrange(-2 * window - 5, 2 * window + 6))
+            price = ref["entry_price"] * (1 + rng.uniform(-2 * tol, 2 * tol))
+        args = (ref["symbol"], ts.strftime("%Y-%m-%dT%H:%M:%SZ"), ref["direction"], price, 0.001)
+        got = guard.validate_signal(*args)
+        assert got == _reference_validate(baseline, cfg, *args)
+        statuses.add(got.status)
+    assert statuses == {"EXACT_MATCH", "SOFT_MATCH", "HARD_FAIL"} or window == 0
+
+
+def test_earliest_loaded_reference_wins_inside_window():
+    # The second-loaded reference is closer in time; load order still decides.
+    details = {
+        "first_loaded": {"symbol": "EURUSD", "direction": 1, "entry_price": 1.1,
+                         "entry_ts": "2025-01-01 10:00:30", "risk_distance": 0.0},
+        "late_loaded_early_time": {"symbol": "EURUSD", "direction": 1, "entry_price": 1.1,
+                                   "entry_ts": "2025-01-01 10:00:05", "risk_distance": 0.0},
+    }
+    baseline = BaselineStats(0.5, 3, 100.0, 1000.0, {"x": "0" * 16}, details)
+    guard = StrategyGuard(baseline, GuardConfig())
+    res = guard.validate_signal("EURUSD", "2025-01-01 10:00:10", 1, 1.1, 0.0)
+    assert res.status == "SOFT_MATCH" and res.matched_ref == "first_loaded" and res.time_delta == 20.0
+    assert guard.validate_signal("EURUSD", "garbage", 1, 1.1, 0.0).status == "HARD_FAIL"
+    assert guard.validate_signal("EURUSD", "2025-01-01 10:00:10", -1, 1.1, 0.0).status == "HARD_FAIL"
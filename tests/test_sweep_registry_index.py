@@ -0,0 +1,232 @@
+"""SQLite index over sweep_registry.yaml (tools/sweep_registry_gate.py).
+
+Contract: re-admitting an allocated identity is answered from the index
+without the registry lock; new sweep slots and patches are allocated in the
+index and mirrored to the YAML with results and YAML content identical to
+the locked walk; heals and errors still go through the locked YAML path;
+gate writes re-stamp the index, out-of-band YAML edits are picked up by
+fingerprint, and unmirrored allocations survive an index rebuild; a reader
+holding older YAML bytes never overwrites a newer index.
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+import yaml
+
+import tools.sweep_registry_gate as srg
+
+IDEA = "98"
+S01 = "98_IDX_XAUUSD_1H_IDXTEST_S01_V1_P00"
+S01_P01 = "98_IDX_XAUUSD_1H_IDXTEST_S01_V1_P01"
+HASH_A = "a" * 64
+HASH_B = "b" * 64
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    reg_path = tmp_path / "sweep_registry.yaml"
+    seed = {
+        "version": 1,
+        "ideas": {
+            IDEA: {
+                "next_sweep": 2,
+                "sweeps": {
+                    "S01": {
+                        "directive_name": S01,
+                        "signature_hash": HASH_A[:16],
+                        "signature_hash_full": HASH_A,
+                        "patches": {
+                            "P01": {"directive_name": S01_P01, "signature_hash": HASH_B[:16]},
+                        },
+                    },
+                },
+            },
+        },
+    }
+    reg_path.write_text(yaml.safe_dump(seed, sort_keys=False), encoding="utf-8")
+    monkeypatch.setattr(srg, "SWEEP_REGISTRY_PATH", reg_path)
+    monkeypatch.setattr(srg, "SWEEP_LOCK_PATH", tmp_path / "sweep_registry.lock")
+    return reg_path
+
+
+@pytest.fixture
+def lock_calls(monkeypatch):
+    calls = []
+    real_acq = srg._acquire_lock
+    monkeypatch.setattr(srg, "_acquire_lock", lambda path: calls.append(path) or real_acq(path))
+    return calls
+
+
+def test_readmission_is_lock_free(registry, lock_calls):
+    res = srg.reserve_sweep_identity(IDEA, S01, HASH_A, requested_sweep="S01")
+    assert (res["status"], res["sweep"]) == ("idempotent", "S01")
+    res = srg.reserve_sweep_identity(IDEA, S01_P01, HASH_B, requested_sweep="S01")
+    assert (res["status"], res["sweep"]) == ("idempotent", "S01")
+    res = srg.update_sweep_signature_hash(IDEA, S01_P01, HASH_B)
+    assert (res["status"], res["patch"]) == ("unchanged", "P01")
+    assert lock_calls == []
+    assert srg._sweep_index_path().exists()
+
+
+def test_mutations_and_errors_take_the_locked_path(registry, lock_calls):
+    with pytest.raises(srg.SweepRegistryError, match="SWEEP_IDEMPOTENCY_MISMATCH"):
+        srg.reserve_sweep_identity(IDEA, S01, HASH_A, requested_sweep="S02")
+    new_name = "98_IDX_XAUUSD_1H_IDXTEST_S02_V1_P00"
+    res = srg.reserve_sweep_identity(IDEA, new_name, "c" * 64)
+    assert (res["status"], res["sweep"]) == ("reserved", "S02")
+    assert len(lock_calls) == 2  # the mismatch walk + one mirror write
+
+    # The gate's own write re-stamped the index: the new slot is served lock-free.
+    assert srg.reserve_sweep_identity(IDEA, new_name, "c" * 64)["status"] == "idempotent"
+    assert len(lock_calls) == 2
+    assert new_name in srg.load_allocated_names()
+    assert [e["sweep"] for e in srg.find_sweep_entries(signature_hash="c" * 16)] == ["S02"]
+
+
+def test_out_of_band_edit_is_detected(registry, lock_calls):
+    assert srg.load_allocated_names() == {S01, S01_P01}
+    data = yaml.safe_load(registry.read_text(encoding="utf-8"))
+    data["ideas"][IDEA]["sweeps"]["S01"]["signature_hash_full"] = "d" * 64
+    data["ideas"][IDEA]["sweeps"]["S01"]["signature_hash"] = "d" * 16
+    registry.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    # HASH_A no longer matches S01: the locked path allocates a fresh slot.
+    res = srg.reserve_sweep_identity(IDEA, S01, HASH_A)
+    assert res["status"] == "reserved" and res["sweep"] == "S02"
+    assert len(lock_calls) == 1
+    assert [e["sweep"] for e in srg.find_sweep_entries(directive_name=S01)] == ["S01", "S02"]
+
+
+def test_concurrent_readmissions(registry):
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(20):
+                assert srg.reserve_sweep_identity(IDEA, S01, HASH_A)["status"] == "idempotent"
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def _strip_timestamps(node):
+    if isinstance(node, dict):
+        return {k: _strip_timestamps(v) for k, v in node.items() if k != "reserved_at_utc"}
+    return node
+
+
+def _allocation_script():
+    s02 = "98_IDX_XAUUSD_1H_IDXTEST_S02_V1_P00"
+    s05 = "98_IDX_XAUUSD_1H_IDXTEST_S05_V1_P00"
+    out = []
+    for args, kwargs in (
+        ((IDEA, s02, "c" * 64), {}),
+        ((IDEA, s05, "d" * 64), {"requested_sweep": "S05"}),
+        ((IDEA, "98_IDX_XAUUSD_1H_IDXTEST_S01_V1_P02", "e" * 64), {"requested_sweep": "S01"}),
+        ((IDEA, "98_IDX_XAUUSD_1H_IDXTEST_S05_V1_P01", "f" * 16), {"requested_sweep": "S05"}),
+        ((IDEA, "98_IDX_XAUUSD_1H_OTHER_S01_V1_P00", "1" * 64), {}),
+        ((IDEA, s02, "c" * 64), {}),
+        ((IDEA, "98_IDX_XAUUSD_1H_IDXTEST_S01_V1_P01", "2" * 64), {"requested_sweep": "S01"}),
+        ((IDEA, "98_IDX_XAUUSD_1H_NEW_S09_V1_P00", "3" * 64), {"requested_sweep": "S09", "auto_advance": False}),
+        (("97", "97_IDX_XAUUSD_1H_X_S01_V1_P00", "4" * 64), {}),
+    ):
+        try:
+            out.append(srg.reserve_sweep_identity(*args, **kwargs))
+        except srg.SweepRegistryError as exc:
+            out.append(str(exc))
+    return out
+
+
+def test_indexed_allocation_matches_locked_path(registry, monkeypatch, tmp_path):
+    seed = registry.read_text(encoding="utf-8")
+    indexed = _allocation_script()
+    indexed_yaml = yaml.safe_load(registry.read_text(encoding="utf-8"))
+    assert [r["sweep"] for r in indexed[:5]] == ["S02", "S05", "S01", "S05", "S06"]
+
+    registry.write_text(seed, encoding="utf-8")
+    srg._sweep_index_path().unlink()
+    monkeypatch.setattr(srg, "_indexed_allocation", lambda *a, **k: None)
+    locked = _allocation_script()
+    assert indexed == locked
+    assert _strip_timestamps(indexed_yaml) == _strip_timestamps(
+        yaml.safe_load(registry.read_text(encoding="utf-8")))
+
+
+def test_concurrent_allocations_share_mirror_writes(registry, monkeypatch):
+    writes = []
+    real_write = srg._write_yaml_atomic
+    monkeypatch.setattr(srg, "_write_yaml_atomic", lambda p, d: writes.append(p) or real_write(p, d))
+    names = [f"98_IDX_XAUUSD_1H_CONC{k}_S01_V1_P00" for k in range(8)]
+    results, errors = {}, []
+
+    def worker(name):
+        try:
+            results[name] = srg.reserve_sweep_identity(IDEA, name, f"{names.index(name) + 1:x}" * 64)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in names]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sorted(r["sweep"] for r in results.values()) == [f"S{k:02d}" for k in range(2, 10)]
+    assert 1 <= len(writes) <= len(names)
+    idea = yaml.safe_load(registry.read_text(encoding="utf-8"))["ideas"][IDEA]
+    assert {idea["sweeps"][r["sweep"]]["directive_name"] for r in results.values()} == set(names)
+    assert idea["next_sweep"] == 10
+
+
+def test_pending_allocation_survives_rebuild_and_is_mirrored(registry, lock_calls):
+    name = "98_IDX_XAUUSD_1H_IDXTEST_S02_V1_P00"
+    # Allocated but not yet written behind (e.g. the allocator died).
+    assert srg._indexed_allocation(IDEA, name, "c" * 64, None, True) == ("S02", None)
+    assert "S02" not in yaml.safe_load(registry.read_text(encoding="utf-8"))["ideas"][IDEA]["sweeps"]
+
+    data = yaml.safe_load(registry.read_text(encoding="utf-8"))
+    data["ideas"][IDEA]["sweeps"]["S01"]["owner_note"] = "manual edit"
+    registry.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    assert name in srg.load_allocated_names()
+    assert srg.reserve_sweep_identity(IDEA, name, "c" * 64)["status"] == "idempotent"
+
+    # The next locked operation mirrors it before walking the YAML.
+    assert srg.update_sweep_signature_hash(IDEA, S01, "d" * 64)["status"] == "updated"
+    idea = yaml.safe_load(registry.read_text(encoding="utf-8"))["ideas"][IDEA]
+    assert idea["sweeps"]["S02"]["directive_name"] == name and idea["next_sweep"] == 3
+    assert idea["sweeps"]["S01"]["owner_note"] == "manual edit"
+    assert srg._indexed_rows("SELECT COUNT(*) FROM sweep_entries WHERE pending = 1", ()) == [(0,)]
+
+
+def test_stale_reader_does_not_overwrite_a_newer_index(registry):
+    old_source = registry.read_bytes()
+    old_registry = yaml.safe_load(old_source.decode("utf-8"))
+    name = "98_IDX_XAUUSD_1H_IDXTEST_S02_V1_P00"
+    # Another process allocates, mirrors and re-stamps the index meanwhile.
+    assert srg.reserve_sweep_identity(IDEA, name, "c" * 64)["sweep"] == "S02"
+
+    conn = srg._connect_sweep_index()
+    try:
+        srg._rebuild_sweep_index(conn, old_registry, srg._sweep_index_fingerprint(old_source),
+                                 only_if_stale=True)
+        assert srg._index_in_sync(conn)
+    finally:
+        conn.close()
+    assert srg.find_sweep_entries(directive_name=name)[0]["sweep"] == "S02"
+
+
+def test_mirror_rechecks_yaml_when_index_is_unreadable(registry, monkeypatch):
+    name = "98_IDX_XAUUSD_1H_IDXTEST_S02_V1_P00"
+    assert srg.reserve_sweep_identity(IDEA, name, "c" * 64)["sweep"] == "S02"
+    monkeypatch.setattr(srg, "_indexed_rows", lambda query, params: None)
+    srg._mirror_allocation(IDEA, "S02", None, name)  # YAML holds the slot: no collision
+    with pytest.raises(srg.SweepRegistryError, match="SWEEP_COLLISION"):
+        srg._mirror_allocation(IDEA, "S02", None, "98_IDX_XAUUSD_1H_OTHER_S02_V1_P00")
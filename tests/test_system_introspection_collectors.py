@@ -0,0 +1,117 @@
+"""Parallel, cached collectors (tools/system_introspection.py).
+
+Contract: run_collectors runs the collectors concurrently and reports
+per-collector timing; a file-backed collector is served from the cache
+while its inputs' mtime/size are unchanged and recomputed once they change;
+error results are never cached; the directive-queue idle check is evaluated
+against the current time even when the parsed state files come from cache.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tools import system_introspection as si
+
+
+@pytest.fixture
+def quiet_collectors(monkeypatch, tmp_path):
+    """Replace every collector with a trivial one; tests override as needed."""
+    for name in ("collect_engine", "collect_directives", "collect_ledgers", "collect_portfolio",
+                 "collect_vault", "collect_data_freshness", "collect_runs", "collect_git",
+                 "collect_deferred_maintenance"):
+        monkeypatch.setattr(si, name, lambda name=name: {"from": name})
+    monkeypatch.setattr(si, "collect_known_issues", lambda cache=None: {"from": "known_issues"})
+    monkeypatch.setattr(si, "PORTFOLIO_YAML", tmp_path / "portfolio.yaml")
+    monkeypatch.setattr(si, "_ledger_inputs", lambda: [tmp_path / "ledger.db"])
+    return tmp_path
+
+
+def test_collectors_run_concurrently_and_report_timing(quiet_collectors, monkeypatch):
+    barrier = threading.Barrier(3, timeout=10)
+
+    def _waits(tag):
+        def fn(*_a, **_k):
+            barrier.wait()  # deadlocks (BrokenBarrierError) if run serially
+            return {"from": tag}
+        return fn
+
+    monkeypatch.setattr(si, "collect_git", _waits("git"))
+    monkeypatch.setattr(si, "collect_ledgers", _waits("ledgers"))
+    monkeypatch.setattr(si, "collect_known_issues", _waits("known_issues"))
+
+    results, timings = si.run_collectors(cache=None)
+    assert results["git"] == {"from": "git"} and results["ledgers"] == {"from": "ledgers"}
+    assert set(timings) == set(results)
+    assert all(t["seconds"] >= 0 and t["cached"] is False for t in timings.values())
+    assert "git" in si._format_timings(timings)
+
+
+def test_cache_hit_until_input_changes(quiet_collectors, monkeypatch):
+    yaml_path = quiet_collectors / "portfolio.yaml"
+    yaml_path.write_text("portfolio: {strategies: []}\n", encoding="utf-8")
+    cache_path = quiet_collectors / "cache.json"
+    calls = []
+    monkeypatch.setattr(si, "collect_portfolio", lambda: calls.append(1) or {"total": len(calls)})
+
+    cache = si._CollectorCache(cache_path)
+    results, timings = si.run_collectors(cache)
+    cache.save(timings)
+    assert results["portfolio"] == {"total": 1} and not timings["portfolio"]["cached"]
+    # Timings live in the session-state cache, not in SYSTEM_STATE.md.
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["last_timings"] == timings
+
+    cache = si._CollectorCache(cache_path)
+    results, timings = si.run_collectors(cache)
+    assert results["portfolio"] == {"total": 1} and timings["portfolio"]["cached"]
+    assert len(calls) == 1
+
+    yaml_path.write_text("portfolio: {strategies: [1]}\n", encoding="utf-8")
+    results, timings = si.run_collectors(cache)
+    assert results["portfolio"] == {"total": 2} and not timings["portfolio"]["cached"]
+
+    disabled = si._CollectorCache(cache_path, enabled=False)
+    si.run_collectors(disabled)
+    assert len(calls) == 3
+
+
+def test_error_results_are_not_cached(quiet_collectors, monkeypatch):
+    monkeypatch.setattr(si, "collect_ledgers", lambda: {"mps": {"error": "database is locked"}})
+    cache = si._CollectorCache(quiet_collectors / "cache.json")
+    si.run_collectors(cache)
+    _, timings = si.run_collectors(cache)
+    assert timings["ledgers"]["cached"] is False
+    assert timings["portfolio"]["cached"] is True
+
+
+def test_directive_queue_cache_reevaluates_idle_threshold(tmp_path, monkeypatch):
+    inbox, runs = tmp_path / "INBOX", tmp_path / "runs"
+    inbox.mkdir()
+    (inbox / "D1.txt").write_text("x", encoding="utf-8")
+    (runs / "D1").mkdir(parents=True)
+    monkeypatch.setattr(si, "INBOX_DIR", inbox)
+    monkeypatch.setattr(si, "RUNS_DIR", runs)
+    recent = (datetime.now(timezone.utc) - timedelta(hours=23, minutes=59, seconds=59)).isoformat()
+    (runs / "D1" / "directive_state.json").write_text(json.dumps({
+        "attempts": {"attempt_01": {"status": "INITIALIZED"}},
+        "last_updated": recent,
+    }), encoding="utf-8")
+
+    cache = si._CollectorCache(tmp_path / "cache.json")
+    assert si._check_directive_queue_health(cache)["stranded"] == []
+
+    class _Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(hours=2)
+
+    import datetime as _dt
+    monkeypatch.setattr(_dt, "datetime", _Later)
+    parsed = []
+    monkeypatch.setattr(si, "_directive_queue_records", lambda: parsed.append(1) or [])
+    stranded = si._check_directive_queue_health(cache)["stranded"]
+    assert parsed == []  # state file unchanged: served from cache
+    assert [s["directive_id"] for s in stranded] == ["D1"]
@@ -0,0 +1,125 @@
+"""Event-driven watchdog mode (tools/orchestration/watchdog_daemon.py).
+
+Contract: threshold deadlines are derived from the observed ages; the event
+loop fires SOFT/HARD breaches promptly after crossing (not a poll interval
+late), re-arms on heartbeat changes, backs off one poll interval after a
+recovery decision, and leaves the EARLY_EXIT confirmation gate to the
+periodic PID probe.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import tools.orchestration.watchdog_daemon as wd
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    for name in ("HB_LOG", "EXEC_STATE", "EXEC_PID", "GUARD_FILE", "WATCHDOG_LOG", "WDOG_PID"):
+        monkeypatch.setattr(wd, name, logs / getattr(wd, name).name)
+    lines: list[tuple[float, str]] = []
+    restarts: list[dict] = []
+    monkeypatch.setattr(wd, "_log", lambda msg: lines.append((time.monotonic(), msg)))
+    monkeypatch.setattr(wd, "_send_alert", lambda *a: None)
+    monkeypatch.setattr(wd, "_check_single_instance", lambda: False)
+    monkeypatch.setattr(wd, "_do_restart", lambda guard: restarts.append(dict(guard)))
+    monkeypatch.setattr(wd, "_kill_pid", lambda pid: True)
+    monkeypatch.setattr(wd, "EVENT_STAT_POLL_S", 0.05)
+    monkeypatch.setattr(wd, "EVENT_DEBOUNCE_S", 0.01)
+    return {"logs": logs, "lines": lines, "restarts": restarts}
+
+
+def _heartbeat():
+    ts = datetime.now(timezone.utc).isoformat()
+    with open(wd.HB_LOG, "a", encoding="utf-8") as f:
+        f.write(f"{ts} | HEARTBEAT | uptime=00h00m01s\n")
+
+
+def _first(lines, prefix, after=0.0):
+    return next((t for t, msg in lines if msg.startswith(prefix) and t >= after), None)
+
+
+def test_threshold_deadlines():
+    state = wd._LoopState()
+    state.hb_age, state.bar_age, state.proc_uptime = 100.0, 10.0, 50.0
+    due = wd._threshold_deadlines(state, now=1000.0)
+    slack = wd.EVENT_DEADLINE_SLACK_S
+    assert due["soft"] == pytest.approx(1000 + wd.SOFT_THRESHOLD_S - 100 + slack)
+    assert due["hard"] == pytest.approx(1000 + wd.HARD_THRESHOLD_S - 100 + slack)
+    assert due["bar_stall"] == pytest.approx(1000 + wd.BAR_STALL_THRESHOLD_S - 10 + slack)
+
+    state.hb_age, state.bar_age = wd.HARD_THRESHOLD_S + 5, wd.BAR_STALL_THRESHOLD_S + 5
+    due = wd._threshold_deadlines(state, now=1000.0)
+    assert "soft" not in due and due["hard"] == 1000 + wd.POLL_INTERVAL_S
+    assert due["bar_stall"] == pytest.approx(1000 + wd.BAR_STALL_MIN_UPTIME_S - 50 + slack)
+
+    state.clean_shutdown = True
+    assert wd._threshold_deadlines(state, now=0.0) == {}
+
+
+def test_tick_skips_liveness_while_early_exit_pending(daemon, monkeypatch):
+    wd.EXEC_PID.write_text("4242", encoding="utf-8")
+    monkeypatch.setattr(wd, "_pid_is_alive", lambda pid: False)
+    _heartbeat()
+    state = wd._LoopState()
+    state.start_monotonic -= wd.EARLY_EXIT_GRACE_S + 1
+    assert wd._watchdog_tick(state) is False
+    assert state.early_exit_strikes == 1
+    n = len(daemon["lines"])
+    assert wd._watchdog_tick(state, probe_pid=False) is False  # a change event, not a probe
+    assert state.early_exit_strikes == 1 and len(daemon["lines"]) == n
+    assert wd._watchdog_tick(state) is True  # confirming probe
+    assert len(daemon["restarts"]) == 1 and not wd.EXEC_PID.exists()
+
+
+def test_event_loop_fires_breaches_promptly(daemon, monkeypatch):
+    monkeypatch.setattr(wd, "SOFT_THRESHOLD_S", 1.0)
+    monkeypatch.setattr(wd, "HARD_THRESHOLD_S", 2.0)
+    monkeypatch.setattr(wd, "POLL_INTERVAL_S", 30)
+    monkeypatch.setattr(wd, "_pid_is_alive", lambda pid: True)
+    wd.EXEC_PID.write_text("4242", encoding="utf-8")
+    lines = daemon["lines"]
+
+    stop = threading.Event()
+    loop = threading.Thread(target=wd.run_event_loop, kwargs={"stop": stop}, daemon=True)
+    loop.start()
+    try:
+        time.sleep(0.2)  # startup rotates heartbeat.log away
+        _heartbeat()
+        t0 = time.monotonic()
+        # A fresh heartbeat 0.5s later re-arms the deadlines from its timestamp.
+        time.sleep(0.5)
+        _heartbeat()
+        t1 = time.monotonic()
+        deadline = time.monotonic() + 10
+        while _first(lines, "HARD_BREACH") is None and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        stop.set()
+        loop.join(timeout=5)
+
+    soft, hard = _first(lines, "SOFT_BREACH"), _first(lines, "HARD_BREACH")
+    assert soft is not None and hard is not None
+    assert 1.0 <= soft - t1 < 1.0 + 1.5
+    assert 2.0 <= hard - t1 < 2.0 + 1.5
+    assert soft - t0 >= 1.4  # the first heartbeat's deadline was superseded
+    assert len(daemon["restarts"]) == 1  # backs off: no second restart within POLL_INTERVAL_S
+    assert any(msg.startswith("WATCHDOG_EVENT_SOURCE") for _, msg in lines)
+
+
+def test_stat_poll_notifier_sees_changes(daemon):
+    notifier = wd._ChangeNotifier([wd.HB_LOG, wd.EXEC_STATE])
+    try:
+        assert notifier.wait(0.2) is False
+        _heartbeat()
+        assert notifier.wait(3.0) is True
+        wd.EXEC_STATE.write_text("{}", encoding="utf-8")
+        assert notifier.wait(3.0) is True
+    finally:
+        notifier.stop()
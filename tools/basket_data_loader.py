@@ -31,6 +31,7 @@ import numpy as np
 import pandas as pd
 
 from config.path_authority import DATA_ROOT
+from data_access.readers.columnar_ohlc_store import open_store
 
 
 __all__ = [
@@ -171,7 +172,13 @@ def _read_year_csv_cached(symbol: str, year: int, timeframe: str = "5m") -> pd.D
     f = research_dir / f"{symbol}_OCTAFX_{timeframe}_{year}_RESEARCH.csv"
     if not f.is_file():
         return pd.DataFrame()  # caller treats as gap year
-    df = pd.read_csv(f, comment="#", parse_dates=["time"])
+    # TS_COLUMNAR_OHLC=1: slice this year out of the symbol/timeframe's
+    # memory-mapped store (built once from every year-file) instead of
+    # re-parsing the CSV in each process. None -> CSV path, identical frame.
+    store = open_store(research_dir, f"{symbol}_OCTAFX_{timeframe}_*_RESEARCH.csv")
+    df = store.source_frame(f.name, parse_time=True) if store is not None else None
+    if df is None:
+        df = pd.read_csv(f, comment="#", parse_dates=["time"])
     df = df.set_index("time").sort_index()
     return df
 
@@ -75,7 +75,7 @@ assert ENGINE_ABI == "engine_abi.v1_5_11", (
 )
 
 __all__ = [
-    "BasketLeg", "BasketRule", "BasketRunner", "ENGINE_VERSION", "ENGINE_ABI",
+    "BasketLeg", "BasketRule", "BasketRunner", "LegColumns", "ENGINE_VERSION", "ENGINE_ABI",
 ]
 
 
@@ -84,6 +84,55 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
+class LegColumns:
+    """Per-leg column arrays over the runner's aligned index.
+
+    `cols["close"][i]` is the value `leg.df.loc[aligned[i], "close"]` returns,
+    without the per-bar index hash lookup + Series construction. Columns are
+    materialized lazily (first access) and cached for the run. Numeric, bool
+    and object columns are plain NumPy arrays; other dtypes (naive datetime,
+    nullable extension types) keep their pandas array so element access yields
+    the same scalar type `.loc` would.
+
+    The runner advances the cursor (`i`, `bar_ts`) before every rule.apply,
+    which lets bar_ts-only helpers resolve the integer position through
+    `BasketLeg.value` without a label lookup.
+
+    Snapshot semantics: arrays reflect `leg.df` as it was after _prepare().
+    A rule that writes new columns into `leg.df` mid-run must keep reading
+    them label-based.
+    """
+
+    __slots__ = ("_df", "_aligned", "_arrays", "i", "bar_ts")
+
+    def __init__(self, df: pd.DataFrame, aligned: pd.DatetimeIndex) -> None:
+        self._df = df
+        self._aligned = aligned
+        self._arrays: dict[str, Any] = {}
+        self.i: int = -1
+        self.bar_ts: pd.Timestamp | None = None
+
+    def __contains__(self, col: str) -> bool:
+        return col in self._arrays or col in self._df.columns
+
+    def __getitem__(self, col: str):
+        arr = self._arrays.get(col)
+        if arr is None:
+            if col not in self._df.columns:
+                raise KeyError(col)
+            series = self._df[col]
+            if len(series) != len(self._aligned) or not series.index.equals(self._aligned):
+                series = series.loc[self._aligned]
+            arr = series.to_numpy() if series.dtype.kind in "biufcO" else series.array
+            self._arrays[col] = arr
+        return arr
+
+    def seek(self, i: int, bar_ts: pd.Timestamp) -> None:
+        """Point the cursor at aligned bar `i` (timestamp `bar_ts`)."""
+        self.i = i
+        self.bar_ts = bar_ts
+
+
 @dataclass
 class BasketLeg:
     """One leg of a basket — symbol, lot, direction, per-leg strategy, state.
@@ -115,6 +164,24 @@ class BasketLeg:
     state:     BarState           = field(default_factory=BarState)
     config:    EngineConfig | None = None
     trades:    list[dict[str, Any]] = field(default_factory=list)
+    # Column arrays over the aligned index; set by BasketRunner for the
+    # duration of a run (None for a leg not driven by a runner).
+    columns:   LegColumns | None  = field(default=None, repr=False, compare=False)
+
+    def value(self, col: str, bar_ts: pd.Timestamp):
+        """Scalar `col` at `bar_ts` — `leg.df.loc[bar_ts, col]` semantics.
+
+        Reads the pre-materialized column array when the runner's cursor is
+        on `bar_ts` (the per-bar fast path); otherwise falls back to the
+        label-based lookup, so rules keep working on legs built outside a
+        runner (unit tests, notebooks). Missing column -> KeyError either way.
+        """
+        cols = self.columns
+        if cols is not None and cols.bar_ts is not None and (
+            cols.bar_ts is bar_ts or cols.bar_ts == bar_ts
+        ):
+            return cols[col][cols.i]
+        return self.df.loc[bar_ts, col]
 
     @property
     def effective_direction(self) -> int:
@@ -312,6 +379,11 @@ class BasketRunner:
             common = common.intersection(leg.df.index)
         return common.sort_values()
 
+    def _attach_columns(self, aligned: pd.DatetimeIndex) -> None:
+        """Give every leg a fresh LegColumns view over `aligned` (post-_prepare)."""
+        for leg in self.legs:
+            leg.columns = LegColumns(leg.df, aligned)
+
     # --- fast-path detection ---------------------------------------------
 
     def _can_use_fast_path(self) -> bool:
@@ -394,6 +466,7 @@ class BasketRunner:
 
         # Construct positional views per leg over the aligned set.
         leg_views: list[pd.DataFrame] = [leg.df.loc[aligned].copy() for leg in self.legs]
+        self._attach_columns(aligned)
 
         # --- Warmup mute setup (no-op when warmup_bars == 0). ---
         wrap_targets: list[tuple[Any, Any, Any]] = []  # (strategy, orig_check_entry, orig_check_exit)
@@ -429,6 +502,8 @@ class BasketRunner:
                 # Skip rule.apply during warmup — the rule's signal columns and
                 # internal state would not be valid against muted legs.
                 if i >= self.warmup_bars:
+                    for leg in self.legs:
+                        leg.columns.seek(i, bar_ts)
                     for rule in self.rules:
                         rule.apply(self.legs, i, bar_ts)
         finally:
@@ -475,6 +550,7 @@ class BasketRunner:
             )
 
         leg_views: list[pd.DataFrame] = [leg.df.loc[aligned].copy() for leg in self.legs]
+        self._attach_columns(aligned)
 
         # ---- Open every leg at the bar after warmup completes.
         # Fast-path strategies (ContinuousHoldStrategy + variants) signal once
@@ -525,6 +601,8 @@ class BasketRunner:
                     leg.state.trade_high = bar_high
                 if bar_low < leg.state.trade_low:
                     leg.state.trade_low = bar_low
+            for leg in self.legs:
+                leg.columns.seek(i, bar_ts)
             for rule in self.rules:
                 rule.apply(self.legs, i, bar_ts)
 
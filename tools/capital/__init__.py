@@ -6,6 +6,7 @@ Submodules (stable import order — leaf → core → orchestration):
                                    compute_signal_hash (trade-signal identity)
   capital_broker_spec           — broker spec YAML loading + cache (single location)
   capital_fx                    — FX currency parsing + ConversionLookup (dynamic USD conv)
+  capital_recording             — opt-in columnar recorders (EquityTimeline, ColumnarLog)
   capital_portfolio_state       — PROFILES, PortfolioState (sizing + gate logic)
   capital_metrics               — compute_deployable_metrics
   capital_validation            — conservation + comparative/validation print helpers
@@ -15,5 +16,6 @@ Submodules (stable import order — leaf → core → orchestration):
 
 Dependency direction (strict, no reverse links):
   events ← broker_spec ← fx ← portfolio_state ← (metrics, validation, plotting, artifacts)
+  recording is a leaf (numpy/pandas only), used by portfolio_state.
   directive_discovery is standalone.
 """
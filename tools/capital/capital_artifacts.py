@@ -6,23 +6,29 @@ import csv
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 from tools.capital.capital_metrics import compute_deployable_metrics
 from tools.capital.capital_plotting import plot_equity_curve
 from tools.capital.capital_portfolio_state import PortfolioState
+from tools.capital.capital_recording import ColumnarLog, EquityTimeline
+from tools.chart_render import ChartRenderService
 
 
-def emit_profile_artifacts(state: PortfolioState, output_dir: Path, total_runs: int, total_assets: int):
-    """Write per-profile CSV and JSON artifacts."""
+def emit_profile_artifacts(state: PortfolioState, output_dir: Path, total_runs: int, total_assets: int,
+                           renderer: Optional[ChartRenderService] = None):
+    """Write per-profile CSV and JSON artifacts (PNG via ``renderer`` when given)."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # equity_curve.csv
-    with open(output_dir / "equity_curve.csv", "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["timestamp", "equity"])
-        w.writeheader()
-        for ts, eq in state.equity_timeline:
-            w.writerow({"timestamp": str(ts), "equity": round(eq, 2)})
+    if isinstance(state.equity_timeline, EquityTimeline):
+        state.equity_timeline.to_csv(output_dir / "equity_curve.csv")
+    else:
+        with open(output_dir / "equity_curve.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=["timestamp", "equity"])
+            w.writeheader()
+            for ts, eq in state.equity_timeline:
+                w.writerow({"timestamp": str(ts), "equity": round(eq, 2)})
 
     # deployable_trade_log.csv
     trade_fields = [
@@ -34,30 +40,45 @@ def emit_profile_artifacts(state: PortfolioState, output_dir: Path, total_runs:
         "signal_hash",   # 16-char SHA-256 prefix for signal integrity verification
     ]
 
+    trade_log = state.closed_trades_log
+    columnar = isinstance(trade_log, ColumnarLog)
+
     # Check if overrides exist in log
-    has_overrides = any(t.get("risk_override_flag") for t in state.closed_trades_log)
+    if columnar:
+        has_overrides = any(trade_log.column("risk_override_flag"))
+    else:
+        has_overrides = any(t.get("risk_override_flag") for t in trade_log)
     if has_overrides:
         trade_fields.extend(["risk_override_flag", "target_risk_usd", "actual_risk_usd", "risk_multiple"])
 
     # Partial-exit columns only emitted when at least one trade carried a partial
-    has_partials = any(t.get("partial_fraction") is not None for t in state.closed_trades_log)
+    if columnar:
+        has_partials = any(v is not None for v in trade_log.column("partial_fraction"))
+    else:
+        has_partials = any(t.get("partial_fraction") is not None for t in trade_log)
     if has_partials:
         trade_fields.extend(["partial_fraction", "partial_pnl_usd", "partial_exit_price", "partial_exit_timestamp"])
 
-    with open(output_dir / "deployable_trade_log.csv", "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=trade_fields, extrasaction='ignore')
-        w.writeheader()
-        for t in state.closed_trades_log:
-            w.writerow(t)
+    if columnar:
+        trade_log.to_csv(output_dir / "deployable_trade_log.csv", trade_fields)
+    else:
+        with open(output_dir / "deployable_trade_log.csv", "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=trade_fields, extrasaction='ignore')
+            w.writeheader()
+            for t in trade_log:
+                w.writerow(t)
 
     # rejection_log.csv
     if state.rejection_log:
         rej_fields = list(state.rejection_log[0].keys())
-        with open(output_dir / "rejection_log.csv", "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=rej_fields)
-            w.writeheader()
-            for r in state.rejection_log:
-                w.writerow(r)
+        if isinstance(state.rejection_log, ColumnarLog):
+            state.rejection_log.to_csv(output_dir / "rejection_log.csv", rej_fields)
+        else:
+            with open(output_dir / "rejection_log.csv", "w", newline="", encoding="utf-8") as f:
+                w = csv.DictWriter(f, fieldnames=rej_fields)
+                w.writeheader()
+                for r in state.rejection_log:
+                    w.writerow(r)
 
     # summary_metrics.json
     metrics = compute_deployable_metrics(state, total_runs, total_assets)
@@ -65,7 +86,7 @@ def emit_profile_artifacts(state: PortfolioState, output_dir: Path, total_runs:
         json.dump(metrics, f, indent=2)
 
     # equity_curve.png (equity + drawdown chart)
-    plot_equity_curve(state, output_dir)
+    plot_equity_curve(state, output_dir, renderer=renderer)
 
     print(f"[EMIT] {state.profile_name} artifacts -> {output_dir}")
     return metrics
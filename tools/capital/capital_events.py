@@ -10,17 +10,25 @@ Exposes:
   _parse_ts / _optional_float             — parsing helpers
   load_trades / load_partial_legs         — raw-artifact loaders
   build_events / sort_events              — event-stream assembly
+  load_trade_table / build_event_table    — columnar equivalents of the above
+  events_from_table / load_sorted_events  — columnar path -> sorted TradeEvents
   print_events                            — diagnostic dump
 """
 
 from __future__ import annotations
 
 import csv
+import gc
 import hashlib
+import re
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
 
 
 # ======================================================================
@@ -394,6 +402,245 @@ def sort_events(events: List[TradeEvent]) -> List[TradeEvent]:
     return sorted(events, key=lambda e: e.sort_key)
 
 
+# ======================================================================
+# COLUMNAR INGESTION
+# ======================================================================
+# Same contract as load_trades -> build_events -> sort_events, but every
+# column is converted once per array instead of once per row. Values keep
+# the row path's semantics exactly: numbers go through float()/int(),
+# optional fields through the _optional_float rules, and timestamps
+# through _parse_ts unless they have the plain ISO shape pandas parses
+# identically. Event order matches sort_events (stable, same key).
+
+# Shapes where pandas' ISO8601 parser and datetime.fromisoformat agree.
+_ISO_TS_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[ T]\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?(?:Z|[+-]\d{2}:\d{2})?)?"
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+# Event table codes: index into _EVENT_TYPES; priority via EVENT_TYPE_PRIORITY.
+_EVENT_TYPES = (EVENT_TYPE_ENTRY, EVENT_TYPE_PARTIAL, EVENT_TYPE_EXIT)
+_EVENT_PRIORITIES = np.array([EVENT_TYPE_PRIORITY[t] for t in _EVENT_TYPES], dtype=np.int64)
+
+
+@contextmanager
+def _gc_paused():
+    """Suspend cyclic GC while bulk-allocating acyclic objects.
+
+    Ingestion creates millions of strings, floats and TradeEvents and no
+    reference cycles; generational passes over that growing heap cost
+    more than the work itself.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _epoch_us(dt: datetime) -> int:
+    return (dt - _EPOCH) // _ONE_US
+
+
+def _parse_ts_array(values) -> np.ndarray:
+    """Vectorised _parse_ts: int64 microseconds since the UTC epoch.
+
+    Each distinct string is parsed once. Plain ISO forms go through one
+    pandas call; anything else (or anything pandas rejects) falls back to
+    _parse_ts, which also supplies the error message for bad input.
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    tokens = pd.Series(uniques, dtype=object).str.strip()
+    out = np.zeros(len(tokens), dtype=np.int64)
+    shape = tokens.str.fullmatch(_ISO_TS_RE).fillna(False).to_numpy(dtype=bool)
+    aware = tokens.str.contains(r"(?:Z|[+-]\d{2}:\d{2})$", regex=True).fillna(False).to_numpy(dtype=bool)
+    fast = np.zeros(len(tokens), dtype=bool)
+    # Naive and offset forms are parsed separately: pandas mis-reads naive
+    # values when one call mixes them with offsets.
+    for group in (shape & ~aware, shape & aware):
+        idx = np.flatnonzero(group)
+        if not len(idx):
+            continue
+        parsed = pd.to_datetime(tokens.iloc[idx], utc=True, format="ISO8601", errors="coerce")
+        ok = parsed.notna().to_numpy()
+        out[idx[ok]] = (
+            parsed[ok].dt.tz_localize(None).to_numpy().astype("datetime64[us]").view(np.int64)
+        )
+        fast[idx[ok]] = True
+    for i in np.flatnonzero(~fast):
+        out[i] = _epoch_us(_parse_ts(uniques[i]))
+    return out[codes]
+
+
+def _strip_array(col: pd.Series) -> np.ndarray:
+    """str.strip() per value, computed once per distinct value."""
+    codes, uniques = pd.factorize(col.to_numpy(dtype=object))
+    return np.array([u.strip() for u in uniques], dtype=object)[codes]
+
+
+def _blank_mask(col: pd.Series) -> np.ndarray:
+    """True where a value is empty or 'none' once stripped (load_trades' rule)."""
+    codes, uniques = pd.factorize(col.to_numpy(dtype=object))
+    blank = [u.strip() == "" or u.strip().lower() == "none" for u in uniques]
+    return np.array(blank, dtype=bool)[codes]
+
+
+def _optional_float_array(col: pd.Series) -> np.ndarray:
+    """Vectorised _optional_float: object array of float or None."""
+    out = np.full(len(col), None, dtype=object)
+    keep = ~_blank_mask(col)
+    if keep.any():
+        out[keep] = col.to_numpy(dtype=object)[keep].astype(np.float64)
+    return out
+
+
+def load_trade_table(run_dirs: List[Path]) -> pd.DataFrame:
+    """Columnar load_trades: one DataFrame of raw string columns, same checks."""
+    frames = []
+
+    for run_dir in run_dirs:
+        csv_path = run_dir / "raw" / "results_tradelevel.csv"
+        if not csv_path.exists():
+            raise FileNotFoundError(f"Missing trade artifact: {csv_path}")
+
+        df = pd.read_csv(
+            csv_path, dtype=str, keep_default_na=False, index_col=False,
+            encoding="utf-8",
+        ).fillna("")
+        missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+        if missing:
+            raise ValueError(
+                f"[FATAL] {csv_path} missing required columns: {missing}"
+            )
+        blank = np.column_stack([_blank_mask(df[c]) for c in REQUIRED_COLUMNS])
+        if blank.any():
+            row = int(np.flatnonzero(blank.any(axis=1))[0])
+            col = REQUIRED_COLUMNS[int(np.argmax(blank[row]))]
+            raise ValueError(
+                f"[FATAL] {csv_path} trade {df['parent_trade_id'].iloc[row]} "
+                f"has empty required field: '{col}'"
+            )
+        for col in OPTIONAL_RECON_COLUMNS:
+            if col not in df.columns:
+                df[col] = ""
+        frames.append(df)
+
+    trades = (
+        pd.concat(frames, ignore_index=True) if frames
+        else pd.DataFrame(columns=REQUIRED_COLUMNS + OPTIONAL_RECON_COLUMNS, dtype=str)
+    )
+    print(f"[LOAD] Total trades loaded: {len(trades)}")
+    return trades
+
+
+def build_event_table(trades: pd.DataFrame,
+                      partials_by_parent: Optional[dict] = None) -> Dict[str, np.ndarray]:
+    """Columnar build_events + sort_events: parallel arrays, one slot per event.
+
+    ``timestamp_us`` holds microseconds since the UTC epoch; the other
+    keys mirror the TradeEvent fields.
+    """
+    partials_by_parent = partials_by_parent or {}
+    n = len(trades)
+
+    trade_id = (trades["strategy_name"] + "|" + trades["parent_trade_id"]).to_numpy(dtype=object)
+    entry_ts = _parse_ts_array(trades["entry_timestamp"])
+    exit_ts = _parse_ts_array(trades["exit_timestamp"])
+    per_trade = {
+        "trade_id": trade_id,
+        "symbol": trades["symbol"].to_numpy(dtype=object),
+        "direction": trades["direction"].to_numpy(dtype=object).astype(np.int64),
+        "entry_price": trades["entry_price"].to_numpy(dtype=object).astype(np.float64),
+        "exit_price": trades["exit_price"].to_numpy(dtype=object).astype(np.float64),
+        "risk_distance": trades["risk_distance"].to_numpy(dtype=object).astype(np.float64),
+        "initial_stop_price": _optional_float_array(trades["initial_stop_price"]),
+        "atr_entry": _optional_float_array(trades["atr_entry"]),
+        "r_multiple": _optional_float_array(trades["r_multiple"]),
+        "volatility_regime": _strip_array(trades["volatility_regime"]),
+        "trend_regime": _strip_array(trades["trend_regime"]),
+        "trend_label": _strip_array(trades["trend_label"]),
+    }
+
+    # PARTIAL rows: at most one per parent, inside the [entry, exit] window.
+    legs = [partials_by_parent.get(tid) for tid in trade_id] if partials_by_parent else [None] * n
+    p_idx = np.array([i for i, pl in enumerate(legs) if pl is not None], dtype=np.int64)
+    p_ts = np.array([_epoch_us(legs[i]["timestamp"]) for i in p_idx], dtype=np.int64)
+    outside = (p_ts < entry_ts[p_idx]) | (p_ts > exit_ts[p_idx])
+    if outside.any():
+        i = int(p_idx[np.argmax(outside)])
+        pl = legs[i]
+        raise ValueError(
+            f"[FATAL] partial timestamp {pl['timestamp']} outside "
+            f"[{_parse_ts(trades['entry_timestamp'].iloc[i])}, "
+            f"{_parse_ts(trades['exit_timestamp'].iloc[i])}] for {trade_id[i]}"
+        )
+
+    # Lay events out in build_events' emission order (ENTRY, PARTIAL, EXIT
+    # per trade) so the stable sort below breaks full ties the same way.
+    all_idx = np.arange(n, dtype=np.int64)
+    src = np.concatenate([all_idx, p_idx, all_idx])
+    kind = np.concatenate([
+        np.zeros(n, dtype=np.int64),
+        np.ones(len(p_idx), dtype=np.int64),
+        np.full(n, 2, dtype=np.int64),
+    ])
+    ts = np.concatenate([entry_ts, p_ts, exit_ts])
+    emitted = np.concatenate([all_idx * 3, p_idx * 3 + 1, all_idx * 3 + 2])
+
+    expected = n * 2 + len(p_idx)
+    print(f"[BUILD] Total events created: {len(src)}  (expected: {expected})")
+
+    # sort_key = (timestamp, priority, trade_id); trade_id by sorted rank.
+    tid_rank, _ = pd.factorize(trade_id, sort=True)
+    order = np.lexsort((emitted, tid_rank[src], _EVENT_PRIORITIES[kind], ts))
+    src, kind = src[order], kind[order]
+
+    partial_fraction = np.full(len(src), None, dtype=object)
+    partial_exit_price = np.full(len(src), None, dtype=object)
+    is_partial = np.flatnonzero(kind == 1)
+    partial_fraction[is_partial] = [legs[i]["fraction"] for i in src[is_partial]]
+    partial_exit_price[is_partial] = [legs[i]["exit_price"] for i in src[is_partial]]
+
+    table = {
+        "timestamp_us": ts[order],
+        "event_type": np.array(_EVENT_TYPES, dtype=object)[kind],
+    }
+    table.update({col: values[src] for col, values in per_trade.items()})
+    table["partial_fraction"] = partial_fraction
+    table["partial_exit_price"] = partial_exit_price
+    return table
+
+
+def events_from_table(table: Dict[str, np.ndarray]) -> List[TradeEvent]:
+    """Materialise an event table (see build_event_table) as TradeEvents."""
+    stamps = table["timestamp_us"].astype("datetime64[us]").astype(object)
+    utc = timezone.utc
+    cols = [table[c].tolist() for c in (
+        "event_type", "trade_id", "symbol", "direction",
+        "entry_price", "exit_price", "risk_distance",
+        "initial_stop_price", "atr_entry", "r_multiple",
+        "volatility_regime", "trend_regime", "trend_label",
+        "partial_fraction", "partial_exit_price",
+    )]
+    with _gc_paused():
+        return [
+            TradeEvent(ts.replace(tzinfo=utc), *fields)
+            for ts, *fields in zip(stamps, *cols)
+        ]
+
+
+def load_sorted_events(run_dirs: List[Path],
+                       partials_by_parent: Optional[dict] = None) -> List[TradeEvent]:
+    """Columnar load_trades -> build_events -> sort_events for run_dirs."""
+    with _gc_paused():
+        table = build_event_table(load_trade_table(run_dirs), partials_by_parent)
+        return events_from_table(table)
+
+
 # ======================================================================
 # VALIDATION OUTPUT
 # ======================================================================
@@ -1,18 +1,20 @@
 """FX currency parsing + dynamic USD conversion.
 
 ConversionLookup caches daily close series for non-USD quote currencies
-and supports date-aware bisect lookup. get_usd_per_price_unit_dynamic()
-falls back to the provided static value when data is unavailable and
-logs once per symbol (see _STATIC_FALLBACK_WARNED).
+as NumPy arrays and supports date-aware searchsorted lookup, per
+timestamp (get_rate) or in batch (get_rates).
+get_usd_per_price_unit_dynamic() falls back to the provided static value
+when data is unavailable and logs once per symbol (see
+_STATIC_FALLBACK_WARNED).
 """
 
 from __future__ import annotations
 
-import bisect
 from datetime import datetime, date as date_type, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -52,17 +54,19 @@ CONVERSION_MAP = {
 
 class ConversionLookup:
     """
-    Provides O(1)-ish USD conversion rate lookups by date.
+    Provides O(log n) USD conversion rate lookups by date.
 
     Loads daily close prices from RESEARCH data for each required
-    conversion pair. Uses bisect to find the nearest available date
-    (handles weekends/holidays).
+    conversion pair into parallel NumPy arrays (datetime64[D] dates,
+    float64 rates). Lookups take the latest bar on or before the UTC
+    trading date (handles weekends/holidays); get_rates resolves a whole
+    batch of timestamps with one searchsorted call.
     """
 
     def __init__(self):
-        # {currency: [(date, rate), ...]} sorted by date
-        self._series: Dict[str, List[Tuple[date_type, float]]] = {}
-        self._dates: Dict[str, List[date_type]] = {}  # for bisect
+        # {currency: sorted datetime64[D] dates} / {currency: float64 rates}
+        self._dates: Dict[str, np.ndarray] = {}
+        self._rates: Dict[str, np.ndarray] = {}
         self._fallback_warned: set = set()
 
     def load(self, currencies_needed: set, data_root: Optional[Path] = None):
@@ -90,25 +94,37 @@ class ConversionLookup:
                     end_date="2030-12-31",
                     data_root=data_root,
                 )
-                # Build sorted (date, rate) list
-                entries = []
-                for _, row in df.iterrows():
-                    ts = pd.to_datetime(row.get("timestamp", row.get("date")), utc=True)
-                    close = float(row["close"])
-                    if inverted:
-                        rate = 1.0 / close if close != 0 else 0.0
-                    else:
-                        rate = close
-                    entries.append((ts.date(), rate))
-
-                entries.sort(key=lambda x: x[0])
-                self._series[ccy] = entries
-                self._dates[ccy] = [e[0] for e in entries]
-                print(f"[CONV] Loaded {pair_symbol} -> {ccy}/USD: {len(entries)} daily bars")
+                dates, rates = self._series_arrays(df, inverted)
+                self._dates[ccy] = dates
+                self._rates[ccy] = rates
+                print(f"[CONV] Loaded {pair_symbol} -> {ccy}/USD: {len(dates)} daily bars")
 
             except FileNotFoundError:
                 print(f"[WARN] Conversion data not found for {pair_symbol}. Will use YAML fallback for {ccy}.")
 
+    @staticmethod
+    def _series_arrays(df: pd.DataFrame, inverted: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Daily bars -> (UTC dates, quote_ccy -> USD rates), sorted by date."""
+        ts_col = "timestamp" if "timestamp" in df.columns else "date"
+        dates = ConversionLookup._utc_dates(df[ts_col])
+        close = df["close"].to_numpy(dtype=np.float64)
+        if inverted:
+            with np.errstate(divide="ignore"):
+                rates = np.where(close != 0, 1.0 / close, 0.0)
+        else:
+            rates = close
+        order = np.argsort(dates, kind="stable")
+        return dates[order], rates[order]
+
+    @staticmethod
+    def _utc_dates(values) -> np.ndarray:
+        """Dates / datetimes (naive = UTC) -> datetime64[D] UTC trading dates."""
+        arr = np.asarray(values)
+        if arr.dtype.kind == "M":
+            return arr.astype("datetime64[D]")
+        stamps = pd.to_datetime(pd.Series(arr, dtype=object), utc=True)
+        return stamps.dt.tz_localize(None).to_numpy().astype("datetime64[D]")
+
     @staticmethod
     def _normalize_lookup_date(lookup_input) -> date_type:
         """
@@ -135,17 +151,33 @@ class ConversionLookup:
             return 1.0
 
         dates = self._dates.get(currency)
-        series = self._series.get(currency)
-        if dates is None or series is None:
+        if dates is None:
             return None
 
-        lookup_date = self._normalize_lookup_date(lookup_input)
+        lookup_date = np.datetime64(self._normalize_lookup_date(lookup_input), "D")
+
+        # Nearest date <= lookup_date; before the series starts, use the earliest.
+        idx = int(np.searchsorted(dates, lookup_date, side="right")) - 1
+        return float(self._rates[currency][max(idx, 0)])
+
+    def get_rates(self, currency: str, timestamps) -> Optional[np.ndarray]:
+        """
+        Vectorised get_rate: quote_ccy -> USD rates for many timestamps.
+
+        ``timestamps`` may hold dates, datetimes (naive = UTC) or
+        datetime64 values. Returns a float64 array aligned with the input,
+        or None if data unavailable (caller should use YAML fallback).
+        """
+        lookup_dates = self._utc_dates(timestamps)
+        if currency == "USD":
+            return np.ones(len(lookup_dates), dtype=np.float64)
+
+        dates = self._dates.get(currency)
+        if dates is None:
+            return None
 
-        # Bisect to find nearest date <= lookup_date
-        idx = bisect.bisect_right(dates, lookup_date) - 1
-        if idx < 0:
-            idx = 0  # Use earliest available
-        return series[idx][1]
+        idx = np.searchsorted(dates, lookup_dates, side="right") - 1
+        return self._rates[currency][np.maximum(idx, 0)]
 
 
 # Tracks symbols already warned about static fallback — prevents per-trade log spam.
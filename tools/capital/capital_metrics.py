@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from tools.capital.capital_portfolio_state import PortfolioState
+from tools.capital.capital_recording import ColumnarLog
 
 
 def compute_deployable_metrics(state: PortfolioState, total_runs: int, total_assets: int) -> dict:
@@ -52,8 +53,12 @@ def compute_deployable_metrics(state: PortfolioState, total_runs: int, total_ass
     # Longest loss streak
     longest_loss = 0
     current_loss = 0
-    for t in state.closed_trades_log:
-        if t["pnl_usd"] < 0:
+    if isinstance(state.closed_trades_log, ColumnarLog):
+        trade_pnls = state.closed_trades_log.column("pnl_usd")
+    else:
+        trade_pnls = [t["pnl_usd"] for t in state.closed_trades_log]
+    for pnl in trade_pnls:
+        if pnl < 0:
             current_loss += 1
             if current_loss > longest_loss:
                 longest_loss = current_loss
@@ -1,42 +1,71 @@
-"""Equity-curve + overlay comparison plots (visualization only, no artifact writing)."""
+"""Equity-curve + overlay comparison plots (visualization only, no artifact writing).
+
+Each chart is split into a payload builder (daily resample, drawdown and
+min/max decimation, run in the caller) and a module-level renderer that
+only draws arrays, so a ChartRenderService can encode the PNGs in a
+process pool (see tools/chart_render.py).
+"""
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
+
+import pandas as pd
 
 from tools.capital.capital_portfolio_state import PortfolioState
+from tools.capital.capital_recording import EquityTimeline
+from tools.chart_render import ChartRenderService, decimate_minmax, plot_x
+
+
+def _daily_equity(timeline) -> pd.Series:
+    """equity_timeline -> daily last-equity series (forward-filled)."""
+    if isinstance(timeline, EquityTimeline):
+        eq_series = pd.Series(timeline.equity(), index=timeline.index())
+    else:
+        frame = pd.DataFrame.from_records(timeline, columns=["timestamp", "equity"])
+        eq_series = pd.Series(
+            frame["equity"].to_numpy(dtype=float),
+            index=pd.DatetimeIndex(pd.to_datetime(frame["timestamp"])),
+        )
+    eq_series = eq_series[~eq_series.index.duplicated(keep="last")]
+    return eq_series.resample("D").last().ffill()
 
 
-def plot_equity_curve(state: PortfolioState, output_dir: Path) -> None:
-    """Render equity-curve + drawdown chart and save as PNG."""
+def equity_curve_payload(state: PortfolioState) -> Optional[dict]:
+    """Array payload for render_equity_curve, decimated to screen resolution."""
+    if not state.equity_timeline:
+        return None
+
+    daily   = _daily_equity(state.equity_timeline)
+    peak    = daily.cummax()
+    dd_pct  = ((daily - peak) / peak) * 100   # negative values
+    dates   = plot_x(daily.index)
+
+    eq_x, eq_y = decimate_minmax(dates, daily.to_numpy())
+    dd_x, dd_y = decimate_minmax(dates, dd_pct.to_numpy())
+    return {
+        "profile_name": state.profile_name,
+        "starting_capital": state.starting_capital,
+        "final_equity": float(daily.iloc[-1]),
+        "eq_x": eq_x, "eq_y": eq_y,
+        "dd_x": dd_x, "dd_y": dd_y,
+    }
+
+
+def render_equity_curve(payload: dict, out_path: Path) -> None:
+    """Render equity-curve + drawdown chart from a payload and save as PNG."""
     try:
         import matplotlib
         matplotlib.use("Agg")  # headless â€” no display required
         import matplotlib.pyplot as plt
         import matplotlib.dates as mdates
-        import matplotlib.patches as mpatches
-        import numpy as np
     except ImportError:
         print("[WARN] matplotlib not installed â€” skipping equity curve plot.")
         return
 
-    if not state.equity_timeline:
-        return
-
-    timestamps = [ts for ts, _ in state.equity_timeline]
-    equity     = [eq for _, eq in state.equity_timeline]
-
-    # Convert to pandas for resampling convenience
-    import pandas as pd
-    eq_series = pd.Series(equity, index=pd.to_datetime(timestamps))
-    eq_series = eq_series[~eq_series.index.duplicated(keep="last")]
-    daily     = eq_series.resample("D").last().ffill()
-
-    peak    = daily.cummax()
-    dd_pct  = ((daily - peak) / peak) * 100   # negative values
-
-    dates = daily.index.to_pydatetime()
+    eq_x, eq_y = payload["eq_x"], payload["eq_y"]
+    dd_x, dd_y = payload["dd_x"], payload["dd_y"]
 
     # â”€â”€ Layout: 2 rows, shared x-axis â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
     fig, (ax_eq, ax_dd) = plt.subplots(
@@ -48,15 +77,15 @@ def plot_equity_curve(state: PortfolioState, output_dir: Path) -> None:
     )
     fig.subplots_adjust(hspace=0.05)
 
-    profile_label = state.profile_name
-    start_cap     = state.starting_capital
-    final_eq      = daily.iloc[-1]
+    profile_label = payload["profile_name"]
+    start_cap     = payload["starting_capital"]
+    final_eq      = payload["final_equity"]
 
     # â”€â”€ Upper panel: equity curve â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
     ax_eq.set_facecolor("#0d0d12")
-    ax_eq.plot(dates, daily.values, color="#00d4aa", linewidth=1.4, zorder=3)
-    ax_eq.fill_between(dates, start_cap, daily.values,
-                        where=(daily.values >= start_cap),
+    ax_eq.plot(eq_x, eq_y, color="#00d4aa", linewidth=1.4, zorder=3)
+    ax_eq.fill_between(eq_x, start_cap, eq_y,
+                        where=(eq_y >= start_cap),
                         alpha=0.15, color="#00d4aa", zorder=2)
     ax_eq.axhline(start_cap, color="#555", linewidth=0.8, linestyle="--")
 
@@ -77,10 +106,10 @@ def plot_equity_curve(state: PortfolioState, output_dir: Path) -> None:
 
     # â”€â”€ Lower panel: drawdown â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€
     ax_dd.set_facecolor("#0d0d12")
-    ax_dd.fill_between(dates, dd_pct.values, 0,
-                        where=(dd_pct.values < 0),
+    ax_dd.fill_between(dd_x, dd_y, 0,
+                        where=(dd_y < 0),
                         color="#e05252", alpha=0.7, zorder=2)
-    ax_dd.plot(dates, dd_pct.values, color="#e05252", linewidth=0.9, zorder=3)
+    ax_dd.plot(dd_x, dd_y, color="#e05252", linewidth=0.9, zorder=3)
     ax_dd.axhline(0, color="#555", linewidth=0.8)
 
     ax_dd.set_ylabel("Drawdown %", color="#ccc", fontsize=10)
@@ -96,33 +125,65 @@ def plot_equity_curve(state: PortfolioState, output_dir: Path) -> None:
     ax_dd.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
     ax_dd.tick_params(axis="x", colors="#999", labelsize=9)
 
-    out_path = output_dir / "equity_curve.png"
     fig.savefig(out_path, dpi=150, bbox_inches="tight", facecolor=fig.get_facecolor())
     plt.close(fig)
-    print(f"[EMIT] {state.profile_name} equity curve plot -> {out_path}")
+    print(f"[EMIT] {profile_label} equity curve plot -> {out_path}")
 
 
-def plot_overlay_comparison(states: Dict[str, "PortfolioState"], output_root: Path) -> None:
-    """Render a single normalized-linear overlay comparing all profiles on shared axes.
+def plot_equity_curve(state: PortfolioState, output_dir: Path,
+                      renderer: Optional[ChartRenderService] = None) -> None:
+    """Render equity-curve + drawdown chart and save as PNG.
 
-    Individual equity_curve.png files use log-scale and look visually identical across
-    profiles because every profile consumes the same R-series. This overlay plots each
-    profile normalized to starting_capital=1.0 on a LINEAR axis so magnitude divergence
-    (the real signal) is visible in one frame.
+    With a ``renderer`` the PNG is encoded in its pool; otherwise inline.
     """
+    payload = equity_curve_payload(state)
+    if payload is None:
+        return
+    out_path = output_dir / "equity_curve.png"
+    if renderer is None:
+        render_equity_curve(payload, out_path)
+    else:
+        renderer.submit(render_equity_curve, payload, out_path)
+
+
+def overlay_payload(states: Dict[str, "PortfolioState"]) -> list:
+    """Per-profile normalized equity + drawdown lines for render_overlay_comparison."""
+    # REAL_MODEL_V1 rendered thick so it stands out if present.
+    ordered = sorted(states.items(), key=lambda kv: 0 if kv[0] == "REAL_MODEL_V1" else 1)
+
+    lines = []
+    for name, state in ordered:
+        if not state.equity_timeline:
+            lines.append(None)  # keeps palette slots aligned with profile order
+            continue
+        daily = _daily_equity(state.equity_timeline)
+        start = state.starting_capital if state.starting_capital > 0 else daily.iloc[0]
+        norm = daily / start
+        peak = daily.cummax()
+        dd = (daily / peak - 1.0) * 100.0
+        dates = plot_x(daily.index)
+        norm_x, norm_y = decimate_minmax(dates, norm.to_numpy())
+        dd_x, dd_y = decimate_minmax(dates, dd.to_numpy())
+        lines.append({
+            "name": name,
+            "label": f"{name}  ({norm.iloc[-1]:.2f}x, DD {dd.min():.1f}%)",
+            "norm_x": norm_x, "norm_y": norm_y,
+            "dd_x": dd_x, "dd_y": dd_y,
+        })
+    return lines
+
+
+def render_overlay_comparison(lines: list, out_path: Path) -> None:
+    """Render the normalized-linear profile overlay from overlay_payload lines."""
     try:
         import matplotlib
         matplotlib.use("Agg")
         import matplotlib.pyplot as plt
         import matplotlib.dates as mdates
-        import pandas as pd
     except ImportError:
         print("[WARN] matplotlib not installed — skipping overlay comparison plot.")
         return
 
-    if not states:
-        return
-
     palette = [
         "#00d4aa", "#ff7043", "#42a5f5", "#ab47bc",
         "#ffca28", "#8d6e63", "#bdbdbd", "#ef5350",
@@ -138,29 +199,16 @@ def plot_overlay_comparison(states: Dict[str, "PortfolioState"], output_root: Pa
     ax_eq.set_facecolor("#0d0d12")
     ax_dd.set_facecolor("#0d0d12")
 
-    # REAL_MODEL_V1 rendered thick so it stands out if present.
-    ordered = sorted(states.items(), key=lambda kv: 0 if kv[0] == "REAL_MODEL_V1" else 1)
-
-    for i, (name, state) in enumerate(ordered):
-        if not state.equity_timeline:
+    for i, line in enumerate(lines):
+        if line is None:
             continue
-        ts = [t for t, _ in state.equity_timeline]
-        eq = [e for _, e in state.equity_timeline]
-        s = pd.Series(eq, index=pd.to_datetime(ts))
-        s = s[~s.index.duplicated(keep="last")]
-        daily = s.resample("D").last().ffill()
-        start = state.starting_capital if state.starting_capital > 0 else daily.iloc[0]
-        norm = daily / start
-        peak = daily.cummax()
-        dd = (daily / peak - 1.0) * 100.0
-
+        name = line["name"]
         color = palette[i % len(palette)]
         lw = 2.2 if name == "REAL_MODEL_V1" else 1.2
         alpha = 1.0 if name == "REAL_MODEL_V1" else 0.85
-        label = f"{name}  ({norm.iloc[-1]:.2f}x, DD {dd.min():.1f}%)"
-        ax_eq.plot(daily.index.to_pydatetime(), norm.values,
-                   color=color, linewidth=lw, alpha=alpha, label=label, zorder=3)
-        ax_dd.plot(daily.index.to_pydatetime(), dd.values,
+        ax_eq.plot(line["norm_x"], line["norm_y"],
+                   color=color, linewidth=lw, alpha=alpha, label=line["label"], zorder=3)
+        ax_dd.plot(line["dd_x"], line["dd_y"],
                    color=color, linewidth=lw * 0.7, alpha=alpha, zorder=3)
 
     ax_eq.axhline(1.0, color="#555", linewidth=0.8, linestyle="--")
@@ -185,7 +233,25 @@ def plot_overlay_comparison(states: Dict[str, "PortfolioState"], output_root: Pa
     ax_dd.xaxis.set_major_locator(mdates.YearLocator())
     ax_dd.xaxis.set_major_formatter(mdates.DateFormatter("%Y"))
 
-    out_path = output_root / "overlay_comparison.png"
     fig.savefig(out_path, dpi=130, bbox_inches="tight", facecolor=fig.get_facecolor())
     plt.close(fig)
     print(f"[EMIT] Overlay comparison -> {out_path}")
+
+
+def plot_overlay_comparison(states: Dict[str, "PortfolioState"], output_root: Path,
+                            renderer: Optional[ChartRenderService] = None) -> None:
+    """Render a single normalized-linear overlay comparing all profiles on shared axes.
+
+    Individual equity_curve.png files use log-scale and look visually identical across
+    profiles because every profile consumes the same R-series. This overlay plots each
+    profile normalized to starting_capital=1.0 on a LINEAR axis so magnitude divergence
+    (the real signal) is visible in one frame.
+    """
+    if not states:
+        return
+    out_path = output_root / "overlay_comparison.png"
+    lines = overlay_payload(states)
+    if renderer is None:
+        render_overlay_comparison(lines, out_path)
+    else:
+        renderer.submit(render_overlay_comparison, lines, out_path)
@@ -3,6 +3,7 @@
 This is the core module. Imports from:
   - capital_events (TradeEvent, OpenTrade, compute_signal_hash, EVENT_* constants)
   - capital_broker_spec (_normalize_lot_broker)
+  - capital_recording (use_columnar_recording — opt-in columnar recorders)
 
 NO reverse dependency. Other modules import FROM this module, not into it.
 """
@@ -16,6 +17,7 @@ from typing import Dict, List, Optional, Tuple
 
 from tools.capital.capital_broker_spec import _normalize_lot_broker
 from tools.capital.capital_events import OpenTrade, TradeEvent, compute_signal_hash
+from tools.capital.capital_recording import use_columnar_recording
 
 
 FLOAT_TOLERANCE = 1e-9
@@ -131,6 +133,9 @@ class PortfolioState:
     # dangerous. When set, trades with normalized_lot > retail_max_lot are
     # SKIPPED (not scaled down) so rejection_rate honestly reflects executability.
     retail_max_lot: Optional[float] = None
+    # Record timelines/logs into typed columnar buffers (capital_recording)
+    # instead of Python lists — same contents, far fewer objects.
+    columnar_recording: bool = False
     # Running state
     equity: float = 0.0
     realized_pnl: float = 0.0
@@ -177,6 +182,8 @@ class PortfolioState:
             )
         self.equity = self.starting_capital
         self.peak_equity = self.starting_capital
+        if self.columnar_recording:
+            use_columnar_recording(self)
 
     # ------------------------------------------------------------------
     # LOT SIZING
@@ -0,0 +1,410 @@
+"""Columnar recording backend for PortfolioState timelines and logs (opt-in).
+
+By default PortfolioState records into plain Python lists: one
+(datetime, float) tuple per equity point, one dict per closed trade or
+rejection, one float per heat sample. Multi-profile simulations of long
+portfolios end up holding millions of small objects per profile.
+
+With ``columnar_recording=True`` the same attributes hold the containers
+below instead. They keep the list surface the consumers use (append,
+len, truthiness, indexing, iteration yields the same tuples / dicts /
+floats), but store values in growable typed NumPy buffers, and write
+their CSV (or parquet) in one vectorized call:
+
+  GrowableArray   — typed 1-D buffer with amortised O(1) append
+  EquityTimeline  — (timestamp, equity) points as int64 µs + float64
+  ColumnarLog     — list-of-dicts replacement, one column per key
+  use_columnar_recording(state) — swap a state's list recorders
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+_INITIAL_CAPACITY = 1024
+_BATCH = 256  # appends staged per flush (small enough to still be in cache)
+_ITER_CHUNK = 4096
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH_NAIVE.replace(tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+# Beyond this magnitude x * 100 loses the fractional bits format_round2
+# needs to spot ties, so such values are formatted one by one.
+_FIXED_POINT_LIMIT = 1e13
+
+# Typed columns per log. Values of any other type demote the column to a
+# plain list (see _Column), so the declared types are a storage hint only.
+TRADE_LOG_DTYPES: Dict[str, type] = {
+    "direction": int,
+    "lot_size": float,
+    "entry_price": float,
+    "exit_price": float,
+    "risk_distance": float,
+    "pnl_usd": float,
+}
+REJECTION_LOG_DTYPES: Dict[str, type] = {
+    "equity_at_rejection": float,
+    "open_risk_at_rejection": float,
+}
+_NP_DTYPES = {float: np.float64, int: np.int64}
+
+
+class _Missing:
+    """Placeholder for a key absent from a record (renders as '' in CSV)."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+# ======================================================================
+# BUFFERS
+# ======================================================================
+
+class GrowableArray:
+    """Append-only typed 1-D buffer; capacity doubles when full.
+
+    Appends are staged in a short Python list and copied into the array
+    _BATCH at a time, so the per-append cost stays that of list.append.
+    """
+
+    __slots__ = ("_data", "_n", "_pending")
+
+    def __init__(self, dtype=np.float64, capacity: int = _INITIAL_CAPACITY):
+        self._data = np.empty(max(1, capacity), dtype=dtype)
+        self._n = 0
+        self._pending: list = []
+
+    def append(self, value) -> None:
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= _BATCH:
+            self._flush()
+
+    def extend(self, values) -> None:
+        self._flush()
+        block = np.asarray(values, dtype=self._data.dtype)
+        n, need = self._n, self._n + len(block)
+        if need > len(self._data):
+            grown = np.empty(max(need, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:n] = self._data[:n]
+            self._data = grown
+        self._data[n:need] = block
+        self._n = need
+
+    def _flush(self) -> None:
+        if self._pending:
+            block, self._pending = self._pending, []
+            self.extend(block)
+
+    def view(self) -> np.ndarray:
+        """Read-only view of the filled part of the buffer."""
+        self._flush()
+        out = self._data[:self._n]
+        out.flags.writeable = False
+        return out
+
+    def tolist(self) -> list:
+        return self.view().tolist()
+
+    def __len__(self) -> int:
+        return self._n + len(self._pending)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.view()[index].tolist()
+        return self.view()[index].item()
+
+    def __iter__(self) -> Iterator:
+        data = self.view()
+        for start in range(0, len(data), _ITER_CHUNK):
+            yield from data[start:start + _ITER_CHUNK].tolist()
+
+    def __repr__(self) -> str:
+        return f"GrowableArray({self.tolist()!r})"
+
+
+class EquityTimeline:
+    """(timestamp, equity) points stored as int64 epoch-µs + float64 arrays.
+
+    Timestamps must be all naive or all UTC (offset zero) — what the event
+    loaders produce — so the string form written to CSV is unchanged;
+    this is checked when a batch is flushed (at the latest on first read).
+    Items read back as (datetime, float) tuples; aware timestamps come
+    back with ``timezone.utc``.
+    """
+
+    __slots__ = ("_us", "_equity", "_pending", "_aware")
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY):
+        self._us = GrowableArray(np.int64, capacity)
+        self._equity = GrowableArray(np.float64, capacity)
+        self._pending: list = []
+        self._aware: Optional[bool] = None
+
+    def append(self, point) -> None:
+        pending = self._pending
+        pending.append(point)
+        if len(pending) >= _BATCH:
+            self._flush()
+
+    def _check_tz(self, stamps) -> None:
+        """Timezone checks run once per batch, on its distinct tzinfo objects."""
+        for tz in set(map(attrgetter("tzinfo"), stamps)):
+            ts = next(t for t in stamps if t.tzinfo is tz)
+            offset = ts.utcoffset()
+            aware = offset is not None
+            if self._aware is not None and aware != self._aware:
+                raise ValueError("EquityTimeline cannot mix naive and tz-aware timestamps")
+            if aware and offset:
+                raise ValueError(f"EquityTimeline records UTC timestamps only, got {ts!r}")
+            self._aware = aware
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        points, self._pending = self._pending, []
+        stamps, equity = zip(*points)
+        self._check_tz(stamps)
+        epoch = _EPOCH_UTC if self._aware else _EPOCH_NAIVE
+        self._us.extend([(ts - epoch) // _ONE_US for ts in stamps])
+        self._equity.extend(equity)
+
+    def timestamps_us(self) -> np.ndarray:
+        self._flush()
+        return self._us.view()
+
+    def equity(self) -> np.ndarray:
+        self._flush()
+        return self._equity.view()
+
+    def _datetime(self, us: int) -> datetime:
+        ts = _EPOCH_NAIVE + timedelta(microseconds=us)
+        return ts.replace(tzinfo=timezone.utc) if self._aware else ts
+
+    def __len__(self) -> int:
+        return len(self._equity) + len(self._pending)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        us, eq = self.timestamps_us(), self.equity()
+        return self._datetime(us[index].item()), eq[index].item()
+
+    def __iter__(self) -> Iterator[tuple]:
+        us, eq = self.timestamps_us(), self.equity()
+        for start in range(0, len(us), _ITER_CHUNK):
+            stop = start + _ITER_CHUNK
+            yield from zip(map(self._datetime, us[start:stop].tolist()), eq[start:stop].tolist())
+
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(pd.to_datetime(self.timestamps_us(), unit="us", utc=bool(self._aware)))
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({"timestamp": self.index(), "equity": self.equity()})
+
+    def timestamp_strings(self) -> np.ndarray:
+        """str(ts) for every point, vectorized."""
+        text = pd.Series(np.datetime_as_string(self.timestamps_us().astype("datetime64[us]"), unit="us"))
+        text = text.str.replace("T", " ", regex=False).str.removesuffix(".000000")
+        if self._aware:
+            text = text + "+00:00"
+        return text.to_numpy(dtype=object)
+
+    def to_csv(self, path: Path) -> None:
+        """Write equity_curve.csv exactly as the per-row DictWriter loop did."""
+        frame = pd.DataFrame({
+            "timestamp": self.timestamp_strings(),
+            "equity": format_round2(self.equity()),
+        })
+        frame.to_csv(path, index=False, lineterminator="\r\n")
+
+    def to_parquet(self, path: Path) -> None:
+        self.to_frame().to_parquet(path, index=False)
+
+
+def format_round2(values: np.ndarray) -> np.ndarray:
+    """str(round(x, 2)) for a float array, vectorized.
+
+    np.round(x, 2) is rint(x * 100) / 100, which gives the same float as
+    round(x, 2) unless x * 100 lands within rounding error of a .5 tie;
+    those (and non-finite / huge values) go through round() itself.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = values * 100.0
+        out = (np.rint(scaled) / 100.0).astype(str).astype(object)
+        tie_gap = np.abs(scaled - np.floor(scaled) - 0.5)
+        exact = (np.abs(values) < _FIXED_POINT_LIMIT) & (tie_gap > np.abs(scaled) * 2.0 ** -50)
+    for i in np.flatnonzero(~exact):
+        out[i] = str(round(float(values[i]), 2))
+    return out
+
+
+# ======================================================================
+# COLUMNAR LOG
+# ======================================================================
+
+class _Column:
+    """One log column: a typed GrowableArray until a value of another type
+    (or a missing cell) arrives, then a plain list."""
+
+    __slots__ = ("pytype", "values")
+
+    def __init__(self, pytype: Optional[type], n_missing: int):
+        if pytype is not None and n_missing == 0:
+            self.pytype = pytype
+            self.values = GrowableArray(_NP_DTYPES[pytype])
+        else:
+            self.pytype = None
+            self.values = [_MISSING] * n_missing
+
+    def extend(self, values: list) -> None:
+        if self.pytype is not None:
+            if set(map(type, values)) == {self.pytype}:
+                self.values.extend(values)
+                return
+            self.pytype = None
+            self.values = self.values.tolist()
+        self.values.extend(values)
+
+    def chunk(self, start: int, stop: int) -> list:
+        if self.pytype is not None:
+            return self.values.view()[start:stop].tolist()
+        return self.values[start:stop]
+
+
+class ColumnarLog:
+    """List-of-dicts log stored one column per key.
+
+    ``append(record)`` takes the dict a list log would hold (records are
+    columnarized _BATCH at a time); reading (indexing, iteration) rebuilds
+    equal dicts without the keys a record did not have. Key order follows
+    first appearance across the log. ``dtypes`` maps keys to int/float
+    for typed storage.
+    """
+
+    __slots__ = ("_columns", "_dtypes", "_n", "_pending")
+
+    def __init__(self, dtypes: Optional[Dict[str, type]] = None):
+        self._columns: Dict[str, _Column] = {}
+        self._dtypes = dict(dtypes or {})
+        self._n = 0
+        self._pending: List[dict] = []
+
+    def append(self, record: dict) -> None:
+        pending = self._pending
+        pending.append(record)
+        if len(pending) >= _BATCH:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        columns, n = self._columns, self._n
+        if set().union(*rows) - columns.keys():
+            for row in rows:
+                for key in row:
+                    if key not in columns:
+                        columns[key] = _Column(self._dtypes.get(key), n)
+        fill = repeat(_MISSING)
+        for key, col in columns.items():
+            col.extend(list(map(dict.get, rows, repeat(key), fill)))
+        self._n = n + len(rows)
+
+    def keys(self) -> List[str]:
+        self._flush()
+        return list(self._columns)
+
+    def column(self, key: str) -> list:
+        """All values of ``key`` (None where a record lacked it)."""
+        self._flush()
+        col = self._columns.get(key)
+        if col is None:
+            return [None] * self._n
+        return [None if v is _MISSING else v for v in col.chunk(0, self._n)]
+
+    def __len__(self) -> int:
+        return self._n + len(self._pending)
+
+    def _rows(self, start: int, stop: int) -> List[dict]:
+        names = list(self._columns)
+        cells = [col.chunk(start, stop) for col in self._columns.values()]
+        return [
+            {k: v for k, v in zip(names, row) if v is not _MISSING}
+            for row in zip(*cells)
+        ]
+
+    def __getitem__(self, index):
+        self._flush()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("ColumnarLog index out of range")
+        return self._rows(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[dict]:
+        self._flush()
+        for start in range(0, self._n, _ITER_CHUNK):
+            yield from self._rows(start, min(start + _ITER_CHUNK, self._n))
+
+    def to_frame(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """DataFrame of the log (typed columns keep their dtype; missing -> None)."""
+        self._flush()
+        data = {}
+        for key in (self.keys() if columns is None else columns):
+            col = self._columns.get(key)
+            if col is not None and col.pytype is not None:
+                data[key] = col.values.view()
+            else:
+                data[key] = pd.array(self.column(key), dtype=object)
+        return pd.DataFrame(data, index=pd.RangeIndex(self._n))
+
+    def to_csv(self, path: Path, fieldnames: Sequence[str]) -> None:
+        """Write ``fieldnames`` columns exactly as csv.DictWriter(extrasaction="ignore")
+        would: str() of each value, '' for None and for absent keys."""
+        self._flush()
+        data = {}
+        for key in fieldnames:
+            col = self._columns.get(key)
+            if col is None:
+                data[key] = np.full(self._n, "", dtype=object)
+            elif col.pytype is not None:
+                data[key] = col.values.view().astype(str).astype(object)
+            else:
+                data[key] = ["" if v is None or v is _MISSING else str(v) for v in col.values]
+        pd.DataFrame(data, columns=list(fieldnames)).to_csv(path, index=False, lineterminator="\r\n")
+
+    def to_parquet(self, path: Path, columns: Optional[Sequence[str]] = None) -> None:
+        self.to_frame(columns).to_parquet(path, index=False)
+
+    def __repr__(self) -> str:
+        return f"ColumnarLog({len(self)} records, columns={self.keys()})"
+
+
+# ======================================================================
+# STATE HOOK
+# ======================================================================
+
+def use_columnar_recording(state) -> None:
+    """Replace a fresh PortfolioState's list recorders with columnar ones."""
+    if state.equity_timeline or state.closed_trades_log or state.heat_samples or state.rejection_log:
+        raise ValueError(
+            f"columnar recording must be enabled before {state.profile_name!r} records events"
+        )
+    state.equity_timeline = EquityTimeline()
+    state.closed_trades_log = ColumnarLog(TRADE_LOG_DTYPES)
+    state.heat_samples = GrowableArray(np.float64)
+    state.rejection_log = ColumnarLog(REJECTION_LOG_DTYPES)
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import yaml
 
+from tools.capital.capital_recording import use_columnar_recording
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 FLOAT_TOLERANCE = 1e-9
 
@@ -269,6 +271,7 @@ class PortfolioState:
     tier_multiplier: float = 2.0
     retail_max_lot: Optional[float] = None
     fixed_risk_usd_floor: Optional[float] = None  # FIXED_USD_V1: risk = max(equity*risk_per_trade, floor)
+    columnar_recording: bool = False  # typed columnar recorders (tools/capital/capital_recording.py)
     equity: float = 0.0
     realized_pnl: float = 0.0
     total_open_risk: float = 0.0
@@ -294,6 +297,8 @@ class PortfolioState:
     def __post_init__(self):
         self.equity = self.starting_capital
         self.peak_equity = self.starting_capital
+        if self.columnar_recording:
+            use_columnar_recording(self)
 
     def _floor_to_step(self, lots: float) -> float:
         steps = math.floor(lots / self.lot_step)
@@ -634,6 +639,7 @@ def run_simulation(
     broker_specs: Dict[str, dict],
     profiles: Optional[Dict[str, dict]] = None,
     conv_lookup: Optional[ConversionLookup] = None,  # DEPRECATED: ignored, kept for API compat
+    columnar_recording: bool = False,
 ) -> Dict[str, PortfolioState]:
     if profiles is None:
         raise ValueError("profiles must be provided")
@@ -663,6 +669,7 @@ def run_simulation(
             tier_multiplier=params.get("tier_multiplier", 2.0),
             retail_max_lot=params.get("retail_max_lot"),
             fixed_risk_usd_floor=params.get("fixed_risk_usd_floor"),
+            columnar_recording=columnar_recording,
         )
 
     # MT5-verified static valuation: usd_per_pu_per_lot = tick_value / tick_size
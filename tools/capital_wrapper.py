@@ -40,9 +40,13 @@ from tools.capital.capital_events import (  # noqa: F401
     _normalize_hash_timestamp,
     _optional_float,
     _parse_ts,
+    build_event_table,
     build_events,
     compute_signal_hash,
+    events_from_table,
     load_partial_legs,
+    load_sorted_events,
+    load_trade_table,
     load_trades,
     print_events,
     sort_events,
@@ -89,6 +93,7 @@ from tools.capital.capital_directive_discovery import (  # noqa: F401
 )
 
 from tools.capital_engine import run_simulation as _engine_run_simulation
+from tools.chart_render import ChartRenderService
 
 
 # Back-compat alias — some experiments/CLI callers use BACKTESTS_ROOT.
@@ -101,7 +106,8 @@ BACKTESTS_ROOT = BACKTESTS_DIR
 
 def run_simulation(sorted_events, broker_specs: Dict[str, dict],
                    profiles: Optional[Dict[str, dict]] = None,
-                   conv_lookup: Optional[ConversionLookup] = None) -> Dict[str, PortfolioState]:
+                   conv_lookup: Optional[ConversionLookup] = None,
+                   columnar_recording: bool = False) -> Dict[str, PortfolioState]:
     """Compatibility wrapper that delegates simulation execution to capital_engine."""
     if profiles is None:
         profiles = PROFILES
@@ -110,6 +116,7 @@ def run_simulation(sorted_events, broker_specs: Dict[str, dict],
         broker_specs=broker_specs,
         profiles=profiles,
         conv_lookup=conv_lookup,
+        columnar_recording=columnar_recording,
     )
 
 
@@ -128,6 +135,12 @@ def main():
         "strategy_prefix",
         help="Strategy prefix to match backtest folders (e.g. AK31_FX_PORTABILITY_4H)",
     )
+    parser.add_argument(
+        "--columnar-recording",
+        action="store_true",
+        help="Record equity timelines and trade/rejection logs in typed columnar "
+             "buffers (lower memory for long multi-profile runs; identical artifacts)",
+    )
     args = parser.parse_args()
     prefix = args.strategy_prefix
 
@@ -145,11 +158,9 @@ def main():
     else:
         print("[WARN] No directive found; using prefix-scan discovery (unfrozen universe).")
 
-    # Phase 2: Load → Build → Sort
-    trades = load_trades(run_dirs)
+    # Phase 2: Load → Build → Sort (columnar; same order as sort_events)
     partials_by_parent = load_partial_legs(run_dirs)
-    events = build_events(trades, partials_by_parent)
-    sorted_events = sort_events(events)
+    sorted_events = load_sorted_events(run_dirs, partials_by_parent)
 
     # Discover unique symbols and load broker specs
     symbols = sorted(set(e.symbol for e in sorted_events))
@@ -177,7 +188,8 @@ def main():
     print("[INIT] Using MT5-verified static valuation (dynamic conversion disabled)")
 
     # Phase 4: Run multi-profile simulation (static MT5 valuation)
-    states = run_simulation(sorted_events, broker_specs, conv_lookup=None)
+    states = run_simulation(sorted_events, broker_specs, conv_lookup=None,
+                            columnar_recording=args.columnar_recording)
 
     # Conservation checks (partial-aware). Fail-fast per invariant #1.
     _assert_partial_conservation(states, partials_by_parent)
@@ -207,20 +219,23 @@ def main():
             except Exception:
                 pass
 
-    for name, state in states.items():
-        profile_dir = deployable_root / name
-        metrics = emit_profile_artifacts(state, profile_dir, true_constituent_runs, len(symbols))
-        plot_equity_curve(state, profile_dir)
-        all_metrics[name] = metrics
-
-    emit_comparison_json(all_metrics, states, deployable_root)
-    plot_overlay_comparison(states, deployable_root)
-
-    try:
-        from tools.post_process_capital import process_profile_comparison
-        process_profile_comparison(args.strategy_prefix)
-    except Exception as e:
-        print(f"[WARN] post_process_capital failed for {args.strategy_prefix}: {e}")
+    # Charts encode in a process pool while the remaining artifacts are
+    # written; leaving the block waits for the PNGs.
+    with ChartRenderService() as charts:
+        for name, state in states.items():
+            profile_dir = deployable_root / name
+            all_metrics[name] = emit_profile_artifacts(
+                state, profile_dir, true_constituent_runs, len(symbols), renderer=charts,
+            )
+
+        emit_comparison_json(all_metrics, states, deployable_root)
+        plot_overlay_comparison(states, deployable_root, renderer=charts)
+
+        try:
+            from tools.post_process_capital import process_profile_comparison
+            process_profile_comparison(args.strategy_prefix)
+        except Exception as e:
+            print(f"[WARN] post_process_capital failed for {args.strategy_prefix}: {e}")
 
     print(f"[DONE] All artifacts emitted to {deployable_root}")
 
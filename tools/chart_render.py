@@ -0,0 +1,126 @@
+"""
+chart_render.py — Off-critical-path PNG rendering for capital and portfolio charts.
+
+Chart builders (tools/capital/capital_plotting.py,
+tools/portfolio/portfolio_charts.py) reduce their inputs to plain array
+payloads — long series decimated to screen resolution with
+decimate_minmax() — and hand each payload plus a module-level render
+function to a ChartRenderService. The service renders in a process pool
+while the pipeline carries on; drain() / close() (or leaving the ``with``
+block) waits for the PNGs and re-raises the first render error.
+
+With a single worker (the default on single-core hosts) the service
+renders inline on submit, which is exactly the old synchronous behaviour.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Points kept per decimated series: two per horizontal pixel of the
+# widest chart (16in at 150dpi = 2400px).
+CHART_MAX_POINTS = 4800
+MAX_RENDER_WORKERS = 4
+
+
+def default_render_workers() -> int:
+    """Pool size: one core left for the pipeline, capped at MAX_RENDER_WORKERS."""
+    return max(1, min(MAX_RENDER_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+# ======================================================================
+# PAYLOAD HELPERS
+# ======================================================================
+
+def plot_x(index) -> np.ndarray:
+    """Index -> picklable x array; tz-aware datetimes become naive UTC datetime64."""
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        index = index.tz_convert(None)
+    return np.asarray(index)
+
+
+def minmax_indices(y, max_points: int = CHART_MAX_POINTS) -> np.ndarray:
+    """Sorted positions of the points decimate_minmax keeps.
+
+    The series is cut into (max_points - 2) // 2 equal-count buckets and
+    each bucket keeps its minimum and maximum, plus the first and last
+    point overall — every peak and trough survives, so a decimated line
+    is indistinguishable from the full one at screen resolution.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    n_buckets = max(1, (max_points - 2) // 2)
+    bucket = np.arange(n, dtype=np.int64) * n_buckets // n
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket, np.arange(n_buckets))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate(([0, n - 1], order[starts], order[ends])))
+
+
+def decimate_minmax(x, y, max_points: int = CHART_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max-preserving downsample of (x, y) to at most max_points points."""
+    x, y = np.asarray(x), np.asarray(y)
+    keep = minmax_indices(y, max_points)
+    return x[keep], y[keep]
+
+
+# ======================================================================
+# RENDER SERVICE
+# ======================================================================
+
+class ChartRenderService:
+    """Runs chart render jobs off the caller's critical path.
+
+    ``submit(render_fn, *args)`` queues ``render_fn(*args)``; render_fn
+    must be a module-level function and args picklable (array payloads,
+    paths). Rendering starts immediately in the pool; drain() blocks
+    until every queued chart is written.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = default_render_workers() if max_workers is None else max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: List[Future] = []
+
+    def submit(self, render_fn: Callable, *args) -> None:
+        if self.max_workers <= 1:
+            render_fn(*args)
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._futures.append(self._executor.submit(render_fn, *args))
+
+    def drain(self) -> int:
+        """Wait for all queued charts; re-raise the first failure. Returns the count."""
+        futures, self._futures = self._futures, []
+        errors = [f.exception() for f in futures]
+        first = next((e for e in errors if e is not None), None)
+        if first is not None:
+            raise first
+        return len(futures)
+
+    def close(self) -> None:
+        try:
+            self.drain()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> "ChartRenderService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            # Already failing: let queued charts finish, don't mask the error.
+            self._executor.shutdown(wait=True)
+            self._executor = None
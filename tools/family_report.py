@@ -33,6 +33,9 @@ Output: a single markdown file under
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sqlite3
 import sys
@@ -87,6 +90,8 @@ from tools.report.report_sections.verdict_risk import (
     _loss_streak_flag,
     _stall_decay_flag,
 )
+import tools.report.family_verdicts as _family_verdicts
+import tools.report.report_sections.verdict_risk as _verdict_risk
 from tools.window_compat import annotate_window_status, find_family_window
 from tools.report.family_renderer import render
 
@@ -100,6 +105,24 @@ _OUTPUT_DIR = TRADE_SCAN_STATE / "reports" / "families"
 # point at the canonical successor family when the prefix has been
 # superseded by a rename (e.g. 53_MR_EURUSD_* -> 53_MR_FX_*).
 _SUPERSESSION_MAP_PATH = PROJECT_ROOT / "governance" / "supersession_map.yaml"
+# Per-variant analytics cache: one JSON file per <directive_id>_<symbol>,
+# keyed by the sha256 of the variant's trade log + equity curve, the
+# soft-gate thresholds and the producing code. A family regenerated after
+# one new pass recomputes only that pass.
+_PAYLOAD_CACHE_DIR = _OUTPUT_DIR / "_payload_cache"
+_PAYLOAD_CACHE_VERSION = 1
+# Functions whose code produces cached values (analytics, soft-gate trips,
+# additional soft flags). Their modules' source, and this module's, is folded
+# into every cache key so a logic edit invalidates old entries.
+_PAYLOAD_PRODUCERS = (
+    tail_contribution, rolling_window, identify_dd_clusters, compute_streaks,
+    yearwise_pnl, direction_session_matrix, compute_family_verdicts,
+    _loss_streak_flag, _stall_decay_flag,
+)
+_PAYLOAD_CODE_FINGERPRINT: str | None = None
+# Payload keys derived from the MF row rather than the backtest artifacts —
+# never cached, always rebuilt from the current row.
+_ROW_PAYLOAD_KEYS = ("directive_id", "symbol", "row", "in_window", "reason")
 
 
 # ---------------------------------------------------------------------------
@@ -112,9 +135,16 @@ def generate_family_report(
     out_path: Path | None = None,
     window_tolerance_days: int = 5,
     latest_only: bool = False,
+    use_cache: bool = True,
 ) -> Path:
     """Generate the family analysis report. Returns path written.
 
+    Per-variant analytics (and the trade-derived soft-gate trips) are
+    served from ``_PAYLOAD_CACHE_DIR`` when the variant's backtest
+    artifacts hash to the cached key; only new or changed variants load
+    their trade logs. ``use_cache=False`` recomputes everything and leaves
+    the cache untouched.
+
     When ``latest_only`` is True, the per-strategy MF row with the highest
     SQLite rowid (== insertion order proxy for "most recent run") is kept.
     Rows flagged ``is_current = 0`` are dropped. If a strategy still has
@@ -139,13 +169,26 @@ def generate_family_report(
     # Build per-variant payload
     variant_payloads: list[dict[str, Any]] = []
     trades_by_variant: dict[str, pd.DataFrame] = {}
+    cached_trips: dict[str, list[str]] = {}
+    cached_flags: dict[str, list[str]] = {}
+    fresh: list[tuple[dict[str, Any], str | None]] = []
     for row in annotated:
         directive_id = _strip_symbol_suffix(str(row.get("strategy", "")))
         symbol = str(row.get("symbol", ""))
-        trades = _load_trade_log(directive_id, symbol)
-        if trades is not None and len(trades) > 0:
-            trades_by_variant[str(row.get("strategy"))] = trades
-        payload = _build_variant_payload(directive_id, symbol, row, trades)
+        name = str(row.get("strategy"))
+        cache_key = _variant_cache_key(directive_id, symbol, row) if use_cache else None
+        cached = _load_cached_variant(directive_id, symbol, cache_key) if cache_key else None
+        if cached is not None:
+            payload = _row_payload(directive_id, symbol, row)
+            payload.update(cached["analytics"])
+            cached_trips[name] = cached["soft_gate_trips"]
+            cached_flags[name] = cached["additional_soft_flags"]
+        else:
+            trades = _load_trade_log(directive_id, symbol)
+            if trades is not None and len(trades) > 0:
+                trades_by_variant[name] = trades
+            payload = _build_variant_payload(directive_id, symbol, row, trades)
+            fresh.append((payload, cache_key))
         # Same-strategy prior-run Δ. Window mismatch is informative here
         # (unlike parent-Δ which suppresses) — see prior_run_delta module
         # docstring for the comparison-policy rationale.
@@ -160,7 +203,9 @@ def generate_family_report(
         variant_payloads.append(payload)
 
     # Verdicts via canonical authority
-    verdicts = compute_family_verdicts(rows_df, trades_by_variant)
+    verdicts = compute_family_verdicts(
+        rows_df, trades_by_variant, soft_gate_trips_by_variant=cached_trips,
+    )
     for vp in variant_payloads:
         vp["verdict"] = verdicts.get(_canonical_strategy_name(vp), {})
 
@@ -171,6 +216,9 @@ def generate_family_report(
     # and the renderer reads both.
     for vp in variant_payloads:
         key = _canonical_strategy_name(vp)
+        if key in cached_flags:
+            vp["additional_soft_flags"] = list(cached_flags[key])
+            continue
         tdf = trades_by_variant.get(key)
         extra: list[str] = []
         if tdf is not None and len(tdf) > 0:
@@ -178,6 +226,10 @@ def generate_family_report(
             extra.extend(_stall_decay_flag(tdf))
         vp["additional_soft_flags"] = extra
 
+    for payload, cache_key in fresh:
+        if cache_key and not payload.get("missing_data"):
+            _store_cached_variant(payload, cache_key)
+
     # Lineage (parent inference + signature diffs)
     parents = _infer_lineage_parents(variant_payloads)
     diffs = _compute_lineage_diffs(variant_payloads, parents)
@@ -480,6 +532,116 @@ def _load_equity_curve(directive_id: str, symbol: str) -> pd.DataFrame | None:
         return None
 
 
+# ---------------------------------------------------------------------------
+# Variant payload cache
+# ---------------------------------------------------------------------------
+
+def _payload_code_fingerprint() -> str:
+    """sha256 over the source of every module in _PAYLOAD_PRODUCERS plus this
+    one. Read once per process."""
+    global _PAYLOAD_CODE_FINGERPRINT
+    if _PAYLOAD_CODE_FINGERPRINT is None:
+        h = hashlib.sha256()
+        for name in sorted({__name__, *(fn.__module__ for fn in _PAYLOAD_PRODUCERS)}):
+            h.update(b"|" + name.encode() + b"|")
+            try:
+                h.update(Path(sys.modules[name].__file__).read_bytes())
+            except (KeyError, AttributeError, TypeError, OSError):
+                h.update(b"<unavailable>")
+        _PAYLOAD_CODE_FINGERPRINT = h.hexdigest()
+    return _PAYLOAD_CODE_FINGERPRINT
+
+
+def _soft_gate_thresholds() -> tuple:
+    """Current thresholds behind the cached soft-gate trips and soft flags."""
+    return (
+        _family_verdicts._SOFT_TAIL_TOP5_THRESHOLD,
+        _family_verdicts._SOFT_BODY_DEFICIT_THRESHOLD,
+        _family_verdicts._SOFT_FLAT_DAYS_THRESHOLD,
+        _verdict_risk._FLAG_LOSS_STREAK_THRESHOLD,
+        _verdict_risk._FLAG_STALL_DECAY_THRESHOLD,
+    )
+
+
+def _variant_cache_key(directive_id: str, symbol: str, annotated_row: dict) -> str | None:
+    """sha256 over the variant's backtest artifacts, the inputs the
+    analytics take from the MF row, the soft-gate thresholds and the code
+    fingerprint. None when there is no trade log."""
+    raw = _BACKTESTS_DIR / f"{directive_id}_{symbol}" / "raw"
+    trade_path = raw / "results_tradelevel.csv"
+    if not trade_path.exists():
+        return None
+    h = hashlib.sha256()
+    h.update(f"v{_PAYLOAD_CACHE_VERSION}|{annotated_row.get('starting_capital')!r}".encode())
+    h.update(f"|{_soft_gate_thresholds()!r}|{_payload_code_fingerprint()}".encode())
+    for path in (trade_path, raw / "equity_curve.csv"):
+        h.update(b"|" + path.name.encode() + b"|")
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except FileNotFoundError:
+            h.update(b"<missing>")
+    return h.hexdigest()
+
+
+def _variant_cache_path(directive_id: str, symbol: str) -> Path:
+    return _PAYLOAD_CACHE_DIR / f"{directive_id}_{symbol}.json"
+
+
+def _cache_default(obj: Any) -> Any:
+    """json.dumps hook: pandas timestamps (dd_clusters dates) and numpy scalars."""
+    if isinstance(obj, pd.Timestamp) or obj is pd.NaT:
+        return {"__timestamp__": None if obj is pd.NaT else obj.isoformat()}
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _cache_object_hook(obj: dict) -> Any:
+    if obj.keys() == {"__timestamp__"}:
+        iso = obj["__timestamp__"]
+        return pd.NaT if iso is None else pd.Timestamp(iso)
+    return obj
+
+
+def _load_cached_variant(directive_id: str, symbol: str, cache_key: str) -> dict | None:
+    """Cached analytics for the variant, or None on miss / stale / corrupt entry."""
+    try:
+        text = _variant_cache_path(directive_id, symbol).read_text(encoding="utf-8")
+        entry = json.loads(text, object_hook=_cache_object_hook)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != cache_key:
+        return None
+    return entry
+
+
+def _store_cached_variant(payload: dict[str, Any], cache_key: str) -> None:
+    """Persist a freshly built payload's artifact-derived parts (atomic write).
+    Cache write failures never fail the report."""
+    analytics = {
+        k: v for k, v in payload.items()
+        if k not in _ROW_PAYLOAD_KEYS
+        and k not in ("prior_run_delta", "verdict", "additional_soft_flags")
+    }
+    entry = {
+        "version": _PAYLOAD_CACHE_VERSION,
+        "key": cache_key,
+        "analytics": analytics,
+        "soft_gate_trips": payload.get("verdict", {}).get("soft_gate_trips", []),
+        "additional_soft_flags": payload.get("additional_soft_flags", []),
+    }
+    path = _variant_cache_path(payload["directive_id"], payload["symbol"])
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(entry, default=_cache_default), encoding="utf-8")
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
+
+
 # ---------------------------------------------------------------------------
 # Per-variant analytics
 # ---------------------------------------------------------------------------
@@ -491,13 +653,7 @@ def _build_variant_payload(
     trades: pd.DataFrame | None,
 ) -> dict[str, Any]:
     """Compute every per-variant analytic the renderer expects."""
-    payload: dict[str, Any] = {
-        "directive_id": directive_id,
-        "symbol": symbol,
-        "row": annotated_row,
-        "in_window": annotated_row.get("in_window", True),
-        "reason": annotated_row.get("reason", ""),
-    }
+    payload = _row_payload(directive_id, symbol, annotated_row)
 
     if trades is None or len(trades) == 0:
         payload["missing_data"] = True
@@ -542,6 +698,17 @@ def _build_variant_payload(
     return payload
 
 
+def _row_payload(directive_id: str, symbol: str, annotated_row: dict) -> dict[str, Any]:
+    """The MF-row-derived payload keys (`_ROW_PAYLOAD_KEYS`)."""
+    return {
+        "directive_id": directive_id,
+        "symbol": symbol,
+        "row": annotated_row,
+        "in_window": annotated_row.get("in_window", True),
+        "reason": annotated_row.get("reason", ""),
+    }
+
+
 def _body_after_top_20(trades: pd.DataFrame) -> float:
     sorted_pnl = trades["pnl_usd"].astype(float).sort_values(ascending=False)
     if len(sorted_pnl) < 20:
@@ -664,6 +831,9 @@ def main(argv: list[str] | None = None) -> int:
                         "rows. Ambiguities — strategies with >1 current row "
                         "after the supersession filter — are surfaced in the "
                         "rendered report rather than silently collapsed.")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Recompute every variant payload instead of reusing "
+                        "cached analytics for unchanged backtest artifacts.")
     args = p.parse_args(argv)
 
     variants = None
@@ -676,6 +846,7 @@ def main(argv: list[str] | None = None) -> int:
         out_path=args.out,
         window_tolerance_days=args.window_tolerance_days,
         latest_only=args.latest_only,
+        use_cache=not args.no_cache,
     )
     print(f"[FAMILY_REPORT] wrote {out}")
     return 0
@@ -12,14 +12,22 @@ One row per run_id with aggregated metrics.  Queryable by any tool
 Auto-called by run_pipeline.py after each PORTFOLIO_COMPLETE directive.
 Also runnable standalone:
 
-    python tools/generate_run_summary.py          # regenerate
+    python tools/generate_run_summary.py          # regenerate (incremental)
     python tools/generate_run_summary.py --quiet   # silent (for pipeline use)
+    python tools/generate_run_summary.py --full    # ignore saved state, rebuild
 
-Idempotent: overwrites the summary on every run.
+Incremental: run_summary.state.json keeps the per-run index aggregates, a
+byte high-water mark into the append-only index.csv and the last loaded
+registry / portfolio / candidate frames keyed by source mtime+size. A
+regeneration parses only index rows appended since the mark and re-reads a
+source only when it changed. The summary itself is rewritten every time.
 """
 
 import argparse
+import hashlib
+import io
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -37,12 +45,16 @@ from config.state_paths import (
     STRATEGIES_DIR,
     CANDIDATES_DIR,
 )
+from tools.input_fingerprint import ledger_db_paths, stat_fingerprint
 
 REGISTRY_PATH  = REGISTRY_DIR / "run_registry.json"
 INDEX_PATH     = STATE_ROOT / "research" / "index.csv"
 PORTFOLIO_PATH = STRATEGIES_DIR / "Master_Portfolio_Sheet.xlsx"
 CANDIDATE_PATH = CANDIDATES_DIR / "Filtered_Strategies_Passed.xlsx"
 OUTPUT_PATH    = STATE_ROOT / "research" / "run_summary.csv"
+STATE_PATH     = STATE_ROOT / "research" / "run_summary.state.json"
+
+STATE_VERSION = 1
 
 # Authoritative strategy sources live in the repo (Trade_Scan/strategies/<id>/strategy.py).
 # Snapshots in TradeScan_State/runs/<RUN_ID>/strategy.py are frozen copies but carry
@@ -240,32 +252,94 @@ def _load_candidate_status() -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 # Aggregation
 # ---------------------------------------------------------------------------
-def _aggregate_index(df_index: pd.DataFrame) -> pd.DataFrame:
-    """Aggregate per-symbol rows into per-run_id summary."""
+_INDEX_NUMERIC_COLS = ["profit_factor", "max_drawdown_pct", "net_pnl_usd", "total_trades", "win_rate"]
+
+
+def _accumulate_index(df_index: pd.DataFrame) -> pd.DataFrame:
+    """Per-run partial aggregates of index rows, indexed by run_id.
+
+    Means are kept as (sum, count) so aggregates of separate row batches
+    can be merged with _merge_accumulators.
+    """
     if df_index.empty:
         return pd.DataFrame()
 
     # Ensure numeric columns
-    num_cols = ["profit_factor", "max_drawdown_pct", "net_pnl_usd", "total_trades", "win_rate"]
-    for c in num_cols:
+    for c in _INDEX_NUMERIC_COLS:
         if c in df_index.columns:
             df_index[c] = pd.to_numeric(df_index[c], errors="coerce")
 
-    agg = df_index.groupby("run_id", as_index=False).agg(
+    return df_index.groupby("run_id").agg(
         strategy_id=("strategy_id", "first"),
         symbols=("symbol", lambda x: ",".join(sorted(x.unique()))),
-        symbol_count=("symbol", "nunique"),
         timeframe=("timeframe", "first"),
         date_start=("date_start", "min"),
         date_end=("date_end", "max"),
         total_trades=("total_trades", "sum"),
         net_pnl_usd=("net_pnl_usd", "sum"),
-        avg_profit_factor=("profit_factor", "mean"),
-        avg_win_rate=("win_rate", "mean"),
+        pf_sum=("profit_factor", "sum"),
+        pf_n=("profit_factor", "count"),
+        wr_sum=("win_rate", "sum"),
+        wr_n=("win_rate", "count"),
         max_drawdown_pct=("max_drawdown_pct", "max"),
         execution_timestamp=("execution_timestamp_utc", "max"),
     )
 
+
+def _merge_accumulators(prior: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """Fold a new batch of per-run aggregates into the saved ones."""
+    if prior is None or prior.empty:
+        return new
+    if new.empty:
+        return prior
+
+    overlap = prior.index.intersection(new.index)
+    if overlap.empty:
+        return pd.concat([prior, new]).sort_index()
+
+    # Runs whose symbols straddle the high-water mark: prior batch first so
+    # "first" keeps the earliest non-null value, as a single groupby would.
+    both = pd.concat([prior.loc[overlap], new.loc[overlap]])
+    merged = both.groupby(level=0).agg(
+        strategy_id=("strategy_id", "first"),
+        symbols=("symbols", lambda x: ",".join(sorted(set(",".join(x).split(","))))),
+        timeframe=("timeframe", "first"),
+        date_start=("date_start", "min"),
+        date_end=("date_end", "max"),
+        total_trades=("total_trades", "sum"),
+        net_pnl_usd=("net_pnl_usd", "sum"),
+        pf_sum=("pf_sum", "sum"),
+        pf_n=("pf_n", "sum"),
+        wr_sum=("wr_sum", "sum"),
+        wr_n=("wr_n", "sum"),
+        max_drawdown_pct=("max_drawdown_pct", "max"),
+        execution_timestamp=("execution_timestamp", "max"),
+    )
+    rest = [prior.drop(index=overlap), new.drop(index=overlap), merged]
+    return pd.concat(rest).sort_index()
+
+
+def _finalize_index(acc: pd.DataFrame) -> pd.DataFrame:
+    """Turn per-run accumulators into the run-level summary columns."""
+    if acc is None or acc.empty:
+        return pd.DataFrame()
+
+    agg = pd.DataFrame({
+        "run_id": acc.index,
+        "strategy_id": acc["strategy_id"].to_numpy(),
+        "symbols": acc["symbols"].to_numpy(),
+        "symbol_count": acc["symbols"].str.count(",").to_numpy() + 1,
+        "timeframe": acc["timeframe"].to_numpy(),
+        "date_start": acc["date_start"].to_numpy(),
+        "date_end": acc["date_end"].to_numpy(),
+        "total_trades": acc["total_trades"].to_numpy(),
+        "net_pnl_usd": acc["net_pnl_usd"].to_numpy(),
+        "avg_profit_factor": (acc["pf_sum"] / acc["pf_n"].where(acc["pf_n"] > 0)).to_numpy(),
+        "avg_win_rate": (acc["wr_sum"] / acc["wr_n"].where(acc["wr_n"] > 0)).to_numpy(),
+        "max_drawdown_pct": acc["max_drawdown_pct"].to_numpy(),
+        "execution_timestamp": acc["execution_timestamp"].to_numpy(),
+    })
+
     # Round for readability
     for c in ["net_pnl_usd", "avg_profit_factor", "avg_win_rate", "max_drawdown_pct"]:
         if c in agg.columns:
@@ -274,24 +348,164 @@ def _aggregate_index(df_index: pd.DataFrame) -> pd.DataFrame:
     return agg
 
 
+def _aggregate_index(df_index: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate per-symbol rows into per-run_id summary."""
+    return _finalize_index(_accumulate_index(df_index))
+
+
+# ---------------------------------------------------------------------------
+# Incremental state
+# ---------------------------------------------------------------------------
+# Bytes before the high-water mark that must be unchanged for index.csv to
+# count as appended-to rather than rewritten.
+_INDEX_PROBE_BYTES = 4096
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _frame_to_json(df: pd.DataFrame) -> dict:
+    split = df.to_dict(orient="split")
+    return {"index": split["index"], "columns": split["columns"], "data": split["data"]}
+
+
+def _frame_from_json(data: dict) -> pd.DataFrame:
+    return pd.DataFrame(data["data"], index=data["index"], columns=data["columns"])
+
+
+def _load_state() -> dict:
+    """Saved incremental state, or {} when absent, unreadable or stale-format."""
+    if not STATE_PATH.exists():
+        return {}
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state
+
+
+def _save_state(state: dict) -> None:
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_PATH.with_suffix(STATE_PATH.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, default=str)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, STATE_PATH)
+
+
+def _cached_frame(state: dict, key: str, paths, loader):
+    """Return (frame, entry): the saved frame if its sources are unchanged."""
+    fp = stat_fingerprint(paths)
+    entry = state.get(key)
+    if entry and entry.get("fingerprint") == fp:
+        return _frame_from_json(entry["frame"]), entry
+    df = loader()
+    return df, {"fingerprint": fp, "frame": _frame_to_json(df)}
+
+
+def _read_index_rows(index_state: dict | None):
+    """Parse index.csv rows past the saved high-water mark.
+
+    Returns (rows, new_index_state, resumed). index.csv is append-only; the
+    mark is the byte offset after the last complete line consumed, pinned
+    by the header and the bytes just before it. Any mismatch (rewrite,
+    truncation, different file) re-reads from the first data row. A
+    trailing line without its newline is left for the next call.
+    """
+    if not INDEX_PATH.exists():
+        return pd.DataFrame(), None, False
+
+    with open(INDEX_PATH, "rb") as f:
+        header = f.readline()
+        if not header:
+            return pd.DataFrame(), None, False
+        start = len(header)
+        size = os.fstat(f.fileno()).st_size
+
+        st = index_state or {}
+        offset = st.get("offset", 0)
+        resumed = (
+            st.get("path") == str(INDEX_PATH)
+            and st.get("header") == _digest(header)
+            and start <= offset <= size
+        )
+        if resumed:
+            probe_from = max(start, offset - _INDEX_PROBE_BYTES)
+            f.seek(probe_from)
+            resumed = _digest(f.read(offset - probe_from)) == st.get("probe")
+        if not resumed:
+            offset = start
+
+        f.seek(offset)
+        body = f.read()
+
+    complete = body[:body.rfind(b"\n") + 1]
+    new_offset = offset + len(complete)
+    if complete:
+        rows = pd.read_csv(io.BytesIO(header + complete), dtype={"run_id": str})
+    else:
+        rows = pd.DataFrame()
+
+    with open(INDEX_PATH, "rb") as f:
+        probe_from = max(start, new_offset - _INDEX_PROBE_BYTES)
+        f.seek(probe_from)
+        probe = _digest(f.read(new_offset - probe_from))
+
+    prior_rows = st.get("rows", 0) if resumed else 0
+    new_state = {
+        "path": str(INDEX_PATH),
+        "header": _digest(header),
+        "offset": new_offset,
+        "probe": probe,
+        "rows": prior_rows + len(rows),
+    }
+    return rows, new_state, resumed
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-def generate(quiet: bool = False) -> Path:
-    """Build and write run_summary.csv. Returns the output path."""
-    df_reg = _load_registry()
-    df_idx = _load_index()
-    df_port = _load_portfolio_verdicts()
-    df_cand = _load_candidate_status()
+def generate(quiet: bool = False, full_rebuild: bool = False) -> Path:
+    """Build and write run_summary.csv. Returns the output path.
+
+    Merges only what changed since the saved state; ``full_rebuild``
+    ignores the state and re-reads every source.
+    """
+    state = {} if full_rebuild else _load_state()
+
+    df_reg, reg_entry = _cached_frame(state, "registry", [REGISTRY_PATH], _load_registry)
+    df_port, port_entry = _cached_frame(
+        state, "portfolio", ledger_db_paths(), _load_portfolio_verdicts,
+    )
+    df_cand, cand_entry = _cached_frame(state, "candidates", [CANDIDATE_PATH], _load_candidate_status)
+
+    new_rows, index_state, resumed = _read_index_rows(state.get("index"))
+    prior_acc = _frame_from_json(state["runs"]) if resumed and state.get("runs") else None
+    acc = _merge_accumulators(prior_acc, _accumulate_index(new_rows))
 
     if not quiet:
         print(f"  Registry:   {len(df_reg)} entries")
-        print(f"  Index:      {len(df_idx)} rows")
+        print(f"  Index:      {index_state['rows'] if index_state else 0} rows"
+              + (f" ({len(new_rows)} new)" if resumed else ""))
         print(f"  Portfolio:  {len(df_port)} verdicts")
         print(f"  Candidates: {len(df_cand)} statuses")
 
+    _save_state({
+        "version": STATE_VERSION,
+        "index": index_state,
+        "runs": _frame_to_json(acc) if acc is not None and not acc.empty else None,
+        "registry": reg_entry,
+        "portfolio": port_entry,
+        "candidates": cand_entry,
+    })
+
     # Aggregate index to per-run level
-    df_agg = _aggregate_index(df_idx)
+    df_agg = _finalize_index(acc)
 
     if df_agg.empty and df_reg.empty:
         if not quiet:
@@ -394,13 +608,15 @@ def generate(quiet: bool = False) -> Path:
 def main():
     parser = argparse.ArgumentParser(description="Generate run_summary.csv")
     parser.add_argument("--quiet", "-q", action="store_true")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore saved incremental state and rebuild from all sources")
     args = parser.parse_args()
 
     if not args.quiet:
         print("Generating run summary view...")
         print("=" * 40)
 
-    generate(quiet=args.quiet)
+    generate(quiet=args.quiet, full_rebuild=args.full)
 
     if not args.quiet:
         print("=" * 40)
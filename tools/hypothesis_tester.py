@@ -26,6 +26,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
@@ -153,6 +155,66 @@ def _apply_eligibility(insight: InsightRecord, total_trades: int) -> InsightReco
     return insight
 
 
+# ---------------------------------------------------------------------------
+# Typed trade columns (parsed once per extraction)
+# ---------------------------------------------------------------------------
+
+_SESSION_CODES = {"asia": 0, "london": 1, "ny": 2}
+
+
+class _TradeColumns:
+    """direction / pnl / entry-hour / session columns for one trade list.
+
+    Every check used to re-run _safe_int / _safe_float / _parse_timestamp
+    over the trade dicts; they now read these arrays instead.
+    """
+
+    def __init__(self, trades: list[dict[str, Any]]):
+        self.trades = trades
+        self.direction = np.array([_safe_int(t.get("direction", 0)) for t in trades], dtype=np.int64)
+        self.pnl = np.array([_safe_float(t.get("pnl_usd", 0)) for t in trades], dtype=np.float64)
+        self.hours: list[int | None] = [_get_entry_hour(t) for t in trades]
+        self.entry_hour = np.array([-1 if h is None else h for h in self.hours], dtype=np.int64)
+        self.session = np.array(
+            [-1 if h is None else _SESSION_CODES[_classify_session_hour(h)] for h in self.hours],
+            dtype=np.int64,
+        )
+        self._raw: dict[str, list[Any]] = {}
+        self._labels: dict[str, np.ndarray] = {}
+
+    def raw(self, field_name: str) -> list[Any]:
+        """``trade.get(field_name)`` for every trade, cached per field."""
+        if field_name not in self._raw:
+            self._raw[field_name] = [t.get(field_name) for t in self.trades]
+        return self._raw[field_name]
+
+    def labels(self, field_name: str) -> np.ndarray:
+        """Normalised categorical values (``str(v).strip().lower()``), cached per field."""
+        if field_name not in self._labels:
+            self._labels[field_name] = np.array(
+                [str(t.get(field_name, "")).strip().lower() for t in self.trades], dtype=object)
+        return self._labels[field_name]
+
+    def direction_codes(self) -> np.ndarray:
+        """0 = Long, 1 = Short, -1 = anything else."""
+        return np.where(self.direction == 1, 0, np.where(self.direction == -1, 1, -1))
+
+
+def _group_pnls(pnl: np.ndarray, keys: np.ndarray) -> dict[int, list[float]]:
+    """PnL list per non-negative key, in trade order (one stable sort)."""
+    valid = np.flatnonzero(keys >= 0)
+    if len(valid) == 0:
+        return {}
+    order = valid[np.argsort(keys[valid], kind="stable")]
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    bounds = np.append(starts, len(order))
+    return {
+        int(sorted_keys[lo]): pnl[order[lo:hi]].tolist()
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    }
+
+
 # ---------------------------------------------------------------------------
 # Dimensional checks — each returns a list of InsightRecord candidates
 # ---------------------------------------------------------------------------
@@ -166,7 +228,7 @@ def _pf_from_pnls(pnls: list[float]) -> float:
 
 
 def _check_direction_x_categorical(
-    trades: list[dict], total: int,
+    cols: _TradeColumns, total: int,
     cat_field: str, cat_map: dict[str, str],
     hypothesis_class: str,
 ) -> list[InsightRecord]:
@@ -174,14 +236,20 @@ def _check_direction_x_categorical(
     results = []
     dir_map = {1: "Long", -1: "Short"}
 
-    for dir_val, dir_label in dir_map.items():
-        dir_trades = [t for t in trades if _safe_int(t.get("direction", 0)) == dir_val]
+    # One grouped pass: key = direction_code * n_cats + category_code.
+    raw_vals = list(cat_map.values())
+    cat_index = {raw: j for j, raw in enumerate(raw_vals)}
+    cat_codes = np.array([cat_index.get(v, -1) for v in cols.labels(cat_field)], dtype=np.int64)
+    dir_codes = cols.direction_codes()
+    keys = np.where((dir_codes >= 0) & (cat_codes >= 0), dir_codes * len(raw_vals) + cat_codes, -1)
+    cells = _group_pnls(cols.pnl, keys)
+
+    for dir_code, (dir_val, dir_label) in enumerate(dir_map.items()):
         for nice_name, raw_val in cat_map.items():
-            cell = [t for t in dir_trades if str(t.get(cat_field, "")).strip().lower() == raw_val]
-            n = len(cell)
+            pnls = cells.get(dir_code * len(raw_vals) + cat_index[raw_val], [])
+            n = len(pnls)
             if n < 5:
                 continue
-            pnls = [_safe_float(t.get("pnl_usd", 0)) for t in cell]
             b = compute_pnl_basics(pnls)
             pf = b["profit_factor"]
             pct = (n / total * 100) if total > 0 else 0.0
@@ -212,21 +280,20 @@ def _check_direction_x_categorical(
     return results
 
 
-def _check_direction_bias(trades: list[dict], total: int) -> list[InsightRecord]:
+def _check_direction_bias(cols: _TradeColumns, total: int) -> list[InsightRecord]:
     """Standalone direction asymmetry check."""
     results = []
-    for dir_val, dir_label in [(1, "Long"), (-1, "Short")]:
-        dir_trades = [t for t in trades if _safe_int(t.get("direction", 0)) == dir_val]
-        n = len(dir_trades)
+    by_direction = _group_pnls(cols.pnl, cols.direction_codes())
+    for dir_code, (dir_val, dir_label) in enumerate([(1, "Long"), (-1, "Short")]):
+        pnls = by_direction.get(dir_code, [])
+        n = len(pnls)
         if n < 10:
             continue
-        pnls = [_safe_float(t.get("pnl_usd", 0)) for t in dir_trades]
         b = compute_pnl_basics(pnls)
 
-        other_trades = [t for t in trades if _safe_int(t.get("direction", 0)) == -dir_val]
-        if len(other_trades) < 10:
+        other_pnls = by_direction.get(1 - dir_code, [])
+        if len(other_pnls) < 10:
             continue
-        other_pnls = [_safe_float(t.get("pnl_usd", 0)) for t in other_trades]
         other_b = compute_pnl_basics(other_pnls)
 
         # Only surface if this direction is a drag AND the other is clearly better
@@ -237,7 +304,7 @@ def _check_direction_bias(trades: list[dict], total: int) -> list[InsightRecord]
             continue
 
         pct = (n / total * 100) if total > 0 else 0.0
-        score = ratio * min(1.0, min(n, len(other_trades)) / 30)
+        score = ratio * min(1.0, min(n, len(other_pnls)) / 30)
 
         results.append(InsightRecord(
             hypothesis_class="direction_bias",
@@ -256,19 +323,14 @@ def _check_direction_bias(trades: list[dict], total: int) -> list[InsightRecord]
     return results
 
 
-def _check_session_divergence(trades: list[dict], total: int) -> list[InsightRecord]:
+def _check_session_divergence(cols: _TradeColumns, total: int) -> list[InsightRecord]:
     """Session-level PF divergence."""
-    session_buckets: dict[str, list[float]] = {"asia": [], "london": [], "ny": []}
-    session_nice = {"asia": "Asia", "london": "London", "ny": "NY"}
+    by_session = _group_pnls(cols.pnl, cols.session)
+    session_buckets: dict[str, list[float]] = {
+        sess: by_session.get(code, []) for sess, code in _SESSION_CODES.items()
+    }
     session_hours = {"asia": (0, 8), "london": (8, 16), "ny": (16, 24)}
 
-    for t in trades:
-        hour = _get_entry_hour(t)
-        if hour is None:
-            continue
-        sess = _classify_session_hour(hour)
-        session_buckets[sess].append(_safe_float(t.get("pnl_usd", 0)))
-
     results = []
     sess_pfs = {}
     for sess, pnls in session_buckets.items():
@@ -394,39 +456,29 @@ def _check_regime_age_gradient(trades: list[dict], total: int) -> list[InsightRe
     return [record]
 
 
-def _check_late_ny_asymmetry(trades: list[dict], total: int) -> list[InsightRecord]:
+def _check_late_ny_asymmetry(cols: _TradeColumns, total: int) -> list[InsightRecord]:
     """Late NY (21-24 UTC) directional asymmetry."""
-    late_trades = []
-    core_trades = []
-    for t in trades:
-        hour = _get_entry_hour(t)
-        if hour is None:
-            continue
-        sess = _classify_session_hour(hour)
-        if sess != "ny":
-            continue
-        if _LATE_NY_START <= hour < _LATE_NY_END:
-            late_trades.append(t)
-        else:
-            core_trades.append(t)
-
-    if len(late_trades) < 10:
+    ny = cols.session == _SESSION_CODES["ny"]
+    late = ny & (cols.entry_hour >= _LATE_NY_START) & (cols.entry_hour < _LATE_NY_END)
+    if int(late.sum()) < 10:
         return []
 
+    # key = segment * 2 + direction_code, segment 0 = late NY, 1 = core NY
+    dir_codes = cols.direction_codes()
+    segment = np.where(late, 0, np.where(ny, 1, -1))
+    keys = np.where((segment >= 0) & (dir_codes >= 0), segment * 2 + dir_codes, -1)
+    cells = _group_pnls(cols.pnl, keys)
+
     results = []
-    for dir_val, dir_label in [(1, "Long"), (-1, "Short")]:
-        late_d = [t for t in late_trades if _safe_int(t.get("direction", 0)) == dir_val]
+    for dir_code, (dir_val, dir_label) in enumerate([(1, "Long"), (-1, "Short")]):
         opp_val = -dir_val
-        late_opp = [t for t in late_trades if _safe_int(t.get("direction", 0)) == opp_val]
-        core_d = [t for t in core_trades if _safe_int(t.get("direction", 0)) == dir_val]
+        late_pnls = cells.get(dir_code, [])
+        opp_pnls = cells.get(1 - dir_code, [])
+        core_pnls = cells.get(2 + dir_code, [])
 
-        if len(late_d) < 10 or len(late_opp) < 10 or len(core_d) < 10:
+        if len(late_pnls) < 10 or len(opp_pnls) < 10 or len(core_pnls) < 10:
             continue
 
-        late_pnls = [_safe_float(t.get("pnl_usd", 0)) for t in late_d]
-        core_pnls = [_safe_float(t.get("pnl_usd", 0)) for t in core_d]
-        opp_pnls = [_safe_float(t.get("pnl_usd", 0)) for t in late_opp]
-
         late_pf = _pf_from_pnls(late_pnls)
         core_pf = _pf_from_pnls(core_pnls)
         opp_pf = _pf_from_pnls(opp_pnls)
@@ -437,7 +489,7 @@ def _check_late_ny_asymmetry(trades: list[dict], total: int) -> list[InsightReco
         # Look for the WEAK direction in late NY
         if opp_pf < 1.0 and late_pf >= core_pf * 1.5:
             # The opposite direction is weak in late NY — that's the exclusion candidate
-            n = len(late_opp)
+            n = len(opp_pnls)
             b = compute_pnl_basics(opp_pnls)
             pct = (n / total * 100) if total > 0 else 0.0
             late_pf_c = min(late_pf, 5.0)
@@ -469,71 +521,71 @@ def _check_late_ny_asymmetry(trades: list[dict], total: int) -> list[InsightReco
 # Trade matching (for cross-dimension overlap detection)
 # ---------------------------------------------------------------------------
 
-def _trade_matches_insight(trade: dict, insight: InsightRecord) -> bool:
-    """Return True if a trade would be excluded by this insight's filter."""
-    # Primary condition
-    raw = trade.get(insight.target_field)
-
-    # Special handling for entry_hour (derived from entry_timestamp)
-    if insight.target_field == "entry_hour":
-        hour = _get_entry_hour(trade)
-        if hour is None:
-            return False
-        raw = hour
-
+def _condition_holds(raw: Any, op: str, target: Any) -> bool:
+    """Evaluate one filter condition against a raw trade value."""
     if raw is None:
         return False
-
     try:
-        if insight.target_op == "eq":
-            if not (_coerce_match(raw, insight.target_value)):
-                return False
-        elif insight.target_op == "gte":
-            if not (float(raw) >= float(insight.target_value)):
-                return False
-        elif insight.target_op == "lte":
-            if not (float(raw) <= float(insight.target_value)):
-                return False
-        elif insight.target_op == "lt":
-            if not (float(raw) < float(insight.target_value)):
-                return False
-        else:
-            return False
+        if op == "eq":
+            return _coerce_match(raw, target)
+        if op == "gte":
+            return float(raw) >= float(target)
+        if op == "lte":
+            return float(raw) <= float(target)
+        if op == "lt":
+            return float(raw) < float(target)
     except (ValueError, TypeError):
         return False
+    return False
+
+
+def _field_value(trade: dict, field_name: str) -> Any:
+    """Raw value a filter condition sees (entry_hour is derived)."""
+    if field_name == "entry_hour":
+        return _get_entry_hour(trade)
+    return trade.get(field_name)
+
+
+def _trade_matches_insight(trade: dict, insight: InsightRecord) -> bool:
+    """Return True if a trade would be excluded by this insight's filter."""
+    if not _condition_holds(_field_value(trade, insight.target_field),
+                            insight.target_op, insight.target_value):
+        return False
 
     # Secondary condition (AND logic)
     if insight.secondary_field is not None:
-        raw2 = trade.get(insight.secondary_field)
-        if insight.secondary_field == "entry_hour":
-            hour = _get_entry_hour(trade)
-            if hour is None:
-                return False
-            raw2 = hour
-        if raw2 is None:
-            return False
-        op2 = insight.secondary_op or "eq"
-        try:
-            if op2 == "eq":
-                if not _coerce_match(raw2, insight.secondary_value):
-                    return False
-            elif op2 == "gte":
-                if not (float(raw2) >= float(insight.secondary_value)):
-                    return False
-            elif op2 == "lte":
-                if not (float(raw2) <= float(insight.secondary_value)):
-                    return False
-            elif op2 == "lt":
-                if not (float(raw2) < float(insight.secondary_value)):
-                    return False
-            else:
-                return False
-        except (ValueError, TypeError):
-            return False
+        return _condition_holds(_field_value(trade, insight.secondary_field),
+                                insight.secondary_op or "eq", insight.secondary_value)
 
     return True
 
 
+def _condition_mask(cols: _TradeColumns, field_name: str, op: str, target: Any) -> np.ndarray:
+    """_condition_holds over a column, evaluated once per distinct value."""
+    values = cols.hours if field_name == "entry_hour" else cols.raw(field_name)
+    memo: dict[tuple[type, Any], bool] = {}
+    mask = np.zeros(len(values), dtype=bool)
+    for i, raw in enumerate(values):
+        try:
+            key = (type(raw), raw)
+            hit = memo.get(key)
+            if hit is None:
+                hit = memo[key] = _condition_holds(raw, op, target)
+        except TypeError:  # unhashable value
+            hit = _condition_holds(raw, op, target)
+        mask[i] = hit
+    return mask
+
+
+def _matched_trade_indices(cols: _TradeColumns, insight: InsightRecord) -> frozenset:
+    """Indices of the trades _trade_matches_insight() would exclude."""
+    mask = _condition_mask(cols, insight.target_field, insight.target_op, insight.target_value)
+    if insight.secondary_field is not None:
+        mask &= _condition_mask(cols, insight.secondary_field,
+                                insight.secondary_op or "eq", insight.secondary_value)
+    return frozenset(np.flatnonzero(mask).tolist())
+
+
 def _coerce_match(raw: Any, target: Any) -> bool:
     """Flexible equality: try numeric first, then string."""
     try:
@@ -562,32 +614,33 @@ def extract_structured_insights(
         return []
 
     all_insights: list[InsightRecord] = []
+    cols = _TradeColumns(trades)
 
     # 1. Direction x Volatility
     vol_map = {"high": "high", "normal": "normal", "low": "low"}
     if any(t.get("volatility_regime") not in (None, "", "None") for t in trades):
         all_insights.extend(_check_direction_x_categorical(
-            trades, total, "volatility_regime", vol_map, "weak_cell"))
+            cols, total, "volatility_regime", vol_map, "weak_cell"))
 
     # 2. Direction x Trend
     trend_map = {"strong_up": "strong_up", "weak_up": "weak_up", "neutral": "neutral",
                  "weak_down": "weak_down", "strong_down": "strong_down"}
     if any(t.get("trend_label") not in (None, "", "None") for t in trades):
         all_insights.extend(_check_direction_x_categorical(
-            trades, total, "trend_label", trend_map, "weak_cell"))
+            cols, total, "trend_label", trend_map, "weak_cell"))
 
     # 3. Direction bias
-    all_insights.extend(_check_direction_bias(trades, total))
+    all_insights.extend(_check_direction_bias(cols, total))
 
     # 4. Session divergence
-    all_insights.extend(_check_session_divergence(trades, total))
+    all_insights.extend(_check_session_divergence(cols, total))
 
     # 5. Regime age gradient
     if any(t.get("regime_age") not in (None, "", "None", "nan") for t in trades):
         all_insights.extend(_check_regime_age_gradient(trades, total))
 
     # 6. Late NY asymmetry
-    all_insights.extend(_check_late_ny_asymmetry(trades, total))
+    all_insights.extend(_check_late_ny_asymmetry(cols, total))
 
     # Apply eligibility
     for ins in all_insights:
@@ -607,11 +660,7 @@ def extract_structured_insights(
     for ins in all_insights:
         if not ins.eligible:
             continue
-        matched = set()
-        for idx, t in enumerate(trades):
-            if _trade_matches_insight(t, ins):
-                matched.add(idx)
-        ins._matched_trade_indices = frozenset(matched)
+        ins._matched_trade_indices = _matched_trade_indices(cols, ins)
 
     return all_insights
 
@@ -13,6 +13,13 @@ and/or failed in prior research. Uses three data sources:
 
 Fallback: Strategy_Master_Filter.xlsx (if run_summary.csv doesn't exist yet).
 
+The three primary sources are served from a persistent evidence index
+(TradeScan_State/research/idea_evidence_index.json). Each source has its own
+section, keyed by (MODEL token, asset class, signal version) and stamped with
+the size/mtime of the files it was built from. Only a section whose source
+changed is rebuilt, so a batch of sweep directives does a few dict lookups
+per directive instead of re-reading and re-scanning every source.
+
 Returns a structured evaluation dict on success. Never raises (non-blocking).
 With --strict-preflight: REPEAT_FAILED status causes exit(1).
 
@@ -23,6 +30,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -31,6 +39,7 @@ from typing import Any
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from tools.input_fingerprint import stat_fingerprint
 from tools.pipeline_utils import parse_directive
 from config.state_paths import MASTER_FILTER_PATH, STATE_ROOT, REGISTRY_DIR
 from config.asset_classification import (
@@ -44,6 +53,8 @@ from config.asset_classification import (
 # Data source paths
 RUN_SUMMARY_PATH = STATE_ROOT / "research" / "run_summary.csv"
 HYPOTHESIS_LOG_PATH = STATE_ROOT / "hypothesis_log.json"
+EVIDENCE_INDEX_PATH = STATE_ROOT / "research" / "idea_evidence_index.json"
+EVIDENCE_INDEX_VERSION = 1
 
 # Reuse the authoritative naming pattern from namespace_gate
 NAME_PATTERN = re.compile(
@@ -315,6 +326,124 @@ def evaluate_idea(directive_path: str | Path) -> dict[str, Any]:
                    top_examples, recommendation, suggestions, memory_basis)
 
 
+# ---------------------------------------------------------------------------
+# Persistent evidence index
+# ---------------------------------------------------------------------------
+
+def _section(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Wrap keyed records with lookup maps.
+
+    ``by_key`` maps "KEY|AC|SV" to record positions (the common query: one
+    lookup); ``by_token`` maps "KEY" alone for queries without an asset
+    class. Positions preserve source order.
+    """
+    by_key: dict[str, list[int]] = {}
+    by_token: dict[str, list[int]] = {}
+    for pos, rec in enumerate(records):
+        for token in rec["keys"]:
+            by_key.setdefault(f"{token}|{rec['ac']}|{rec['sv']}", []).append(pos)
+            by_token.setdefault(token, []).append(pos)
+    return {"records": records, "by_key": by_key, "by_token": by_token}
+
+
+def _section_lookup(
+    section: dict[str, Any],
+    tokens: str | list[str],
+    asset_class: str | None,
+    signal_version: int | None,
+) -> list[dict[str, Any]]:
+    """Records matching any token (and AC / SV when given), in source order."""
+    if isinstance(tokens, str):
+        tokens = [tokens]
+    records = section["records"]
+    positions: set[int] = set()
+    for token in tokens:
+        if asset_class is not None and signal_version is not None:
+            positions.update(section["by_key"].get(f"{token}|{asset_class}|{signal_version}", ()))
+            continue
+        for pos in section["by_token"].get(token, ()):
+            rec = records[pos]
+            if asset_class is not None and rec["ac"] != asset_class:
+                continue
+            if signal_version is not None and rec["sv"] != signal_version:
+                continue
+            positions.add(pos)
+    return [records[pos] for pos in sorted(positions)]
+
+
+_SECTION_BUILDERS: dict[str, tuple[Any, Any]] = {
+    "run_summary": (lambda: [RUN_SUMMARY_PATH], lambda: _build_run_summary_section()),
+    "hypothesis_log": (lambda: [HYPOTHESIS_LOG_PATH], lambda: _build_hypothesis_log_section()),
+    "research_memory": (lambda: _research_memory_sources(), lambda: _build_research_memory_section()),
+}
+
+# In-process copy of the persisted index: {"path": str, "sections": {...}}
+_evidence_cache: dict[str, Any] = {}
+
+
+def _load_evidence_index() -> dict[str, Any]:
+    path = str(EVIDENCE_INDEX_PATH)
+    if _evidence_cache.get("path") != path:
+        sections: dict[str, Any] = {}
+        try:
+            payload = json.loads(EVIDENCE_INDEX_PATH.read_text(encoding="utf-8"))
+            if isinstance(payload, dict) and payload.get("version") == EVIDENCE_INDEX_VERSION:
+                sections = payload.get("sections") or {}
+        except (OSError, ValueError):
+            pass
+        _evidence_cache.clear()
+        _evidence_cache.update({"path": path, "sections": sections})
+    return _evidence_cache["sections"]
+
+
+def _save_evidence_index(sections: dict[str, Any]) -> None:
+    """Atomic write of the persisted index. Best-effort — the gate never fails on it."""
+    persisted = {
+        name: {k: v for k, v in sec.items() if k != "memo"}
+        for name, sec in sections.items()
+    }
+    try:
+        EVIDENCE_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = EVIDENCE_INDEX_PATH.with_suffix(EVIDENCE_INDEX_PATH.suffix + ".tmp")
+        tmp.write_text(
+            json.dumps({"version": EVIDENCE_INDEX_VERSION, "sections": persisted}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, EVIDENCE_INDEX_PATH)
+    except OSError as e:
+        print(f"  [WARN] Could not persist idea evidence index: {e}")
+
+
+def _evidence_section(name: str) -> dict[str, Any]:
+    """Return the index section for one source, rebuilding it only if the
+    source files changed since it was built."""
+    sources, build = _SECTION_BUILDERS[name]
+    fingerprint = stat_fingerprint(sources())
+    sections = _load_evidence_index()
+    section = sections.get(name)
+    if section is None or section.get("fingerprint") != fingerprint:
+        section = build()
+        section["fingerprint"] = fingerprint
+        sections[name] = section
+        _save_evidence_index(sections)
+    section.setdefault("memo", {})
+    return section
+
+
+def refresh_evidence_index(full_rebuild: bool = False) -> dict[str, int]:
+    """Bring every section up to date (all sections if full_rebuild).
+
+    Returns {section: record_count}.
+    """
+    if full_rebuild:
+        _load_evidence_index().clear()
+    counts = {}
+    for name in _SECTION_BUILDERS:
+        section = _evidence_section(name)
+        counts[name] = len(section.get("records", section.get("entries", [])))
+    return counts
+
+
 # ---------------------------------------------------------------------------
 # Data source 1: run_summary.csv (pre-joined — primary)
 # ---------------------------------------------------------------------------
@@ -374,30 +503,36 @@ def _search_run_summary(
     portfolio_sharpe, candidate_status, in_portfolio, risk_profile,
     signal_version (Phase 2, additive).
     """
+    section = _evidence_section("run_summary")
+    matches: list[dict[str, Any]] = []
+    for rec in _section_lookup(section, model, asset_class, signal_version):
+        match = dict(rec["row"])
+        match["tf_match"] = match["timeframe"].lower() == timeframe.lower()
+        matches.append(match)
+    return matches
+
+
+def _build_run_summary_section() -> dict[str, Any]:
+    """Index every run_summary.csv row whose strategy_id parses, by MODEL/AC/SV."""
+    records: list[dict[str, Any]] = []
     if not RUN_SUMMARY_PATH.exists():
-        return []
+        return _section(records)
     try:
         import pandas as pd
         df = pd.read_csv(RUN_SUMMARY_PATH, dtype={"run_id": str})
     except Exception:
-        return []
+        return _section(records)
 
-    matches: list[dict[str, Any]] = []
     for _, row in df.iterrows():
         sid = str(row.get("strategy_id", ""))
         m = NAME_PATTERN.match(sid)
         if not m:
             continue
-        if m.group("model") != model:
-            continue
-        if asset_class is not None:
-            row_ac = _row_asset_class(row, sid)
-            if row_ac != asset_class:
-                continue
-        if signal_version is not None:
-            if _row_signal_version(row) != signal_version:
-                continue
-        matches.append({
+        records.append({
+            "keys": [m.group("model")],
+            "ac": _row_asset_class(row, sid),
+            "sv": _row_signal_version(row),
+            "row": {
                 "run_id": str(row.get("run_id", "")),
                 "strategy_id": sid,
                 "status": str(row.get("status", "")),
@@ -411,9 +546,9 @@ def _search_run_summary(
                 "portfolio_verdict": str(row.get("portfolio_verdict", "")),
                 "candidate_status": str(row.get("candidate_status", "")),
                 "symbols": str(row.get("symbols", "")),
-                "tf_match": str(row.get("timeframe", "")).lower() == timeframe.lower(),
-            })
-    return matches
+            },
+        })
+    return _section(records)
 
 
 # ---------------------------------------------------------------------------
@@ -433,46 +568,53 @@ def _search_hypothesis_log(
     Each entry has: strategy, hypothesis, decision (ACCEPT/REJECT/SKIP),
     baseline_metrics, pass_metrics, rejection_reason.
     """
+    section = _evidence_section("hypothesis_log")
+    return [
+        dict(rec["row"])
+        for rec in _section_lookup(section, [f"M:{model}", f"I:{idea_id}"],
+                                   asset_class, signal_version)
+    ]
+
+
+def _build_hypothesis_log_section() -> dict[str, Any]:
+    """Index hypothesis_log.json entries by MODEL and idea_id (each with AC/SV)."""
+    records: list[dict[str, Any]] = []
     if not HYPOTHESIS_LOG_PATH.exists():
-        return []
+        return _section(records)
     try:
         with open(HYPOTHESIS_LOG_PATH, encoding="utf-8") as f:
             data = json.load(f)
     except Exception:
-        return []
+        return _section(records)
 
     if not isinstance(data, list):
-        return []
+        return _section(records)
 
-    matches: list[dict[str, Any]] = []
     for entry in data:
         strategy = str(entry.get("strategy", ""))
         m = NAME_PATTERN.match(strategy)
         if not m:
             continue
-        if m.group("model") != model and m.group("idea_id") != idea_id:
-            continue
-        if asset_class is not None:
-            if classify_asset(strategy) != asset_class:
-                continue
-        if signal_version is not None:
-            entry_sv_raw = entry.get("signal_version", 1)
-            try:
-                entry_sv = int(entry_sv_raw) if entry_sv_raw is not None else 1
-            except (TypeError, ValueError):
-                entry_sv = 1
-            if entry_sv != signal_version:
-                continue
+        entry_sv_raw = entry.get("signal_version", 1)
+        try:
+            entry_sv = int(entry_sv_raw) if entry_sv_raw is not None else 1
+        except (TypeError, ValueError):
+            entry_sv = 1
         result = entry.get("result") or entry.get("pass_metrics") or {}
-        matches.append({
-            "strategy": strategy,
-            "hypothesis": str(entry.get("hypothesis", "")),
-            "decision": str(entry.get("decision", entry.get("stage", ""))),
-            "pf": result.get("pf") or result.get("profit_factor"),
-            "rejection_reason": str(entry.get("rejection_reason", "") or ""),
-            "timestamp": str(entry.get("timestamp", "")),
+        records.append({
+            "keys": [f"M:{m.group('model')}", f"I:{m.group('idea_id')}"],
+            "ac": classify_asset(strategy),
+            "sv": entry_sv,
+            "row": {
+                "strategy": strategy,
+                "hypothesis": str(entry.get("hypothesis", "")),
+                "decision": str(entry.get("decision", entry.get("stage", ""))),
+                "pf": result.get("pf") or result.get("profit_factor"),
+                "rejection_reason": str(entry.get("rejection_reason", "") or ""),
+                "timestamp": str(entry.get("timestamp", "")),
+            },
         })
-    return matches
+    return _section(records)
 
 
 # ---------------------------------------------------------------------------
@@ -531,88 +673,89 @@ def _search_research_memory(
     Propagates parse_warnings count via _rm_parse_warnings module-level variable.
     """
     global _rm_parse_warnings
-    _rm_parse_warnings = 0
+    section = _evidence_section("research_memory")
+    _rm_parse_warnings = section["parse_warnings"]
+    entries = section["entries"]
+
+    memo_key = (model, idea_id, asset_class)
+    hits = section["memo"].get(memo_key)
+    if hits is None:
+        model_upper = model.upper()
+        family_token = f"_{idea_id}_"
+        hits = []
+        for pos, entry in enumerate(entries):
+            if not (model_upper in entry["strategy_upper"]
+                    or model_upper in entry["tags_upper"]
+                    or family_token in entry["strategy"]):
+                continue
+            # Asset-class filter: skip entries whose parseable Strategy:
+            # field resolves to a different asset class. Concept-level
+            # entries (no parseable strategy) remain global.
+            if asset_class is not None and entry["ac"] is not None and entry["ac"] != asset_class:
+                continue
+            hits.append(pos)
+        section["memo"][memo_key] = hits
+
     results: list[dict[str, Any]] = []
+    for pos in hits:
+        entry = entries[pos]
+        results.append({
+            "strategy": entry["strategy"],
+            "tags": entry["tags"],
+            "finding": entry["finding"],
+            "tf_match": timeframe.lower() in entry["tags"].lower(),
+            "date": entry["date"],
+        })
+    return results
 
-    # --- Try JSON index first ---
-    index_data = _load_research_entries_from_index()
-    if index_data is not None:
-        all_entries, parse_warnings = index_data
-        _rm_parse_warnings = parse_warnings
-        for entry in all_entries:
-            strategy_field = entry.get("strategy", "")
-            tags_field = entry.get("tags", "")
-
-            model_in_strategy = model.upper() in strategy_field.upper()
-            model_in_tags = model.upper() in tags_field.upper()
-            family_match = f"_{idea_id}_" in strategy_field
-
-            if model_in_strategy or model_in_tags or family_match:
-                # Asset-class filter: skip entries whose parseable Strategy:
-                # field resolves to a different asset class. Concept-level
-                # entries (no parseable strategy) remain global.
-                if asset_class is not None:
-                    entry_ac = _entry_asset_class(strategy_field)
-                    if entry_ac is not None and entry_ac != asset_class:
-                        continue
-
-                body = entry.get("body", "")
-                finding = body[:200].replace("\n", " ").strip()
-                if len(body) > 200:
-                    finding += "..."
-
-                results.append({
-                    "strategy": strategy_field,
-                    "tags": tags_field,
-                    "finding": finding,
-                    "tf_match": timeframe.lower() in tags_field.lower(),
-                    "date": entry.get("date", ""),
-                })
-        return results
-
-    # --- Fallback: parse markdown directly ---
-    for filename in ("RESEARCH_MEMORY.md", "RESEARCH_MEMORY_ARCHIVE.md"):
-        path = PROJECT_ROOT / filename
-        if not path.exists():
-            continue
-        try:
-            text = path.read_text(encoding="utf-8")
-        except Exception:
-            continue
 
-        entries, pw = _parse_research_entries(text)
-        _rm_parse_warnings += pw
-        for entry in entries:
-            strategy_field = entry.get("strategy", "")
-            tags_field = entry.get("tags", "")
-
-            model_in_strategy = model.upper() in strategy_field.upper()
-            model_in_tags = model.upper() in tags_field.upper()
-            family_match = f"_{idea_id}_" in strategy_field
-
-            if model_in_strategy or model_in_tags or family_match:
-                # Asset-class filter: skip entries whose parseable Strategy:
-                # field resolves to a different asset class. Concept-level
-                # entries (no parseable strategy) remain global.
-                if asset_class is not None:
-                    entry_ac = _entry_asset_class(strategy_field)
-                    if entry_ac is not None and entry_ac != asset_class:
-                        continue
-
-                body = entry.get("body", "")
-                finding = body[:200].replace("\n", " ").strip()
-                if len(body) > 200:
-                    finding += "..."
-
-                results.append({
-                    "strategy": strategy_field,
-                    "tags": tags_field,
-                    "finding": finding,
-                    "tf_match": timeframe.lower() in tags_field.lower(),
-                    "date": entry.get("date", ""),
-                })
+def _research_memory_sources() -> list[Path]:
+    paths = [PROJECT_ROOT / fn for fn in ("RESEARCH_MEMORY.md", "RESEARCH_MEMORY_ARCHIVE.md")]
+    try:
+        from tools.generate_research_memory_index import INDEX_PATH
+        paths.insert(0, INDEX_PATH)
+    except ImportError:
+        pass
+    return paths
 
-    return results
+
+def _build_research_memory_section() -> dict[str, Any]:
+    """Pre-digest RESEARCH_MEMORY entries (JSON index if available, else markdown)."""
+    index_data = _load_research_entries_from_index()
+    if index_data is not None:
+        raw_entries, parse_warnings = index_data
+    else:
+        raw_entries, parse_warnings = [], 0
+        for filename in ("RESEARCH_MEMORY.md", "RESEARCH_MEMORY_ARCHIVE.md"):
+            path = PROJECT_ROOT / filename
+            if not path.exists():
+                continue
+            try:
+                text = path.read_text(encoding="utf-8")
+            except Exception:
+                continue
+            parsed, pw = _parse_research_entries(text)
+            raw_entries.extend(parsed)
+            parse_warnings += pw
+
+    entries = []
+    for entry in raw_entries:
+        strategy_field = entry.get("strategy", "")
+        tags_field = entry.get("tags", "")
+        body = entry.get("body", "")
+        finding = body[:200].replace("\n", " ").strip()
+        if len(body) > 200:
+            finding += "..."
+        entries.append({
+            "strategy": strategy_field,
+            "tags": tags_field,
+            "strategy_upper": strategy_field.upper(),
+            "tags_upper": tags_field.upper(),
+            "ac": _entry_asset_class(strategy_field),
+            "finding": finding,
+            "date": entry.get("date", ""),
+        })
+    return {"entries": entries, "parse_warnings": parse_warnings}
 
 
 # Module-level variable to propagate parse warnings to memory_basis
@@ -1243,14 +1386,24 @@ def main() -> int:
         "--sources", action="store_true",
         help="Print data source availability report and exit."
     )
+    parser.add_argument(
+        "--rebuild-index", action="store_true",
+        help="Rebuild the persistent evidence index from all sources and exit."
+    )
     args = parser.parse_args()
 
     if args.sources:
         print_sources_report()
         return 0
 
+    if args.rebuild_index:
+        counts = refresh_evidence_index(full_rebuild=True)
+        parts = ", ".join(f"{k}={v}" for k, v in counts.items())
+        print(f"[IDEA_GATE] Evidence index rebuilt: {parts}  ({EVIDENCE_INDEX_PATH})")
+        return 0
+
     if not args.directive_path:
-        parser.error("directive_path is required (unless --sources)")
+        parser.error("directive_path is required (unless --sources / --rebuild-index)")
 
     result = evaluate_idea(args.directive_path)
 
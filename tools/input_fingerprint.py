@@ -0,0 +1,33 @@
+"""
+input_fingerprint.py — stat fingerprints for caches keyed on source files.
+
+Shared by the caches that skip work while their inputs are unchanged:
+system_introspection (collector cache), generate_run_summary (section
+state) and idea_evaluation_gate (evidence index).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def stat_fingerprint(paths) -> list[list]:
+    """[path, mtime_ns, size] per path; a missing file gives [path, None, None]."""
+    out: list[list] = []
+    for p in paths:
+        try:
+            st = Path(p).stat()
+            out.append([str(p), st.st_mtime_ns, st.st_size])
+        except OSError:
+            out.append([str(p), None, None])
+    return out
+
+
+def ledger_db_paths() -> list[Path]:
+    """ledger.db plus its WAL (writes land there until checkpoint); [] when
+    the DB path cannot be resolved."""
+    try:
+        from tools.ledger_db import _resolve_db_path
+        db = _resolve_db_path()
+    except Exception:
+        return []
+    return [db, db.with_name(db.name + "-wal")]
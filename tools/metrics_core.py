@@ -6,7 +6,8 @@ Extracted from stage2_compiler.py to enable reuse by:
   - shadow_filter (what-if analysis)
   - report_generator (future direct computation)
 
-All functions are pure: no I/O, no global state, no side effects beyond
+All functions are pure: no I/O, no global state (beyond the one-slot
+TradeColumns reuse in compute_metrics_from_trades), no side effects beyond
 diagnostic prints on invalid data. Every function preserves the original
 stage2_compiler behavior exactly.
 
@@ -17,9 +18,11 @@ from __future__ import annotations
 
 import math
 import statistics
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 __all__ = [
     # Public metric functions
     "compute_pnl_basics",
@@ -37,6 +40,9 @@ __all__ = [
     "compute_session_breakdown",
     "compute_regime_age_breakdown",
     "compute_age_dual_breakdown",
+    # Columnar kernel
+    "TradeColumns",
+    "compute_metrics_by_direction",
     # Orchestrator
     "compute_metrics_from_trades",
     "empty_metrics",
@@ -117,7 +123,23 @@ def _safe_int(val: Any, default: int = 0) -> int:
         return default
 
 
-def _parse_timestamp(ts_str: str) -> datetime | None:
+def _parse_timestamp(ts_str: Any) -> datetime | None:
+    """ISO string -> datetime, a UTC offset ('Z' / '+00:00') dropped.
+
+    datetime-likes (datetime, pd.Timestamp, np.datetime64 — what a DataFrame's
+    datetime64 columns give after to_dict("records")) follow the same rule;
+    NaT -> None.
+    """
+    if isinstance(ts_str, np.datetime64):
+        ts_str = ts_str.astype("datetime64[us]").item()  # NaT -> None
+    if isinstance(ts_str, datetime):
+        if ts_str != ts_str:  # NaT
+            return None
+        if hasattr(ts_str, "to_pydatetime"):
+            ts_str = ts_str.to_pydatetime(warn=False)
+        if ts_str.tzinfo is not None and ts_str.utcoffset() == timedelta(0):
+            ts_str = ts_str.replace(tzinfo=None)
+        return ts_str
     if not ts_str:
         return None
     try:
@@ -784,76 +806,392 @@ def compute_exec_delta_distribution(trades: list[dict[str, Any]]) -> dict[str, A
 
 
 # ==================================================================
-# ORCHESTRATOR
+# COLUMNAR KERNEL
 # ==================================================================
+#
+# The per-function API above works on list[dict] and re-coerces every field
+# on every call; the orchestrator used to pay that cost once per direction.
+# TradeColumns coerces each trade exactly once (same _safe_float / _safe_int /
+# _parse_timestamp rules) and the kernel slices shared arrays per direction.
+#
+# Exactness: running totals that the list code builds with `+=` use np.cumsum
+# (strict left-to-right, seeded with 0.0). Everything the list code reduces
+# with builtin sum()/statistics/** is still reduced that way over .tolist()
+# slices, so results are identical across Python versions and libm pow.
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+_MISSING_LABELS = ("none", "nan", "")
+
+
+def _bucket_codes(raw_labels: list[str], bucket_map: dict[str, list[str]]) -> np.ndarray:
+    """Bucket index per trade; -1 = missing label, -2 = unknown label."""
+    lookup: dict[str, int] = {}
+    for code, raw_vals in enumerate(bucket_map.values()):
+        for rv in raw_vals:
+            lookup[rv] = code
+    return np.array(
+        [-1 if raw in _MISSING_LABELS else lookup.get(raw, -2) for raw in raw_labels],
+        dtype=np.int64,
+    )
 
-def compute_metrics_from_trades(trades: list[dict[str, Any]], starting_capital: float, direction_filter: int | None = None, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Compute all metrics from trade-level data. direction_filter: 1=Long, -1=Short, None=All
 
-    Delegates to focused statistical functions; assembles into the canonical
-    metrics dict consumed by get_performance_summary_df() and Stage 3.
+def _running_sum(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum matching ``s = 0.0; s += v`` (including -0.0 handling)."""
+    return np.cumsum(np.concatenate(([0.0], values)))[1:]
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values."""
+    if not mask.any():
+        return 0
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return int((np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)).max())
+
+
+class TradeColumns:
+    """Per-field arrays for a trade list, coerced once.
+
+    Accepts the canonical ``list[dict]`` trade rows or a DataFrame of the
+    same columns (converted to records so coercion rules are unchanged).
+    Timestamps are held as integer microseconds since the epoch; when any
+    parsed timestamp is timezone-aware the microsecond columns are not
+    comparable, so ``naive_times`` is False and the period / bars-per-day
+    metrics fall back to the list functions.
     """
-    # --- Metadata presence guard (prevents silent bars_per_day drift) ---
-    if metadata is None:
-        print("  METRICS_CORE_WARN  metadata=None — bars_per_day will use empirical/fallback")
 
-    filtered = trades
-    if direction_filter is not None:
-        filtered = [t for t in trades if _safe_int(t.get("direction", 0)) == direction_filter]
+    def __init__(self, trades: Any):
+        if hasattr(trades, "to_dict"):
+            trades = trades.to_dict("records")
+        self.records: list[dict[str, Any]] = list(trades)
+        n = len(self.records)
+
+        self.pnl = np.empty(n, dtype=np.float64)
+        self.direction = np.empty(n, dtype=np.int64)
+        self.bars = np.empty(n, dtype=np.int64)
+        self.has_bars = np.empty(n, dtype=bool)
+        self.mfe_r = np.empty(n, dtype=np.float64)
+        self.mae_r = np.empty(n, dtype=np.float64)
+        self.entry_us = np.zeros(n, dtype=np.int64)
+        self.exit_us = np.zeros(n, dtype=np.int64)
+        self.has_entry = np.zeros(n, dtype=bool)
+        self.has_exit = np.zeros(n, dtype=bool)
+        self.entry_hour = np.full(n, -1, dtype=np.int64)
+        self.naive_times = True
+        vol_raw: list[str] = []
+        trend_raw: list[str] = []
+
+        for i, t in enumerate(self.records):
+            self.pnl[i] = _safe_float(t.get("pnl_usd", 0))
+            self.direction[i] = _safe_int(t.get("direction", 0))
+            self.has_bars[i] = t.get("bars_held") not in (None, "", "None")
+            self.bars[i] = _safe_int(t.get("bars_held", 0))
+            self.mfe_r[i] = _safe_float(t.get("mfe_r", 0))
+            self.mae_r[i] = _safe_float(t.get("mae_r", 0))
+
+            entry_dt = _parse_timestamp(t.get("entry_timestamp", ""))
+            exit_dt = _parse_timestamp(t.get("exit_timestamp", ""))
+            if entry_dt is not None:
+                self.has_entry[i] = True
+                self.entry_hour[i] = entry_dt.hour
+                if entry_dt.tzinfo is None:
+                    self.entry_us[i] = (entry_dt - _EPOCH) // _ONE_US
+                else:
+                    self.naive_times = False
+            if exit_dt is not None:
+                self.has_exit[i] = True
+                if exit_dt.tzinfo is None:
+                    self.exit_us[i] = (exit_dt - _EPOCH) // _ONE_US
+                else:
+                    self.naive_times = False
+
+            vol_raw.append(str(t.get("volatility_regime", "")).strip().lower())
+            trend_raw.append(str(t.get("trend_label", "")).strip().lower())
+
+        self.vol_raw = vol_raw
+        self.vol_code = _bucket_codes(vol_raw, VOL_REGIME_BUCKETS)
+        self.trend_code = _bucket_codes(trend_raw, TREND_LABEL_BUCKETS)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def select(self, direction_filter: int | None) -> np.ndarray:
+        """Row positions (in trade order) kept by a direction filter."""
+        if direction_filter is None:
+            return np.arange(len(self.records))
+        return np.flatnonzero(self.direction == direction_filter)
+
+
+def _kernel_drawdown(pnl: np.ndarray, net_profit: float, starting_capital: float) -> dict[str, float]:
+    """compute_drawdown() over an array; fmax keeps the loop's NaN behaviour."""
+    cumulative = _running_sum(pnl)
+    peak = np.fmax.accumulate(np.concatenate(([0.0], cumulative)))[1:]
+    max_dd = float(np.fmax.reduce(np.concatenate(([0.0], peak - cumulative))))
+    return {
+        "max_dd": max_dd,
+        "max_dd_pct": (max_dd / starting_capital) if starting_capital > 0 else 0.0,
+        "return_dd_ratio": (net_profit / max_dd) if max_dd > 0 else net_profit if net_profit > 0 else 0.0,
+        "return_on_capital": (net_profit / starting_capital) if starting_capital > 0 else 0.0,
+    }
+
+
+def _kernel_k_ratio(pnl: np.ndarray) -> float:
+    """compute_k_ratio() over an array."""
+    n = len(pnl)
+    if n < 3:
+        return 0.0
+
+    cum = _running_sum(pnl)
+    x_mean = (n - 1) / 2.0
+    y_mean = sum(cum.tolist()) / n
+
+    # (i - x_mean) is a half-integer, so its square is exact under any pow.
+    dx = np.arange(n) - x_mean
+    ss_xx = sum((dx * dx).tolist())
+    ss_xy = sum((dx * (cum - y_mean)).tolist())
+
+    slope = ss_xy / ss_xx if ss_xx > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+
+    residuals = cum - (slope * np.arange(n) + intercept)
+    residuals_sq = sum(r ** 2 for r in residuals.tolist())
+    mse = residuals_sq / max(1, (n - 2))
+
+    se_slope = math.sqrt(mse / ss_xx) if ss_xx > 0 and mse > 0 else 0.0
+
+    return (slope / se_slope) if se_slope > 0 else 0.0
+
+
+def _kernel_trading_period(cols: TradeColumns, idx: np.ndarray, trade_count: int) -> dict[str, Any]:
+    """compute_trading_period() over the microsecond columns."""
+    entries = np.sort(cols.entry_us[idx][cols.has_entry[idx]])
+    exits = np.sort(cols.exit_us[idx][cols.has_exit[idx]])
+
+    if len(entries) and len(exits):
+        trading_period_days = max(int((exits[-1] - entries[0]) // _US_PER_DAY), 1)
+    else:
+        trading_period_days = 1
+
+    trades_per_month = (trade_count / (trading_period_days / 30)) if trading_period_days >= 30 else trade_count
+
+    longest_flat_days = 0
+    if len(exits) > 1:
+        pairs = min(len(entries) - 1, len(exits))
+        if pairs > 0:
+            gaps = (entries[1:pairs + 1] - exits[:pairs]) // _US_PER_DAY
+            longest_flat_days = max(0, int(gaps.max()))
+
+    return {
+        "trading_period_days": trading_period_days,
+        "trades_per_month": trades_per_month,
+        "longest_flat_days": longest_flat_days,
+    }
+
 
-    if not filtered:
+def _kernel_bars_per_day(cols: TradeColumns, idx: np.ndarray, metadata: dict[str, Any] | None) -> float:
+    """compute_bars_per_day() with the Tier-2 samples taken from columns."""
+    if metadata and "bar_geometry" in metadata and "median_bar_seconds" in metadata["bar_geometry"]:
+        median_sec = _safe_float(metadata["bar_geometry"]["median_bar_seconds"])
+        if median_sec > 0:
+            return 86400.0 / median_sec
+
+    entry, exit_, bars = cols.entry_us[idx], cols.exit_us[idx], cols.bars[idx]
+    ok = cols.has_entry[idx] & cols.has_exit[idx] & (bars > 1) & (exit_ > entry)
+    # timedelta.total_seconds() is integer microseconds / 10**6, correctly rounded.
+    valid_samples = np.sort((exit_[ok] - entry[ok]) / 1e6 / bars[ok])
+
+    if len(valid_samples) >= 5:
+        median_spb = float(valid_samples[len(valid_samples) // 2])
+        if median_spb > 0:
+            return 86400.0 / median_spb
+
+    if metadata and "timeframe" in metadata:
+        tf = str(metadata["timeframe"]).lower().strip()
+        if tf in TF_BARS_PER_DAY:
+            return TF_BARS_PER_DAY[tf]
+
+    return 6.0
+
+
+def _kernel_buckets(cols: TradeColumns, idx: np.ndarray, codes: np.ndarray, field: str,
+                    bucket_map: dict[str, list[str]], strict: bool) -> dict[str, list[float]]:
+    """bucket_breakdown() from precomputed bucket codes."""
+    slice_codes = codes[idx]
+    if strict:
+        bad = np.flatnonzero(slice_codes < 0)
+        if len(bad):
+            row = int(idx[bad[0]])
+            tid = cols.records[row].get("parent_trade_id")
+            if slice_codes[bad[0]] == -1:
+                raise ValueError(
+                    f"Stage-2 CRITICAL: Trade {tid} missing '{field}'. Strict enforcement.")
+            raise ValueError(
+                f"Stage-2 CRITICAL: Invalid {field} '{cols.vol_raw[row]}' for trade {tid}")
+    pnl = cols.pnl[idx]
+    return {bname: pnl[slice_codes == code].tolist() for code, bname in enumerate(bucket_map)}
+
+
+def _kernel_sessions(cols: TradeColumns, idx: np.ndarray) -> dict[str, Any]:
+    """compute_session_breakdown() from the parsed entry hours."""
+    hours, pnl = cols.entry_hour[idx], cols.pnl[idx]
+    asia = (hours >= ASIA_START) & (hours < ASIA_END)
+    london = (hours >= LONDON_START) & (hours < LONDON_END)
+    out: dict[str, Any] = {}
+    for name, mask in (("asia", asia), ("london", london), ("ny", ~(asia | london))):
+        pnls = pnl[mask].tolist()
+        net = sum(pnls)
+        cnt = len(pnls)
+        out[f"net_profit_{name}"] = net
+        out[f"trades_{name}"] = cnt
+        out[f"avg_trade_{name}"] = (net / cnt) if cnt > 0 else 0.0
+    return out
+
+
+def _metrics_from_columns(cols: TradeColumns, idx: np.ndarray, starting_capital: float,
+                          metadata: dict[str, Any] | None) -> dict[str, Any]:
+    """Canonical metrics dict for the rows ``idx`` of ``cols``."""
+    if len(idx) == 0:
         return empty_metrics(starting_capital)
 
-    pnls = [_safe_float(t.get("pnl_usd", 0)) for t in filtered]
-    bars_list = [_safe_int(t.get("bars_held", 0)) for t in filtered if t.get("bars_held") not in (None, "", "None")]
+    pnl_arr = cols.pnl[idx]
+    pnls = pnl_arr.tolist()
+    has_bars = cols.has_bars[idx]
+    bars_arr = cols.bars[idx]
+    bars_list = bars_arr[has_bars].tolist()
 
-    # 1. Core PnL
+    # 1-3. Core PnL, drawdown, streaks
     basics = compute_pnl_basics(pnls)
     trade_count = basics["trade_count"]
-
-    # 2. Drawdown
-    dd = compute_drawdown(pnls, basics["net_profit"], starting_capital)
-
-    # 3. Streaks
-    streaks = compute_streaks(pnls)
+    dd = _kernel_drawdown(pnl_arr, basics["net_profit"], starting_capital)
+    streaks = {
+        "max_consec_wins": _longest_run(pnl_arr > 0),
+        "max_consec_losses": _longest_run(pnl_arr < 0),
+    }
 
     # 4. Bars statistics
-    bars = compute_bars_stats(filtered, bars_list)
-
-    # 5. Trading period
-    period = compute_trading_period(filtered, trade_count)
+    win_bars = bars_arr[has_bars & (pnl_arr > 0)].tolist()
+    loss_bars = bars_arr[has_bars & (pnl_arr < 0)].tolist()
+    bars = {
+        "avg_bars": (sum(bars_list) / len(bars_list)) if bars_list else 0.0,
+        "avg_bars_win": (sum(win_bars) / len(win_bars)) if win_bars else 0.0,
+        "avg_bars_loss": (sum(loss_bars) / len(loss_bars)) if loss_bars else 0.0,
+    }
 
-    # 6. Bars per day + % time in market
-    bars_per_day = compute_bars_per_day(filtered, metadata)
+    # 5-6. Trading period, bars per day, % time in market
+    if cols.naive_times:
+        period = _kernel_trading_period(cols, idx, trade_count)
+        bars_per_day = _kernel_bars_per_day(cols, idx, metadata)
+    else:
+        filtered = [cols.records[i] for i in idx.tolist()]
+        period = compute_trading_period(filtered, trade_count)
+        bars_per_day = compute_bars_per_day(filtered, metadata)
     total_bars_held = sum(bars_list) if bars_list else 0
     total_bars_in_period = period["trading_period_days"] * bars_per_day
     pct_time_in_market = (total_bars_held / total_bars_in_period) if total_bars_in_period > 0 else 0.0
 
     # 7. MFE / MAE
-    mfe_mae = compute_mfe_mae(filtered)
+    mfe_arr, mae_arr = cols.mfe_r[idx], cols.mae_r[idx]
+    emitted = (mfe_arr > 0) | (mae_arr > 0)
+    mfe_list, mae_list = mfe_arr[emitted].tolist(), mae_arr[emitted].tolist()
+    avg_mfe_r = (sum(mfe_list) / len(mfe_list)) if mfe_list else 0.0
+    avg_mae_r = (sum(mae_list) / len(mae_list)) if mae_list else 0.0
+    edge_ratio = (avg_mfe_r / avg_mae_r) if avg_mae_r > 0 else avg_mfe_r if avg_mfe_r > 0 else 0.0
 
-    # 8. Concentration
+    # 8-9. Concentration, risk ratios
     concentration = compute_concentration(
         basics["wins"], basics["losses"], basics["gross_profit"], basics["gross_loss"])
-
-    # 9. Risk ratios
     risk = compute_risk_ratios(pnls, basics["avg_trade"])
 
-    # 10. Volatility regime breakdown (strict — missing/unknown = hard fail)
-    vol_buckets = bucket_breakdown(filtered, "volatility_regime", VOL_REGIME_BUCKETS, strict=True)
-    vol = summarize_buckets(vol_buckets, "")
-
-    # 11. Session breakdown
-    session = compute_session_breakdown(filtered)
+    # 10-12. Volatility (strict), session, trend (non-strict) breakdowns
+    vol = summarize_buckets(
+        _kernel_buckets(cols, idx, cols.vol_code, "volatility_regime", VOL_REGIME_BUCKETS, strict=True), "")
+    session = _kernel_sessions(cols, idx)
+    trend = summarize_buckets(
+        _kernel_buckets(cols, idx, cols.trend_code, "trend_label", TREND_LABEL_BUCKETS, strict=False), "")
 
-    # 12. Trend regime breakdown (non-strict — unlabelled trades silently skipped)
-    trend_buckets = bucket_breakdown(filtered, "trend_label", TREND_LABEL_BUCKETS, strict=False)
-    trend = summarize_buckets(trend_buckets, "")
-
-    # Trade density (trades per year)
     trading_period_days = period["trading_period_days"]
     trade_density = int(round(trade_count / (trading_period_days / 365.25))) if trading_period_days > 0 else 0
 
+    return _assemble_metrics(
+        starting_capital, basics, dd, streaks, bars, period, pct_time_in_market,
+        {"avg_mfe_r": avg_mfe_r, "avg_mae_r": avg_mae_r, "edge_ratio": edge_ratio},
+        concentration, risk, _kernel_k_ratio(pnl_arr), vol, session, trend, trade_density,
+    )
+
+
+def compute_metrics_by_direction(trades: Any, starting_capital: float,
+                                 metadata: dict[str, Any] | None = None,
+                                 ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """(all, long, short) metrics from one coercion pass over ``trades``.
+
+    Equivalent to three compute_metrics_from_trades() calls with
+    direction_filter None, 1 and -1.
+    """
+    if metadata is None:
+        print("  METRICS_CORE_WARN  metadata=None — bars_per_day will use empirical/fallback")
+    cols = TradeColumns(trades)
+    return tuple(
+        _metrics_from_columns(cols, cols.select(direction), starting_capital, metadata)
+        for direction in (None, 1, -1)
+    )
+
+
+# ==================================================================
+# ORCHESTRATOR
+# ==================================================================
+
+def compute_metrics_from_trades(trades: list[dict[str, Any]], starting_capital: float, direction_filter: int | None = None, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Compute all metrics from trade-level data. direction_filter: 1=Long, -1=Short, None=All
+
+    Delegates to focused statistical functions; assembles into the canonical
+    metrics dict consumed by get_performance_summary_df() and Stage 3.
+    Runs on the columnar kernel; callers needing all three direction slices
+    should use compute_metrics_by_direction() to coerce the trades once.
+    """
+    # --- Metadata presence guard (prevents silent bars_per_day drift) ---
+    if metadata is None:
+        print("  METRICS_CORE_WARN  metadata=None — bars_per_day will use empirical/fallback")
+
+    cols = _reuse_trade_columns(trades)
+    return _metrics_from_columns(cols, cols.select(direction_filter), starting_capital, metadata)
+
+
+# Raw fields TradeColumns coerces; a changed value means the columns are stale.
+_TRADE_FIELDS = ("pnl_usd", "direction", "bars_held", "mfe_r", "mae_r",
+                 "entry_timestamp", "exit_timestamp", "volatility_regime", "trend_label")
+_LAST_COLUMNS: list[tuple[list, list[tuple], TradeColumns]] = []
+
+
+def _reuse_trade_columns(trades: Any) -> TradeColumns:
+    """TradeColumns for ``trades``, reusing the previous call's when it came
+    from the same list with the same raw field values.
+
+    The frozen Stage-2 compilers request all / long / short metrics as three
+    calls on one list; this keeps that to one coercion pass. Checking the
+    raw values costs a fraction of re-coercing them (timestamp parsing).
+    """
+    if not isinstance(trades, list):
+        return TradeColumns(trades)
+    snapshot = [tuple(map(t.get, _TRADE_FIELDS)) for t in trades]
+    if _LAST_COLUMNS:
+        last_trades, last_snapshot, cols = _LAST_COLUMNS[0]
+        if last_trades is trades and last_snapshot == snapshot:
+            return cols
+    cols = TradeColumns(trades)
+    _LAST_COLUMNS[:] = [(trades, snapshot, cols)]
+    return cols
+
+
+def _assemble_metrics(starting_capital: float, basics: dict[str, Any], dd: dict[str, float],
+                      streaks: dict[str, int], bars: dict[str, float], period: dict[str, Any],
+                      pct_time_in_market: float, mfe_mae: dict[str, float],
+                      concentration: dict[str, float], risk: dict[str, float], k_ratio: float,
+                      vol: dict[str, Any], session: dict[str, Any], trend: dict[str, Any],
+                      trade_density: int) -> dict[str, Any]:
+    """Canonical metrics dict (key order is the Performance Summary order)."""
+    trading_period_days = period["trading_period_days"]
+    trade_count = basics["trade_count"]
     return {
         "starting_capital": starting_capital,
         "net_profit": basics["net_profit"],
@@ -887,7 +1225,7 @@ def compute_metrics_from_trades(trades: list[dict[str, Any]], starting_capital:
         "pct_time_in_market": pct_time_in_market,
         "sharpe_ratio": risk["sharpe_ratio"],
         "sortino_ratio": risk["sortino_ratio"],
-        "k_ratio": compute_k_ratio(pnls),
+        "k_ratio": k_ratio,
         "sqn": risk["sqn"],
         "return_retracement_ratio": dd["return_dd_ratio"],
         "avg_bars_win": bars["avg_bars_win"],
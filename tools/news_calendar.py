@@ -10,6 +10,7 @@ upstream in the CLEAN layer (DATA_INGRESS build_news_calendar.py).
 This module does NO normalization — only parse, validate, build windows.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 _CALENDAR_CACHE: dict = {}
+_WINDOW_INDEX_CACHE: dict = {}
 
 
 # ---------------------------------------------------------------------------
@@ -163,6 +165,99 @@ def group_windows_by_currency(windows_df: pd.DataFrame) -> dict:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Sorted-interval index (trade classification)
+# ---------------------------------------------------------------------------
+
+def _as_utc_ns(values) -> np.ndarray:
+    """int64 UTC nanoseconds for a sequence of timestamps (naive = UTC)."""
+    idx = pd.DatetimeIndex(values)
+    idx = idx.tz_localize('UTC') if idx.tz is None else idx.tz_convert('UTC')
+    return idx.as_unit('ns').asi8
+
+
+class NewsWindowIndex:
+    """Blackout windows of one currency set as sorted interval arrays.
+
+    Windows are deduplicated on (window_start, window_end) and sorted by
+    start; a running max of window_end lets every overlap question be
+    answered with one searchsorted per trade instead of a scan over the
+    calendar:
+
+      overlap          exists w: entry <= end(w) and exit > start(w)
+      entry_in_window  exists w: start(w) <= entry <= end(w)
+      straddle         exists w: entry < start(w) < exit
+                       (earliest such start = first start after entry)
+    """
+
+    def __init__(self, window_starts, window_ends):
+        pairs = np.unique(np.column_stack([
+            _as_utc_ns(window_starts), _as_utc_ns(window_ends),
+        ]), axis=0)  # sorted by start, then end
+        self.starts = pairs[:, 0]
+        self.ends = pairs[:, 1]
+        self._max_end = np.maximum.accumulate(self.ends) if len(self.ends) else self.ends
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def classify_trades(self, entries, exits):
+        """Classify trades against the windows in O(trades * log windows).
+
+        Returns four arrays aligned to the inputs:
+          news_flag, entry_in_window, straddles (bool), and
+          earliest_window_start (datetime64[ns, UTC], NaT where no straddle).
+        """
+        entry = _as_utc_ns(entries)
+        exit_ = _as_utc_ns(exits)
+        n = len(entry)
+        earliest = pd.DatetimeIndex(np.full(n, np.datetime64('NaT'), dtype='M8[ns]')).tz_localize('UTC')
+        if len(self.starts) == 0 or n == 0:
+            false = np.zeros(n, dtype=bool)
+            return false, false.copy(), false.copy(), earliest
+
+        # Windows starting before exit: [0, m); overlap iff one ends >= entry.
+        m = np.searchsorted(self.starts, exit_, side='left')
+        overlap = (m > 0) & (self._max_end[np.maximum(m - 1, 0)] >= entry)
+
+        # Windows starting at/before entry: [0, k); first start after entry is k.
+        k = np.searchsorted(self.starts, entry, side='right')
+        in_window = overlap & (k > 0) & (self._max_end[np.maximum(k - 1, 0)] >= entry)
+
+        k_clip = np.minimum(k, len(self.starts) - 1)
+        straddles = overlap & (k < len(self.starts)) & (self.starts[k_clip] < exit_)
+
+        earliest_ns = np.where(straddles, self.starts[k_clip], np.iinfo(np.int64).min)
+        earliest = pd.DatetimeIndex(earliest_ns.view('M8[ns]')).tz_localize('UTC')
+        return overlap, in_window, straddles, earliest
+
+
+def build_window_index(windows_by_currency: dict, currencies) -> NewsWindowIndex:
+    """NewsWindowIndex over the union of *currencies*' windows.
+
+    Cached per (windows_by_currency object, currency set) so each calendar
+    and currency set is indexed once per process.
+    """
+    ccys = tuple(sorted(set(currencies)))
+    key = (id(windows_by_currency), ccys)
+    hit = _WINDOW_INDEX_CACHE.get(key)
+    if hit is not None and hit[0] is windows_by_currency:
+        return hit[1]
+
+    frames = [
+        windows_by_currency[c] for c in ccys
+        if windows_by_currency.get(c) is not None and len(windows_by_currency[c]) > 0
+    ]
+    if frames:
+        starts = pd.concat([f['window_start'] for f in frames], ignore_index=True)
+        ends = pd.concat([f['window_end'] for f in frames], ignore_index=True)
+    else:
+        starts = ends = pd.DatetimeIndex([], tz='UTC')
+    index = NewsWindowIndex(starts, ends)
+    _WINDOW_INDEX_CACHE[key] = (windows_by_currency, index)
+    return index
+
+
 # ---------------------------------------------------------------------------
 # Public entry point
 # ---------------------------------------------------------------------------
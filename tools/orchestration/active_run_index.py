@@ -0,0 +1,167 @@
+"""
+active_run_index.py — Index of non-terminal runs under TradeScan_State/runs/.
+
+PipelineStateManager mirrors every run_state.json write (initialize,
+transition, abort, heartbeat) into runs/active_runs.json: a run is listed
+while its state is non-terminal and dropped once it reaches COMPLETE,
+FAILED or ABORTED. Stale-run recovery (run_watchdog.py) reads this index
+instead of opening every historical run_state.json.
+
+The index is a cache, never an authority. Updates are best-effort,
+consumers re-read run_state.json before acting on an entry, and a missing
+or unreadable index is regenerated from disk.
+
+Usage:
+    python -m tools.orchestration.active_run_index            # show live runs
+    python -m tools.orchestration.active_run_index --rebuild  # regenerate from disk
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from filelock import FileLock
+
+from config.state_paths import RUNS_DIR
+from config.status_enums import RUN_TERMINAL_STATES
+
+INDEX_FILENAME = "active_runs.json"
+INDEX_VERSION = 1
+LOCK_TIMEOUT_S = 30
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def index_path(runs_dir: Path | None = None) -> Path:
+    return Path(runs_dir or RUNS_DIR) / INDEX_FILENAME
+
+
+def _lock(path: Path) -> FileLock:
+    return FileLock(str(path) + ".lock", timeout=LOCK_TIMEOUT_S)
+
+
+def _entry(data: dict) -> dict:
+    return {
+        "directive_id": data.get("directive_id"),
+        "current_state": data.get("current_state"),
+        "heartbeat_ts": data.get("heartbeat_ts"),
+        "last_updated": data.get("last_transition") or data.get("last_updated"),
+    }
+
+
+def _is_active(data: dict | None) -> bool:
+    return bool(data) and data.get("current_state") not in RUN_TERMINAL_STATES
+
+
+def _write_atomic(path: Path, runs: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": INDEX_VERSION, "updated_at": _utc_now(), "runs": runs}
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _read(path: Path) -> dict | None:
+    """Index contents, or None when missing, corrupt or of another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return None
+    runs = payload.get("runs")
+    return runs if isinstance(runs, dict) else None
+
+
+def _scan(runs_dir: Path) -> dict:
+    """Full scan of run_state.json files — the authoritative source."""
+    runs = {}
+    if not runs_dir.exists():
+        return runs
+    for run_folder in runs_dir.iterdir():
+        state_file = run_folder / "run_state.json"
+        if not run_folder.is_dir() or not state_file.exists():
+            continue
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[ACTIVE_INDEX] Skipping unreadable state for {run_folder.name}: {e}")
+            continue
+        if _is_active(data):
+            runs[run_folder.name] = _entry(data)
+    return runs
+
+
+def load_active_runs(runs_dir: Path | None = None) -> dict | None:
+    """Return {run_id: entry} for indexed non-terminal runs.
+
+    Returns None when the index is missing or unreadable; callers should
+    fall back to rebuild_active_run_index().
+    """
+    return _read(index_path(runs_dir))
+
+
+def rebuild_active_run_index(runs_dir: Path | None = None) -> dict:
+    """Regenerate the index from every run_state.json on disk."""
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    path = index_path(runs_dir)
+    with _lock(path):
+        runs = _scan(runs_dir)
+        _write_atomic(path, runs)
+    return runs
+
+
+def update_active_run(run_id: str, data: dict | None, runs_dir: Path | None = None) -> None:
+    """Mirror one run's state into the index.
+
+    ``data`` is the run_state.json payload just written; None (or a
+    terminal state) removes the run. A missing index is rebuilt from disk
+    rather than started empty, so pre-existing live runs are not lost.
+    """
+    runs_dir = Path(runs_dir or RUNS_DIR)
+    path = index_path(runs_dir)
+    with _lock(path):
+        runs = _read(path)
+        changed = runs is None
+        if changed:
+            runs = _scan(runs_dir)
+        if _is_active(data):
+            entry = _entry(data)
+            changed = changed or runs.get(run_id) != entry
+            runs[run_id] = entry
+        else:
+            changed = runs.pop(run_id, None) is not None or changed
+        if changed:
+            _write_atomic(path, runs)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or rebuild the active-run index.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Regenerate the index from every run_state.json on disk.")
+    args = parser.parse_args(argv)
+
+    if args.rebuild:
+        runs = rebuild_active_run_index()
+        print(f"[ACTIVE_INDEX] Rebuilt {index_path()} — {len(runs)} active run(s).")
+    else:
+        runs = load_active_runs()
+        if runs is None:
+            print(f"[ACTIVE_INDEX] No readable index at {index_path()} (run with --rebuild).")
+            return 1
+    for run_id, entry in sorted(runs.items()):
+        print(f"  {run_id}  {entry.get('current_state')}  heartbeat_ts={entry.get('heartbeat_ts')}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
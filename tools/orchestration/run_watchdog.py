@@ -1,10 +1,12 @@
 """
 Run Watchdog — recovers stale runs stuck in active FSM states.
 
-Scans TradeScan_State/runs/ for run_state.json files whose heartbeat_ts
-exceeds the threshold.  Routes all state mutations through
-PipelineStateManager.abort() so transitions are FSM-validated, audited,
-and atomically written.
+Reads the active-run index (runs/active_runs.json, maintained by
+PipelineStateManager) and re-verifies only the listed runs whose indexed
+heartbeat_ts exceeds the threshold, instead of parsing every historical
+run_state.json. A missing or unreadable index is rebuilt from disk first.
+Routes all state mutations through PipelineStateManager.abort() so
+transitions are FSM-validated, audited, and atomically written.
 """
 
 import json
@@ -13,37 +15,91 @@ from config.state_paths import RUNS_DIR
 from config.status_enums import RUN_TERMINAL_STATES
 
 
+def _abort_stale_run(run_id: str, data: dict) -> bool:
+    """Abort one verified-stale run and sync its directive registry."""
+    from tools.pipeline_utils import PipelineStateManager
+
+    # Route through FSM — gains audit logging, validation, atomic write
+    directive_id = data.get("directive_id")
+    mgr = PipelineStateManager(run_id, directive_id=directive_id)
+    aborted = mgr.abort(reason="WATCHDOG_TIMEOUT")
+
+    if not aborted:
+        print(f"[WATCHDOG] Could not abort {run_id} (state={data.get('current_state')}) — FSM rejected transition.")
+        return False
+
+    # Sync to run registry (non-authoritative — failure here is non-fatal)
+    if directive_id:
+        try:
+            from tools.orchestration.run_registry import update_run_state
+            registry_path = RUNS_DIR / directive_id / "run_registry.json"
+            if registry_path.exists():
+                update_run_state(
+                    registry_path,
+                    directive_id,
+                    run_id,
+                    "ABORTED",
+                    last_error="Watchdog timeout (abandoned active state).",
+                    termination_reason="WATCHDOG_TIMEOUT",
+                )
+        except Exception as reg_err:
+            print(f"[WATCHDOG] Could not update registry for {run_id}: {reg_err}")
+    return True
+
+
 def recover_stale_runs(threshold_minutes=10):
     """
     Scans the state cluster for runs permanently stuck in active states.
     If pipeline aborted unexpectedly, their `heartbeat_ts` will be older than the threshold.
+
+    Only runs listed in the active-run index are considered; each candidate's
+    run_state.json is re-read before acting, and index entries whose state
+    file is gone or already terminal are dropped.
     """
     if not RUNS_DIR.exists():
         return
 
-    from tools.pipeline_utils import PipelineStateManager
+    from tools.orchestration.active_run_index import (
+        load_active_runs,
+        rebuild_active_run_index,
+        update_active_run,
+    )
+
+    active = load_active_runs(RUNS_DIR)
+    if active is None:
+        print("[WATCHDOG] Active-run index missing or unreadable — rebuilding from disk.")
+        active = rebuild_active_run_index(RUNS_DIR)
 
     threshold_seconds = threshold_minutes * 60
     current_time = datetime.now(timezone.utc).timestamp()
 
     stale_found = 0
 
-    for run_folder in RUNS_DIR.iterdir():
-        if not run_folder.is_dir() or len(run_folder.name) != 24:
+    for run_id, entry in sorted(active.items()):
+        if len(run_id) != 24:
             continue
 
-        state_file = run_folder / "run_state.json"
-        if not state_file.exists():
+        # Indexed heartbeat is fresh — the run is live; no need to open its state file.
+        indexed_hb = entry.get("heartbeat_ts")
+        if indexed_hb and current_time - indexed_hb <= threshold_seconds:
             continue
 
+        state_file = RUNS_DIR / run_id / "run_state.json"
         try:
+            if not state_file.exists():
+                update_active_run(run_id, None, runs_dir=RUNS_DIR)
+                continue
+
             with open(state_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
             current_state = data.get("current_state")
 
-            # Skip terminal states — nothing to recover
-            if current_state in RUN_TERMINAL_STATES or current_state == "IDLE":
+            # Skip terminal states — nothing to recover (and drop the stale index entry)
+            if current_state in RUN_TERMINAL_STATES:
+                update_active_run(run_id, data, runs_dir=RUNS_DIR)
+                continue
+            if current_state == "IDLE":
                 continue
 
             heartbeat = data.get("heartbeat_ts")
@@ -52,38 +108,12 @@ def recover_stale_runs(threshold_minutes=10):
 
             age = current_time - heartbeat
             if age > threshold_seconds:
-                print(f"[WATCHDOG] Stale active run detected ({age:.1f}s old) -> aborting ({run_folder.name})")
-
-                # Route through FSM — gains audit logging, validation, atomic write
-                directive_id = data.get("directive_id")
-                mgr = PipelineStateManager(run_folder.name, directive_id=directive_id)
-                aborted = mgr.abort(reason="WATCHDOG_TIMEOUT")
-
-                if not aborted:
-                    print(f"[WATCHDOG] Could not abort {run_folder.name} (state={current_state}) — FSM rejected transition.")
-                    continue
-
-                # Sync to run registry (non-authoritative — failure here is non-fatal)
-                if directive_id:
-                    try:
-                        from tools.orchestration.run_registry import update_run_state
-                        registry_path = RUNS_DIR / directive_id / "run_registry.json"
-                        if registry_path.exists():
-                            update_run_state(
-                                registry_path,
-                                directive_id,
-                                run_folder.name,
-                                "ABORTED",
-                                last_error="Watchdog timeout (abandoned active state).",
-                                termination_reason="WATCHDOG_TIMEOUT",
-                            )
-                    except Exception as reg_err:
-                        print(f"[WATCHDOG] Could not update registry for {run_folder.name}: {reg_err}")
-
-                stale_found += 1
+                print(f"[WATCHDOG] Stale active run detected ({age:.1f}s old) -> aborting ({run_id})")
+                if _abort_stale_run(run_id, data):
+                    stale_found += 1
 
         except Exception as e:
-            print(f"[WATCHDOG] Failed to parse state for {run_folder.name}: {e}")
+            print(f"[WATCHDOG] Failed to parse state for {run_id}: {e}")
 
     if stale_found > 0:
         print(f"[WATCHDOG] Recovered {stale_found} stale FSM states.")
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import shutil
 import importlib
 import pandas as pd
@@ -54,6 +55,17 @@ def missing_tradelog_is_silent_failure(run_data_dir: Path) -> bool:
     return not Path(run_data_dir).exists()
 
 
+def stage1_in_process_enabled() -> bool:
+    """True when Stage-1 jobs run inside this worker instead of a subprocess.
+
+    Opt-in via ``TS_STAGE1_IN_PROCESS=1`` (set by ``run_pipeline.py
+    --sweep-in-process`` before any worker spawns, so ProcessPool workers
+    inherit it). Intended for parameter sweeps: N variants over one
+    (symbol, timeframe, window) share one data load + regime computation.
+    """
+    return os.environ.get("TS_STAGE1_IN_PROCESS") == "1"
+
+
 # ---------------------------------------------------------------------------
 # Stage-1: Backtest Execution Loop
 # ---------------------------------------------------------------------------
@@ -164,9 +176,18 @@ def run_stage1_execution(context: PipelineContext) -> None:
             raise RuntimeError(f"Run {rid} is already FAILED before Stage-1.")
 
         try:
-            from tools.skill_loader import run_skill
+            if stage1_in_process_enabled():
+                # Sweep execution mode: run the job in this worker so every
+                # variant reuses the shared market-data + regime frames.
+                from tools.run_stage1 import execute_stage1_in_process
+
+                status = execute_stage1_in_process(clean_id, symbol, rid)
+                if status == "FAILED":
+                    raise RuntimeError(f"Stage-1 in-process execution FAILED for {rid} ({symbol}).")
+            else:
+                from tools.skill_loader import run_skill
 
-            run_skill("backtest_execution", strategy=clean_id, symbol=symbol, run_id=rid)
+                run_skill("backtest_execution", strategy=clean_id, symbol=symbol, run_id=rid)
 
             out_folder = BACKTESTS_DIR / f"{clean_id}_{symbol}"
             if not (out_folder / "raw" / "results_tradelevel.csv").exists():
@@ -2,7 +2,8 @@
 watchdog_daemon.py — TS_Execution heartbeat monitor and self-healing watchdog.
 
 Responsibilities:
-  - Poll heartbeat.log every 60s for liveness
+  - Poll heartbeat.log every 60s for liveness (or, in event mode, wake on
+    heartbeat / state / PID file changes and at each threshold deadline)
   - SOFT breach (180s stale): log warning only
   - HARD breach (300s stale): kill execution process + restart
   - EARLY_EXIT_DETECTED: PID file exists but process dead → immediate restart
@@ -21,7 +22,8 @@ Operational rules:
   2. Only one instance allowed — exits immediately if a live instance already exists
 
 Usage:
-  python tools/orchestration/watchdog_daemon.py
+  python tools/orchestration/watchdog_daemon.py               # poll mode
+  python tools/orchestration/watchdog_daemon.py --mode event  # change notifications + deadlines
 
   Override ts_execution root path:
   set TS_EXEC_ROOT=C:\\path\\to\\ts_execution && python tools/orchestration/watchdog_daemon.py
@@ -32,6 +34,7 @@ import sys
 import json
 import shutil
 import subprocess
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -45,6 +48,13 @@ HARD_THRESHOLD_S      = 300    # 5 polls ≈ 4 missed heartbeats → kill + rest
 BAR_STALL_THRESHOLD_S = 3600   # 1 × H1 interval — heartbeat OK but no bar processed
 MAX_RESTARTS          = 3
 COOLDOWN_WINDOW_S     = 600    # 10-minute storm guard window
+BAR_STALL_MIN_UPTIME_S = 3600  # no bar-stall recovery in the first hour of a process
+
+# Event mode (--mode event) — see run_event_loop.
+EVENT_STAT_POLL_S      = 1.0   # stat() cadence when no native change notifications
+EVENT_DEBOUNCE_S       = 0.25  # coalesce bursts (atomic tmp write + rename)
+EVENT_DEADLINE_SLACK_S = 0.05  # fire just after a threshold, never just before
+EVENT_MAX_IDLE_S       = 900   # re-evaluate at least this often with no deadline
 
 # EARLY_EXIT confirmation gate: number of consecutive polls that must observe
 # "pid dead" before EARLY_EXIT_DETECTED fires. Immunizes against transient
@@ -72,7 +82,7 @@ RESTART_CMD  = ["python", "src/main.py", "--phase", "2"]
 # parent (pythonw.exe / Task Scheduler "hidden" context). Without this flag
 # every subprocess.run/Popen call that spawns a console-subsystem exe briefly
 # flashes a black window on the user's desktop.
-_NO_WIN = subprocess.CREATE_NO_WINDOW
+_NO_WIN = getattr(subprocess, "CREATE_NO_WINDOW", 0)  # 0 off-Windows (tests)
 
 # --- Alerts (observer-only, silent on failure) ---
 sys.path.insert(0, str(TS_EXEC_ROOT / "src"))
@@ -374,30 +384,251 @@ def _rotate_log(path: Path) -> None:
         pass
 
 
-def run_watchdog_loop() -> None:
-    if _check_single_instance():
+class _LoopState:
+    """Observations carried between evaluation passes."""
+
+    def __init__(self) -> None:
+        # Post-reboot/startup grace period reference: suppress EARLY_EXIT
+        # restarts while main.py may still be initializing (handles machine
+        # reboot races where stale execution.pid from previous run survives
+        # on disk).
+        self.start_monotonic = time.monotonic()
+        self.observed_run_id: str | None = None
+        # Consecutive-probe counter for EARLY_EXIT confirmation gate.
+        # Incremented each PID probe where (PID file exists AND pid reports
+        # dead). Reset on any observation that contradicts that state. Only
+        # when the counter reaches EARLY_EXIT_CONFIRMATIONS do we fire the
+        # restart.
+        self.early_exit_strikes = 0
+        # Last observed ages (seconds) — the event loop derives deadlines from these.
+        self.clean_shutdown = False
+        self.hb_age: float | None = None
+        self.bar_age: float | None = None
+        self.proc_uptime: float | None = None
+
+
+EARLY_EXIT_GRACE_S = 90
+
+
+def _recover_stalled_process(guard: dict) -> None:
+    """Kill (if alive) and restart the execution process after a breach."""
+    # PID file absent = clean shutdown (atexit deleted it). Do not restart.
+    if not EXEC_PID.exists():
+        _log("CLEAN_SHUTDOWN_DETECTED | execution.pid absent | no restart")
         return
+    pid = _read_exec_pid()
+    if pid and _pid_is_alive(pid):
+        killed = _kill_pid(pid)
+        _log(f"KILL_RESULT | pid={pid} | success={killed}")
+    else:
+        _log(f"NO_LIVE_PID | pid={pid} | process may have already exited")
+    _do_restart(guard)
+
+
+def _watchdog_tick(state: _LoopState, probe_pid: bool = True) -> bool:
+    """One evaluation pass over heartbeat, PID and bar-stall state.
+
+    `probe_pid=False` skips the EARLY_EXIT liveness probe (the event loop
+    probes on its own POLL_INTERVAL_S cadence so the N-of-M confirmation
+    keeps its spacing). Returns True when a breach led to a recovery
+    decision (restart issued or storm-guard blocked) — the caller backs off
+    for one POLL_INTERVAL_S before evaluating again.
+    """
+    state.hb_age = state.bar_age = state.proc_uptime = None
+
+    # Engine wrote exit_reason=market_halt — skip all checks.
+    # No alerts, no restarts. Watchdog stays alive for Monday auto-start
+    # but does nothing until execution_state.json is overwritten by a new run.
+    state.clean_shutdown = _is_clean_shutdown()
+    if state.clean_shutdown:
+        _log("MARKET_HALT_IDLE | engine shutdown was intentional — skipping all checks")
+        return False
+    current_run_id = _current_run_id()
+    if current_run_id and current_run_id != state.observed_run_id:
+        if state.observed_run_id:
+            _log(f"RUN_END | observed_switch_from={state.observed_run_id}")
+        state.observed_run_id = current_run_id
+        _log(f"RUN_START | observed_run_id={state.observed_run_id}")
+    elif current_run_id is None and state.observed_run_id is not None:
+        _log(f"RUN_END | observed_run_id={state.observed_run_id} | execution_state_missing")
+        state.observed_run_id = None
+
+    hb_age  = _get_heartbeat_age()
+    bar_age = _get_bar_stall()
+    state.hb_age, state.bar_age = hb_age, bar_age
+
+    # --- Early exit detection ---
+    # If PID file exists but process is dead, this is an abnormal exit
+    # (e.g. CONFIG_INTEGRITY_FAIL exit code 78). Restart quickly instead
+    # of waiting for heartbeat HARD_THRESHOLD (saves up to 300s blind time).
+    #
+    # Two safeguards against spawning an orphan duplicate:
+    #   1. N-of-M confirmation gate (EARLY_EXIT_CONFIRMATIONS consecutive
+    #      probes of "pid dead") so a single tasklist glitch cannot trigger
+    #      a restart while the process is actually alive.
+    #   2. Belt-and-braces taskkill before restart, guarded by a fresh
+    #      liveness check: if the supposedly-dead pid is actually alive
+    #      when we go to restart, kill it first so we never run two.
+    if EXEC_PID.exists() and not probe_pid:
+        if state.early_exit_strikes > 0:
+            return False  # awaiting the confirming probe; liveness checks wait too
+    elif EXEC_PID.exists():
+        _exit_pid = _read_exec_pid()
+        if _exit_pid is not None and not _pid_is_alive(_exit_pid):
+            # Post-reboot guard: during startup grace, a stale PID file
+            # with no heartbeat is almost certainly pre-reboot residue,
+            # not a crash. Main.py may be initializing right now.
+            _uptime = time.monotonic() - state.start_monotonic
+            if _uptime < EARLY_EXIT_GRACE_S and hb_age is None:
+                _log(f"STALE_PID_IGNORED | pid={_exit_pid} | watchdog_uptime={_uptime:.0f}s < grace={EARLY_EXIT_GRACE_S}s | likely pre-reboot residue — clearing PID file, no restart")
+                try:
+                    EXEC_PID.unlink(missing_ok=True)
+                except Exception:
+                    pass
+                state.early_exit_strikes = 0
+                return False
+
+            # N-of-M confirmation: require N consecutive probes of "dead"
+            # before declaring EARLY_EXIT. Prevents a single tasklist
+            # glitch from spawning an orphan duplicate.
+            state.early_exit_strikes += 1
+            if state.early_exit_strikes < EARLY_EXIT_CONFIRMATIONS:
+                _log(
+                    f"EARLY_EXIT_PENDING | pid={_exit_pid}"
+                    f" | strike={state.early_exit_strikes}/{EARLY_EXIT_CONFIRMATIONS}"
+                    f" | awaiting confirmation before restart"
+                )
+                return False
 
-    # Rotate logs on startup — keep one .prev generation
-    _rotate_log(WATCHDOG_LOG)
-    _rotate_log(HB_LOG)
+            _log(
+                f"EARLY_EXIT_DETECTED | pid={_exit_pid}"
+                f" | confirmed_across={state.early_exit_strikes}_polls"
+                f" | immediate restart"
+            )
+            _send_alert("EARLY_EXIT_DETECTED",
+                f"pid={_exit_pid} died abnormally "
+                f"(confirmed across {state.early_exit_strikes} polls). Restarting.")
+
+            # Belt-and-braces force-kill BEFORE spawning a replacement.
+            # If liveness check was a false positive and the pid is
+            # actually alive, we must kill it first or we end up with
+            # two execution processes on the same state files.
+            if _pid_is_alive(_exit_pid):
+                _log(f"EARLY_EXIT_ALIVE_AT_RESTART | pid={_exit_pid} | liveness check flipped — force-killing before spawn")
+                _send_alert("EARLY_EXIT_ALIVE_AT_RESTART",
+                    f"pid={_exit_pid} liveness re-check returned ALIVE at restart time. "
+                    f"Force-killing before spawning replacement.")
+                killed = _kill_pid(_exit_pid)
+                _log(f"EARLY_EXIT_FORCE_KILL | pid={_exit_pid} | success={killed}")
+
+            # Clean up stale PID file so restart writes a new one
+            try:
+                EXEC_PID.unlink(missing_ok=True)
+            except Exception:
+                pass
+            state.early_exit_strikes = 0
+            guard = _load_guard()
+            if _check_restart_storm(guard):
+                _log(f"STORM_GUARD_ACTIVE | restart_count={guard.get('restart_count')} | BLOCKED")
+                _send_alert("STORM_GUARD_ACTIVE",
+                    f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
+                    f"HALTED. Manual intervention required.")
+            else:
+                _do_restart(guard)
+            return True
+        else:
+            # PID file exists AND pid is alive → reset strike counter.
+            if state.early_exit_strikes > 0:
+                _log(
+                    f"EARLY_EXIT_STRIKE_RESET | pid={_exit_pid}"
+                    f" | was {state.early_exit_strikes}/{EARLY_EXIT_CONFIRMATIONS}"
+                    f" | pid confirmed alive"
+                )
+            state.early_exit_strikes = 0
+    else:
+        # No PID file → no EARLY_EXIT condition to track.
+        state.early_exit_strikes = 0
+
+    acted = False
+
+    # --- Liveness check ---
+    if hb_age is None:
+        _log("HB_LOG_MISSING | heartbeat.log not found — execution not yet started or path wrong")
+
+    elif hb_age >= HARD_THRESHOLD_S:
+        _log(f"HARD_BREACH | hb_age={hb_age:.1f}s | INITIATING RECOVERY")
+        _send_alert("HARD_BREACH", f"hb_age={hb_age:.0f}s threshold={HARD_THRESHOLD_S}s")
+        acted = True
+        guard = _load_guard()
+        if _check_restart_storm(guard):
+            _log(
+                f"STORM_GUARD_ACTIVE"
+                f" | restart_count={guard.get('restart_count')}"
+                f" | last_restart={guard.get('last_restart_ts')}"
+                f" | BLOCKED"
+            )
+            _send_alert("STORM_GUARD_ACTIVE",
+                f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
+                f"HALTED. Manual intervention required.")
+        else:
+            _recover_stalled_process(guard)
+
+    elif hb_age >= SOFT_THRESHOLD_S:
+        _log(f"SOFT_BREACH | hb_age={hb_age:.1f}s | WARNING ONLY")
+
+    else:
+        _log(f"HEARTBEAT_OK | hb_age={hb_age:.1f}s")
+
+    # --- Bar stall check (independent of liveness) ---
+    # Escalated to HARD action: heartbeat proves process is alive but bar loop
+    # is stalled (thread crash, feed hang, or MT5 disconnect not detected).
+    _proc_uptime = _get_process_uptime()
+    state.proc_uptime = _proc_uptime
+    if (
+        bar_age is not None
+        and bar_age >= BAR_STALL_THRESHOLD_S
+        and hb_age is not None
+        and hb_age < SOFT_THRESHOLD_S
+        and (_proc_uptime is None or _proc_uptime >= BAR_STALL_MIN_UPTIME_S)
+    ):
+        _log(
+            f"BAR_STALL_BREACH | heartbeat OK but no bar processed in {bar_age:.0f}s"
+            f" | threshold={BAR_STALL_THRESHOLD_S}s | INITIATING RECOVERY"
+        )
+        _send_alert("BAR_STALL_BREACH",
+            f"bar_age={bar_age:.0f}s threshold={BAR_STALL_THRESHOLD_S}s heartbeat_ok")
+        acted = True
+        guard = _load_guard()
+        if _check_restart_storm(guard):
+            _log(
+                f"STORM_GUARD_ACTIVE"
+                f" | restart_count={guard.get('restart_count')}"
+                f" | BLOCKED — manual intervention required"
+            )
+            _send_alert("STORM_GUARD_ACTIVE",
+                f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
+                f"HALTED. Manual intervention required.")
+        else:
+            _recover_stalled_process(guard)
 
-    # Post-reboot/startup grace period: suppress EARLY_EXIT restarts while
-    # main.py may still be initializing (handles machine reboot races where
-    # stale execution.pid from previous run survives on disk).
-    EARLY_EXIT_GRACE_S = 90
-    _watchdog_start_monotonic = time.monotonic()
+    return acted
 
-    observed_run_id: str | None = None
 
-    # Consecutive-poll counter for EARLY_EXIT confirmation gate.
-    # Incremented each poll where (PID file exists AND pid reports dead).
-    # Reset on any observation that contradicts that state. Only when the
-    # counter reaches EARLY_EXIT_CONFIRMATIONS do we fire the restart.
-    _early_exit_strike_count = 0
+def _start_watchdog(mode: str) -> _LoopState | None:
+    """Single-instance check, log rotation and startup banner.
+
+    Returns the loop state, or None if another instance owns the daemon.
+    """
+    if _check_single_instance():
+        return None
+
+    # Rotate logs on startup — keep one .prev generation
+    _rotate_log(WATCHDOG_LOG)
+    _rotate_log(HB_LOG)
 
     _log(
         f"WATCHDOG_DAEMON_STARTED"
+        f" | mode={mode}"
         f" | soft={SOFT_THRESHOLD_S}s"
         f" | hard={HARD_THRESHOLD_S}s"
         f" | bar_stall={BAR_STALL_THRESHOLD_S}s"
@@ -405,202 +636,291 @@ def run_watchdog_loop() -> None:
         f" | early_exit_confirmations={EARLY_EXIT_CONFIRMATIONS}"
         f" | ts_exec_root={TS_EXEC_ROOT}"
     )
+    return _LoopState()
 
-    while True:
-        try:
-            # Engine wrote exit_reason=market_halt — skip all checks.
-            # No alerts, no restarts. Watchdog stays alive for Monday auto-start
-            # but does nothing until execution_state.json is overwritten by a new run.
-            if _is_clean_shutdown():
-                _log("MARKET_HALT_IDLE | engine shutdown was intentional — skipping all checks")
-                time.sleep(POLL_INTERVAL_S)
-                continue
-            current_run_id = _current_run_id()
-            if current_run_id and current_run_id != observed_run_id:
-                if observed_run_id:
-                    _log(f"RUN_END | observed_switch_from={observed_run_id}")
-                observed_run_id = current_run_id
-                _log(f"RUN_START | observed_run_id={observed_run_id}")
-            elif current_run_id is None and observed_run_id is not None:
-                _log(f"RUN_END | observed_run_id={observed_run_id} | execution_state_missing")
-                observed_run_id = None
-
-            hb_age  = _get_heartbeat_age()
-            bar_age = _get_bar_stall()
-
-            # --- Early exit detection ---
-            # If PID file exists but process is dead, this is an abnormal exit
-            # (e.g. CONFIG_INTEGRITY_FAIL exit code 78). Restart quickly instead
-            # of waiting for heartbeat HARD_THRESHOLD (saves up to 300s blind time).
-            #
-            # Two safeguards against spawning an orphan duplicate:
-            #   1. N-of-M confirmation gate (EARLY_EXIT_CONFIRMATIONS consecutive
-            #      polls of "pid dead") so a single tasklist glitch cannot trigger
-            #      a restart while the process is actually alive.
-            #   2. Belt-and-braces taskkill before restart, guarded by a fresh
-            #      liveness check: if the supposedly-dead pid is actually alive
-            #      when we go to restart, kill it first so we never run two.
-            if EXEC_PID.exists():
-                _exit_pid = _read_exec_pid()
-                if _exit_pid is not None and not _pid_is_alive(_exit_pid):
-                    # Post-reboot guard: during startup grace, a stale PID file
-                    # with no heartbeat is almost certainly pre-reboot residue,
-                    # not a crash. Main.py may be initializing right now.
-                    _uptime = time.monotonic() - _watchdog_start_monotonic
-                    if _uptime < EARLY_EXIT_GRACE_S and hb_age is None:
-                        _log(f"STALE_PID_IGNORED | pid={_exit_pid} | watchdog_uptime={_uptime:.0f}s < grace={EARLY_EXIT_GRACE_S}s | likely pre-reboot residue — clearing PID file, no restart")
-                        try:
-                            EXEC_PID.unlink(missing_ok=True)
-                        except Exception:
-                            pass
-                        _early_exit_strike_count = 0
-                        time.sleep(POLL_INTERVAL_S)
-                        continue
-
-                    # N-of-M confirmation: require N consecutive polls of "dead"
-                    # before declaring EARLY_EXIT. Prevents a single tasklist
-                    # glitch from spawning an orphan duplicate.
-                    _early_exit_strike_count += 1
-                    if _early_exit_strike_count < EARLY_EXIT_CONFIRMATIONS:
-                        _log(
-                            f"EARLY_EXIT_PENDING | pid={_exit_pid}"
-                            f" | strike={_early_exit_strike_count}/{EARLY_EXIT_CONFIRMATIONS}"
-                            f" | awaiting confirmation before restart"
-                        )
-                        time.sleep(POLL_INTERVAL_S)
-                        continue
-
-                    _log(
-                        f"EARLY_EXIT_DETECTED | pid={_exit_pid}"
-                        f" | confirmed_across={_early_exit_strike_count}_polls"
-                        f" | immediate restart"
-                    )
-                    _send_alert("EARLY_EXIT_DETECTED",
-                        f"pid={_exit_pid} died abnormally "
-                        f"(confirmed across {_early_exit_strike_count} polls). Restarting.")
-
-                    # Belt-and-braces force-kill BEFORE spawning a replacement.
-                    # If liveness check was a false positive and the pid is
-                    # actually alive, we must kill it first or we end up with
-                    # two execution processes on the same state files.
-                    if _pid_is_alive(_exit_pid):
-                        _log(f"EARLY_EXIT_ALIVE_AT_RESTART | pid={_exit_pid} | liveness check flipped — force-killing before spawn")
-                        _send_alert("EARLY_EXIT_ALIVE_AT_RESTART",
-                            f"pid={_exit_pid} liveness re-check returned ALIVE at restart time. "
-                            f"Force-killing before spawning replacement.")
-                        killed = _kill_pid(_exit_pid)
-                        _log(f"EARLY_EXIT_FORCE_KILL | pid={_exit_pid} | success={killed}")
-
-                    # Clean up stale PID file so restart writes a new one
-                    try:
-                        EXEC_PID.unlink(missing_ok=True)
-                    except Exception:
-                        pass
-                    _early_exit_strike_count = 0
-                    guard = _load_guard()
-                    if _check_restart_storm(guard):
-                        _log(f"STORM_GUARD_ACTIVE | restart_count={guard.get('restart_count')} | BLOCKED")
-                        _send_alert("STORM_GUARD_ACTIVE",
-                            f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
-                            f"HALTED. Manual intervention required.")
-                    else:
-                        _do_restart(guard)
-                    time.sleep(POLL_INTERVAL_S)
-                    continue
-                else:
-                    # PID file exists AND pid is alive → reset strike counter.
-                    if _early_exit_strike_count > 0:
-                        _log(
-                            f"EARLY_EXIT_STRIKE_RESET | pid={_exit_pid}"
-                            f" | was {_early_exit_strike_count}/{EARLY_EXIT_CONFIRMATIONS}"
-                            f" | pid confirmed alive"
-                        )
-                    _early_exit_strike_count = 0
-            else:
-                # No PID file → no EARLY_EXIT condition to track.
-                _early_exit_strike_count = 0
-
-            # --- Liveness check ---
-            if hb_age is None:
-                _log("HB_LOG_MISSING | heartbeat.log not found — execution not yet started or path wrong")
-
-            elif hb_age >= HARD_THRESHOLD_S:
-                _log(f"HARD_BREACH | hb_age={hb_age:.1f}s | INITIATING RECOVERY")
-                _send_alert("HARD_BREACH", f"hb_age={hb_age:.0f}s threshold={HARD_THRESHOLD_S}s")
-                guard = _load_guard()
-                if _check_restart_storm(guard):
-                    _log(
-                        f"STORM_GUARD_ACTIVE"
-                        f" | restart_count={guard.get('restart_count')}"
-                        f" | last_restart={guard.get('last_restart_ts')}"
-                        f" | BLOCKED"
-                    )
-                    _send_alert("STORM_GUARD_ACTIVE",
-                        f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
-                        f"HALTED. Manual intervention required.")
-                else:
-                    # PID file absent = clean shutdown (atexit deleted it). Do not restart.
-                    if not EXEC_PID.exists():
-                        _log("CLEAN_SHUTDOWN_DETECTED | execution.pid absent | no restart")
-                    else:
-                        pid = _read_exec_pid()
-                        if pid and _pid_is_alive(pid):
-                            killed = _kill_pid(pid)
-                            _log(f"KILL_RESULT | pid={pid} | success={killed}")
-                        else:
-                            _log(f"NO_LIVE_PID | pid={pid} | process may have already exited")
-                        _do_restart(guard)
-
-            elif hb_age >= SOFT_THRESHOLD_S:
-                _log(f"SOFT_BREACH | hb_age={hb_age:.1f}s | WARNING ONLY")
 
-            else:
-                _log(f"HEARTBEAT_OK | hb_age={hb_age:.1f}s")
-
-            # --- Bar stall check (independent of liveness) ---
-            # Escalated to HARD action: heartbeat proves process is alive but bar loop
-            # is stalled (thread crash, feed hang, or MT5 disconnect not detected).
-            _proc_uptime = _get_process_uptime()
-            if (
-                bar_age is not None
-                and bar_age >= BAR_STALL_THRESHOLD_S
-                and hb_age is not None
-                and hb_age < SOFT_THRESHOLD_S
-                and (_proc_uptime is None or _proc_uptime >= 3600)
-            ):
-                _log(
-                    f"BAR_STALL_BREACH | heartbeat OK but no bar processed in {bar_age:.0f}s"
-                    f" | threshold={BAR_STALL_THRESHOLD_S}s | INITIATING RECOVERY"
-                )
-                _send_alert("BAR_STALL_BREACH",
-                    f"bar_age={bar_age:.0f}s threshold={BAR_STALL_THRESHOLD_S}s heartbeat_ok")
-                guard = _load_guard()
-                if _check_restart_storm(guard):
-                    _log(
-                        f"STORM_GUARD_ACTIVE"
-                        f" | restart_count={guard.get('restart_count')}"
-                        f" | BLOCKED — manual intervention required"
-                    )
-                    _send_alert("STORM_GUARD_ACTIVE",
-                        f"restart_count={guard.get('restart_count')} in {COOLDOWN_WINDOW_S}s — "
-                        f"HALTED. Manual intervention required.")
-                else:
-                    if not EXEC_PID.exists():
-                        _log("CLEAN_SHUTDOWN_DETECTED | execution.pid absent | no restart")
-                    else:
-                        pid = _read_exec_pid()
-                        if pid and _pid_is_alive(pid):
-                            killed = _kill_pid(pid)
-                            _log(f"KILL_RESULT | pid={pid} | success={killed}")
-                        else:
-                            _log(f"NO_LIVE_PID | pid={pid} | process may have already exited")
-                        _do_restart(guard)
+def run_watchdog_loop() -> None:
+    """Poll mode: evaluate every POLL_INTERVAL_S."""
+    state = _start_watchdog("poll")
+    if state is None:
+        return
 
+    while True:
+        try:
+            _watchdog_tick(state)
         except Exception as e:
             _log(f"WATCHDOG_LOOP_ERROR | {type(e).__name__}: {e}")
 
         time.sleep(POLL_INTERVAL_S)
 
 
+# ---------------------------------------------------------------------------
+# Event mode: change notifications + deadline timers
+# ---------------------------------------------------------------------------
+class _ChangeNotifier:
+    """Signals when any watched file is created, modified, replaced or removed.
+
+    Native: the `watchdog` package's observer (ReadDirectoryChangesW on
+    Windows, inotify on Linux) when importable and the directory exists.
+    Fallback: a thread that only stat()s the files every
+    EVENT_STAT_POLL_S — no reads, no parsing.
+    """
+
+    def __init__(self, paths: list[Path]) -> None:
+        self._paths = [Path(p) for p in paths]
+        self._names = {p.name for p in self._paths}
+        self._event = threading.Event()
+        self._stop = threading.Event()
+        self._observer = None
+        self.kind = "stat-poll"
+        try:
+            from watchdog.events import FileSystemEventHandler  # type: ignore
+            from watchdog.observers import Observer  # type: ignore
+
+            notifier = self
+
+            class _Handler(FileSystemEventHandler):
+                def on_any_event(self, event):  # noqa: D401 — watchdog callback
+                    for p in (getattr(event, "src_path", ""), getattr(event, "dest_path", "")):
+                        if p and Path(p).name in notifier._names:
+                            notifier.notify()
+                            return
+
+            observer = Observer()
+            observer.schedule(_Handler(), str(self._paths[0].parent), recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._observer = observer
+            self.kind = "native"
+        except Exception:
+            threading.Thread(target=self._stat_poll, name="watchdog-stat-poll", daemon=True).start()
+
+    def _fingerprint(self) -> tuple:
+        out = []
+        for p in self._paths:
+            try:
+                st = p.stat()
+                out.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                out.append(None)
+        return tuple(out)
+
+    def _stat_poll(self) -> None:
+        last = self._fingerprint()
+        while not self._stop.wait(EVENT_STAT_POLL_S):
+            current = self._fingerprint()
+            if current != last:
+                last = current
+                self.notify()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    def wait(self, timeout: float | None) -> bool:
+        fired = self._event.wait(timeout)
+        if fired:
+            # Coalesce the burst an atomic write produces (tmp write + rename).
+            time.sleep(EVENT_DEBOUNCE_S)
+            self._event.clear()
+        return fired
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+            except Exception:
+                pass
+
+
+class _DeadlineTimers:
+    """Named one-shot deadlines on the monotonic clock.
+
+    Each evaluation re-arms the handful of threshold slots (SOFT, HARD,
+    BAR_STALL, PID probe, back-off), so a keyed min-set is all the wheel
+    needs.
+    """
+
+    def __init__(self) -> None:
+        self._due: dict[str, float] = {}
+
+    def set(self, name: str, when: float) -> None:
+        self._due[name] = when
+
+    def cancel(self, name: str) -> None:
+        self._due.pop(name, None)
+
+    def get(self, name: str) -> float | None:
+        return self._due.get(name)
+
+    def next_due(self) -> float | None:
+        return min(self._due.values()) if self._due else None
+
+    def pop_due(self, name: str, now: float) -> bool:
+        """True (and clears the slot) if `name` is due at `now`."""
+        when = self._due.get(name)
+        if when is not None and when <= now:
+            del self._due[name]
+            return True
+        return False
+
+
+_THRESHOLD_TIMERS = ("soft", "hard", "bar_stall")
+
+
+def _threshold_deadlines(state: _LoopState, now: float) -> dict[str, float]:
+    """Monotonic times at which the observed ages cross a threshold.
+
+    An age already past its threshold re-checks at POLL_INTERVAL_S cadence,
+    exactly as poll mode would keep re-evaluating it.
+    """
+    due: dict[str, float] = {}
+    if state.clean_shutdown:
+        return due
+
+    hb = state.hb_age
+    if hb is not None:
+        if hb < SOFT_THRESHOLD_S:
+            due["soft"] = now + (SOFT_THRESHOLD_S - hb) + EVENT_DEADLINE_SLACK_S
+        if hb < HARD_THRESHOLD_S:
+            due["hard"] = now + (HARD_THRESHOLD_S - hb) + EVENT_DEADLINE_SLACK_S
+        else:
+            due["hard"] = now + POLL_INTERVAL_S
+
+    bar = state.bar_age
+    if bar is not None:
+        if bar < BAR_STALL_THRESHOLD_S:
+            due["bar_stall"] = now + (BAR_STALL_THRESHOLD_S - bar) + EVENT_DEADLINE_SLACK_S
+        elif state.proc_uptime is not None and state.proc_uptime < BAR_STALL_MIN_UPTIME_S:
+            due["bar_stall"] = now + (BAR_STALL_MIN_UPTIME_S - state.proc_uptime) + EVENT_DEADLINE_SLACK_S
+        else:
+            due["bar_stall"] = now + POLL_INTERVAL_S
+    return due
+
+
+def _watch_process_exit(pid: int, on_exit) -> bool:
+    """Call `on_exit()` from a daemon thread when `pid` exits (needs psutil).
+
+    Returns False when psutil is unavailable or the pid cannot be opened —
+    the caller then relies on the periodic probe alone.
+    """
+    try:
+        import psutil  # type: ignore
+        proc = psutil.Process(pid)
+    except Exception:
+        return False
+
+    def _wait() -> None:
+        try:
+            proc.wait()
+        except Exception:
+            pass
+        on_exit()
+
+    threading.Thread(target=_wait, name=f"watchdog-exit-{pid}", daemon=True).start()
+    return True
+
+
+def run_event_loop(stop: threading.Event | None = None) -> None:
+    """Event mode: evaluate on file changes and threshold deadlines.
+
+    Heartbeat / execution-state / PID-file changes wake the loop (debounced);
+    between changes it sleeps until the next SOFT/HARD/BAR_STALL crossing,
+    so breaches fire within EVENT_DEADLINE_SLACK_S + EVENT_DEBOUNCE_S of the
+    threshold instead of up to POLL_INTERVAL_S late. The EARLY_EXIT PID
+    probe keeps its POLL_INTERVAL_S cadence (confirmation spacing is part
+    of the glitch guard); with psutil, a process exit triggers the first
+    probe immediately. After a recovery decision the loop backs off one
+    POLL_INTERVAL_S, as poll mode does. `stop` ends the loop (tests/embedding).
+    """
+    state = _start_watchdog("event")
+    if state is None:
+        return
+
+    notifier = _ChangeNotifier([HB_LOG, EXEC_STATE, EXEC_PID])
+    _log(f"WATCHDOG_EVENT_SOURCE | {notifier.kind}")
+    timers = _DeadlineTimers()
+    timers.set("pid_probe", time.monotonic())
+    watched_pid: int | None = None
+    process_exited = threading.Event()  # set from the psutil waiter thread
+
+    def _on_process_exit() -> None:
+        process_exited.set()
+        notifier.notify()
+
+    try:
+        while stop is None or not stop.is_set():
+            now = time.monotonic()
+            if process_exited.is_set():
+                process_exited.clear()
+                timers.set("pid_probe", now)
+            probe = timers.pop_due("pid_probe", now)
+            try:
+                acted = _watchdog_tick(state, probe_pid=probe)
+            except Exception as e:
+                _log(f"WATCHDOG_LOOP_ERROR | {type(e).__name__}: {e}")
+                acted = True
+
+            now = time.monotonic()
+            for name in _THRESHOLD_TIMERS:
+                timers.cancel(name)
+            for name, when in _threshold_deadlines(state, now).items():
+                timers.set(name, when)
+
+            if EXEC_PID.exists():
+                if probe or timers.get("pid_probe") is None:
+                    timers.set("pid_probe", now + (POLL_INTERVAL_S if probe else 0.0))
+                pid = _read_exec_pid()
+                if pid is not None and pid != watched_pid and _watch_process_exit(pid, _on_process_exit):
+                    watched_pid = pid
+            else:
+                timers.cancel("pid_probe")
+                watched_pid = None
+
+            backoff_until = now + POLL_INTERVAL_S if acted else None
+            if backoff_until is not None:
+                timers.set("backoff", backoff_until)
+                for name in (*_THRESHOLD_TIMERS, "pid_probe"):
+                    when = timers.get(name)
+                    if when is not None and when < backoff_until:
+                        timers.set(name, backoff_until)
+
+            # Sleep until the next deadline or a file change (changes are
+            # ignored while backing off after a recovery decision).
+            while stop is None or not stop.is_set():
+                now = time.monotonic()
+                next_due = timers.next_due()
+                if next_due is not None and next_due <= now:
+                    break
+                timeout = EVENT_MAX_IDLE_S if next_due is None else min(next_due - now, EVENT_MAX_IDLE_S)
+                if stop is not None:
+                    timeout = min(timeout, 0.5)
+                if notifier.wait(timeout):
+                    backoff = timers.get("backoff")
+                    if backoff is None or time.monotonic() >= backoff:
+                        break
+                elif next_due is None and stop is None:
+                    break  # EVENT_MAX_IDLE_S without any deadline: re-evaluate
+            timers.cancel("backoff")
+    finally:
+        notifier.stop()
+
+
+def main() -> None:
+    import argparse
+    parser = argparse.ArgumentParser(description="TS_Execution heartbeat watchdog.")
+    parser.add_argument(
+        "--mode", choices=("poll", "event"),
+        default=os.environ.get("WATCHDOG_MODE", "poll"),
+        help="poll: evaluate every POLL_INTERVAL_S (default). "
+             "event: evaluate on file changes and threshold deadlines.",
+    )
+    args = parser.parse_args()
+    if args.mode == "event":
+        run_event_loop()
+    else:
+        run_watchdog_loop()
+
+
 if __name__ == "__main__":
-    run_watchdog_loop()
+    main()
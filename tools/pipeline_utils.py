@@ -456,6 +456,20 @@ class PipelineStateManager:
             os.fsync(f.fileno())
             
         shutil.move(str(temp_file), str(self.state_file))
+        self._sync_active_index(data)
+
+    def _sync_active_index(self, data: dict):
+        """Mirror the state just written into runs/active_runs.json.
+
+        Best-effort: the index is a cache for stale-run recovery and is
+        rebuilt from run_state.json files, so a failure here must never
+        block a state write.
+        """
+        try:
+            from tools.orchestration.active_run_index import update_active_run
+            update_active_run(self.run_id, data, runs_dir=self.run_dir.parent)
+        except Exception as e:
+            print(f"[WARN] Active-run index update failed for {self.run_id}: {e}")
 
     def initialize(self, metadata: dict | None = None):
         """Creates the run directory and initial state file with Audit Log.
@@ -693,6 +707,8 @@ class PipelineStateManager:
         with open(temp_file, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=4)
         shutil.move(str(temp_file), str(self.state_file))
+        self._sync_active_index(data)
+
     def verify_state(self, expected_state: str):
         """
         Verify current state matches expected_state.
@@ -1,4 +1,9 @@
-"""PNG chart generation — matplotlib isolated here."""
+"""PNG chart generation — matplotlib isolated here.
+
+generate_charts() builds one array payload per chart (equity series
+decimated to screen resolution) and renders each through a module-level
+_render_* function — inline, or in a ChartRenderService pool.
+"""
 
 from __future__ import annotations
 
@@ -8,20 +13,16 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from matplotlib.colors import LinearSegmentedColormap
 
+from tools.chart_render import decimate_minmax, plot_x
 from tools.portfolio.portfolio_config import COLORS
 
 
-def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
-                    stress_results, output_dir, strategy_id):
-    """Generate all required PNG charts."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # --- Equity Curve ---
+def _render_equity_curve(payload, out_path):
+    strategy_id = payload['strategy_id']
     fig, ax = plt.subplots(figsize=(14, 6))
-    ax.plot(portfolio_equity.index, portfolio_equity.values,
-            color='#00d4ff', linewidth=2, label='Portfolio')
-    for i, (sym, eq) in enumerate(symbol_equity.items()):
-        ax.plot(eq.index, eq.values, color=COLORS[i % len(COLORS)],
+    ax.plot(*payload['portfolio'], color='#00d4ff', linewidth=2, label='Portfolio')
+    for i, (sym, x, y) in enumerate(payload['symbols']):
+        ax.plot(x, y, color=COLORS[i % len(COLORS)],
                 linewidth=0.8, alpha=0.5, label=sym)
     ax.set_title(f'{strategy_id} - Portfolio Equity Curve', fontweight='bold')
     ax.set_ylabel('Equity (USD)')
@@ -29,26 +30,29 @@ def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
     ax.grid(True)
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
     fig.tight_layout()
-    fig.savefig(output_dir / 'equity_curve.png', dpi=150, bbox_inches='tight')
+    fig.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close(fig)
 
-    # --- Drawdown Curve ---
+
+def _render_drawdown_curve(payload, out_path):
+    strategy_id = payload['strategy_id']
+    x, y = payload['drawdown']
     fig, ax = plt.subplots(figsize=(14, 4))
-    running_max = portfolio_equity.cummax()
-    dd_pct = (portfolio_equity - running_max) / running_max * 100
-    ax.fill_between(dd_pct.index, dd_pct.values, 0,
+    ax.fill_between(x, y, 0,
                     color='#ff4757', alpha=0.6)
-    ax.plot(dd_pct.index, dd_pct.values, color='#ff6b81', linewidth=0.8)
+    ax.plot(x, y, color='#ff6b81', linewidth=0.8)
     ax.set_title(f'{strategy_id} - Portfolio Drawdown', fontweight='bold')
     ax.set_ylabel('Drawdown (%)')
     ax.grid(True)
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
     fig.tight_layout()
-    fig.savefig(output_dir / 'drawdown_curve.png', dpi=150, bbox_inches='tight')
+    fig.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close(fig)
 
-    # --- Correlation Heatmap ---
-    corr_matrix = corr_data['corr_matrix']
+
+def _render_correlation_matrix(payload, out_path):
+    strategy_id = payload['strategy_id']
+    corr_matrix = payload['corr_matrix']
     fig, ax = plt.subplots(figsize=(10, 8))
     cmap = LinearSegmentedColormap.from_list('custom', ['#2196F3', '#1a1a2e', '#FF5722'])
     im = ax.imshow(corr_matrix.values, cmap=cmap, vmin=-1, vmax=1, aspect='auto')
@@ -64,13 +68,14 @@ def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
     fig.colorbar(im, ax=ax, shrink=0.8)
     ax.set_title(f'{strategy_id} - Correlation Matrix', fontweight='bold')
     fig.tight_layout()
-    fig.savefig(output_dir / 'correlation_matrix.png', dpi=150, bbox_inches='tight')
+    fig.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close(fig)
 
-    # --- Contribution Bar Chart ---
+
+def _render_contribution_chart(payload, out_path):
+    strategy_id = payload['strategy_id']
+    syms, pnls = payload['syms'], payload['pnls']
     fig, ax = plt.subplots(figsize=(12, 6))
-    syms = list(contributions.keys())
-    pnls = [contributions[s]['total_pnl'] for s in syms]
     colors_bar = ['#2ecc71' if p >= 0 else '#e74c3c' for p in pnls]
     bars = ax.bar(syms, pnls, color=colors_bar, edgecolor='#ffffff22', linewidth=0.5)
     for bar, val in zip(bars, pnls):
@@ -82,10 +87,13 @@ def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
     ax.axhline(y=0, color='#ffffff44', linewidth=0.8)
     ax.grid(True, axis='y')
     fig.tight_layout()
-    fig.savefig(output_dir / 'contribution_chart.png', dpi=150, bbox_inches='tight')
+    fig.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close(fig)
 
-    # --- Stress Test Chart ---
+
+def _render_stress_test_chart(payload, out_path):
+    strategy_id = payload['strategy_id']
+    stress_results = payload['stress_results']
     fig, axes = plt.subplots(1, 3, figsize=(15, 5))
     scenarios = list(stress_results.keys())
     for idx, metric in enumerate(['net_pnl', 'sharpe', 'return_dd']):
@@ -102,7 +110,47 @@ def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
                           va='center', fontsize=8)
     fig.suptitle(f'{strategy_id} - Stress Test Results', fontweight='bold', fontsize=14)
     fig.tight_layout()
-    fig.savefig(output_dir / 'stress_test_chart.png', dpi=150, bbox_inches='tight')
+    fig.savefig(out_path, dpi=150, bbox_inches='tight')
     plt.close(fig)
 
-    print(f"  [CHARTS] 5 charts saved to {output_dir}")
+
+def generate_charts(portfolio_equity, symbol_equity, corr_data, contributions,
+                    stress_results, output_dir, strategy_id, renderer=None):
+    """Generate all required PNG charts.
+
+    With a ``renderer`` (tools.chart_render.ChartRenderService) the PNGs
+    are encoded in its pool and are on disk once the renderer drains.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    running_max = portfolio_equity.cummax()
+    dd_pct = (portfolio_equity - running_max) / running_max * 100
+    jobs = [
+        (_render_equity_curve, 'equity_curve.png', {
+            'portfolio': decimate_minmax(plot_x(portfolio_equity.index), portfolio_equity.to_numpy()),
+            'symbols': [(sym, *decimate_minmax(plot_x(eq.index), eq.to_numpy()))
+                        for sym, eq in symbol_equity.items()],
+        }),
+        (_render_drawdown_curve, 'drawdown_curve.png', {
+            'drawdown': decimate_minmax(plot_x(dd_pct.index), dd_pct.to_numpy()),
+        }),
+        (_render_correlation_matrix, 'correlation_matrix.png', {
+            'corr_matrix': corr_data['corr_matrix'],
+        }),
+        (_render_contribution_chart, 'contribution_chart.png', {
+            'syms': list(contributions.keys()),
+            'pnls': [contributions[s]['total_pnl'] for s in contributions],
+        }),
+        (_render_stress_test_chart, 'stress_test_chart.png', {
+            'stress_results': stress_results,
+        }),
+    ]
+    for render, filename, payload in jobs:
+        payload['strategy_id'] = strategy_id
+        if renderer is None:
+            render(payload, output_dir / filename)
+        else:
+            renderer.submit(render, payload, output_dir / filename)
+
+    verb = "queued for" if renderer is not None and renderer.max_workers > 1 else "saved to"
+    print(f"  [CHARTS] {len(jobs)} charts {verb} {output_dir}")
@@ -10,7 +10,9 @@ Contents:
   compute_stress_correlation
   contribution_analysis
   drawdown_anatomy
+  SymbolPnlMatrix
   stress_test
+  leave_one_symbol_out
   regime_segmentation
   _to_mt5_timeframe
 """
@@ -129,29 +131,29 @@ def _metrics_risk_ratios(portfolio_equity, daily_pnl):
 
 
 def _metrics_flat_period(portfolio_equity, portfolio_df):
-    """Longest flat period (calendar days below prior HWM) + trades during it."""
+    """Longest flat period (calendar days below prior HWM) + trades during it.
+
+    A flat period runs from the first day below the prior high-water mark to
+    the first day back at it (or the last day); runs are found from the
+    edges of the below-HWM mask.
+    """
     high_water = portfolio_equity.cummax()
-    in_dd = portfolio_equity < high_water
-    flat_periods = []
-    current_start = None
-    for i, (dt, is_flat) in enumerate(in_dd.items()):
-        if is_flat and current_start is None:
-            current_start = dt
-        elif not is_flat and current_start is not None:
-            flat_periods.append((current_start, dt))
-            current_start = None
-    if current_start is not None:
-        flat_periods.append((current_start, portfolio_equity.index[-1]))
-
-    if flat_periods:
-        longest_flat = max(flat_periods, key=lambda x: (x[1] - x[0]).days)
-        longest_flat_days = (longest_flat[1] - longest_flat[0]).days
-    else:
-        longest_flat_days = 0
+    in_dd = (portfolio_equity < high_water).to_numpy()
+    dates = portfolio_equity.index
+
+    edges = np.diff(np.concatenate(([0], in_dd.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    if len(starts) == 0:
+        return 0, 0
+    # A run ending at row i closes on the next (recovered) date, else the last date.
+    ends = np.minimum(np.flatnonzero(edges == -1), len(dates) - 1)
+    durations = (dates[ends] - dates[starts]).days
+    longest = int(np.argmax(durations))  # first longest, as max() picked
+    longest_flat_days = int(durations[longest])
 
     flat_trades = 0
-    if flat_periods and longest_flat_days > 0:
-        lf_start, lf_end = longest_flat
+    if longest_flat_days > 0:
+        lf_start, lf_end = dates[starts[longest]], dates[ends[longest]]
         flat_trades = len(portfolio_df[
             (portfolio_df['exit_timestamp'] >= lf_start) &
             (portfolio_df['exit_timestamp'] <= lf_end)
@@ -404,27 +406,41 @@ def compute_stress_correlation(returns_df, peak_date, trough_date):
 # 4) CONTRIBUTION ANALYSIS
 # ==================================================================
 def contribution_analysis(symbol_trades, portfolio_df):
-    """Per-symbol contribution to portfolio metrics."""
-    total_pnl = portfolio_df['pnl_usd'].sum()
-    contributions = {}
-
-    for sym, df in symbol_trades.items():
-        sym_pnl = df['pnl_usd'].sum()
-        pnl_pct = (sym_pnl / total_pnl) if total_pnl != 0 else 0
-
-        sym_vol = df['pnl_usd'].std()
+    """Per-symbol contribution to portfolio metrics.
 
-        regime_pnl = {}
-        for regime in ['low', 'normal', 'high']:
-            r_df = df[df['volatility_regime'] == regime]
-            regime_pnl[regime] = r_df['pnl_usd'].sum()
+    One grouped aggregation over all symbol frames replaces the
+    symbols x regimes filtering loop.
+    """
+    if not symbol_trades:
+        return {}
+    total_pnl = portfolio_df['pnl_usd'].sum()
+    frames = pd.concat(
+        {sym: df[['pnl_usd', 'volatility_regime']] for sym, df in symbol_trades.items()},
+        names=['_symbol', None],
+    )
+    by_symbol = frames.groupby(level='_symbol', sort=False)['pnl_usd'].agg(['sum', 'std', 'size'])
+    by_regime = (
+        frames.groupby([frames.index.get_level_values('_symbol'), 'volatility_regime'])['pnl_usd']
+        .sum()
+        .unstack(fill_value=0.0)
+        .reindex(columns=['low', 'normal', 'high'], fill_value=0.0)
+    )
 
+    contributions = {}
+    for sym in symbol_trades:
+        # A symbol with an empty frame has no group: zero PnL, NaN std, 0 trades.
+        present = sym in by_symbol.index
+        sym_pnl = by_symbol.at[sym, 'sum'] if present else 0.0
+        regimes = by_regime.loc[sym] if sym in by_regime.index else None
         contributions[sym] = {
             'total_pnl': sym_pnl,
-            'pnl_pct': pnl_pct,
-            'volatility': sym_vol,
-            'trades': len(df),
-            'regime_pnl': regime_pnl,
+            'pnl_pct': (sym_pnl / total_pnl) if total_pnl != 0 else 0,
+            'volatility': by_symbol.at[sym, 'std'] if present else np.nan,
+            'trades': int(by_symbol.at[sym, 'size']) if present else 0,
+            'regime_pnl': {
+                regime: (regimes[regime] if regimes is not None else 0.0)
+                for regime in ['low', 'normal', 'high']
+            },
         }
 
     return contributions
@@ -482,9 +498,85 @@ def drawdown_anatomy(portfolio_equity, portfolio_df):
 # ==================================================================
 # 6) STRESS TESTING
 # ==================================================================
-def stress_test(symbol_trades, portfolio_df):
+class SymbolPnlMatrix:
+    """Per-symbol daily PnL and trade counts (rows: exit dates, cols: symbols).
+
+    Built once per evaluation. Any symbol-subset portfolio is a column of
+    ``pnl @ keep``; a day belongs to that portfolio's equity curve only if
+    one of its symbols closed a trade that day, matching a regroup of the
+    filtered trade frame.
+    """
+
+    def __init__(self, portfolio_df):
+        exit_day = portfolio_df['exit_timestamp'].dt.normalize()
+        if exit_day.dt.tz is not None:
+            exit_day = exit_day.dt.tz_localize(None)
+        grouped = portfolio_df.groupby([exit_day.rename('day'), portfolio_df['symbol']])['pnl_usd']
+        pnl = grouped.sum().unstack(fill_value=0.0).sort_index()
+        counts = grouped.size().unstack(fill_value=0).reindex(index=pnl.index, columns=pnl.columns)
+        self.dates = pd.DatetimeIndex(pnl.index)
+        self.symbols = list(pnl.columns)
+        self.pnl = pnl.to_numpy(dtype=np.float64)
+        self.counts = counts.to_numpy(dtype=np.int64)
+
+    def keep_mask(self, symbols):
+        """Boolean column selector for a symbol subset."""
+        wanted = set(symbols)
+        return np.array([sym in wanted for sym in self.symbols], dtype=bool)
+
+    def scenario_metrics(self, keep, capital=TOTAL_PORTFOLIO_CAPITAL):
+        """net_pnl / sharpe / max_dd_usd / return_dd for each column of ``keep``.
+
+        ``keep`` is a (n_symbols, n_scenarios) boolean matrix. Returns one
+        dict per scenario, or None where the subset has no trades.
+        """
+        keep = np.asarray(keep, dtype=bool).reshape(len(self.symbols), -1)
+        if len(self.dates) == 0:
+            return [None] * keep.shape[1]
+        daily = self.pnl @ keep.astype(np.float64)
+        active = (self.counts @ keep.astype(np.int64)) > 0
+        seen = np.cumsum(active, axis=0)
+
+        # Inactive days carry the previous equity, so they neither move the
+        # running peak nor add a drawdown; days before the first trade are
+        # masked out of the peak entirely.
+        equity = capital + np.cumsum(daily, axis=0)
+        peak = np.maximum.accumulate(np.where(seen > 0, equity, -np.inf), axis=0)
+        dd = np.where(seen > 0, equity - peak, np.inf).min(axis=0)
+
+        # Return on day t uses the equity of the previous trading day; the
+        # first trading day has none (it was the shift(1) NaN).
+        has_ret = active & (seen > 1)
+        prev_equity = np.vstack([np.full((1, keep.shape[1]), np.nan), equity[:-1]])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rets = np.where(has_ret, daily / prev_equity, 0.0)
+            n = has_ret.sum(axis=0)
+            mean = rets.sum(axis=0) / n
+            dev = np.where(has_ret, rets - mean, 0.0)
+            std = np.sqrt((dev ** 2).sum(axis=0) / (n - 1))
+
+        results = []
+        for j in range(keep.shape[1]):
+            if seen[-1, j] == 0:
+                results.append(None)
+                continue
+            net = equity[-1, j] - capital
+            sh = (mean[j] / std[j]) * np.sqrt(252) if n[j] > 1 and std[j] > 0 else 0
+            results.append({
+                'net_pnl': net,
+                'sharpe': sh,
+                'max_dd_usd': dd[j],
+                'return_dd': abs(net / dd[j]) if dd[j] != 0 else 0,
+            })
+        return results
+
+
+_EMPTY_SCENARIO = {'net_pnl': 0, 'sharpe': 0, 'max_dd_usd': 0, 'return_dd': 0}
+
+
+def stress_test(symbol_trades, portfolio_df, pnl_matrix=None):
     """Simulate removal of symbols and recompute metrics."""
-    results = {}
+    matrix = pnl_matrix if pnl_matrix is not None else SymbolPnlMatrix(portfolio_df)
 
     sym_pnl = {sym: df['pnl_usd'].sum() for sym, df in symbol_trades.items()}
     top_sym = max(sym_pnl, key=sym_pnl.get)
@@ -498,39 +590,34 @@ def stress_test(symbol_trades, portfolio_df):
         'remove_US_cluster': [s for s in symbol_trades if s not in us_cluster],
     }
 
-    for name, syms in scenarios.items():
-        subset = portfolio_df[portfolio_df['symbol'].isin(syms)].copy()
-        subset.sort_values('exit_timestamp', inplace=True)
-
-        if len(subset) == 0:
-            results[name] = {'net_pnl': 0, 'sharpe': 0, 'max_dd_usd': 0, 'return_dd': 0}
-            continue
-
-        daily_pnl = subset.groupby(subset['exit_timestamp'].dt.date)['pnl_usd'].sum()
-        daily_pnl.index = pd.DatetimeIndex(daily_pnl.index)
-        capital = TOTAL_PORTFOLIO_CAPITAL
-        equity = daily_pnl.cumsum() + capital
-        net = equity.iloc[-1] - capital
-
-        rm = equity.cummax()
-        dd = (equity - rm).min()
+    keep = np.column_stack([matrix.keep_mask(syms) for syms in scenarios.values()])
+    results = {}
+    for (name, syms), metrics in zip(scenarios.items(), matrix.scenario_metrics(keep)):
+        if metrics is None:
+            results[name] = dict(_EMPTY_SCENARIO)
+        else:
+            results[name] = {'symbols': len(syms), **metrics}
 
-        equity_series = equity.shift(1)
-        rets = daily_pnl / equity_series
-        rets = rets.dropna()
+    return results
 
-        sh = (rets.mean() / rets.std()) * np.sqrt(252) if len(rets) > 1 and rets.std() > 0 else 0
 
-        rdd = abs(net / dd) if dd != 0 else 0
-
-        results[name] = {
-            'symbols': len(syms),
-            'net_pnl': net,
-            'sharpe': sh,
-            'max_dd_usd': dd,
-            'return_dd': rdd,
-        }
+def leave_one_symbol_out(portfolio_df, pnl_matrix=None):
+    """Portfolio metrics with each symbol removed in turn.
 
+    Returns {removed_symbol: {symbols, net_pnl, sharpe, max_dd_usd, return_dd}}
+    in symbol order; one matrix pass covers every symbol.
+    """
+    matrix = pnl_matrix if pnl_matrix is not None else SymbolPnlMatrix(portfolio_df)
+    n = len(matrix.symbols)
+    if n == 0:
+        return {}
+    keep = ~np.eye(n, dtype=bool)
+    results = {}
+    for sym, metrics in zip(matrix.symbols, matrix.scenario_metrics(keep)):
+        if metrics is None:
+            results[sym] = dict(_EMPTY_SCENARIO)
+        else:
+            results[sym] = {'symbols': n - 1, **metrics}
     return results
 
 
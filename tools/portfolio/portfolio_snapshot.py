@@ -204,21 +204,29 @@ def _snapshot_build_overview_md(strategy_id, port_metrics, contributions, corr_d
     return overview
 
 
-def _snapshot_write_stress_report(strategy_id, stress_results, output_dir):
-    """Write stress_test_report.md."""
+def _snapshot_write_stress_report(strategy_id, stress_results, output_dir, leave_one_out=None):
+    """Write stress_test_report.md (plus the leave-one-symbol-out table if given)."""
     stress_md = f"# {strategy_id} - Stress Test Report\n\n"
     stress_md += "| Scenario | Symbols | Net PnL | Sharpe | Max DD | Return/DD |\n"
     stress_md += "|----------|---------|---------|--------|--------|-----------|\n"
     for name, data in stress_results.items():
         stress_md += f"| {name} | {data.get('symbols','?')} | ${data['net_pnl']:,.2f} | {data['sharpe']:.2f} | ${data['max_dd_usd']:,.2f} | {data['return_dd']:.2f} |\n"
 
+    if leave_one_out:
+        stress_md += "\n## Leave-One-Symbol-Out\n\n"
+        stress_md += "| Removed | Symbols | Net PnL | Sharpe | Max DD | Return/DD |\n"
+        stress_md += "|---------|---------|---------|--------|--------|-----------|\n"
+        for sym, data in leave_one_out.items():
+            stress_md += f"| {sym} | {data.get('symbols','?')} | ${data['net_pnl']:,.2f} | {data['sharpe']:.2f} | ${data['max_dd_usd']:,.2f} | {data['return_dd']:.2f} |\n"
+
     with open(output_dir / 'stress_test_report.md', 'w', encoding='utf-8') as f:
         f.write(stress_md)
 
 
 def save_snapshot(strategy_id, port_metrics, contributions, corr_data,
                   dd_anatomy, stress_results, regime_data, cap_util, concurrency_data,
-                  max_stress_corr, constituent_run_ids, inert_warnings, output_dir):
+                  max_stress_corr, constituent_run_ids, inert_warnings, output_dir,
+                  leave_one_out=None):
     """Save frozen evaluation snapshot (orchestrator)."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -244,7 +252,7 @@ def save_snapshot(strategy_id, port_metrics, contributions, corr_data,
     with open(output_dir / 'portfolio_overview.md', 'w', encoding='utf-8') as f:
         f.write(overview)
 
-    _snapshot_write_stress_report(strategy_id, stress_results, output_dir)
+    _snapshot_write_stress_report(strategy_id, stress_results, output_dir, leave_one_out)
 
     print(f"  [SNAPSHOT] Saved to {output_dir}")
     return recommendation
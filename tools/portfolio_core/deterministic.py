@@ -151,39 +151,42 @@ def load_trades_for_portfolio_evaluator(run_ids, project_root: Path):
 
 
 def compute_equity_curve(trades, reference_capital):
-    """Legacy-compatible equity progression used by run_portfolio_analysis.py."""
-    equity = reference_capital
-    equity_before_list = []
-    equity_after_list = []
-    return_list = []
-
-    for _, row in trades.iterrows():
-        equity_before_list.append(equity)
-        pnl = row["pnl"]
-        r = pnl / equity if equity != 0 else 0.0
-        equity += pnl
-        equity_after_list.append(equity)
-        return_list.append(r)
-
-    trades["equity_before_trade"] = equity_before_list
-    trades["equity_after_trade"] = equity_after_list
-    trades["return_t"] = return_list
+    """Legacy-compatible equity progression used by run_portfolio_analysis.py.
+
+    Equity is the running sum of ``pnl`` seeded with ``reference_capital``;
+    ``np.cumsum`` adds left to right, so every value is bit-identical to the
+    original per-row accumulation.
+    """
+    if trades.empty:
+        trades["equity_before_trade"] = []
+        trades["equity_after_trade"] = []
+        trades["return_t"] = []
+        return trades
+
+    pnl = trades["pnl"].to_numpy()
+    path = np.cumsum(np.concatenate(([reference_capital], pnl)))
+    equity_before = path[:-1]
+    returns = np.zeros(len(pnl), dtype=np.float64)
+    np.divide(pnl, equity_before, out=returns, where=equity_before != 0)
+
+    trades["equity_before_trade"] = equity_before
+    trades["equity_after_trade"] = path[1:]
+    trades["return_t"] = returns
     return trades
 
 
-def compute_concurrency_series(portfolio_df):
-    """
-    Compute concurrency metrics using exact timestamp overlap.
-    Returns:
-      - series
-      - max_concurrent
-      - avg_concurrent (time weighted)
-      - pct_time_at_max
-      - pct_time_deployed
+def _elapsed_seconds(delta_ns):
+    """``Timedelta.total_seconds()`` for non-negative int64 nanosecond deltas.
+
+    pandas truncates to whole microseconds and adds the fractional second to
+    the integral part; reproduced here so sweep-line durations stay exact.
     """
-    if portfolio_df.empty:
-        return [], 0, 0.0, 0.0, 0.0
+    micros = delta_ns // 1000
+    return (micros // 1_000_000) + (micros % 1_000_000) / 1e6
 
+
+def _concurrency_from_events(portfolio_df):
+    """Per-event walk; only used when a timestamp is NaT (unordered events)."""
     df_sorted = portfolio_df.sort_values("entry_timestamp").copy()
 
     events = []
@@ -230,6 +233,57 @@ def compute_concurrency_series(portfolio_df):
     return series, max_concurrent, avg_concurrent, pct_at_max, pct_deployed
 
 
+def compute_concurrency_series(portfolio_df):
+    """
+    Compute concurrency metrics using exact timestamp overlap.
+    Returns:
+      - series
+      - max_concurrent
+      - avg_concurrent (time weighted)
+      - pct_time_at_max
+      - pct_time_deployed
+
+    Columnar sweep-line: entries (+1) and exits (-1) are concatenated and
+    ordered by (timestamp, type) with a stable lexsort, so exits still come
+    first on ties; the open count is a cumsum over that order. Durations are
+    accumulated with ``np.cumsum`` (strict left-to-right) to keep the float
+    sums identical to the original per-event loop.
+    """
+    if portfolio_df.empty:
+        return [], 0, 0.0, 0.0, 0.0
+
+    entries = pd.DatetimeIndex(portfolio_df["entry_timestamp"])
+    exits = pd.DatetimeIndex(portfolio_df["exit_timestamp"])
+    if entries.hasnans or exits.hasnans:
+        return _concurrency_from_events(portfolio_df)
+
+    n = len(portfolio_df)
+    times = np.concatenate((entries.as_unit("ns").asi8, exits.as_unit("ns").asi8))
+    types = np.concatenate((np.ones(n, dtype=np.int64), np.full(n, -1, dtype=np.int64)))
+    order = np.lexsort((types, times))
+    times = times[order]
+    types = types[order]
+
+    counts = np.cumsum(types)
+    before = np.concatenate(([0], counts[:-1]))  # open count during each gap
+    deltas = _elapsed_seconds(np.diff(times, prepend=times[0]))
+
+    series = counts[types == 1].tolist()
+    max_concurrent = max(0, int(counts.max()))
+    total_duration = float(_elapsed_seconds(times[-1] - times[0]))
+
+    # Zero-length gaps add 0.0, which leaves a running float sum unchanged.
+    weighted_sum = float(np.cumsum(before * deltas)[-1])
+    time_deployed = float(np.cumsum(np.where(before > 0, deltas, 0.0))[-1])
+    time_at_max = float(np.cumsum(np.where(before == max_concurrent, deltas, 0.0))[-1])
+
+    avg_concurrent = weighted_sum / total_duration if total_duration > 0 else 0.0
+    pct_deployed = (time_deployed / total_duration) if total_duration > 0 else 0.0
+    pct_at_max = (time_at_max / total_duration) if total_duration > 0 else 0.0
+
+    return series, max_concurrent, avg_concurrent, pct_at_max, pct_deployed
+
+
 def compute_drawdown(trades):
     """Legacy-compatible drawdown computation used by run_portfolio_analysis.py."""
     equity = trades["equity_after_trade"]
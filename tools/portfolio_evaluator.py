@@ -54,11 +54,14 @@ from tools.portfolio.portfolio_metrics import (  # noqa: F401
     contribution_analysis,
     correlation_analysis,
     drawdown_anatomy,
+    leave_one_symbol_out,
     regime_segmentation,
     stress_test,
+    SymbolPnlMatrix,
     _to_mt5_timeframe,
 )
 from tools.portfolio.portfolio_charts import generate_charts  # noqa: F401
+from tools.chart_render import ChartRenderService
 from tools.portfolio.portfolio_tradelevel import generate_portfolio_tradelevel  # noqa: F401
 from tools.portfolio.portfolio_snapshot import save_snapshot  # noqa: F401
 
@@ -360,9 +363,13 @@ def main():
     print(f"  Max pairwise (stress): {max_stress_corr:.3f}")
 
     print("[7/9] Running stress tests...")
-    stress_results = stress_test(symbol_trades, portfolio_df)
+    pnl_matrix = SymbolPnlMatrix(portfolio_df)
+    stress_results = stress_test(symbol_trades, portfolio_df, pnl_matrix=pnl_matrix)
     for name, data in stress_results.items():
         print(f"  {name}: PnL=${data['net_pnl']:,.2f}, Sharpe={data['sharpe']}")
+    leave_one_out = leave_one_symbol_out(portfolio_df, pnl_matrix=pnl_matrix) if len(symbol_trades) > 1 else {}
+    for sym, data in leave_one_out.items():
+        print(f"  without {sym}: PnL=${data['net_pnl']:,.2f}, Sharpe={data['sharpe']:.2f}")
 
     print("[8/9] Segmenting by regime...")
     regime_data = regime_segmentation(portfolio_df)
@@ -370,50 +377,54 @@ def main():
         print(f"  {regime}: {stats['trades']} trades, PnL=${stats['net_pnl']:,.2f}")
 
     print("[9/9] Generating visual outputs...")
-    generate_charts(portfolio_equity, symbol_equity, corr_data,
-                    contributions, stress_results, output_dir, strategy_id)
+    # PNGs encode in the background; the service drains after the ledger update.
+    with ChartRenderService() as charts:
+        generate_charts(portfolio_equity, symbol_equity, corr_data,
+                        contributions, stress_results, output_dir, strategy_id,
+                        renderer=charts)
 
-    print("  [ARTIFACT] Generating portfolio_tradelevel.csv...")
-    try:
-        transparency = generate_portfolio_tradelevel(portfolio_df, output_dir, TOTAL_PORTFOLIO_CAPITAL)
-        port_metrics.update(transparency)
-    except Exception as e:
-        print(f"  [WARN] Failed to generate portfolio_tradelevel.csv: {e}")
+        print("  [ARTIFACT] Generating portfolio_tradelevel.csv...")
+        try:
+            transparency = generate_portfolio_tradelevel(portfolio_df, output_dir, TOTAL_PORTFOLIO_CAPITAL)
+            port_metrics.update(transparency)
+        except Exception as e:
+            print(f"  [WARN] Failed to generate portfolio_tradelevel.csv: {e}")
 
-    unique_runs = sorted(list(set(portfolio_df['source_run_id'].astype(str).unique())))
+        unique_runs = sorted(list(set(portfolio_df['source_run_id'].astype(str).unique())))
 
-    # Snapshot metric enrichment (Phase 15)
-    exposure_pct = cap_util.get('pct_time_deployed', 0.0) * 100.0
-    port_metrics['exposure_pct'] = exposure_pct
-    port_metrics['equity_stability_k_ratio'] = port_metrics.get('k_ratio', 0.0)
+        # Snapshot metric enrichment (Phase 15)
+        exposure_pct = cap_util.get('pct_time_deployed', 0.0) * 100.0
+        port_metrics['exposure_pct'] = exposure_pct
+        port_metrics['equity_stability_k_ratio'] = port_metrics.get('k_ratio', 0.0)
 
-    recommendation = save_snapshot(
-        strategy_id, port_metrics, contributions, corr_data,
-        dd_anatomy, stress_results, regime_data, cap_util, concurrency_data,
-        max_stress_corr, unique_runs, inert_warnings, output_dir
-    )
+        recommendation = save_snapshot(
+            strategy_id, port_metrics, contributions, corr_data,
+            dd_anatomy, stress_results, regime_data, cap_util, concurrency_data,
+            max_stress_corr, unique_runs, inert_warnings, output_dir,
+            leave_one_out=leave_one_out,
+        )
 
-    # 10) Master Ledger Update (SOP 8) — curated composite / multi-asset / forced
-    is_valid_for_master = (
-        len(unique_runs) > 1 or
-        len(symbol_trades) > 1 or
-        str(strategy_id).startswith("PF_") or
-        getattr(args, 'force_ledger', False)
-    )
+        # 10) Master Ledger Update (SOP 8) — curated composite / multi-asset / forced
+        is_valid_for_master = (
+            len(unique_runs) > 1 or
+            len(symbol_trades) > 1 or
+            str(strategy_id).startswith("PF_") or
+            getattr(args, 'force_ledger', False)
+        )
 
-    if is_valid_for_master:
-        print(f"[10/10] Updating Master Portfolio Ledger...")
-        try:
-            update_master_portfolio_ledger(
-                strategy_id, port_metrics, corr_data, max_stress_corr,
-                concurrency_data, unique_runs, n_assets=len(symbol_trades),
-            )
-            print(f"  [LEDGER] Row appended to Master_Portfolio_Sheet.xlsx")
-        except Exception as e:
-            print(f"  [ERROR] Failed to update ledger: {e}")
-            raise
-    else:
-        print(f"[10/10] Skipping Master Ledger Update (Filtered: Single-Run / Single-Asset Strategy).")
+        if is_valid_for_master:
+            print(f"[10/10] Updating Master Portfolio Ledger...")
+            try:
+                update_master_portfolio_ledger(
+                    strategy_id, port_metrics, corr_data, max_stress_corr,
+                    concurrency_data, unique_runs, n_assets=len(symbol_trades),
+                )
+                print(f"  [LEDGER] Row appended to Master_Portfolio_Sheet.xlsx")
+            except Exception as e:
+                print(f"  [ERROR] Failed to update ledger: {e}")
+                raise
+        else:
+            print(f"[10/10] Skipping Master Ledger Update (Filtered: Single-Run / Single-Asset Strategy).")
 
     _main_print_final_summary(port_metrics, corr_data, max_stress_corr,
                               strategy_id, recommendation)
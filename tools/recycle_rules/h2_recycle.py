@@ -234,7 +234,7 @@ class H2RecycleRule:
         bar_closes: dict[str, float] = {}
         for leg in legs:
             try:
-                bar_closes[leg.symbol] = float(leg.df.loc[bar_ts, "close"])
+                bar_closes[leg.symbol] = float(leg.value("close", bar_ts))
             except (KeyError, ValueError):
                 # Data gap — record RULE_NOT_INVOKED; cannot compute floating/margin.
                 self._record_bar(
@@ -296,7 +296,7 @@ class H2RecycleRule:
         factor_present_but_nan = False
         if not column_missing:
             try:
-                raw_val = float(primary_df.loc[bar_ts, self.factor_column])
+                raw_val = float(legs[0].value(self.factor_column, bar_ts))
                 if pd.isna(raw_val):
                     factor_present_but_nan = True
                 else:
@@ -831,7 +831,7 @@ class H2RecycleRule:
         """
         sym = leg.symbol
         try:
-            atr_entry = float(leg.df.loc[bar_ts, "atr"])
+            atr_entry = float(leg.value("atr", bar_ts))
             if atr_entry != atr_entry or atr_entry <= 0:
                 atr_entry = float("nan")
         except (KeyError, ValueError, TypeError):
@@ -852,7 +852,7 @@ class H2RecycleRule:
         }
         for col in self._ENTRY_PASSTHROUGH_COLS:
             try:
-                val = leg.df.loc[bar_ts, col]
+                val = leg.value(col, bar_ts)
                 if pd.isna(val):
                     val = None
             except (KeyError, ValueError, TypeError):
@@ -861,8 +861,8 @@ class H2RecycleRule:
         self._cycle_entry_ctx[sym] = ctx
         # Reset MFE/MAE trackers to this bar's high/low (per direction)
         try:
-            bar_high = float(leg.df.loc[bar_ts, "high"])
-            bar_low = float(leg.df.loc[bar_ts, "low"])
+            bar_high = float(leg.value("high", bar_ts))
+            bar_low = float(leg.value("low", bar_ts))
         except (KeyError, ValueError, TypeError):
             bar_high = bar_closes.get(sym, float("nan"))
             bar_low = bar_high
@@ -942,8 +942,8 @@ class H2RecycleRule:
             if not leg.state.in_pos:
                 continue
             try:
-                bar_high = float(leg.df.loc[bar_ts, "high"])
-                bar_low = float(leg.df.loc[bar_ts, "low"])
+                bar_high = float(leg.value("high", bar_ts))
+                bar_low = float(leg.value("low", bar_ts))
             except (KeyError, ValueError, TypeError):
                 bar_high = bar_closes.get(sym, float("nan"))
                 bar_low = bar_high
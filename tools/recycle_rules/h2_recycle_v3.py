@@ -107,7 +107,7 @@ def _build_ref_closes(legs: list[BasketLeg], bar_ts: pd.Timestamp) -> dict[str,
         if leg.symbol in {"EURUSD", "GBPUSD", "AUDUSD", "NZDUSD",
                           "USDJPY", "USDCHF", "USDCAD"}:
             try:
-                out[leg.symbol] = float(leg.df.loc[bar_ts, "close"])
+                out[leg.symbol] = float(leg.value("close", bar_ts))
             except (KeyError, ValueError):
                 pass
         # External reference rates loaded by basket_data_loader
@@ -117,7 +117,7 @@ def _build_ref_closes(legs: list[BasketLeg], bar_ts: pd.Timestamp) -> dict[str,
             col = f"usd_ref_{ref_pair}_close"
             if col in leg.df.columns and ref_pair not in out:
                 try:
-                    val = float(leg.df.loc[bar_ts, col])
+                    val = float(leg.value(col, bar_ts))
                     if not pd.isna(val):
                         out[ref_pair] = val
                 except (KeyError, ValueError):
@@ -286,7 +286,7 @@ class H2RecycleRuleV3:
         bar_closes: dict[str, float] = {}
         for leg in legs:
             try:
-                bar_closes[leg.symbol] = float(leg.df.loc[bar_ts, "close"])
+                bar_closes[leg.symbol] = float(leg.value("close", bar_ts))
             except (KeyError, ValueError):
                 # Data gap — record RULE_NOT_INVOKED; cannot compute floating/margin.
                 self._record_bar(
@@ -400,7 +400,7 @@ class H2RecycleRuleV3:
         factor_present_but_nan = False
         if not column_missing:
             try:
-                raw_val = float(primary_df.loc[bar_ts, self.factor_column])
+                raw_val = float(legs[0].value(self.factor_column, bar_ts))
                 if pd.isna(raw_val):
                     factor_present_but_nan = True
                 else:
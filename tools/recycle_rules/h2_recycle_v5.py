@@ -246,14 +246,14 @@ class H2RecycleRuleV5(H2RecycleRule):
         rho_4h: Optional[float] = None
         if self.correlation_column_1h in df.columns:
             try:
-                v = float(df.loc[bar_ts, self.correlation_column_1h])
+                v = float(legs[0].value(self.correlation_column_1h, bar_ts))
                 if not pd.isna(v):
                     rho_1h = v
             except (KeyError, ValueError, TypeError):
                 pass
         if self.correlation_column_4h in df.columns:
             try:
-                v = float(df.loc[bar_ts, self.correlation_column_4h])
+                v = float(legs[0].value(self.correlation_column_4h, bar_ts))
                 if not pd.isna(v):
                     rho_4h = v
             except (KeyError, ValueError, TypeError):
@@ -307,7 +307,7 @@ class H2RecycleRuleV5(H2RecycleRule):
         bar_closes: dict[str, float] = {}
         for leg in legs:
             try:
-                bar_closes[leg.symbol] = float(leg.df.loc[bar_ts, "close"])
+                bar_closes[leg.symbol] = float(leg.value("close", bar_ts))
             except (KeyError, ValueError):
                 self._record_bar(
                     legs, i, bar_ts,
@@ -376,7 +376,7 @@ class H2RecycleRuleV5(H2RecycleRule):
         factor_present_but_nan = False
         if not column_missing:
             try:
-                raw_val = float(primary_df.loc[bar_ts, self.factor_column])
+                raw_val = float(legs[0].value(self.factor_column, bar_ts))
                 if pd.isna(raw_val):
                     factor_present_but_nan = True
                 else:
@@ -33,6 +33,7 @@ _SOFT_FLAT_DAYS_THRESHOLD = 250
 def compute_family_verdicts(
     rows_df: pd.DataFrame,
     trades_by_variant: dict[str, pd.DataFrame] | None = None,
+    soft_gate_trips_by_variant: dict[str, list[str]] | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Compute the {CORE/WATCH/FAIL/RESERVE/LIVE} verdict for every variant
     in `rows_df`, then apply soft-gate overrides where trade data is provided.
@@ -44,6 +45,9 @@ def compute_family_verdicts(
             trade_density, expectancy.
         trades_by_variant: optional mapping {variant_strategy_name -> trade_df}.
             When supplied, soft-gate overrides are evaluated per variant.
+        soft_gate_trips_by_variant: optional precomputed trips
+            {variant_strategy_name -> list[str]} (e.g. from the family
+            report's payload cache); takes precedence over trades_by_variant.
 
     Returns:
         {variant_strategy_name: {
@@ -68,7 +72,9 @@ def compute_family_verdicts(
 
         # Soft-gate evaluation from trade-level data
         trips: list[str] = []
-        if trades_by_variant:
+        if soft_gate_trips_by_variant and name in soft_gate_trips_by_variant:
+            trips = list(soft_gate_trips_by_variant[name])
+        elif trades_by_variant:
             tdf = trades_by_variant.get(name)
             if tdf is not None and len(tdf) > 0:
                 trips = _evaluate_soft_gates(tdf)
@@ -3,21 +3,99 @@
 Loads raw CSV artifacts (the DB) into a SymbolPayloads container that the
 section builders consume read-only.
 
-Dependency: tools.report.report_sessions (for _classify_session).
+Dependency: tools.report.report_sessions (for _classify_sessions).
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from tools.report.report_sessions import _classify_session
+from tools.report.report_sessions import _classify_sessions
 
 
-def _collect_vol_trend_edges(tdf):
+# Regime / session labels the report breaks PnL down by; any other value
+# (after lower/strip normalisation) is ignored.
+_VOL_LABELS = ("high", "normal", "low")
+_TREND_LABELS = ("strong_up", "weak_up", "neutral", "weak_down", "strong_down")
+_SESSION_LABELS = ("asia", "london", "ny")
+
+# Trade-log columns read by the metrics_core age / exec-delta breakdowns.
+_AGE_RECORD_COLUMNS = ("pnl_usd", "regime_age", "regime_age_signal", "regime_age_fill",
+                       "regime_age_exec_signal", "regime_age_exec_fill")
+
+# Symbol directories loaded concurrently (CSV parsing releases the GIL).
+_MAX_LOAD_WORKERS = 8
+
+
+def _clean_labels(values: pd.Series) -> pd.Categorical:
+    """``values.astype(str).str.lower().str.strip()`` as a categorical.
+
+    The string normalisation runs once per distinct value instead of once
+    per row.
+    """
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(uniques, dtype=values.dtype).astype(str).str.lower().str.strip().to_numpy(object)
+    rows = text[codes] if len(text) else np.empty(len(values), dtype=object)
+    missing = codes < 0
+    if missing.any():
+        rows[missing] = values[missing].astype(str).str.lower().str.strip().to_numpy(object)
+    return pd.Categorical(rows)
+
+
+def _label_codes(clean: pd.Categorical, labels) -> np.ndarray:
+    """Row -> position of its label in *labels*, -1 for anything else."""
+    pos = pd.Index(labels).get_indexer(clean.categories)
+    return pos[clean.codes]
+
+
+def _collect_trade_cells(tdf):
+    """Volatility / trend / session PnL sums and counts in one grouped aggregation.
+
+    Normalises ``volatility_regime``, ``trend_label`` and the entry session
+    once into categorical columns (``volatility_regime_clean``,
+    ``trend_label_clean``, ``_session``) on *tdf*, then stacks the three
+    label dimensions into a single key so one ``groupby`` yields every
+    cell. Returns ``{(dimension, label): (pnl_sum, trade_count)}``.
+    """
+    if tdf is None or len(tdf) == 0:
+        return {}
+    has_pnl = 'pnl_usd' in tdf.columns
+    dims = []
+    if 'volatility_regime' in tdf.columns and has_pnl:
+        tdf['volatility_regime_clean'] = _clean_labels(tdf['volatility_regime'])
+        dims.append(("vol", _VOL_LABELS, _label_codes(tdf['volatility_regime_clean'].array, _VOL_LABELS)))
+    if 'trend_label' in tdf.columns and has_pnl:
+        tdf['trend_label_clean'] = _clean_labels(tdf['trend_label'])
+        dims.append(("trend", _TREND_LABELS, _label_codes(tdf['trend_label_clean'].array, _TREND_LABELS)))
+    if 'entry_timestamp' in tdf.columns:
+        tdf['_session'] = pd.Categorical(_classify_sessions(tdf['entry_timestamp']))
+        dims.append(("session", _SESSION_LABELS, _label_codes(tdf['_session'].array, _SESSION_LABELS)))
+    if not dims:
+        return {}
+
+    cells = [(dim, label) for dim, labels, _ in dims for label in labels]
+    offsets = np.cumsum([0] + [len(labels) for _, labels, _ in dims[:-1]])
+    keys = np.concatenate([np.where(codes >= 0, codes + off, -1)
+                           for (_, _, codes), off in zip(dims, offsets)])
+    pnl = pd.concat([tdf['pnl_usd']] * len(dims), ignore_index=True)
+    keep = keys >= 0
+    agg = pnl[keep].groupby(keys[keep]).agg(["sum", "count"])
+    return {cells[k]: (total, count) for k, total, count in zip(agg.index, agg["sum"], agg["count"])}
+
+
+def _cell(cells, dim, label):
+    pnl, count = cells.get((dim, label), (0.0, 0))
+    return float(pnl), int(count)
+
+
+def _collect_vol_trend_edges(tdf, cells=None):
     """Compute avg_r + volatility/trend PnL+count breakdowns from trade-level df."""
     out = {
         "avg_r": 0.0,
@@ -32,41 +110,28 @@ def _collect_vol_trend_edges(tdf):
     if 'r_multiple' in tdf.columns:
         out["avg_r"] = float(tdf['r_multiple'].mean())
 
-    if 'volatility_regime' in tdf.columns and 'pnl_usd' in tdf.columns:
-        tdf['volatility_regime_clean'] = tdf['volatility_regime'].astype(str).str.lower().str.strip()
-        vol_groups = tdf.groupby('volatility_regime_clean')['pnl_usd'].sum()
-        vol_counts = tdf.groupby('volatility_regime_clean')['pnl_usd'].count()
-        out["h_vol"] = float(vol_groups.get('high', 0.0))
-        out["n_vol"] = float(vol_groups.get('normal', 0.0))
-        out["l_vol"] = float(vol_groups.get('low', 0.0))
-        out["h_vol_t"] = int(vol_counts.get('high', 0))
-        out["n_vol_t"] = int(vol_counts.get('normal', 0))
-        out["l_vol_t"] = int(vol_counts.get('low', 0))
-
-    if 'trend_label' in tdf.columns and 'pnl_usd' in tdf.columns:
-        tdf['trend_label_clean'] = tdf['trend_label'].astype(str).str.lower().str.strip()
-        trend_groups = tdf.groupby('trend_label_clean')['pnl_usd'].sum()
-        trend_counts = tdf.groupby('trend_label_clean')['pnl_usd'].count()
-        out["s_up"] = float(trend_groups.get('strong_up', 0.0))
-        out["w_up"] = float(trend_groups.get('weak_up', 0.0))
-        out["neu"] = float(trend_groups.get('neutral', 0.0))
-        out["w_dn"] = float(trend_groups.get('weak_down', 0.0))
-        out["s_dn"] = float(trend_groups.get('strong_down', 0.0))
-        out["s_up_t"] = int(trend_counts.get('strong_up', 0))
-        out["w_up_t"] = int(trend_counts.get('weak_up', 0))
-        out["neu_t"] = int(trend_counts.get('neutral', 0))
-        out["w_dn_t"] = int(trend_counts.get('weak_down', 0))
-        out["s_dn_t"] = int(trend_counts.get('strong_down', 0))
+    if cells is None:
+        cells = _collect_trade_cells(tdf)
+    for key, label in (("h_vol", "high"), ("n_vol", "normal"), ("l_vol", "low")):
+        out[key], out[f"{key}_t"] = _cell(cells, "vol", label)
+    for key, label in (("s_up", "strong_up"), ("w_up", "weak_up"), ("neu", "neutral"),
+                       ("w_dn", "weak_down"), ("s_dn", "strong_down")):
+        out[key], out[f"{key}_t"] = _cell(cells, "trend", label)
     return out
 
 
-def _collect_age_entry(symbol, tdf):
+def _trade_records(tdf):
+    """``to_dict('records')`` over just the columns the age breakdowns read."""
+    return tdf[[c for c in _AGE_RECORD_COLUMNS if c in tdf.columns]].to_dict('records')
+
+
+def _collect_age_entry(symbol, tdf, records=None):
     """Regime Lifecycle (Age) row keyed by symbol. Returns None if unavailable."""
     if (tdf is None or len(tdf) == 0
             or 'regime_age' not in tdf.columns or 'pnl_usd' not in tdf.columns):
         return None
     from tools.metrics_core import compute_regime_age_breakdown
-    trade_dicts = tdf.to_dict('records')
+    trade_dicts = records if records is not None else _trade_records(tdf)
     age_rows = compute_regime_age_breakdown(trade_dicts)
     age_entry = {"Symbol": symbol}
     for r in age_rows:
@@ -78,13 +143,13 @@ def _collect_age_entry(symbol, tdf):
     return age_entry
 
 
-def _collect_dual_age(symbol, tdf):
+def _collect_dual_age(symbol, tdf, records=None):
     """Fill-age + delta + meta entries for v1.5.5+ dual-time breakdown."""
     if (tdf is None or len(tdf) == 0 or 'pnl_usd' not in tdf.columns
             or not ('regime_age_signal' in tdf.columns or 'regime_age_fill' in tdf.columns)):
         return None
     from tools.metrics_core import compute_age_dual_breakdown
-    trade_dicts_dual = tdf.to_dict('records')
+    trade_dicts_dual = records if records is not None else _trade_records(tdf)
     dual = compute_age_dual_breakdown(trade_dicts_dual)
 
     fill_entry = {"Symbol": symbol}
@@ -112,14 +177,15 @@ def _collect_dual_age(symbol, tdf):
     return fill_entry, delta_entry, meta_entry
 
 
-def _collect_exec_delta(symbol, tdf):
+def _collect_exec_delta(symbol, tdf, records=None):
     """v1.5.6 exec-TF delta distribution. Returns (exec_entry, meta_entry) or None."""
     if (tdf is None or len(tdf) == 0 or 'pnl_usd' not in tdf.columns
             or not ('regime_age_exec_signal' in tdf.columns
                     or 'regime_age_exec_fill' in tdf.columns)):
         return None
     from tools.metrics_core import compute_exec_delta_distribution
-    exec_out = compute_exec_delta_distribution(tdf.to_dict('records'))
+    exec_out = compute_exec_delta_distribution(
+        records if records is not None else _trade_records(tdf))
     exec_entry = {"Symbol": symbol}
     for r in exec_out["delta_buckets"]:
         key = (r["label"].replace(" ", "_").replace("<=", "le").replace(">=", "ge")
@@ -132,20 +198,13 @@ def _collect_exec_delta(symbol, tdf):
     return exec_entry, meta_entry
 
 
-def _collect_session_row(symbol, tdf):
+def _collect_session_row(symbol, tdf, cells=None):
     """Session-level PnL+counts row for symbol."""
-    asia_pnl = 0.0; london_pnl = 0.0; ny_pnl = 0.0
-    asia_t = 0; london_t = 0; ny_t = 0
-    if tdf is not None and len(tdf) > 0 and 'entry_timestamp' in tdf.columns:
-        tdf['_session'] = tdf['entry_timestamp'].apply(_classify_session)
-        sess_groups = tdf.groupby('_session')['pnl_usd'].sum()
-        sess_counts = tdf.groupby('_session')['pnl_usd'].count()
-        asia_pnl = float(sess_groups.get('asia', 0.0))
-        london_pnl = float(sess_groups.get('london', 0.0))
-        ny_pnl = float(sess_groups.get('ny', 0.0))
-        asia_t = int(sess_counts.get('asia', 0))
-        london_t = int(sess_counts.get('london', 0))
-        ny_t = int(sess_counts.get('ny', 0))
+    if cells is None:
+        cells = _collect_trade_cells(tdf)
+    asia_pnl, asia_t = _cell(cells, "session", "asia")
+    london_pnl, london_t = _cell(cells, "session", "london")
+    ny_pnl, ny_t = _cell(cells, "session", "ny")
     return {"Symbol": symbol, "Asia": asia_pnl, "London": london_pnl, "NY": ny_pnl,
             "Asia_T": asia_t, "London_T": london_t, "NY_T": ny_t}
 
@@ -216,7 +275,8 @@ def _load_symbol_data(pl: SymbolPayloads, s_dir: Path, directive_name: str) -> N
                 })
             pl.all_trades_dfs.append(tdf)
 
-    edges = _collect_vol_trend_edges(tdf)
+    cells = _collect_trade_cells(tdf)
+    edges = _collect_vol_trend_edges(tdf, cells)
     avg_r = edges["avg_r"]
 
     if has_stage3:
@@ -288,24 +348,25 @@ def _load_symbol_data(pl: SymbolPayloads, s_dir: Path, directive_name: str) -> N
                           "Neutral_T": edges["neu_t"], "WeakDn_T": edges["w_dn_t"],
                           "StrongDn_T": edges["s_dn_t"]})
 
-    age_entry = _collect_age_entry(symbol, tdf)
+    records = _trade_records(tdf) if tdf is not None and len(tdf) > 0 else None
+    age_entry = _collect_age_entry(symbol, tdf, records)
     if age_entry is not None:
         pl.age_data.append(age_entry)
 
-    dual = _collect_dual_age(symbol, tdf)
+    dual = _collect_dual_age(symbol, tdf, records)
     if dual is not None:
         fill_entry, delta_entry, meta_entry = dual
         pl.fill_age_data.append(fill_entry)
         pl.delta_age_data.append(delta_entry)
         pl.dual_meta_data.append(meta_entry)
 
-    exec_out = _collect_exec_delta(symbol, tdf)
+    exec_out = _collect_exec_delta(symbol, tdf, records)
     if exec_out is not None:
         exec_entry, exec_meta = exec_out
         pl.exec_delta_data.append(exec_entry)
         pl.exec_meta_data.append(exec_meta)
 
-    pl.session_data.append(_collect_session_row(symbol, tdf))
+    pl.session_data.append(_collect_session_row(symbol, tdf, cells))
 
     if has_stage1 and pl.start_date == "YYYY-MM-DD":
         if tdf is not None and len(tdf) > 0 and 'entry_timestamp' in tdf.columns:
@@ -313,14 +374,52 @@ def _load_symbol_data(pl: SymbolPayloads, s_dir: Path, directive_name: str) -> N
             pl.end_date = str(tdf['exit_timestamp'].max())[:10]
 
 
-def _collect_symbol_payloads(symbol_dirs, directive_name: str) -> SymbolPayloads:
-    """Walk each symbol dir and accumulate per-symbol payloads."""
+def _collect_symbol_payloads(symbol_dirs, directive_name: str,
+                             max_workers: int | None = None) -> SymbolPayloads:
+    """Load each symbol dir (concurrently) and accumulate per-symbol payloads.
+
+    Every symbol is loaded into its own SymbolPayloads on a thread pool;
+    the parts are merged in ``symbol_dirs`` order, so the result matches
+    a sequential walk exactly.
+    """
+    symbol_dirs = list(symbol_dirs)
+    if max_workers is None:
+        max_workers = min(_MAX_LOAD_WORKERS, (os.cpu_count() or 1) + 4)
+    max_workers = max(1, min(max_workers, len(symbol_dirs)))
+
+    def load(s_dir):
+        part = SymbolPayloads(timeframe=None)
+        _load_symbol_data(part, s_dir, directive_name)
+        return part
+
+    if max_workers == 1:
+        parts = [load(s_dir) for s_dir in symbol_dirs]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(load, symbol_dirs))
+
     pl = SymbolPayloads()
-    for s_dir in symbol_dirs:
-        _load_symbol_data(pl, s_dir, directive_name)
+    for part in parts:
+        _merge_symbol_payloads(pl, part)
     return pl
 
 
+def _merge_symbol_payloads(pl: SymbolPayloads, part: SymbolPayloads) -> None:
+    """Fold one symbol's payloads into *pl* the way a sequential load would."""
+    for f in fields(SymbolPayloads):
+        if f.default_factory is list:
+            getattr(pl, f.name).extend(getattr(part, f.name))
+    if part.timeframe is not None:
+        pl.timeframe = part.timeframe
+    if pl.start_date == "YYYY-MM-DD" and part.start_date != "YYYY-MM-DD":
+        pl.start_date, pl.end_date = part.start_date, part.end_date
+    pl.global_has_stage3 = pl.global_has_stage3 or part.global_has_stage3
+    pl.portfolio_pnl += part.portfolio_pnl
+    pl.portfolio_trades += part.portfolio_trades
+    pl.portfolio_gross_profit += part.portfolio_gross_profit
+    pl.portfolio_gross_loss += part.portfolio_gross_loss
+
+
 def _compute_portfolio_totals(pl: SymbolPayloads) -> dict:
     """Portfolio-level aggregates (trade-weighted averages + worst-case DD)."""
     totals = {
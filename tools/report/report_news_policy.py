@@ -12,6 +12,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from tools.news_calendar import build_window_index
+
 
 # Minimum trade count for optional scenarios (No-Entry / Go-Flat).
 _NEWS_MIN_TRADES = 10
@@ -59,6 +61,11 @@ def _get_price_at(ohlc_df, target_dt):
     """Return close of the last OHLC bar at or before *target_dt*, or None."""
     if ohlc_df is None or len(ohlc_df) == 0:
         return None
+    if ohlc_df.index.is_monotonic_increasing:
+        pos = ohlc_df.index.searchsorted(target_dt, side='right')
+        if pos == 0:
+            return None
+        return float(ohlc_df['close'].iloc[pos - 1])
     mask = ohlc_df.index <= target_dt
     if not mask.any():
         return None
@@ -77,13 +84,14 @@ def _news_pf(series):
 def _classify_all_trades_news(df, windows_by_currency, symbol_currencies):
     """Classify every trade's relationship to news windows.
 
-    For each symbol, collects all relevant currency windows, then uses
-    vectorised numpy comparisons per trade for speed.
+    For each symbol, the windows of its currencies are indexed once
+    (tools.news_calendar.build_window_index, cached per calendar and
+    currency set) and all of the symbol's trades are classified in one
+    vectorised searchsorted pass.
 
     Returns four Series aligned to *df.index*:
       news_flag, entry_in_window, straddles, earliest_window_start
     """
-    n = len(df)
     news_flag = pd.Series(False, index=df.index)
     entry_in_window = pd.Series(False, index=df.index)
     straddles = pd.Series(False, index=df.index)
@@ -92,50 +100,18 @@ def _classify_all_trades_news(df, windows_by_currency, symbol_currencies):
     for sym in df['symbol'].dropna().unique():
         sym_str = str(sym)
         ccys = symbol_currencies.get(sym_str, ['USD'])
-
-        # Collect all windows for this symbol's currencies, deduplicate
-        pairs_set: set = set()
-        for ccy in ccys:
-            wdf = windows_by_currency.get(ccy)
-            if wdf is not None and len(wdf) > 0:
-                for ws, we in zip(wdf['window_start'], wdf['window_end']):
-                    pairs_set.add((ws, we))
-
-        if not pairs_set:
+        index = build_window_index(windows_by_currency, ccys)
+        if len(index) == 0:
             continue
 
-        pairs = sorted(pairs_set, key=lambda x: x[0])
-        ws_arr = pd.DatetimeIndex([p[0] for p in pairs])
-        we_arr = pd.DatetimeIndex([p[1] for p in pairs])
-        # Ensure tz-aware (UTC) for comparison with trade timestamps
-        if ws_arr.tz is None:
-            ws_arr = ws_arr.tz_localize('UTC')
-            we_arr = we_arr.tz_localize('UTC')
-
-        sym_mask = df['symbol'] == sym
-        sym_df = df.loc[sym_mask]
-
-        for idx in sym_df.index:
-            entry = df.at[idx, '_entry_dt']
-            exit_ = df.at[idx, '_exit_dt']
-
-            # Vectorised overlap: entry <= window_end AND exit > window_start
-            overlap = (entry <= we_arr) & (exit_ > ws_arr)
-            if not overlap.any():
-                continue
-
-            news_flag.at[idx] = True
-
-            # Entry in window: window_start <= entry <= window_end
-            eiw = (ws_arr <= entry) & (entry <= we_arr)
-            if eiw.any():
-                entry_in_window.at[idx] = True
-
-            # Straddle: entry < window_start < exit
-            strad = (entry < ws_arr) & (exit_ > ws_arr)
-            if strad.any():
-                straddles.at[idx] = True
-                earliest_ws.at[idx] = ws_arr[strad].min()
+        sym_idx = df.index[df['symbol'] == sym]
+        nf, eiw, strad, ews = index.classify_trades(
+            df.loc[sym_idx, '_entry_dt'], df.loc[sym_idx, '_exit_dt']
+        )
+        news_flag.loc[sym_idx] = nf
+        entry_in_window.loc[sym_idx] = eiw
+        straddles.loc[sym_idx] = strad
+        earliest_ws.loc[sym_idx] = ews
 
     return news_flag, entry_in_window, straddles, earliest_ws
 
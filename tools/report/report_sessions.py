@@ -6,6 +6,9 @@ the classification boundaries (UTC hour ranges) in one place.
 
 from __future__ import annotations
 
+import warnings
+
+import numpy as np
 import pandas as pd
 
 
@@ -37,6 +40,42 @@ def _classify_session(ts) -> str:
         return "ny"
 
 
+def _classify_sessions(entry_ts: pd.Series) -> pd.Series:
+    """Vectorized `_classify_session` over a column — same label per row.
+
+    ISO timestamp strings (and datetime columns) are parsed in one pass;
+    anything that pass cannot handle (mixed UTC offsets, other formats)
+    falls back to the scalar classifier row by row.
+    """
+    parsed = None
+    if pd.api.types.is_datetime64_any_dtype(entry_ts.dtype):
+        parsed = entry_ts
+    elif entry_ts.dtype == object or pd.api.types.is_string_dtype(entry_ts.dtype):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                parsed = pd.to_datetime(entry_ts, errors="coerce", format="ISO8601")
+        except (ValueError, TypeError, OverflowError):
+            parsed = None
+        if parsed is not None and not pd.api.types.is_datetime64_any_dtype(parsed.dtype):
+            parsed = None
+    if parsed is None:
+        return entry_ts.map(_classify_session)
+
+    hour = parsed.dt.hour.to_numpy()
+    labels = np.select(
+        [(hour >= _ASIA_START) & (hour < _ASIA_END),
+         (hour >= _LONDON_START) & (hour < _LONDON_END)],
+        ["asia", "london"], "ny",
+    ).astype(object)
+    unparsed = parsed.isna().to_numpy()
+    labels[unparsed] = "unknown"
+    retry = unparsed & entry_ts.notna().to_numpy()
+    if retry.any():
+        labels[retry] = entry_ts[retry].map(_classify_session).to_numpy()
+    return pd.Series(labels, index=entry_ts.index)
+
+
 def _is_overlap(ts) -> bool:
     """True if entry_timestamp falls in London-NY overlap (13:00-15:59 UTC)."""
     if pd.isna(ts):
@@ -1 +1,7 @@
-from tools.utils.research.drawdown import identify_dd_clusters, analyze_dd_exposure, analyze_dd_trade_behavior
+from tools.utils.research.drawdown import (
+    identify_dd_clusters,
+    find_dd_episodes,
+    analyze_dd_exposure,
+    analyze_dd_trade_behavior,
+    analyze_dd_episodes,
+)
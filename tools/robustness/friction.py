@@ -1,6 +1,7 @@
 from tools.utils.research.friction import (
     apply_friction,
     run_friction_scenarios,
+    run_friction_sweep,
     run_tiered_friction,
     get_tier_costs,
     reset_config_cache,
@@ -1 +1,3 @@
-from tools.utils.research.rolling import rolling_window, classify_stability
+from tools.utils.research.rolling import (
+    rolling_window, rolling_window_grid, classify_stability, DEFAULT_WINDOW_GRID
+)
@@ -184,10 +184,10 @@ def run_robustness_suite(
 
     # Section 5/6: Drawdown
     clusters = drawdown.identify_dd_clusters(eq_df, top_n=3)
+    anatomy = drawdown.analyze_dd_episodes(tr_df, clusters)
     dd_results = []
-    for c in clusters:
-        exp = drawdown.analyze_dd_exposure(tr_df, c)
-        beh = drawdown.analyze_dd_trade_behavior(tr_df, c)
+    for c, a in zip(clusters, anatomy):
+        exp, beh = a["exposure"], a["behavior"]
         dd_results.append({
             "start_date": c.get("start_date"),
             "trough_date": c.get("trough_date"),
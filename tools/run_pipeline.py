@@ -1883,11 +1883,8 @@ def _batch_discover_and_admit(provision_only: bool):
 
     # --- ACTIVE Bypass Guard ---
     try:
-        from tools.sweep_registry_gate import (
-            _load_yaml, SWEEP_REGISTRY_PATH, get_all_allocated_names,
-        )
-        registry_data = _load_yaml(SWEEP_REGISTRY_PATH)
-        allocated_names = get_all_allocated_names(registry_data)
+        from tools.sweep_registry_gate import load_allocated_names
+        allocated_names = load_allocated_names()
         for d_path in directives:
             if d_path.stem not in allocated_names:
                 print(f"DIRECTIVE_NOT_ADMITTED | directive={d_path.name}")
@@ -2167,7 +2164,7 @@ def normalize_directive_arg(arg: str) -> str:
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python tools/run_pipeline.py <DIRECTIVE_ID> | --all [--max-parallel N] [--provision-only] [--refresh]")
+        print("Usage: python tools/run_pipeline.py <DIRECTIVE_ID> | --all [--max-parallel N] [--provision-only] [--refresh] [--sweep-in-process]")
         sys.exit(1)
 
     arg = sys.argv[1]
@@ -2176,6 +2173,12 @@ def main():
     # pilot). Single-directive only; set by tools/refresh_cointegration.py.
     refresh = "--refresh" in sys.argv[2:]
     max_parallel = _parse_max_parallel(sys.argv[2:])
+    # --sweep-in-process: run Stage-1 jobs inside the pipeline worker instead
+    # of one run_stage1.py subprocess each, so sweep variants sharing a
+    # (symbol, timeframe, window) load the data and compute the regime frame
+    # once. Env var so --max-parallel workers inherit it.
+    if "--sweep-in-process" in sys.argv[2:]:
+        os.environ["TS_STAGE1_IN_PROCESS"] = "1"
 
     try:
         initialize_state_directories()
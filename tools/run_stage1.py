@@ -7,6 +7,7 @@ NO METRICS COMPUTATION
 NO STAGE-2 OR STAGE-3
 """
 
+import io
 import sys
 import uuid
 import json
@@ -14,6 +15,7 @@ import hashlib
 import csv
 import traceback
 import re
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 import subprocess
@@ -29,6 +31,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from tools.pipeline_utils import PipelineStateManager, generate_run_id, parse_directive, get_engine_version
 from engines.regime_state_machine import apply_regime_model
 from config.state_paths import RUNS_DIR, BACKTESTS_DIR
+from data_access.readers.columnar_ohlc_store import open_store
 
 # --- REGIME TIMEFRAME MAP (v1.5.4) ---
 _REGIME_TF_MAP_PATH = PROJECT_ROOT / "config" / "regime_timeframe_map.yaml"
@@ -79,6 +82,55 @@ END_DATE = "2026-01-31"
 RESOLVED_WARMUP_BARS = 250
 
 
+# Import-time defaults of the per-run globals above. Restored before each
+# in-process run (execute_stage1_in_process) so a variant never inherits the
+# previous variant's directive values — a subprocess run starts from these.
+_RUN_GLOBAL_DEFAULTS = {
+    "DIRECTIVE_FILENAME": DIRECTIVE_FILENAME,
+    "BROKER": BROKER,
+    "TIMEFRAME": TIMEFRAME,
+    "START_DATE": START_DATE,
+    "END_DATE": END_DATE,
+    "RESOLVED_WARMUP_BARS": RESOLVED_WARMUP_BARS,
+}
+
+# --- SHARED PREPROCESSING CACHE (in-process sweep execution) ---
+# A subprocess Stage-1 run executes one (directive, symbol) and exits, so these
+# caches are single-use there. Under in-process execution
+# (TS_STAGE1_IN_PROCESS=1, see execute_stage1_in_process) one worker runs every
+# sweep variant back-to-back. Variants share (symbol, timeframe, window), so the
+# RESEARCH CSV parse and the HTF regime frame are computed once and each variant
+# receives a private copy (callers mutate their frames in place). Bounded LRU so
+# a long multi-symbol batch cannot grow without limit.
+_SHARED_CACHE_MAX_ENTRIES = 8
+_RAW_MARKET_DATA_CACHE = OrderedDict()   # (data_root, tf) -> full parsed history
+_REGIME_FRAME_CACHE = OrderedDict()      # (symbol, broker, tf, window, warmup) -> regime df
+_CONVERSION_DF_CACHE = OrderedDict()     # (pair, broker, window, warmup) -> 1d close frame
+
+
+def _shared_cache_get(cache: OrderedDict, key):
+    """Return the cached frame for key (refreshing its LRU slot), or None."""
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _shared_cache_put(cache: OrderedDict, key, value) -> None:
+    """Insert value under key, evicting the least-recently-used entry."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _SHARED_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def clear_shared_preprocessing_cache() -> None:
+    """Drop every shared market-data, regime and conversion frame."""
+    _RAW_MARKET_DATA_CACHE.clear()
+    _REGIME_FRAME_CACHE.clear()
+    _CONVERSION_DF_CACHE.clear()
+
+
 # --- PnL NORMALIZATION LOGIC ---
 
 # Module-level cache for Close prices: (symbol, date_str) -> close_price
@@ -125,14 +177,16 @@ def parse_symbol_properties(symbol: str):
     else:
         return s, None
 
-# Global DF Cache for conversion pairs: symbol -> DF
-_CONVERSION_DF_CACHE = {}
-
 def get_conversion_price_at_time(target_pair: str, timestamp: pd.Timestamp) -> float:
     """
     Fetch price from cached dataframe.
     """
-    if target_pair not in _CONVERSION_DF_CACHE:
+    # Keyed by the run window as well as the pair: load_market_data slices to
+    # START_DATE/END_DATE, and an in-process worker runs variants whose windows
+    # may differ.
+    cache_key = (target_pair, BROKER, START_DATE, END_DATE, RESOLVED_WARMUP_BARS)
+    df = _shared_cache_get(_CONVERSION_DF_CACHE, cache_key)
+    if df is None:
         try:
             # Re-use load_market_data but we need to ensure global Start/End dates cover it.
             # We will use the global START_DATE/END_DATE.
@@ -145,12 +199,10 @@ def get_conversion_price_at_time(target_pair: str, timestamp: pd.Timestamp) -> f
             df.set_index('timestamp', inplace=True)
             df.sort_index(inplace=True)
             
-            _CONVERSION_DF_CACHE[target_pair] = df
+            _shared_cache_put(_CONVERSION_DF_CACHE, cache_key, df)
         except Exception as e:
             # Allow failure if file doesn't exist, caller handles retry logic
             raise ValueError(f"Failed to load conversion pair {target_pair}: {e}")
-            
-    df = _CONVERSION_DF_CACHE[target_pair]
     
     # As-of lookup (nearest previous close)
     try:
@@ -225,6 +277,48 @@ def normalize_pnl_to_usd(raw_pnl_quote: float,
 # get_canonical_hash imported from pipeline_utils (indirectly used via generate_run_id)
 
 
+def _load_raw_from_columnar_store(data_root: Path, pattern: str):
+    """Full parsed history from the memory-mapped columnar store
+    (TS_COLUMNAR_OHLC=1), identical to the CSV path below; None -> parse CSVs.
+    Used when the store's rows are not already in time order.
+
+    The string `time` column keeps its de-dup / sort role; only the slow
+    mixed-format datetime parse is replaced by the store's pre-parsed column.
+    """
+    store = open_store(data_root, pattern)
+    if store is None or not store.has_time('utc'):
+        return None
+    raw = store.frame()
+    raw['timestamp'] = raw['time']
+    raw = raw.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
+    parsed = store.time_values('utc')[raw.index.to_numpy()]
+    raw = raw.reset_index(drop=True)
+    raw['timestamp'] = parsed
+    return raw
+
+
+def _load_window_from_columnar_store(data_root: Path, pattern: str, warmup_bars: int):
+    """(frame, warm_up_applied) for the run window only, or None.
+
+    When the store's rows are already de-duplicated and in time order (the
+    usual case) the warm-up / END_DATE bounds below are binary searches on
+    the store's UTC column, so only the window is decoded — the result is
+    what load_market_data() slices out of the full history.
+    """
+    store = open_store(data_root, pattern)
+    if store is None or not store.has_time('utc') or not store.time_text_increasing:
+        return None
+    window = store.rows_between('utc', START_DATE, END_DATE)
+    if window is None:
+        return None
+    warm_up = window.start < store.nrows
+    begin = max(0, window.start - warmup_bars) if warm_up else 0
+    rows = slice(begin, max(begin, window.stop))
+    df = store.frame(rows)
+    df['timestamp'] = store.time_values('utc', rows)
+    return df.reset_index(drop=True), warm_up
+
+
 def load_market_data(symbol: str, tf_override: str = None) -> pd.DataFrame:
     """Load Daily data from MASTER_DATA for efficient batching."""
     # Dynamic path construction
@@ -233,22 +327,41 @@ def load_market_data(symbol: str, tf_override: str = None) -> pd.DataFrame:
     
     # Use override or global TIMEFRAME
     tf = tf_override if tf_override else TIMEFRAME
-    
-    # Files are split by year. Pattern: SYMBOL_BROKER_TIMEFRAME_YYYY_RESEARCH.csv
-    pattern = f"{symbol}_{BROKER.upper()}_{tf}_*_RESEARCH.csv"
-    files = sorted(data_root.glob(pattern))
-    
-    if not files:
-        raise FileNotFoundError(f"No RESEARCH market data found for {symbol} / {BROKER} / {TIMEFRAME} in {data_root}")
-    
-    dfs = [pd.read_csv(f, comment='#') for f in files]
-    df = pd.concat(dfs, ignore_index=True)
-    
-    if 'time' in df.columns:
-        df['timestamp'] = df['time']
-    
-    df = df.drop_duplicates(subset=['timestamp']).sort_values('timestamp').reset_index(drop=True)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], dayfirst=True, format='mixed', utc=True)
+
+    # The parsed full history is window-independent; only the warm-up/end
+    # slicing below depends on the run globals, so the parse is shared.
+    # An in-order columnar store skips it and decodes just the window.
+    raw_key = (str(data_root), tf)
+    raw = _shared_cache_get(_RAW_MARKET_DATA_CACHE, raw_key)
+    if raw is None:
+        # Files are split by year. Pattern: SYMBOL_BROKER_TIMEFRAME_YYYY_RESEARCH.csv
+        pattern = f"{symbol}_{BROKER.upper()}_{tf}_*_RESEARCH.csv"
+        files = sorted(data_root.glob(pattern))
+
+        if not files:
+            raise FileNotFoundError(f"No RESEARCH market data found for {symbol} / {BROKER} / {TIMEFRAME} in {data_root}")
+
+        window = _load_window_from_columnar_store(data_root, pattern, RESOLVED_WARMUP_BARS)
+        if window is not None:
+            df, warm_up = window
+            if warm_up:
+                print(f"[DATA] {symbol}: Warm-up extension: {RESOLVED_WARMUP_BARS} bars before {START_DATE}")
+            print(f"[DATA] {symbol}: Loaded {len(df)} bars")
+            return df
+
+        raw = _load_raw_from_columnar_store(data_root, pattern)
+        if raw is None:
+            dfs = [pd.read_csv(f, comment='#') for f in files]
+            raw = pd.concat(dfs, ignore_index=True)
+
+            if 'time' in raw.columns:
+                raw['timestamp'] = raw['time']
+
+            raw = raw.drop_duplicates(subset=['timestamp']).sort_values('timestamp').reset_index(drop=True)
+            raw['timestamp'] = pd.to_datetime(raw['timestamp'], dayfirst=True, format='mixed', utc=True)
+        _shared_cache_put(_RAW_MARKET_DATA_CACHE, raw_key, raw)
+
+    df = raw.copy()
     
     # --- WARM-UP EXTENSION PROVISION ---
     # Extends the data window backward from START_DATE by the per-strategy
@@ -1165,11 +1278,14 @@ def emit_result(trades, df, broker_spec, symbol, run_id, content_hash, lineage_s
 # ────────────────────────────────────────────────────────────────────────
 
 
-def _stage1_parse_args_and_load_directive():
+def _stage1_parse_args_and_load_directive(args=None):
     """Phase A — parse CLI args, locate the admitted directive in
     active_backup/, parse it, and set the BROKER/TIMEFRAME/START_DATE/
     END_DATE/DIRECTIVE_FILENAME module globals from the directive's content.
 
+    `args` is supplied (directive / symbol / run_id namespace) by the
+    in-process path; argparse reads sys.argv only when it is None.
+
     Returns (parsed_config, directive_content, directive_path, args), or
     None for the two early-FATAL paths (directive not found in either
     `<stem>.txt` or exact-name form). The caller short-circuits to `return`
@@ -1177,12 +1293,13 @@ def _stage1_parse_args_and_load_directive():
     semantics)."""
     global DIRECTIVE_FILENAME, BROKER, TIMEFRAME, START_DATE, END_DATE
 
-    import argparse
-    parser = argparse.ArgumentParser(description="Stage-1 Execution Harness")
-    parser.add_argument("directive", help="Directive ID (e.g. IDX28)")
-    parser.add_argument("--symbol", required=True, help="Target Symbol")
-    parser.add_argument("--run_id", required=True, help="Deterministic Run ID")
-    args = parser.parse_args()
+    if args is None:
+        import argparse
+        parser = argparse.ArgumentParser(description="Stage-1 Execution Harness")
+        parser.add_argument("directive", help="Directive ID (e.g. IDX28)")
+        parser.add_argument("--symbol", required=True, help="Target Symbol")
+        parser.add_argument("--run_id", required=True, help="Deterministic Run ID")
+        args = parser.parse_args()
 
     active_dir = PROJECT_ROOT / "backtest_directives" / "active_backup"
 
@@ -1328,6 +1445,12 @@ def _stage1_compute_regime_dataframe(target_symbol):
     files exist), and applies the regime state machine. Returns the
     regime DataFrame indexed by timestamp."""
     regime_tf, resample_freq = resolve_regime_config(TIMEFRAME)
+    regime_key = (str(PROJECT_ROOT), target_symbol, BROKER, regime_tf, resample_freq,
+                  START_DATE, END_DATE, RESOLVED_WARMUP_BARS)
+    cached = _shared_cache_get(_REGIME_FRAME_CACHE, regime_key)
+    if cached is not None:
+        print(f"    [HTF] Reusing {regime_tf.upper()} regime frame for {target_symbol} (shared preprocessing)")
+        return cached.copy()
     print(f"    [HTF] Computing regime on {regime_tf.upper()} grid for {target_symbol} (resample->{resample_freq})...")
 
     # Weekly regime: no 1W data files exist — resample from daily
@@ -1354,7 +1477,8 @@ def _stage1_compute_regime_dataframe(target_symbol):
     # Apply regime model on the regime-TF data
     df_regime = apply_regime_model(df_regime, resample_freq=resample_freq,
                                    symbol_hint=target_symbol)
-    return df_regime
+    _shared_cache_put(_REGIME_FRAME_CACHE, regime_key, df_regime)
+    return df_regime.copy()
 
 
 def _stage1_load_market_data_and_snapshot(target_symbol, strategy_id, run_id, directive_path):
@@ -1738,6 +1862,78 @@ def _stage1_write_summary_and_reports(target_symbol, run_id, status, net_pnl,
 
 
 def main():
+    """CLI entry point — one (directive, symbol, run_id) per process.
+
+    Exits 1 when the run is FAILED; the early-FATAL paths return normally
+    (the orchestrator detects the missing data dir as a silent failure)."""
+    status = run_stage1()
+    if status == "FAILED":
+        sys.exit(1)
+
+
+def execute_stage1_in_process(directive_id: str, symbol: str, run_id: str):
+    """Run one Stage-1 job inside the calling process (sweep execution mode).
+
+    Same phases, artifacts and run_state writes as the `tools/run_stage1.py`
+    subprocess the backtest_execution skill launches; the difference is that
+    the shared preprocessing caches (parsed RESEARCH history, HTF regime
+    frame, conversion closes) survive between calls, so a worker running N
+    sweep variants over one (symbol, timeframe, window) pays for the data load
+    and apply_regime_model once instead of N times.
+
+    Module globals are reset to their import-time defaults first so a variant
+    never inherits the previous variant's directive values.
+
+    Output is teed so the same crash bundle / failure log the subprocess path
+    gets from skill_loader.report_worker_result is written here too, with the
+    exit code `main` would have produced (1 on FAILED or an uncaught error).
+
+    Returns the run status ("SUCCESS" / "NO_TRADES" / "FAILED"), or None for
+    the early-FATAL paths (directive or symbol not found, warmup guard)."""
+    import argparse
+    import contextlib
+    from tools.skill_loader import report_worker_result
+
+    globals().update(_RUN_GLOBAL_DEFAULTS)
+    args = argparse.Namespace(directive=directive_id, symbol=symbol, run_id=run_id)
+    out, err = _TeeStream(sys.stdout), _TeeStream(sys.stderr)
+    returncode = 1
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                status = run_stage1(args)
+            except BaseException:
+                traceback.print_exc()
+                raise
+        returncode = 1 if status == "FAILED" else 0
+        return status
+    finally:
+        report_worker_result(
+            strategy=directive_id,
+            run_id=run_id,
+            command=f"in-process: execute_stage1_in_process({directive_id!r}, {symbol!r}, {run_id!r})",
+            returncode=returncode,
+            stdout=out.getvalue(),
+            stderr=err.getvalue(),
+        )
+
+
+class _TeeStream(io.StringIO):
+    """Captures everything written while still forwarding it to *stream*."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def write(self, text):
+        self._stream.write(text)
+        return super().write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def run_stage1(args=None):
     """Stage-1 Atomic Execution Harness — slim orchestrator (2026-06-01
     decomposition, Backlog Item 3/4).
 
@@ -1754,7 +1950,8 @@ def main():
 
     Behavior preserved byte-equivalent: same print order, same FATAL/return
     semantics, same try/except + try/finally boundaries, same global
-    mutations, same exit code (sys.exit(1) on FAILED)."""
+    mutations. Returns the run status (None on the early-FATAL paths); the
+    caller owns the exit code (main: sys.exit(1) on FAILED)."""
     print("=" * 60)
     print("MULTI-ASSET BATCH EXECUTION HARNESS (v5 - State Gated)")
     print("=" * 60)
@@ -1765,8 +1962,14 @@ def main():
         print(f"[FATAL] Indicators repository missing at {indicators_root}")
         return
 
+    # Opt-in indicator memoization (TS_INDICATOR_CACHE=memory|disk). Installed
+    # before Phase B imports the strategy, which binds indicator names.
+    from engines.indicator_cache import install_indicator_cache, cache_mode
+    if install_indicator_cache():
+        print(f"[INIT] Indicator memoization active (tier={cache_mode()})")
+
     # Phase A — argparse + directive load + globals
-    args_bundle = _stage1_parse_args_and_load_directive()
+    args_bundle = _stage1_parse_args_and_load_directive(args)
     if args_bundle is None:
         return
     parsed_config, directive_content, directive_path, args = args_bundle
@@ -1852,9 +2055,7 @@ def main():
         target_symbol, run_id, status, net_pnl, error_msg,
         summary_csv_ui, strategy_id,
     )
-
-    if status == "FAILED":
-        sys.exit(1)
+    return status
 
 if __name__ == "__main__":
     main()
@@ -27,6 +27,56 @@ def discover_skills():
     return skills
 
 
+def report_worker_result(strategy, run_id, command, returncode, stdout, stderr):
+    """Crash diagnostics for one Stage-1 worker, however it was executed.
+
+    Shared by the subprocess path (run_skill) and the in-process sweep path
+    (run_stage1.execute_stage1_in_process) so both leave the same trail.
+    """
+    # Anti-masking diagnostics: persist a self-contained crash bundle whenever the
+    # worker looks failed OR empty -- non-zero exit, OR (for a run_id run) no run dir
+    # / no data dir / no trade log. Previously only a non-zero exit wrote a crash log,
+    # so an exit-0-but-empty worker (the governed NO_TRADES false-negative) left no
+    # trace at all. Bundle = crash_trace.log + worker_stdout/stderr/command.txt so the
+    # next failure is self-contained without re-running.
+    if run_id:
+        from config.state_paths import RUNS_DIR
+        run_dir = RUNS_DIR / str(run_id)
+        data_dir = run_dir / "data"
+        trade_log = data_dir / "results_tradelevel.csv"
+        failed_or_empty = (
+            returncode != 0
+            or not run_dir.exists()
+            or not data_dir.exists()
+            or not trade_log.exists()
+        )
+        if failed_or_empty and run_dir.exists():
+            from datetime import datetime, timezone
+            (run_dir / "worker_command.txt").write_text(command + "\n", encoding="utf-8")
+            (run_dir / "worker_stdout.log").write_text(stdout or "", encoding="utf-8")
+            (run_dir / "worker_stderr.log").write_text(stderr or "", encoding="utf-8")
+            with open(run_dir / "crash_trace.log", "w", encoding="utf-8") as f:
+                f.write(f"[{datetime.now(timezone.utc).isoformat()}] WORKER FAILED-OR-EMPTY\n")
+                f.write(f"Command: {command}\n")
+                f.write(f"Exit Code: {returncode}\n")
+                f.write(f"run_dir={run_dir.exists()} data_dir={data_dir.exists()} "
+                        f"trade_log={trade_log.exists()}\n")
+                f.write("-" * 80 + "\nSTDOUT:\n" + (stdout or "") + "\n")
+                f.write("-" * 80 + "\nSTDERR:\n" + (stderr or "") + "\n")
+            print(f"[DIAG] Worker failed-or-empty for run {run_id} -- self-contained "
+                  f"diagnostics in {run_dir} (crash_trace.log + worker_stdout/stderr/command).")
+
+    # Centralized failure log
+    if returncode != 0 and _log_failure:
+        _log_failure(
+            directive_id=str(strategy or "UNKNOWN"),
+            run_id=str(run_id) if run_id else None,
+            stage="SYMBOL_EXECUTION",
+            error_type="ENGINE_CRASH",
+            message=f"Exit code {returncode}: {(stderr or stdout or '').strip()[:300]}",
+        )
+
+
 def run_skill(skill_name, **kwargs):
     skills = discover_skills()
 
@@ -70,53 +120,17 @@ def run_skill(skill_name, **kwargs):
         if result.stdout:
             sys.stdout.write(result.stdout)
             
-        # Anti-masking diagnostics: persist a self-contained crash bundle whenever the
-        # worker looks failed OR empty -- non-zero exit, OR (for a run_id run) no run dir
-        # / no data dir / no trade log. Previously only a non-zero exit wrote a crash log,
-        # so an exit-0-but-empty worker (the governed NO_TRADES false-negative) left no
-        # trace at all. Bundle = crash_trace.log + worker_stdout/stderr/command.txt so the
-        # next failure is self-contained without re-running.
-        _rid = kwargs.get("run_id")
-        if _rid:
-            from config.state_paths import RUNS_DIR
-            run_dir = RUNS_DIR / str(_rid)
-            data_dir = run_dir / "data"
-            trade_log = data_dir / "results_tradelevel.csv"
-            failed_or_empty = (
-                result.returncode != 0
-                or not run_dir.exists()
-                or not data_dir.exists()
-                or not trade_log.exists()
-            )
-            if failed_or_empty and run_dir.exists():
-                from datetime import datetime, timezone
-                cmd_str = " ".join(cmd)
-                (run_dir / "worker_command.txt").write_text(cmd_str + "\n", encoding="utf-8")
-                (run_dir / "worker_stdout.log").write_text(result.stdout or "", encoding="utf-8")
-                (run_dir / "worker_stderr.log").write_text(result.stderr or "", encoding="utf-8")
-                with open(run_dir / "crash_trace.log", "w", encoding="utf-8") as f:
-                    f.write(f"[{datetime.now(timezone.utc).isoformat()}] WORKER FAILED-OR-EMPTY\n")
-                    f.write(f"Command: {cmd_str}\n")
-                    f.write(f"Exit Code: {result.returncode}\n")
-                    f.write(f"run_dir={run_dir.exists()} data_dir={data_dir.exists()} "
-                            f"trade_log={trade_log.exists()}\n")
-                    f.write("-" * 80 + "\nSTDOUT:\n" + (result.stdout or "") + "\n")
-                    f.write("-" * 80 + "\nSTDERR:\n" + (result.stderr or "") + "\n")
-                print(f"[DIAG] Worker failed-or-empty for run {_rid} -- self-contained "
-                      f"diagnostics in {run_dir} (crash_trace.log + worker_stdout/stderr/command).")
+        report_worker_result(
+            strategy=kwargs.get("strategy"),
+            run_id=kwargs.get("run_id"),
+            command=" ".join(cmd),
+            returncode=result.returncode,
+            stdout=result.stdout,
+            stderr=result.stderr,
+        )
 
         if result.returncode != 0:
 
-            # Centralized failure log
-            if _log_failure:
-                _log_failure(
-                    directive_id=str(kwargs.get("strategy", "UNKNOWN")),
-                    run_id=str(kwargs.get("run_id")) if kwargs.get("run_id") else None,
-                    stage="SYMBOL_EXECUTION",
-                    error_type="ENGINE_CRASH",
-                    message=f"Exit code {result.returncode}: {(result.stderr or result.stdout or '').strip()[:300]}",
-                )
-
             # Print stderr to console so it's still visible
             if result.stderr:
                 sys.stderr.write(result.stderr)
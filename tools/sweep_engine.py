@@ -144,6 +144,8 @@ def generate(spec_file):
         p += 1
 
     print(f"\nGenerated {len(combos)} directives.")
+    print("Run the variants in one worker (shared data load + regime frame):")
+    print("  python tools/run_pipeline.py --all --sweep-in-process")
 
 
 if __name__ == "__main__":
@@ -5,16 +5,30 @@ Rules:
 1. Sweep SNN must be unique per idea_id.
 2. If sweep exists, it must match same directive + same signature hash (idempotent).
 3. If sweep does not exist, reserve it atomically via gate authority.
+
+A SQLite (WAL) index next to the registry (sweep_registry.index.db) holds
+every sweep/patch entry keyed by directive name, lineage, slot and hash
+prefix, and is stamped with the SHA-256 of the YAML it mirrors.
+Already-allocated identities are resolved from it without the registry lock
+or a YAML parse. New sweep slots and patches are allocated in it too, in one
+BEGIN IMMEDIATE transaction, and written behind to sweep_registry.yaml --
+the human-reviewed export -- by whichever allocator next holds the lock, so
+concurrent admissions share one YAML rewrite. Heals, stub replacement,
+reclaims and every error path still run the locked YAML walk, which mirrors
+pending allocations first.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import sys
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -33,6 +47,7 @@ from config.status_enums import REGISTRY_RECLAIMABLE
 NAMESPACE_ROOT = PROJECT_ROOT / "governance" / "namespace"
 SWEEP_REGISTRY_PATH = NAMESPACE_ROOT / "sweep_registry.yaml"
 SWEEP_LOCK_PATH = NAMESPACE_ROOT / "sweep_registry.lock"
+SWEEP_INDEX_VERSION = 2
 
 
 class SweepRegistryError(ValueError):
@@ -133,6 +148,635 @@ def _write_yaml_atomic(path: Path, payload: dict[str, Any]) -> None:
     data = yaml.safe_dump(payload, sort_keys=False, allow_unicode=False)
     tmp_path.write_text(data, encoding="utf-8")
     os.replace(str(tmp_path), str(path))
+    if path == SWEEP_REGISTRY_PATH:
+        _refresh_sweep_index(payload)
+
+
+# ---------------------------------------------------------------------------
+# Sweep index (SQLite WAL allocation store, mirrored to sweep_registry.yaml)
+# ---------------------------------------------------------------------------
+
+_SWEEP_INDEX_TABLES = ("index_meta", "sweep_ideas", "sweep_entries")
+
+_SWEEP_INDEX_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS index_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)""",
+    """CREATE TABLE IF NOT EXISTS sweep_ideas (
+    idea_id    TEXT PRIMARY KEY,
+    next_sweep INTEGER,
+    clean      INTEGER NOT NULL
+)""",
+    """CREATE TABLE IF NOT EXISTS sweep_entries (
+    ord            INTEGER PRIMARY KEY,
+    idea_id        TEXT NOT NULL,
+    sweep          TEXT NOT NULL,
+    patch          TEXT,
+    directive_name TEXT NOT NULL,
+    match_name     TEXT NOT NULL,
+    lineage        TEXT NOT NULL,
+    stored_hash    TEXT NOT NULL,
+    hash16         TEXT NOT NULL,
+    reserved_at    TEXT,
+    pending        INTEGER NOT NULL DEFAULT 0
+)""",
+    "CREATE INDEX IF NOT EXISTS ix_sweep_entries_name ON sweep_entries(idea_id, match_name)",
+    "CREATE INDEX IF NOT EXISTS ix_sweep_entries_lineage ON sweep_entries(idea_id, lineage)",
+    "CREATE INDEX IF NOT EXISTS ix_sweep_entries_slot ON sweep_entries(idea_id, sweep, patch)",
+    "CREATE INDEX IF NOT EXISTS ix_sweep_entries_hash ON sweep_entries(hash16)",
+    "CREATE INDEX IF NOT EXISTS ix_sweep_entries_pending ON sweep_entries(pending)",
+)
+
+_PENDING_COLUMNS = "idea_id, sweep, patch, directive_name, stored_hash, reserved_at"
+
+
+def _sweep_index_path() -> Path:
+    return SWEEP_REGISTRY_PATH.with_name(SWEEP_REGISTRY_PATH.stem + ".index.db")
+
+
+@contextmanager
+def _index_write_txn(conn: sqlite3.Connection):
+    """BEGIN IMMEDIATE ... COMMIT: one writer at a time, waiters use SQLite's busy handler."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _connect_sweep_index() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(_sweep_index_path()), timeout=10.0, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SWEEP_INDEX_VERSION:
+        with _index_write_txn(conn):
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SWEEP_INDEX_VERSION:
+                for table in _SWEEP_INDEX_TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in _SWEEP_INDEX_SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {SWEEP_INDEX_VERSION}")
+    return conn
+
+
+def _sweep_index_fingerprint(source: bytes) -> str:
+    return f"v{SWEEP_INDEX_VERSION}:{hashlib.sha256(source).hexdigest()}"
+
+
+def _sweep_index_rows(registry: dict[str, Any]) -> list[tuple]:
+    """Flatten the registry in traversal order: each sweep owner, then its patches.
+
+    ``ord`` preserves that order so index lookups see entries in the same
+    sequence as the YAML walks in reserve_sweep_identity and
+    update_sweep_signature_hash. ``match_name`` is the stripped name those
+    walks compare against; ``directive_name`` is the raw string value.
+    Non-string idea keys are stored as '' (never a valid two-digit idea_id).
+    """
+    rows: list[tuple] = []
+    ideas = registry.get("ideas", {})
+    if not isinstance(ideas, dict):
+        return rows
+
+    def _row(idea_id, sweep_key, patch_key, node):
+        raw = node.get("directive_name")
+        match_name = str(node.get("directive_name", "")).strip()
+        stored = _get_stored_hash(node)
+        rows.append((
+            len(rows),
+            idea_id if isinstance(idea_id, str) else "",
+            str(sweep_key),
+            None if patch_key is None else str(patch_key),
+            raw if isinstance(raw, str) else "",
+            match_name,
+            _strip_sweep_segment(match_name),
+            stored,
+            stored[:16],
+            None,
+            0,
+        ))
+
+    for idea_id, idea_data in ideas.items():
+        if not isinstance(idea_data, dict):
+            continue
+        sweeps = idea_data.get("sweeps", idea_data.get("allocated", {}))
+        if not isinstance(sweeps, dict):
+            continue
+        for sweep_key, sweep_data in sweeps.items():
+            if not isinstance(sweep_data, dict):
+                continue
+            _row(idea_id, sweep_key, None, sweep_data)
+            patches = sweep_data.get("patches", {})
+            if isinstance(patches, dict):
+                for patch_key, patch_data in patches.items():
+                    if isinstance(patch_data, dict):
+                        _row(idea_id, sweep_key, patch_key, patch_data)
+    return rows
+
+
+def _sweep_index_ideas(registry: dict[str, Any]) -> list[tuple]:
+    """One (idea_id, next_sweep, clean) row per idea block the gate can address.
+
+    ``clean`` is 0 when the block holds anything the locked YAML walk treats
+    specially (non-mapping slots or patches, non-string keys, a next_sweep
+    that is not an integer); allocations for such ideas stay on the locked
+    path so its exact behaviour and errors are preserved.
+    """
+    out: list[tuple] = []
+    ideas = registry.get("ideas", {})
+    if not isinstance(ideas, dict):
+        return out
+    for idea_id, idea_data in ideas.items():
+        if not isinstance(idea_id, str) or not isinstance(idea_data, dict):
+            continue
+        sweeps = idea_data.get("sweeps", idea_data.get("allocated", {}))
+        if not isinstance(sweeps, dict):
+            continue
+        clean = True
+        for sweep_key, sweep_data in sweeps.items():
+            patches = sweep_data.get("patches", {}) if isinstance(sweep_data, dict) else None
+            if not isinstance(sweep_key, str) or not isinstance(patches, dict):
+                clean = False
+            elif not all(isinstance(k, str) and isinstance(v, dict) for k, v in patches.items()):
+                clean = False
+        next_sweep = idea_data.get("next_sweep")
+        if "next_sweep" in idea_data:
+            try:
+                next_sweep = int(next_sweep)
+            except (TypeError, ValueError):
+                clean, next_sweep = False, None
+        out.append((idea_id, next_sweep, int(clean)))
+    return out
+
+
+def _rebuild_sweep_index(
+    conn: sqlite3.Connection,
+    registry: dict[str, Any],
+    fingerprint: str,
+    only_if_stale: bool = False,
+) -> None:
+    """Replace the index with ``registry``, carrying over pending allocations.
+
+    A pending row (allocated in the index, not yet mirrored to the YAML) is
+    kept while its slot is still free in ``registry``; once the YAML holds
+    that slot -- mirrored, or taken by an out-of-band edit -- it is dropped.
+
+    The YAML is re-read under the write lock: when it changed since the
+    caller parsed it, the fresh bytes are indexed instead, so a slow reader
+    never overwrites a newer index with an older registry. ``only_if_stale``
+    (readers) skips the rebuild when the index already matches those bytes.
+    """
+    with _index_write_txn(conn):
+        source = SWEEP_REGISTRY_PATH.read_bytes()
+        current = _sweep_index_fingerprint(source)
+        if only_if_stale:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'source'").fetchone()
+            if row is not None and row[0] == current:
+                return
+        if current != fingerprint:
+            registry = yaml.safe_load(source.decode("utf-8")) or {}
+            if not isinstance(registry, dict):
+                raise yaml.YAMLError("sweep_registry.yaml is not a mapping")
+            fingerprint = current
+        rows = _sweep_index_rows(registry)
+        ideas = {idea_id: [next_sweep, clean] for idea_id, next_sweep, clean in _sweep_index_ideas(registry)}
+        pending = conn.execute(
+            f"SELECT {_PENDING_COLUMNS} FROM sweep_entries WHERE pending = 1 ORDER BY ord"
+        ).fetchall()
+        for table in _SWEEP_INDEX_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+        occupied = {(r[1], r[2], r[3]) for r in rows}
+        for idea_id, sweep, patch, name, stored, reserved_at in pending:
+            slot = (idea_id, sweep, patch)
+            if idea_id not in ideas or slot in occupied:
+                continue
+            if patch is not None and (idea_id, sweep, None) not in occupied:
+                continue
+            occupied.add(slot)
+            rows.append((
+                len(rows), idea_id, sweep, patch, name, name,
+                _strip_sweep_segment(name), stored, stored[:16], reserved_at, 1,
+            ))
+            if patch is None:
+                ideas[idea_id][0] = _compute_next_sweep(
+                    {s: None for (i, s, p) in occupied if i == idea_id and p is None}
+                )
+        conn.executemany("INSERT INTO sweep_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT INTO sweep_ideas VALUES (?, ?, ?)",
+            [(idea_id, *values) for idea_id, values in ideas.items()],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('source', ?)",
+            (fingerprint,),
+        )
+
+
+def _refresh_sweep_index(registry: dict[str, Any]) -> None:
+    """Re-stamp the index after a gate write. Best-effort: a stale index is
+    detected by fingerprint and rebuilt on the next read."""
+    try:
+        fingerprint = _sweep_index_fingerprint(SWEEP_REGISTRY_PATH.read_bytes())
+        conn = _connect_sweep_index()
+        try:
+            _rebuild_sweep_index(conn, registry, fingerprint)
+        finally:
+            conn.close()
+    except Exception as exc:
+        print(f"[SWEEP_INDEX] WARN: index refresh failed ({exc}); rebuilt on next read.")
+
+
+def _index_in_sync(conn: sqlite3.Connection) -> bool:
+    try:
+        fingerprint = _sweep_index_fingerprint(SWEEP_REGISTRY_PATH.read_bytes())
+    except OSError:
+        return False
+    row = conn.execute("SELECT value FROM index_meta WHERE key = 'source'").fetchone()
+    return row is not None and row[0] == fingerprint
+
+
+def _open_sweep_index() -> sqlite3.Connection | None:
+    """Return a connection to an index that matches sweep_registry.yaml on disk.
+
+    Rebuilds the index when the YAML was changed outside the gate (manual
+    edits, other writers). Returns None when the registry is missing or not
+    a valid mapping -- callers then fall back to the locked YAML path, which
+    raises the canonical error.
+    """
+    try:
+        source = SWEEP_REGISTRY_PATH.read_bytes()
+    except OSError:
+        return None
+    fingerprint = _sweep_index_fingerprint(source)
+    try:
+        conn = _connect_sweep_index()
+    except sqlite3.Error:
+        return None
+    try:
+        row = conn.execute("SELECT value FROM index_meta WHERE key = 'source'").fetchone()
+        if row is None or row[0] != fingerprint:
+            registry = yaml.safe_load(source.decode("utf-8")) or {}
+            if not isinstance(registry, dict):
+                conn.close()
+                return None
+            _rebuild_sweep_index(conn, registry, fingerprint, only_if_stale=True)
+        return conn
+    except (OSError, sqlite3.Error, yaml.YAMLError, UnicodeDecodeError):
+        conn.close()
+        return None
+
+
+def load_allocated_names() -> set[str]:
+    """Index-backed equivalent of get_all_allocated_names(_load_yaml(SWEEP_REGISTRY_PATH)).
+
+    Includes allocations not yet mirrored to the YAML.
+    """
+    conn = _open_sweep_index()
+    if conn is None:
+        return get_all_allocated_names(_load_yaml(SWEEP_REGISTRY_PATH))
+    try:
+        return {
+            name for (name,) in conn.execute(
+                "SELECT directive_name FROM sweep_entries WHERE directive_name != ''"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def find_sweep_entries(
+    directive_name: str | None = None,
+    signature_hash: str | None = None,
+) -> list[dict[str, Any]]:
+    """Indexed lookup of registry entries by exact directive name and/or hash.
+
+    Hash matching follows _hashes_match (16-char legacy hashes match the
+    64-char prefix). Returns [] when the registry cannot be read.
+    """
+    clauses, params = [], []
+    if directive_name is not None:
+        clauses.append("match_name = ?")
+        params.append(str(directive_name).strip())
+    if signature_hash is not None:
+        signature_hash = _normalize_signature_hash(signature_hash)
+        clauses.append("hash16 = ?")
+        params.append(signature_hash[:16])
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    conn = _open_sweep_index()
+    if conn is None:
+        return []
+    try:
+        rows = conn.execute(
+            "SELECT idea_id, sweep, patch, match_name, stored_hash FROM sweep_entries "
+            f"{where} ORDER BY ord",
+            params,
+        ).fetchall()
+    finally:
+        conn.close()
+    entries = []
+    for idea_id, sweep, patch, name, stored in rows:
+        if signature_hash is not None and not _hashes_match(stored, signature_hash):
+            continue
+        entries.append({
+            "idea_id": idea_id, "sweep": sweep, "patch": patch,
+            "directive_name": name, "directive_hash": stored,
+        })
+    return entries
+
+
+def _indexed_rows(query: str, params: tuple) -> list[tuple] | None:
+    conn = _open_sweep_index()
+    if conn is None:
+        return None
+    try:
+        return conn.execute(query, params).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def _hash_matches_quietly(existing_hash: str, incoming_hash: str) -> bool | None:
+    """_hashes_match, or None when the stored hash is malformed (the locked
+    path raises on it, so the fast path must defer)."""
+    try:
+        return _hashes_match(existing_hash, incoming_hash)
+    except SweepRegistryError:
+        return None
+
+
+def _identity_candidates(conn: sqlite3.Connection, idea_id: str, directive_name: str) -> list[tuple]:
+    """Rows the idempotency walk of reserve_sweep_identity would test, in registry order."""
+    return conn.execute(
+        "SELECT sweep, patch, match_name, stored_hash FROM sweep_entries "
+        "WHERE idea_id = ? AND ((patch IS NULL AND lineage = ?) "
+        "OR (patch IS NOT NULL AND directive_name = ?)) ORDER BY ord",
+        (idea_id, _strip_sweep_segment(directive_name), directive_name),
+    ).fetchall()
+
+
+def _indexed_reservation(
+    idea_id: str,
+    directive_name: str,
+    signature_hash: str,
+    requested_key: str | None,
+) -> dict[str, str] | None:
+    """Resolve an already-allocated identity from the index, lock-free.
+
+    Mirrors the idempotency walk of reserve_sweep_identity: the first entry
+    in registry order that is either a same-lineage sweep owner or an
+    exact-name patch with a matching hash decides. Returns None whenever the
+    answer would involve a mutation (legacy-name heal) or an error, or no
+    entry matches -- the caller then tries an indexed allocation.
+    """
+    conn = _open_sweep_index()
+    if conn is None:
+        return None
+    try:
+        rows = _identity_candidates(conn, idea_id, directive_name)
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    for sweep, patch, match_name, stored in rows:
+        matched = _hash_matches_quietly(stored, signature_hash)
+        if matched is None:
+            return None
+        if not matched:
+            continue
+        if patch is None and (
+            (requested_key and sweep != requested_key) or match_name != directive_name
+        ):
+            return None
+        return {
+            "status": "idempotent",
+            "idea_id": idea_id,
+            "sweep": sweep,
+            "strategy_name": directive_name,
+            "directive_hash": signature_hash,
+            "signature_hash": signature_hash,  # legacy alias
+        }
+    return None
+
+
+def _indexed_allocation(
+    idea_id: str,
+    directive_name: str,
+    signature_hash: str,
+    requested_key: str | None,
+    auto_advance: bool,
+) -> tuple[str, str | None] | None:
+    """Allocate a new sweep slot or patch in the index; return (sweep, patch).
+
+    Runs as one BEGIN IMMEDIATE transaction against the indexed rows, so the
+    decision costs a few B-tree lookups and concurrent admissions queue on
+    SQLite's write lock instead of the PID lock file. The row is stored as
+    pending; _mirror_allocation writes it through to sweep_registry.yaml.
+
+    Covers exactly the two allocating outcomes of the locked walk -- a fresh
+    sweep slot, and a new patch under an existing sweep owner. Returns None
+    for everything else (idempotent hits, heals, stub replacement, reclaim,
+    collisions, unclean idea blocks, a stale index) so the locked path keeps
+    its exact results and errors.
+    """
+    conn = _open_sweep_index()
+    if conn is None:
+        return None
+    try:
+        with _index_write_txn(conn):
+            if not _index_in_sync(conn):
+                return None
+            if SWEEP_LOCK_PATH.exists():
+                # A locked YAML walk may be choosing a slot from the registry
+                # it loaded; a row pending now would be invisible to it.
+                return None
+            idea = conn.execute(
+                "SELECT next_sweep, clean FROM sweep_ideas WHERE idea_id = ?", (idea_id,)
+            ).fetchone()
+            if idea is None or not idea[1]:
+                return None
+            for _sweep, _patch, _name, stored in _identity_candidates(conn, idea_id, directive_name):
+                if _hash_matches_quietly(stored, signature_hash) is not False:
+                    return None
+
+            taken = {
+                sweep for (sweep,) in conn.execute(
+                    "SELECT sweep FROM sweep_entries WHERE idea_id = ? AND patch IS NULL", (idea_id,)
+                )
+            }
+            patch_key = None
+            if requested_key and requested_key in taken:
+                (owner_name,) = conn.execute(
+                    "SELECT match_name FROM sweep_entries "
+                    "WHERE idea_id = ? AND sweep = ? AND patch IS NULL",
+                    (idea_id, requested_key),
+                ).fetchone()
+                patch_key = _patch_key_from_name(directive_name)
+                if patch_key is None or not _is_patch_sibling(owner_name, directive_name):
+                    return None
+                if conn.execute(
+                    "SELECT 1 FROM sweep_entries WHERE idea_id = ? AND sweep = ? AND patch = ?",
+                    (idea_id, requested_key, patch_key),
+                ).fetchone():
+                    return None
+                sweep_key = requested_key
+            elif not auto_advance:
+                return None
+            elif requested_key:
+                sweep_key = requested_key
+            else:
+                next_num = idea[0] if idea[0] is not None else _compute_next_sweep(dict.fromkeys(taken))
+                while f"S{next_num:02d}" in taken:
+                    next_num += 1
+                sweep_key = f"S{next_num:02d}"
+
+            stored_hash, _stored_short = _hash_for_storage(signature_hash)
+            (ord_,) = conn.execute("SELECT COALESCE(MAX(ord), -1) + 1 FROM sweep_entries").fetchone()
+            conn.execute(
+                "INSERT INTO sweep_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
+                (ord_, idea_id, sweep_key, patch_key, directive_name, directive_name,
+                 _strip_sweep_segment(directive_name), stored_hash, stored_hash[:16], _now_utc()),
+            )
+            if patch_key is None:
+                conn.execute(
+                    "UPDATE sweep_ideas SET next_sweep = ? WHERE idea_id = ?",
+                    (_compute_next_sweep(dict.fromkeys(taken | {sweep_key})), idea_id),
+                )
+            return sweep_key, patch_key
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def _apply_pending_allocations(registry: dict[str, Any], pending: list[tuple]) -> int:
+    """Write pending index rows into ``registry`` exactly as the locked path
+    would have. Rows whose slot is already taken (or whose idea block is
+    gone) are skipped; the index rebuild after the write drops them."""
+    applied = 0
+    ideas = registry.get("ideas", {})
+    if not isinstance(ideas, dict):
+        return applied
+    for idea_id, sweep_key, patch_key, name, stored, reserved_at in pending:
+        idea_block = ideas.get(idea_id)
+        if not isinstance(idea_block, dict):
+            continue
+        sweeps = idea_block.get("sweeps", idea_block.get("allocated", {}))
+        if not isinstance(sweeps, dict):
+            continue
+        stored_hash, stored_short = _hash_for_storage(stored)
+        entry = {"directive_name": name, "reserved_at_utc": reserved_at}
+        _write_hash_fields(entry, stored_short, stored_hash)
+        if patch_key is None:
+            if sweep_key in sweeps:
+                continue
+            sweeps[sweep_key] = entry
+            idea_block["sweeps"] = sweeps
+            idea_block["next_sweep"] = _compute_next_sweep(sweeps)
+        else:
+            owner = sweeps.get(sweep_key)
+            if not isinstance(owner, dict):
+                continue
+            patches = owner.get("patches", {})
+            if not isinstance(patches, dict):
+                patches = {}
+            if patch_key in patches:
+                continue
+            patches[patch_key] = entry
+            owner["patches"] = patches
+        applied += 1
+    registry["ideas"] = ideas
+    return applied
+
+
+def _load_registry_locked() -> dict[str, Any]:
+    """_load_yaml for callers holding SWEEP_LOCK_PATH.
+
+    Mirrors every pending index allocation into sweep_registry.yaml first
+    (one write for all of them), so the locked walk sees the full registry.
+    Index allocations stand down while the lock file exists, so no row can
+    become pending behind the walk.
+    """
+    registry = _load_yaml(SWEEP_REGISTRY_PATH)
+    conn = _open_sweep_index()
+    if conn is None:
+        return registry
+    try:
+        # A write transaction waits out any allocation that checked the lock
+        # file before we took it, so its pending row is read here.
+        with _index_write_txn(conn):
+            pending = conn.execute(
+                f"SELECT {_PENDING_COLUMNS} FROM sweep_entries WHERE pending = 1 ORDER BY ord"
+            ).fetchall()
+    except sqlite3.Error:
+        pending = []
+    finally:
+        conn.close()
+    if pending:
+        if _apply_pending_allocations(registry, pending):
+            _write_yaml_atomic(SWEEP_REGISTRY_PATH, registry)
+        else:
+            _refresh_sweep_index(registry)
+    return registry
+
+
+def _registry_slot_name(registry: dict[str, Any], idea_id: str, sweep_key: str,
+                        patch_key: str | None) -> str | None:
+    """Stripped directive_name holding a slot in ``registry``, or None."""
+    ideas = registry.get("ideas", {})
+    idea_block = ideas.get(idea_id) if isinstance(ideas, dict) else None
+    if not isinstance(idea_block, dict):
+        return None
+    sweeps = idea_block.get("sweeps", idea_block.get("allocated", {}))
+    node = sweeps.get(sweep_key) if isinstance(sweeps, dict) else None
+    if isinstance(node, dict) and patch_key is not None:
+        patches = node.get("patches", {})
+        node = patches.get(patch_key) if isinstance(patches, dict) else None
+    if not isinstance(node, dict):
+        return None
+    return str(node.get("directive_name", "")).strip()
+
+
+def _mirror_allocation(idea_id: str, sweep_key: str, patch_key: str | None, directive_name: str) -> None:
+    """Write an index allocation behind to sweep_registry.yaml (group commit).
+
+    The first allocator to take the registry lock mirrors every pending row
+    in one YAML write; allocators that queued behind it find their row
+    already mirrored and skip the parse and rewrite. Returns once the YAML
+    holds the slot, so readers of the YAML never miss a reserved identity.
+    """
+    slot = (idea_id, sweep_key, patch_key)
+    lock_fd = _acquire_lock(SWEEP_LOCK_PATH)
+    try:
+        # None (index unreadable) is "unknown", not "mirrored": take the
+        # group-commit path, which also re-reads the YAML.
+        registry = None
+        if _indexed_rows(
+            "SELECT 1 FROM sweep_entries WHERE idea_id = ? AND sweep = ? AND patch IS ? AND pending = 1",
+            slot,
+        ) != []:
+            registry = _load_registry_locked()
+        owner = _indexed_rows(
+            "SELECT match_name FROM sweep_entries "
+            "WHERE idea_id = ? AND sweep = ? AND patch IS ? AND pending = 0",
+            slot,
+        )
+        if owner:
+            owner_name = owner[0][0]
+        else:
+            # No readable owner row: the YAML, read under the lock, decides.
+            if registry is None:
+                registry = _load_yaml(SWEEP_REGISTRY_PATH)
+            owner_name = _registry_slot_name(registry, *slot)
+    finally:
+        _release_lock(lock_fd, SWEEP_LOCK_PATH)
+    if owner_name != directive_name:
+        raise SweepRegistryError(
+            "SWEEP_COLLISION: "
+            f"idea_id='{idea_id}' sweep='{sweep_key}' patch='{patch_key}' was taken by a "
+            f"concurrent registry write before '{directive_name}' was mirrored; re-run admission."
+        )
 
 
 def _is_lock_stale(lock_path: Path) -> bool:
@@ -181,9 +825,15 @@ def _is_pid_alive(pid: int) -> bool:
 
 
 def _acquire_lock(lock_path: Path, timeout_sec: float = 10.0, poll_sec: float = 0.1) -> int:
+    """Create the PID lock file exclusively.
+
+    Contended waits back off exponentially from 5ms up to ``poll_sec`` so a
+    short critical section does not cost every waiter a full poll interval.
+    """
     lock_path.parent.mkdir(parents=True, exist_ok=True)
     deadline = time.time() + timeout_sec
     stale_cleared = False  # Only attempt stale-lock removal once per acquire call
+    delay = min(0.005, poll_sec)
 
     while True:
         try:
@@ -204,7 +854,8 @@ def _acquire_lock(lock_path: Path, timeout_sec: float = 10.0, poll_sec: float =
                 raise SweepRegistryError(
                     f"SWEEP_LOCK_TIMEOUT: Could not acquire lock: {lock_path}"
                 )
-            time.sleep(poll_sec)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_sec)
 
 
 def _release_lock(fd: int, lock_path: Path) -> None:
@@ -463,9 +1114,33 @@ def reserve_sweep_identity(
     if not signature_hash:
         raise SweepRegistryError("signature_hash is required.")
 
+    # Re-admission of an already-allocated identity: answered from the index
+    # without the lock or a YAML parse.
+    indexed = _indexed_reservation(idea_id, directive_name, signature_hash, requested_key)
+    if indexed is not None:
+        return indexed
+
+    # New sweep slot or patch: allocated in the index, then mirrored to YAML.
+    allocated = _indexed_allocation(
+        idea_id, directive_name, signature_hash, requested_key, auto_advance
+    )
+    if allocated is not None:
+        sweep_key, patch_key = allocated
+        _mirror_allocation(idea_id, sweep_key, patch_key, directive_name)
+        result = {
+            "status": "reserved",
+            "idea_id": idea_id,
+            "sweep": sweep_key,
+            "strategy_name": directive_name,
+        }
+        if patch_key is not None:
+            result["directive_hash"] = signature_hash
+        result["signature_hash"] = signature_hash
+        return result
+
     lock_fd = _acquire_lock(SWEEP_LOCK_PATH)
     try:
-        registry = _load_yaml(SWEEP_REGISTRY_PATH)
+        registry = _load_registry_locked()
         ideas = registry.get("ideas", {})
         if not isinstance(ideas, dict):
             raise SweepRegistryError(
@@ -769,9 +1444,25 @@ def update_sweep_signature_hash(
     if not signature_hash:
         raise SweepRegistryError("signature_hash is required.")
 
+    # Unchanged hash: answered from the index without the lock or a YAML parse.
+    rows = _indexed_rows(
+        "SELECT sweep, patch, stored_hash FROM sweep_entries "
+        "WHERE idea_id = ? AND match_name = ? ORDER BY ord LIMIT 1",
+        (idea_id, directive_name),
+    )
+    if rows and _hash_matches_quietly(rows[0][2], signature_hash):
+        return {
+            "status": "unchanged",
+            "idea_id": idea_id,
+            "sweep": rows[0][0],
+            "patch": rows[0][1],
+            "directive_name": directive_name,
+            "signature_hash": signature_hash,
+        }
+
     lock_fd = _acquire_lock(SWEEP_LOCK_PATH)
     try:
-        registry = _load_yaml(SWEEP_REGISTRY_PATH)
+        registry = _load_registry_locked()
         ideas = registry.get("ideas", {})
         idea_block = ideas.get(idea_id) if isinstance(ideas, dict) else None
         if not isinstance(idea_block, dict):
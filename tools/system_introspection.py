@@ -8,24 +8,38 @@ Usage:
     python tools/system_introspection.py                    # full snapshot
     python tools/system_introspection.py --skip-preflight   # skip governance check
     python tools/system_introspection.py --output /tmp/ss.md
+    python tools/system_introspection.py --no-cache         # recompute every collector
+
+Collectors run concurrently. File-backed collectors are cached in
+outputs/.session_state/introspection_cache.json, keyed by the mtime/size of
+their inputs, so an unchanged ledger, portfolio.yaml or freshness index is
+not re-read. Per-collector timing goes to stderr and into the cache file
+(``last_timings``), never into SYSTEM_STATE.md, so an unchanged system
+regenerates an unchanged snapshot apart from ``Generated:``.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from tools.input_fingerprint import ledger_db_paths, stat_fingerprint
+
 
 def _find_trade_scan_root() -> Path:
     """Walk up from PROJECT_ROOT to find the real Trade_Scan repo root.
@@ -511,7 +525,7 @@ def collect_runs() -> dict[str, int]:
     return {"total": _count_dirs(RUNS_DIR)}
 
 
-def _check_directive_queue_health() -> dict[str, Any]:
+def _check_directive_queue_health(cache: "_CollectorCache | None" = None) -> dict[str, Any]:
     """Detect stale or stranded directives sitting in INBOX.
 
     Surfaces two failure modes the V1_P00 / 18-stale-PSBRK incident
@@ -532,6 +546,10 @@ def _check_directive_queue_health() -> dict[str, Any]:
     Read-only; cannot affect pipeline correctness. Best-effort: any
     per-directive I/O or parse error is silently skipped — a malformed
     state file should not blank out the whole snapshot.
+
+    Parsing the state files is cached (keyed by the INBOX listing and
+    state-file mtimes) when `cache` is given; the 24h idle threshold is
+    always evaluated against the current time.
     """
     from datetime import datetime, timezone, timedelta
 
@@ -543,41 +561,29 @@ def _check_directive_queue_health() -> dict[str, Any]:
     if not INBOX_DIR.exists():
         return result
 
+    if cache is not None:
+        records, _ = cache.get_or_compute(
+            "directive_queue", _directive_queue_inputs, _directive_queue_records,
+        )
+    else:
+        records = _directive_queue_records()
+
     now = datetime.now(timezone.utc)
     idle_threshold = timedelta(hours=24)
 
-    for txt_path in sorted(INBOX_DIR.glob("*.txt")):
-        directive_id = txt_path.stem
-        state_path = RUNS_DIR / directive_id / "directive_state.json"
-        if not state_path.exists():
-            continue
-
-        try:
-            state = json.loads(state_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-
-        attempts = state.get("attempts") or {}
-        if not isinstance(attempts, dict) or not attempts:
-            continue
-
-        sorted_keys = sorted(attempts.keys())
-        latest_key = state.get("latest_attempt") or sorted_keys[-1]
-        latest = attempts.get(latest_key) or {}
-        latest_status = str(latest.get("status", "?"))
+    for rec in records:
+        latest_status = rec["latest_status"]
 
         # 1. Stale: PORTFOLIO_COMPLETE in INBOX
         if latest_status == "PORTFOLIO_COMPLETE":
-            result["stale_inbox"].append(directive_id)
+            result["stale_inbox"].append(rec["directive_id"])
             continue
 
         # 2a. Stranded by repeated failure (last 3 attempts)
-        recent = [attempts[k] for k in sorted_keys[-3:] if isinstance(attempts.get(k), dict)]
-        fail_count = sum(1 for a in recent if a.get("status") == "FAILED")
-        repeat_fails = fail_count >= 2
+        repeat_fails = rec["fail_count"] >= 2
 
         # 2b. Stranded by stale idle attempt
-        last_updated_raw = state.get("last_updated") or ""
+        last_updated_raw = rec["last_updated"]
         last_updated_dt = None
         if isinstance(last_updated_raw, str) and last_updated_raw:
             try:
@@ -595,8 +601,8 @@ def _check_directive_queue_health() -> dict[str, Any]:
 
         if repeat_fails or is_idle_stale:
             result["stranded"].append({
-                "directive_id": directive_id,
-                "fail_count": fail_count,
+                "directive_id": rec["directive_id"],
+                "fail_count": rec["fail_count"],
                 "latest_status": latest_status,
                 "last_updated": last_updated_raw,
             })
@@ -604,6 +610,49 @@ def _check_directive_queue_health() -> dict[str, Any]:
     return result
 
 
+def _directive_queue_inputs() -> list[Path]:
+    """INBOX listing plus the directive_state.json of every INBOX directive."""
+    if not INBOX_DIR.exists():
+        return [INBOX_DIR]
+    return [INBOX_DIR] + [
+        RUNS_DIR / p.stem / "directive_state.json" for p in sorted(INBOX_DIR.glob("*.txt"))
+    ]
+
+
+def _directive_queue_records() -> list[dict[str, Any]]:
+    """Time-independent summary of each INBOX directive's state file."""
+    records: list[dict[str, Any]] = []
+    if not INBOX_DIR.exists():
+        return records
+
+    for txt_path in sorted(INBOX_DIR.glob("*.txt")):
+        directive_id = txt_path.stem
+        state_path = RUNS_DIR / directive_id / "directive_state.json"
+        if not state_path.exists():
+            continue
+
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+
+        attempts = state.get("attempts") or {}
+        if not isinstance(attempts, dict) or not attempts:
+            continue
+
+        sorted_keys = sorted(attempts.keys())
+        latest_key = state.get("latest_attempt") or sorted_keys[-1]
+        latest = attempts.get(latest_key) or {}
+        recent = [attempts[k] for k in sorted_keys[-3:] if isinstance(attempts.get(k), dict)]
+        records.append({
+            "directive_id": directive_id,
+            "latest_status": str(latest.get("status", "?")),
+            "fail_count": sum(1 for a in recent if a.get("status") == "FAILED"),
+            "last_updated": state.get("last_updated") or "",
+        })
+    return records
+
+
 # Self-generated artifacts excluded from the OPERATOR-FACING working-tree
 # cleanliness metric — NOT from git tracking. These files are regenerated by
 # this tool (SYSTEM_STATE.md, tools/TOOLS_INDEX.md), committed unconditionally
@@ -847,7 +896,7 @@ def collect_deferred_maintenance() -> list[dict[str, str]]:
     return items[:5]
 
 
-def collect_known_issues() -> dict[str, Any]:
+def collect_known_issues(cache: "_CollectorCache | None" = None) -> dict[str, Any]:
     """Auto-populate Known Issues from runtime signals.
 
     S2 fix (2026-05-04): pre-fix, the Known Issues section defaulted to
@@ -955,7 +1004,7 @@ def collect_known_issues() -> dict[str, Any]:
     # 4. Directive queue health: stale INBOX + stranded directives.
     # See _check_directive_queue_health docstring for failure modes.
     try:
-        auto["directive_queue"] = _check_directive_queue_health()
+        auto["directive_queue"] = _check_directive_queue_health(cache)
     except Exception as e:
         auto["directive_queue_error"] = f"{type(e).__name__}: {e}"
 
@@ -988,6 +1037,122 @@ def collect_known_issues() -> dict[str, Any]:
     return auto
 
 
+# ── Collector cache + parallel runner ─────────────────────────────────────
+
+INTROSPECTION_CACHE = _TRADE_SCAN_ROOT / "outputs" / ".session_state" / "introspection_cache.json"
+_CACHE_VERSION = 1
+
+
+def _has_error(result: Any) -> bool:
+    """True if a collector result (or one of its sections) carries an error."""
+    if not isinstance(result, dict):
+        return False
+    if "error" in result:
+        return True
+    return any(isinstance(v, dict) and "error" in v for v in result.values())
+
+
+class _CollectorCache:
+    """Collector results keyed by the fingerprint of their input files.
+
+    Best-effort: an unreadable cache file starts empty, a failed save is
+    ignored, and results carrying an error are never stored (a locked DB
+    should not stick until its file next changes). Thread-safe.
+    """
+
+    def __init__(self, path: Path, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: dict[str, Any] = {}
+        if enabled:
+            data = _safe_json(path)
+            if data and data.get("version") == _CACHE_VERSION:
+                self._entries = data.get("entries", {})
+
+    def get_or_compute(self, name: str, inputs: Callable[[], list[Path]],
+                       compute: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return (result, served_from_cache)."""
+        fingerprint = stat_fingerprint(inputs())
+        with self._lock:
+            entry = self._entries.get(name)
+        if self.enabled and entry and entry.get("fingerprint") == fingerprint:
+            return entry["result"], True
+
+        result = compute()
+        if not _has_error(result):
+            with self._lock:
+                self._entries[name] = {"fingerprint": fingerprint, "result": result}
+        return result, False
+
+    def save(self, timings: dict[str, dict] | None = None) -> None:
+        """Persist entries (and the run's per-collector timings, if given)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            with self._lock:
+                payload = {"version": _CACHE_VERSION, "entries": self._entries}
+                if timings is not None:
+                    payload["last_timings"] = timings
+            tmp.write_text(json.dumps(payload, default=str), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+
+def _ledger_inputs() -> list[Path]:
+    """Ledger Excel files plus the ledger DB and its WAL."""
+    return [MASTER_FILTER_PATH, MPS_PATH, CANDIDATE_FILTER_PATH, *ledger_db_paths()]
+
+
+def run_collectors(cache: _CollectorCache | None = None,
+                   max_workers: int | None = None) -> tuple[dict[str, Any], dict[str, dict]]:
+    """Run every collector concurrently.
+
+    Returns (results, timings): results by collector name, and
+    {name: {"seconds", "cached"}}. Collectors with file inputs go through
+    `cache`; git, the known-issues checks (gate pytest) and the
+    time-dependent collectors always run.
+    """
+    # name -> (collector, input paths or None when not cacheable)
+    collectors: dict[str, tuple[Callable[[], Any], Callable[[], list[Path]] | None]] = {
+        "engine": (collect_engine, None),
+        "directives": (collect_directives, None),
+        "ledgers": (collect_ledgers, _ledger_inputs),
+        "portfolio": (collect_portfolio, lambda: [PORTFOLIO_YAML]),
+        "vault": (collect_vault, lambda: [DRY_RUN_VAULT]),
+        "freshness": (collect_data_freshness, lambda: [FRESHNESS_INDEX]),
+        "runs": (collect_runs, lambda: [RUNS_DIR]),
+        "git": (collect_git, None),
+        "known_issues": (lambda: collect_known_issues(cache), None),
+        "deferred_maintenance": (collect_deferred_maintenance, None),
+    }
+
+    def _run(name: str) -> tuple[Any, dict]:
+        fn, inputs = collectors[name]
+        start = time.perf_counter()
+        if cache is not None and inputs is not None:
+            result, cached = cache.get_or_compute(name, inputs, fn)
+        else:
+            result, cached = fn(), False
+        return result, {"seconds": round(time.perf_counter() - start, 3), "cached": cached}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(collectors)) as pool:
+        futures = {name: pool.submit(_run, name) for name in collectors}
+        outcomes = {name: f.result() for name, f in futures.items()}
+
+    results = {name: out[0] for name, out in outcomes.items()}
+    timings = {name: out[1] for name, out in outcomes.items()}
+    return results, timings
+
+
+def _format_timings(timings: dict[str, dict]) -> str:
+    return " · ".join(
+        f"{name} {t['seconds']:.2f}s" + (" (cached)" if t.get("cached") else "")
+        for name, t in timings.items()
+    )
+
+
 # ── Session Status ────────────────────────────────────────────────────────
 
 
@@ -1364,6 +1529,11 @@ def main() -> None:
         action="store_true",
         help="Skip running governance/preflight.py (unused in new design, kept for compat)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute every collector instead of reusing cached results",
+    )
     args = parser.parse_args()
 
     output_path = Path(args.output)
@@ -1372,16 +1542,21 @@ def main() -> None:
 
     print("[SYSTEM_STATE] Collecting system snapshot...")
 
-    engine = collect_engine()
-    directives = collect_directives()
-    ledgers = collect_ledgers()
-    portfolio = collect_portfolio()
-    vault = collect_vault()
-    freshness = collect_data_freshness()
-    runs = collect_runs()
-    git = collect_git()
-    known_issues = collect_known_issues()
-    deferred_maintenance = collect_deferred_maintenance()
+    cache = _CollectorCache(INTROSPECTION_CACHE, enabled=not args.no_cache)
+    collected, timings = run_collectors(cache)
+    cache.save(timings)
+    print(f"[SYSTEM_STATE] Collectors: {_format_timings(timings)}", file=sys.stderr)
+
+    engine = collected["engine"]
+    directives = collected["directives"]
+    ledgers = collected["ledgers"]
+    portfolio = collected["portfolio"]
+    vault = collected["vault"]
+    freshness = collected["freshness"]
+    runs = collected["runs"]
+    git = collected["git"]
+    known_issues = collected["known_issues"]
+    deferred_maintenance = collected["deferred_maintenance"]
 
     session_status = compute_session_status(engine, freshness, git)
     markdown = render_markdown(
@@ -7,8 +7,8 @@ import pandas as pd
 import numpy as np
 
 
-def identify_dd_clusters(eq_df: pd.DataFrame, top_n: int = 3) -> list[dict]:
-    """Find the top-N deepest drawdown periods from the equity curve."""
+def _daily_drawdown(eq_df: pd.DataFrame) -> pd.DataFrame:
+    """Daily equity, running peak and drawdown % (the cluster basis)."""
     eq = eq_df.copy()
     eq["timestamp"] = pd.to_datetime(eq["timestamp"])
     eq = eq.set_index("timestamp")
@@ -17,52 +17,166 @@ def identify_dd_clusters(eq_df: pd.DataFrame, top_n: int = 3) -> list[dict]:
 
     peak = daily.cummax()
     dd_pct = (peak - daily) / peak * 100
+    return pd.DataFrame({"equity": daily, "peak": peak, "dd_pct": dd_pct})
+
+
+def find_dd_episodes(eq_df: pd.DataFrame) -> list[dict]:
+    """Every underwater episode of the daily equity curve, chronologically.
+
+    Episodes are the runs of days whose equity is below its running peak,
+    found by run-length encoding the at-peak mask. Each episode reports its
+    first underwater day, its trough (first day of maximum drawdown), the
+    recovery day (first day back at peak; NaT while still underwater),
+    the max drawdown % and the duration in days.
+    """
+    dd_df = _daily_drawdown(eq_df)
+    if dd_df.empty:
+        return []
+    dates = dd_df.index
+    under = (dd_df["equity"] != dd_df["peak"]).to_numpy()
+    dd = dd_df["dd_pct"].to_numpy(dtype="float64")
+    n = len(under)
+
+    edges = np.diff(np.concatenate(([False], under, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)  # exclusive: first at-peak day after the run
+    if len(starts) == 0:
+        return []
+
+    # Trough = first position of the run's maximum. A NaN first value is
+    # never exceeded (strict '>' against NaN), so such a run keeps it.
+    filled = np.where(np.isnan(dd), -np.inf, dd)
+    run_max = np.maximum.reduceat(filled, starts)
+    seg = np.repeat(np.arange(len(starts)), ends - starts)
+    pos = np.flatnonzero(under)  # aligned with seg
+    hit = filled[pos] == run_max[seg]
+    first_hit = np.full(len(starts), -1)
+    hit_seg, hit_idx = np.unique(seg[hit], return_index=True)
+    first_hit[hit_seg] = pos[hit][hit_idx]
+    nan_first = np.isnan(dd[starts])
+    trough_pos = np.where(nan_first | (first_hit < 0), starts, first_hit)
+    max_dd = np.where(nan_first, np.nan, dd[trough_pos])
+
+    episodes = []
+    for k, (a, b) in enumerate(zip(starts, ends)):
+        start_dt = dates[a]
+        recovered = b < n
+        end_dt = dates[b] if recovered else dates[-1]
+        episodes.append({
+            "start_date": start_dt,
+            "trough_date": dates[trough_pos[k]],
+            "recovery_date": dates[b] if recovered else pd.NaT,
+            "max_dd_pct": float(max_dd[k]),
+            "duration_days": (end_dt - start_dt).days,
+        })
+    return episodes
+
 
-    dd_df = pd.DataFrame({"equity": daily, "peak": peak, "dd_pct": dd_pct})
-    dd_df["is_peak"] = dd_df["equity"] == dd_df["peak"]
-
-    periods = []
-    in_dd = False
-    start_dt = None
-    max_dd = 0.0
-    trough_dt = None
-
-    for dt, row in dd_df.iterrows():
-        if row["is_peak"]:
-            if in_dd:
-                periods.append(
-                    {
-                        "start_date": start_dt,
-                        "trough_date": trough_dt,
-                        "recovery_date": dt,
-                        "max_dd_pct": max_dd,
-                        "duration_days": (dt - start_dt).days,
-                    }
-                )
-                in_dd = False
-        else:
-            if not in_dd:
-                start_dt = dt
-                in_dd = True
-                max_dd = row["dd_pct"]
-                trough_dt = dt
-            elif row["dd_pct"] > max_dd:
-                max_dd = row["dd_pct"]
-                trough_dt = dt
-
-    if in_dd:
-        periods.append(
-            {
-                "start_date": start_dt,
-                "trough_date": trough_dt,
-                "recovery_date": pd.NaT,
-                "max_dd_pct": max_dd,
-                "duration_days": (dd_df.index[-1] - start_dt).days,
-            }
-        )
+def identify_dd_clusters(eq_df: pd.DataFrame, top_n: int = 3) -> list[dict]:
+    """Find the top-N deepest drawdown periods from the equity curve.
 
+    top_n=None returns every episode, deepest first.
+    """
+    periods = find_dd_episodes(eq_df)
     periods.sort(key=lambda x: x["max_dd_pct"], reverse=True)
-    return periods[:top_n]
+    return periods if top_n is None else periods[:top_n]
+
+
+def _exposure_stats(direction: np.ndarray, symbols: np.ndarray) -> dict:
+    n = len(direction)
+    if n == 0:
+        return {
+            "total_trades": 0,
+            "pct_long": 0,
+            "pct_short": 0,
+            "symbol_concentration_top2": 0,
+        }
+    top2 = pd.Series(symbols).value_counts().head(2).sum() / n * 100
+    return {
+        "total_trades": n,
+        "pct_long": (direction == 1).sum() / n * 100,
+        "pct_short": (direction == -1).sum() / n * 100,
+        "symbol_concentration_top2": top2,
+    }
+
+
+def _behavior_stats(pnl: pd.Series) -> dict:
+    n = len(pnl)
+    if n == 0:
+        return {"trades_closed": 0}
+    streaks = (pnl < 0).astype(int)
+    groups = streaks.groupby((streaks != streaks.shift()).cumsum())
+    return {
+        "trades_closed": n,
+        "win_rate": (pnl > 0).sum() / n * 100,
+        "avg_pnl": pnl.mean(),
+        "total_pnl": pnl.sum(),
+        "max_loss_streak": int(groups.sum().max()),
+    }
+
+
+def analyze_dd_episodes(tr_df: pd.DataFrame, episodes: list[dict]) -> list[dict]:
+    """Exposure + trade behavior for many episodes with one interval join.
+
+    Equivalent to calling analyze_dd_exposure / analyze_dd_trade_behavior
+    per episode, but trades are matched to episodes by searchsorted over the
+    episodes' [start_date, trough_date] intervals (sorted, non-overlapping —
+    as produced by find_dd_episodes) rather than by one full-frame mask per
+    episode. Returns [{"exposure": ..., "behavior": ...}] in `episodes` order.
+    """
+    if not episodes:
+        return []
+    order = sorted(range(len(episodes)), key=lambda k: episodes[k]["start_date"])
+    starts = pd.DatetimeIndex([episodes[k]["start_date"] for k in order])
+    troughs = pd.DatetimeIndex([episodes[k]["trough_date"] for k in order])
+    if not (troughs.is_monotonic_increasing and (starts[1:] > troughs[:-1]).all()):
+        # Overlapping intervals: no contiguous-range join; use the per-episode path.
+        return [
+            {"exposure": analyze_dd_exposure(tr_df, ep), "behavior": analyze_dd_trade_behavior(tr_df, ep)}
+            for ep in episodes
+        ]
+
+    entry = pd.DatetimeIndex(pd.to_datetime(tr_df["entry_timestamp"]))
+    exit_ = pd.DatetimeIndex(pd.to_datetime(tr_df["exit_timestamp"]))
+    valid_open = ~(entry.isna() | exit_.isna())
+    valid_exit = ~exit_.isna()
+    n_ep = len(order)
+
+    # Open during the plunge: entry <= trough and exit >= start. With sorted,
+    # disjoint intervals each trade overlaps a contiguous episode range [lo, hi).
+    lo = np.where(valid_open, troughs.searchsorted(entry, side="left"), n_ep)
+    hi = np.where(valid_open, starts.searchsorted(exit_, side="right"), 0)
+    span = np.clip(hi - lo, 0, None)
+    open_trade = np.repeat(np.arange(len(tr_df)), span)
+    open_ep = np.repeat(lo, span) + (np.arange(span.sum()) - np.repeat(np.cumsum(span) - span, span))
+
+    # Closed in the plunge: start <= exit <= trough -> at most one episode.
+    cand = np.where(valid_exit, starts.searchsorted(exit_, side="right") - 1, -1)
+    safe = np.clip(cand, 0, None)
+    closed_mask = (cand >= 0) & valid_exit & np.asarray(exit_ <= troughs[safe])
+    closed_trade = np.flatnonzero(closed_mask)
+    closed_ep = cand[closed_mask]
+
+    direction = tr_df["direction"].to_numpy()
+    symbols = tr_df["symbol"].to_numpy()
+    pnl = tr_df["pnl_usd"].reset_index(drop=True)
+
+    o_sort = np.lexsort((open_trade, open_ep))
+    open_trade, open_ep = open_trade[o_sort], open_ep[o_sort]
+    c_sort = np.lexsort((closed_trade, closed_ep))
+    closed_trade, closed_ep = closed_trade[c_sort], closed_ep[c_sort]
+    o_bounds = np.searchsorted(open_ep, np.arange(n_ep + 1))
+    c_bounds = np.searchsorted(closed_ep, np.arange(n_ep + 1))
+
+    out: list = [None] * len(episodes)
+    for rank, k in enumerate(order):
+        rows = open_trade[o_bounds[rank]:o_bounds[rank + 1]]
+        closed_rows = closed_trade[c_bounds[rank]:c_bounds[rank + 1]]
+        out[k] = {
+            "exposure": _exposure_stats(direction[rows], symbols[rows]),
+            "behavior": _behavior_stats(pnl.iloc[closed_rows]),
+        }
+    return out
 
 
 def analyze_dd_exposure(tr_df: pd.DataFrame, cluster: dict) -> dict:
@@ -119,6 +119,47 @@ def _cost_per_trade(row: pd.Series, slippage_pips: float) -> float:
     return (abs(row["pnl_usd"]) / price_diff) * price_drag
 
 
+def _friction_cost_matrix(tr_df: pd.DataFrame, rt_slippage_pips) -> np.ndarray:
+    """Round-trip slippage cost (USD) for every trade under every level.
+
+    Column-wise equivalent of `_cost_per_trade` evaluated for each level in
+    `rt_slippage_pips`: pip sizes are resolved once per symbol, the per-trade
+    USD-per-price factor once per frame, and the levels are applied as one
+    broadcast. Returns shape (len(levels), len(tr_df)); a zero level yields
+    exact zeros, as `_cost_per_trade` does.
+    """
+    levels = np.asarray(rt_slippage_pips, dtype="float64")
+    n = len(tr_df)
+    if n == 0:
+        return np.zeros((len(levels), 0))
+
+    symbols = tr_df["symbol"]
+    pip_by_symbol = {sym: _pip_size(sym) for sym in pd.unique(symbols)}
+    pip = symbols.map(pip_by_symbol).to_numpy(dtype="float64")
+
+    if "exit_price" in tr_df.columns:
+        price_diff = np.abs(
+            tr_df["exit_price"].to_numpy(dtype="float64")
+            - tr_df["entry_price"].to_numpy(dtype="float64")
+        )
+    else:
+        price_diff = np.zeros(n)
+    lots = (
+        tr_df["lot_size"].to_numpy(dtype="float64")
+        if "lot_size" in tr_df.columns else np.full(n, 0.01)
+    )
+    tiny = price_diff < pip * 0.1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        usd_per_price = np.abs(tr_df["pnl_usd"].to_numpy(dtype="float64")) / price_diff
+        # Same operation order as _cost_per_trade, level by level in one broadcast.
+        moved = usd_per_price[None, :] * (levels[:, None] * pip[None, :])
+    flat = (10.0 * lots)[None, :] * levels[:, None]
+    costs = np.where(tiny[None, :], flat, moved)
+    costs[levels == 0, :] = 0.0
+    return np.ascontiguousarray(costs)
+
+
 def apply_friction(
     tr_df: pd.DataFrame,
     slippage_pips: float = 0.0,
@@ -142,9 +183,7 @@ def apply_friction(
 
     # Per-side -> round-trip
     rt_slip = slippage_pips * 2
-    costs = []
-    for _, row in result.iterrows():
-        costs.append(_cost_per_trade(row, rt_slip))
+    costs = _friction_cost_matrix(result, [rt_slip])[0]
     result["friction_cost"] = costs
     result["pnl_usd_adjusted"] = result["pnl_usd"] - result["friction_cost"]
     return result
@@ -153,19 +192,20 @@ def apply_friction(
 # ── Tiered friction scenarios ─────────────────────────────────────────────────
 
 
-def _compute_scenario(tr_df: pd.DataFrame, label: str,
+def _scenario_metrics(pnl: pd.Series, cost: np.ndarray, label: str,
                       slippage_pips: float, base_net: float) -> dict:
-    """Run one friction scenario and return metrics dict."""
-    adj = apply_friction(tr_df, slippage_pips=slippage_pips)
-    net = adj["pnl_usd_adjusted"].sum()
+    """Scenario metrics dict from one row of the cost matrix."""
+    friction_cost = pd.Series(cost, index=pnl.index, dtype="float64")
+    adjusted = pnl - friction_cost
+    net = adjusted.sum()
 
-    wins = adj.loc[adj["pnl_usd_adjusted"] > 0, "pnl_usd_adjusted"].sum()
-    losses = abs(adj.loc[adj["pnl_usd_adjusted"] < 0, "pnl_usd_adjusted"].sum())
+    wins = adjusted[adjusted > 0].sum()
+    losses = abs(adjusted[adjusted < 0].sum())
     pf = wins / losses if losses > 0 else 999.0
 
     deg = (1 - net / base_net) * 100 if base_net != 0 else 0.0
-    avg_cost = adj["friction_cost"].mean()
-    total_cost = adj["friction_cost"].sum()
+    avg_cost = friction_cost.mean()
+    total_cost = friction_cost.sum()
 
     logger.info(
         "[FRICTION] %s | slip=%.2f/side | net=$%.2f | PF=%.2f | avg_cost=$%.4f",
@@ -180,10 +220,44 @@ def _compute_scenario(tr_df: pd.DataFrame, label: str,
         "degradation_pct": deg,
         "avg_friction_cost": avg_cost,
         "total_friction_cost": total_cost,
-        "trade_count": len(adj),
+        "trade_count": len(adjusted),
     }
 
 
+def _compute_scenario(tr_df: pd.DataFrame, label: str,
+                      slippage_pips: float, base_net: float) -> dict:
+    """Run one friction scenario and return metrics dict."""
+    cost = _friction_cost_matrix(tr_df, [slippage_pips * 2])[0]
+    return _scenario_metrics(tr_df["pnl_usd"], cost, label, slippage_pips, base_net)
+
+
+def run_friction_sweep(
+    tr_df: pd.DataFrame,
+    slippage_levels,
+    labels=None,
+) -> list[dict]:
+    """Evaluate many per-side slippage levels in one cost-matrix broadcast.
+
+    Returns one scenario dict per level (same keys as the tier dicts of
+    run_tiered_friction). Levels are validated against the configured
+    bounds exactly like tier costs. `labels` defaults to "Slip X pip/side".
+    """
+    config = _load_config()
+    levels = [
+        _validate_cost(float(v), f"sweep[{k}].slippage_pips", config)
+        for k, v in enumerate(slippage_levels)
+    ]
+    if labels is None:
+        labels = [f"Slip {v:g} pip/side" for v in levels]
+    base_net = tr_df["pnl_usd"].sum()
+    costs = _friction_cost_matrix(tr_df, [v * 2 for v in levels])
+    pnl = tr_df["pnl_usd"]
+    return [
+        _scenario_metrics(pnl, costs[k], label, level, base_net)
+        for k, (label, level) in enumerate(zip(labels, levels))
+    ]
+
+
 def run_tiered_friction(tr_df: pd.DataFrame) -> dict:
     """Run slippage stress test across all configured tiers.
 
@@ -202,12 +276,15 @@ def run_tiered_friction(tr_df: pd.DataFrame) -> dict:
 
     base_net = tr_df["pnl_usd"].sum()
     tier_names = ["baseline", "stress", "extreme"]
+    tier_costs = [get_tier_costs(name) for name in tier_names]
+    cost_matrix = _friction_cost_matrix(
+        tr_df, [c["slippage_pips"] * 2 for c in tier_costs]
+    )
     tier_results = {}
 
-    for name in tier_names:
-        costs = get_tier_costs(name)
-        result = _compute_scenario(
-            tr_df, costs["label"],
+    for k, (name, costs) in enumerate(zip(tier_names, tier_costs)):
+        result = _scenario_metrics(
+            tr_df["pnl_usd"], cost_matrix[k], costs["label"],
             costs["slippage_pips"],
             base_net,
         )
@@ -7,6 +7,88 @@ import pandas as pd
 import numpy as np
 
 
+# Window/step grid used for multi-horizon stability (days).
+DEFAULT_WINDOW_GRID = ((90, 30), (180, 30), (365, 30))
+
+
+def _prepare_rolling_inputs(eq_df: pd.DataFrame, tr_df: pd.DataFrame):
+    """Daily (ffilled) equity and the sorted, NaT-free trade exit times."""
+    eq = eq_df.copy()
+    eq["timestamp"] = pd.to_datetime(eq["timestamp"])
+    eq = eq.set_index("timestamp")
+    eq = eq[~eq.index.duplicated(keep="last")]
+    eq = eq.sort_index()
+    daily = eq["equity"].resample("D").last().ffill()
+
+    exits = pd.DatetimeIndex(pd.to_datetime(tr_df["exit_timestamp"]))
+    exits = exits[~exits.isna()].sort_values()
+    return daily, exits
+
+
+def _window_table(
+    daily: pd.Series,
+    exits: pd.DatetimeIndex,
+    window_days: int,
+    step_days: int,
+) -> pd.DataFrame:
+    """All windows of one (window, step) grid at once.
+
+    Window boundaries are located with searchsorted on the daily index and
+    the sorted exit times; every window's equity slice is gathered into one
+    2-D array (rows padded with NaN), so return, max DD and trade count
+    come from row-wise reductions instead of a per-window slice + mask.
+    Values are identical to the original per-window loop.
+    """
+    cols = ["start", "end", "return_pct", "max_dd_pct", "trade_count"]
+    if daily.empty:
+        return pd.DataFrame(columns=cols)
+    start, end = daily.index[0], daily.index[-1]
+    window = pd.Timedelta(days=window_days)
+    step = pd.Timedelta(days=step_days)
+    if start + window > end:
+        return pd.DataFrame(columns=cols)
+
+    n_windows = int((end - window - start) // step) + 1
+    starts = pd.DatetimeIndex([start + k * step for k in range(n_windows)])
+    ends = starts + window
+
+    # [lo, hi) positions of daily.loc[start:end] per window.
+    lo = daily.index.searchsorted(starts, side="left")
+    hi = daily.index.searchsorted(ends, side="right")
+    keep = (hi - lo) >= 2
+    starts, ends, lo, hi = starts[keep], ends[keep], lo[keep], hi[keep]
+    if len(starts) == 0:
+        return pd.DataFrame(columns=cols)
+
+    values = daily.to_numpy(dtype="float64")
+    width = int((hi - lo).max())
+    offs = np.arange(width)
+    pos = lo[:, None] + offs[None, :]
+    valid = pos < hi[:, None]
+    w_eq = np.where(valid, values[np.minimum(pos, len(values) - 1)], np.nan)
+
+    first = values[lo]
+    last = values[hi - 1]
+    ret = (last / first - 1) * 100
+
+    # cummax with pandas' skipna semantics: running peak ignores NaN, and
+    # NaN positions (incl. padding) yield NaN drawdown that max() skips.
+    peak = np.fmax.accumulate(w_eq, axis=1)
+    peak = np.where(np.isnan(w_eq), np.nan, peak)
+    dd = np.fmax.reduce((peak - w_eq) / peak * 100, axis=1)
+
+    trade_count = (
+        exits.searchsorted(ends, side="right") - exits.searchsorted(starts, side="left")
+    )
+    return pd.DataFrame({
+        "start": starts,
+        "end": ends,
+        "return_pct": ret,
+        "max_dd_pct": dd,
+        "trade_count": trade_count.astype(int),
+    })
+
+
 def rolling_window(
     eq_df: pd.DataFrame,
     tr_df: pd.DataFrame,
@@ -14,48 +96,29 @@ def rolling_window(
     step_days: int = 30,
 ) -> pd.DataFrame:
     """Compute rolling return, max DD, and trade count over sliding windows."""
-    eq = eq_df.copy()
-    eq["timestamp"] = pd.to_datetime(eq["timestamp"])
-    eq = eq.set_index("timestamp")
-    eq = eq[~eq.index.duplicated(keep="last")]
-    eq = eq.sort_index()
-    daily = eq["equity"].resample("D").last().ffill()
+    daily, exits = _prepare_rolling_inputs(eq_df, tr_df)
+    return _window_table(daily, exits, window_days, step_days)
+
+
+def rolling_window_grid(
+    eq_df: pd.DataFrame,
+    tr_df: pd.DataFrame,
+    grid=DEFAULT_WINDOW_GRID,
+) -> pd.DataFrame:
+    """rolling_window for several (window_days, step_days) pairs in one call.
 
-    tr = tr_df.copy()
-    tr["exit_timestamp"] = pd.to_datetime(tr["exit_timestamp"])
-
-    start = daily.index[0]
-    end = daily.index[-1]
-    rows = []
-
-    current = start
-    while current + pd.Timedelta(days=window_days) <= end:
-        w_end = current + pd.Timedelta(days=window_days)
-        w_eq = daily.loc[current:w_end]
-
-        if len(w_eq) < 2:
-            current += pd.Timedelta(days=step_days)
-            continue
-
-        ret = (w_eq.iloc[-1] / w_eq.iloc[0] - 1) * 100
-        peak = w_eq.cummax()
-        dd = ((peak - w_eq) / peak * 100).max()
-
-        trades_in = tr[
-            (tr["exit_timestamp"] >= current) & (tr["exit_timestamp"] <= w_end)
-        ]
-        rows.append(
-            {
-                "start": current,
-                "end": w_end,
-                "return_pct": ret,
-                "max_dd_pct": dd,
-                "trade_count": len(trades_in),
-            }
-        )
-        current += pd.Timedelta(days=step_days)
-
-    return pd.DataFrame(rows)
+    The daily equity resample and exit sort are shared across the grid.
+    Returns the concatenated window tables with leading `window_days` /
+    `step_days` columns.
+    """
+    daily, exits = _prepare_rolling_inputs(eq_df, tr_df)
+    frames = []
+    for window_days, step_days in grid:
+        table = _window_table(daily, exits, window_days, step_days)
+        table.insert(0, "step_days", step_days)
+        table.insert(0, "window_days", window_days)
+        frames.append(table)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
 
 def classify_stability(windows_df: pd.DataFrame) -> dict: